@@ -19,11 +19,18 @@ Notes:
 - Gump text lines numbers vary in this cooking example so we map a few known example to categories
 then handle each troublesome item mapping 
 
+CAPTURE_ONLY:: the crawl only clicks and dumps raw item info gump lines to data/gump_crafting_capture_*.ndjson ,
+parse the capture afterwards with tools/DEV_crafting_capture_parse.py , it writes the same JSON as a parsing crawl
+
+STREAM_RESULTS:: each item is written as one record the moment it is parsed ( data/gump_crafting_*.ndjson ) ,
+memory stays flat on long crawls and a disconnect keeps every item written so far , STREAM_INDENT pretty prints as json-seq
+
 STATUS:: in progress , only tuned for cooking , needs verification ( DEV_crafting_tester.py )
-VERSION = 20251016
+VERSION = 20261019
 """
 import time
 import os
+import json
 import random
 from collections import OrderedDict
 
@@ -42,6 +49,9 @@ TOOL_ITEM_IDS = ALCHEMY_TOOL_ITEM_IDS if USE_ALCHEMY_SETTINGS else COOKING_TOOL_
 OUTPUT_BASE = False # - OUTPUT_BASE: include session/base gump and category scaffolding
 OUTPUT_ITEM = True # - OUTPUT_ITEM: include items parsed
 INCLUDE_PERCENTS = False  # success/exceptional percents are included in item JSON
+CAPTURE_ONLY = False  # skip parsing in game , dump raw item info gumps to NDJSON for tools/DEV_crafting_capture_parse.py
+STREAM_RESULTS = True  # write items as records while crawling instead of one JSON at the end
+STREAM_INDENT = None  # None = NDJSON one record per line , a number = pretty printed json-seq records
 
 DEBUG_TOKEN_STRIPE = True
 DEBUG_TOKEN_STRIPE_CATEGORIES = { 'ingredients', 'preparations', 'baking' }
@@ -804,26 +814,45 @@ def handle_example_F(lines: list) -> list:
 def pause_ms(ms):
     Misc.Pause(int(ms + random.randint(0, JITTER_MS)))
 
-def to_json(obj, indent=4, _level=0):
-    sp = ' ' * (indent * _level)
-    if isinstance(obj, dict):
-        items = []
-        for k, v in obj.items():
-            items.append(f'{sp}    "{str(k)}": {to_json(v, indent, _level+1)}')
-        return '{\n' + ',\n'.join(items) + f'\n{sp}' + '}'
-    elif isinstance(obj, list):
-        items = [to_json(i, indent, _level+1) for i in obj]
-        return '[\n' + ',\n'.join(' ' * (indent * (_level+1)) + i for i in items) + f'\n{sp}]'
-    elif isinstance(obj, str):
-        return '"' + obj.replace('"', '\\"') + '"'
-    elif obj is True:
-        return 'true'
-    elif obj is False:
-        return 'false'
-    elif obj is None:
-        return 'null'
-    else:
-        return str(obj)
+def to_json(obj, indent=4):
+    return json.dumps(obj, indent=indent, ensure_ascii=False, default=str)
+
+class JsonRecordWriter:
+    """Streams records to a file as they are produced instead of dumping one structure at the end.
+    indent None writes NDJSON , one compact record per line. An indent pretty prints each record as json-seq ( RFC 7464 ) ,
+    every record starts with a record separator character so a reader can split them again.
+    Each record is flushed , a crawl stopped by a disconnect keeps every record written before it."""
+
+    RECORD_SEPARATOR = "\x1e"
+
+    def __init__(self, file_path, indent=None):
+        self.file_path = file_path
+        self.indent = indent
+        self.count = 0
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(file_path, 'w', encoding='utf-8')
+
+    @staticmethod
+    def extension(indent=None):
+        return ".ndjson" if indent is None else ".json-seq"
+
+    def write(self, record):
+        if self._file is None:
+            return
+        if self.indent is None:
+            text = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        else:
+            text = self.RECORD_SEPARATOR + json.dumps(record, indent=self.indent, ensure_ascii=False, default=str) + "\n"
+        self._file.write(text)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 def debug_message(msg, color=68):
     if DEBUG_TO_INGAME_MESSAGE:
@@ -1127,24 +1156,24 @@ def _parse_with_lines(entry: dict, lines: list, category: str):
 
 # ===== Handler sequencing for troublesome items =====
 
-def build_handler_candidates(category: str, entry: dict) -> list:
-    """Return a list of (tag, ordered_tokens) candidates prioritized by category and example patterns.
-    Includes original, normalization-based, order-type heuristic, and example handlers A-F.
+def handler_candidate_builders(category: str, lines: list) -> list:
+    """Return a list of (key, build) in priority order , build() returns (tag, ordered_tokens) or None.
+    Candidates are built lazily so a known layout can run just its winning handler.
     """
-    lines = (entry or {}).get('text_lines') or []
-    candidates = []
+    lines = lines or []
+    builders = []
     # Original
     if lines:
-        candidates.append(('original', list(lines)))
+        builders.append(('original', lambda: ('original', list(lines))))
     # Normalized suggested order (computed locally; we don't persist it to entry)
-    try:
+    def _normalized():
         norm = normalize_text_by_anchors(lines)
         if isinstance(norm, dict):
             sug = norm.get('suggested_order') or []
             if sug:
-                candidates.append(('normalized', sug))
-    except Exception:
-        pass
+                return ('normalized', sug)
+        return None
+    builders.append(('normalized', _normalized))
     # Category-specific example handlers (priority varies by category)
     cat = (category or '').lower()
     if cat == 'meals':
@@ -1163,23 +1192,123 @@ def build_handler_candidates(category: str, entry: dict) -> list:
         # Default: include Example F as a fallback candidate as well
         example_funcs = [handle_example_A, handle_example_B, handle_example_C, handle_example_D, handle_example_E, handle_example_F]
     for fn in example_funcs:
-        try:
+        def _example(fn=fn):
             seq = fn(lines) or []
-            if seq:
-                candidates.append((fn.__name__, seq))
-        except Exception:
-            continue
+            return (fn.__name__, seq) if seq else None
+        builders.append((fn.__name__, _example))
 
     # Order-type suggestion (for Meals, this now comes after example handlers to avoid tie overshadowing)
-    try:
+    # the order type depends on the item name , so the cache key is 'order' and the tag is resolved per entry
+    def _order():
         ot = identify_order_type(category, lines)
         sug = build_suggested_by_order_type(lines, ot)
-        if sug:
-            candidates.append((f'order:{ot}', sug))
-    except Exception:
-        pass
+        return (f'order:{ot}', sug) if sug else None
+    builders.append(('order', _order))
+    return builders
+
+def build_handler_candidates(category: str, entry: dict) -> list:
+    """Return a list of (tag, ordered_tokens) candidates prioritized by category and example patterns.
+    Includes original, normalization-based, order-type heuristic, and example handlers A-F.
+    """
+    lines = (entry or {}).get('text_lines') or []
+    candidates = []
+    for _key, build in handler_candidate_builders(category, lines):
+        try:
+            candidate = build()
+            if candidate:
+                candidates.append(candidate)
+        except Exception:
+            continue
     return candidates
 
+# ===== Handler dispatch by layout signature =====
+# item info panels with the same layout ( token classes in order ) are won by the same handler ,
+# after the first full scoring pass later entries with that layout run only the winner
+HANDLER_BY_SIGNATURE = {}  # (category, signature) -> (builder key, winning score)
+
+def layout_signature(lines: list) -> str:
+    """Cheap structural signature of an item info panel , one class letter per non-empty token.
+    U = UI anchor , G = graphic-sized int , N = int , F = float , P = percent , T = other text."""
+    classes = []
+    for raw in (lines or []):
+        s = _strip_tags(raw)
+        if not s:
+            continue
+        if s.upper() in UI_TOKENS_IGNORE or s.lower() == DISCIPLINE_NAME_LOWER:
+            classes.append('U')
+        elif _is_percent(s):
+            classes.append('P')
+        elif _to_int_or_none(s) is not None:
+            classes.append('G' if _to_int_or_none(s) >= 1000 else 'N')
+        elif _is_float(s):
+            classes.append('F')
+        else:
+            classes.append('T')
+    return ''.join(classes)
+
+def _score_candidates(entry: dict, category: str, builders: list):
+    """Parse and score each builder's candidate , returns (parsed, score, tag, builder key) of the best one."""
+    best = (None, None, None, None)
+    for key, build in builders:
+        try:
+            candidate = build()
+            if not candidate:
+                continue
+            tag, seq = candidate
+            parsed = _parse_with_lines(entry, seq, category)
+            score = _score_parsed(parsed)
+            if (best[0] is None) or (score > best[1]):
+                best = (parsed, score, tag, key)
+        except Exception:
+            continue
+    return best
+
+def parse_item_entry(entry: dict, category_key: str, category_button_id, item_info_button_id):
+    """Parse one item info gump snapshot into (parsed_item_details, parse_meta).
+    Every handler candidate is parsed and scored , the best one wins , unless the layout signature already
+    has a winner in HANDLER_BY_SIGNATURE. Touches no game state ,
+    tools/DEV_crafting_capture_parse.py runs it offline over CAPTURE_ONLY dumps.
+    """
+    builders = handler_candidate_builders(category_key, (entry or {}).get('text_lines') or [])
+    signature_key = ((category_key or '').lower(), layout_signature((entry or {}).get('text_lines')))
+    best_parsed = None
+    cached = HANDLER_BY_SIGNATURE.get(signature_key)
+    if cached:
+        # Known layout , run only its winning handler ; a weaker result than it scored before rescores everything
+        cached_key, cached_score = cached
+        best_parsed, best_score, best_tag, _ = _score_candidates(entry, category_key, [b for b in builders if b[0] == cached_key])
+        if best_parsed is not None and best_score < cached_score:
+            best_parsed = None
+    if best_parsed is None:
+        # Build handler candidates and score to select best parsing result
+        best_parsed, best_score, best_tag, best_key = _score_candidates(entry, category_key, builders)
+        if best_parsed is not None:
+            HANDLER_BY_SIGNATURE[signature_key] = (best_key, best_score)
+    # Fallback to baseline parser
+    if not best_parsed:
+        try:
+            best_parsed = parse_item_info_gump(entry, category_key) or {}
+        except Exception:
+            best_parsed = {}
+    # Attach originating category key for downstream consumers
+    parsed_item_details = best_parsed if isinstance(best_parsed, dict) else {}
+    parsed_item_details['category'] = category_key
+    # Track which buttons led here
+    try:
+        parsed_item_details['button_category'] = int(category_button_id)
+    except Exception:
+        parsed_item_details['button_category'] = None
+    parsed_item_details['button_info'] = int(item_info_button_id)
+    try:
+        parsed_item_details['button_make'] = int(item_info_button_id) - 1
+    except Exception:
+        parsed_item_details['button_make'] = None
+    parse_meta = {
+        'strategy': best_tag,
+        'score': best_score,
+    }
+    return parsed_item_details, parse_meta
+
 def test_extract_troublesome_recipes():
     """Merged extractor: iterate TROUBLESOME_ITEMS categories and capture a single targeted
     item info panel per category. Uses category-driven handler sequencing to parse best.
@@ -2115,6 +2244,8 @@ def crawl_once(max_items=1):
     base_gump_entry = snap_gump_to_entry(crafting_gump_id)
     crawl_results['base_gump'] = base_gump_entry
     register_known(base_gump_entry, crawl_results)
+    capture_file = open_capture_file(crawl_results) if CAPTURE_ONLY else None
+    results_stream = open_results_stream(crawl_results) if (STREAM_RESULTS and DEBUG_TO_JSON and not CAPTURE_ONLY) else None
 
     # Initialize the list of item-info button identifiers (3, 10, 17, ...)
     global ITEM_INFO_BUTTONS
@@ -2147,6 +2278,10 @@ def crawl_once(max_items=1):
         category_key = category_name if category_name else str(category_button_id)
         if category_key not in crawl_results['categories']:
             crawl_results['categories'][category_key] = { 'button': category_button_id, 'items': [] }
+            if capture_file:
+                capture_file.write({'type': 'category', 'category': category_key, 'button': category_button_id})
+            if results_stream and OUTPUT_BASE:
+                results_stream.write({'type': 'category', 'category': category_key, 'button': category_button_id})
         # Detect per-category item-button series if offset differs; fallback to global series
         detected_series, crafting_gump_id = detect_item_button_series_for_category(crafting_gump_id, category_button_id)
         series_to_use = detected_series if (detected_series and len(detected_series) > 0) else ITEM_INFO_BUTTONS
@@ -2184,70 +2319,54 @@ def crawl_once(max_items=1):
                     exit_gump(current_gump_id, retries=2)
                     break
                 register_known(gump_snapshot_entry, crawl_results)
-                # Debug: show token stream in alternating colors for tricky categories
-                try:
-                    debug_tokens_striped(category_key, gump_snapshot_entry.get('text_lines'))
-                except Exception:
-                    pass
-                # Build handler candidates and score to select best parsing result
-                best_parsed = None
-                best_score = None
-                best_tag = None
-                for tag, seq in build_handler_candidates(category_key, gump_snapshot_entry):
+                if CAPTURE_ONLY:
+                    # Raw lines only , parsing happens offline in tools/DEV_crafting_capture_parse.py
+                    capture_file.write({
+                        'type': 'item',
+                        'category': category_key,
+                        'button_category': category_button_id,
+                        'button_info': item_info_button_id,
+                        'detail': gump_snapshot_entry,
+                    })
+                else:
+                    # Debug: show token stream in alternating colors for tricky categories
                     try:
-                        parsed = _parse_with_lines(gump_snapshot_entry, seq, category_key)
-                        score = _score_parsed(parsed)
-                        if (best_parsed is None) or (score > best_score):
-                            best_parsed, best_score, best_tag = parsed, score, tag
+                        debug_tokens_striped(category_key, gump_snapshot_entry.get('text_lines'))
                     except Exception:
+                        pass
+                    parsed_item_details, parse_meta = parse_item_entry(gump_snapshot_entry, category_key, category_button_id, item_info_button_id)
+                    # Skip sparse/under-parsed items with a warning
+                    if is_sparse_parsed_item(parsed_item_details):
+                        # Build a compact preview of found text to aid debugging
+                        try:
+                            preview_tokens = [_strip_tags(x) for x in (gump_snapshot_entry.get('text_lines') or []) if _strip_tags(x)]
+                            preview = ', '.join(preview_tokens[:12])
+                        except Exception:
+                            preview = ''
+                        debug_message(f"Skipped sparse item detail (btn {item_info_button_id}) in category {category_key}: too many null fields | found: {preview}", 53)
+                        # Close the info gump to avoid getting stuck, then restore base and reselect
+                        exit_gump(current_gump_id, retries=2)
+                        crafting_gump_id = open_crafting_gump()
+                        if crafting_gump_id == 0:
+                            break
+                        crafting_gump_id = send_action_and_wait(crafting_gump_id, category_button_id)
+                        pause_ms(ITEM_BUTTON_CLICK_PAUSE_MS // 2)
+                        # Continue scanning; treat as seen info so do not bump non-info counter
                         continue
-                # Fallback to baseline parser
-                if not best_parsed:
-                    try:
-                        best_parsed = parse_item_info_gump(gump_snapshot_entry, category_key) or {}
-                    except Exception:
-                        best_parsed = {}
-                # Attach originating category key for downstream consumers
-                parsed_item_details = best_parsed if isinstance(best_parsed, dict) else {}
-                parsed_item_details['category'] = category_key
-                # Track which buttons led here
-                try:
-                    parsed_item_details['button_category'] = int(category_button_id)
-                except Exception:
-                    parsed_item_details['button_category'] = None
-                parsed_item_details['button_info'] = int(item_info_button_id)
-                try:
-                    parsed_item_details['button_make'] = int(item_info_button_id) - 1
-                except Exception:
-                    parsed_item_details['button_make'] = None
-                # Skip sparse/under-parsed items with a warning
-                if is_sparse_parsed_item(parsed_item_details):
-                    # Build a compact preview of found text to aid debugging
-                    try:
-                        preview_tokens = [_strip_tags(x) for x in (gump_snapshot_entry.get('text_lines') or []) if _strip_tags(x)]
-                        preview = ', '.join(preview_tokens[:12])
-                    except Exception:
-                        preview = ''
-                    debug_message(f"Skipped sparse item detail (btn {item_info_button_id}) in category {category_key}: too many null fields | found: {preview}", 53)
-                    # Close the info gump to avoid getting stuck, then restore base and reselect
-                    exit_gump(current_gump_id, retries=2)
-                    crafting_gump_id = open_crafting_gump()
-                    if crafting_gump_id == 0:
-                        break
-                    crafting_gump_id = send_action_and_wait(crafting_gump_id, category_button_id)
-                    pause_ms(ITEM_BUTTON_CLICK_PAUSE_MS // 2)
-                    # Continue scanning; treat as seen info so do not bump non-info counter
-                    continue
-                crawl_results['categories'][category_key]['items'].append({
-                    'button': item_info_button_id,
-                    'detail': gump_snapshot_entry,
-                    'parsed': parsed_item_details,
-                    'parse_meta': {
-                        'strategy': best_tag,
-                        'score': best_score,
+                    item_entry = {
+                        'button': item_info_button_id,
+                        'detail': gump_snapshot_entry,
+                        'parsed': parsed_item_details,
+                        'parse_meta': parse_meta
                     }
-                })
-                debug_message(f"Captured item detail via cat {category_key} (btn {category_button_id}) item-btn {item_info_button_id}", 68)
+                    if results_stream:
+                        # Written now and dropped , nothing accumulates across the crawl
+                        stream_record = item_stream_record(category_key, item_entry)
+                        if stream_record:
+                            results_stream.write(stream_record)
+                    else:
+                        crawl_results['categories'][category_key]['items'].append(item_entry)
+                    debug_message(f"Captured item detail via cat {category_key} (btn {category_button_id}) item-btn {item_info_button_id}", 68)
                 # Close the info gump to ensure we return to a clean state; double-exit for safety
                 exit_gump(current_gump_id, retries=2)
                 # Reopen base crafting gump and reselect current category before next item
@@ -2278,73 +2397,136 @@ def crawl_once(max_items=1):
 
     # Final exit attempts to ensure reset state
     exit_gump(crafting_gump_id, retries=3)
+    if capture_file:
+        capture_file.close()
+        debug_message(f"Captured {number_of_items_captured} item panels to data/{os.path.basename(capture_file.file_path)}", 63)
+    if results_stream:
+        if OUTPUT_BASE:
+            results_stream.write({'type': 'known_gumps', 'known_gumps': crawl_results.get('known_gumps', {})})
+        results_stream.close()
+        debug_message(f"Streamed {results_stream.count} records to data/{os.path.basename(results_stream.file_path)}", 63)
 
     return crawl_results
 
-def save_results(results):
-    if not DEBUG_TO_JSON:
-        return
+# ===== Capture only =====
+
+def data_directory():
+    """Project data/ directory next to scripts/ , created when missing."""
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.join(os.path.dirname(scripts_dir), 'data')
     try:
-        # Save under project's data/ directory next to scripts/
-        scripts_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(scripts_dir)
-        data_dir = os.path.join(project_root, 'data')
+        os.makedirs(data_dir, exist_ok=True)
+    except Exception:
+        pass
+    return data_dir
+
+def open_capture_file(crawl_results):
+    """Open a new NDJSON capture and write the session record , every later record is one item or category line.
+    Always compact , tools/DEV_crafting_capture_parse.py reads it line by line."""
+    dt = time.strftime("%Y%m%d%H%M%S", time.localtime())
+    file_path = os.path.join(data_directory(), f"gump_crafting_capture_{CRAFTING_TYPE_KEY}_{dt}.ndjson")
+    capture_file = JsonRecordWriter(file_path)
+    capture_file.write({
+        'type': 'session',
+        'session_start': crawl_results.get('session_start'),
+        'tool_item_ids': crawl_results.get('tool_item_ids'),
+        'crafting_type': crawl_results.get('crafting_type'),
+        'crafting_type_key': crawl_results.get('crafting_type_key'),
+        'base_gump': crawl_results.get('base_gump'),
+    })
+    debug_message(f"Capturing raw gumps to data/{os.path.basename(file_path)}", 63)
+    return capture_file
+
+# ===== Streamed results =====
+
+def open_results_stream(crawl_results):
+    """Open the streamed crawl output and write its session record.
+    Records follow OUTPUT_BASE / OUTPUT_ITEM like the saved JSON , only split into one record per category and item."""
+    dt = time.strftime("%Y%m%d%H%M%S", time.localtime())
+    filename = f"gump_crafting_{CRAFTING_TYPE_KEY}_{dt}{JsonRecordWriter.extension(STREAM_INDENT)}"
+    results_stream = JsonRecordWriter(os.path.join(data_directory(), filename), indent=STREAM_INDENT)
+    session_record = {
+        'type': 'session',
+        'crafting_type': crawl_results.get('crafting_type'),
+        'crafting_type_key': crawl_results.get('crafting_type_key'),
+    }
+    if OUTPUT_BASE:
+        session_record['session_start'] = crawl_results.get('session_start')
+        session_record['tool_item_ids'] = crawl_results.get('tool_item_ids')
+        session_record['base_gump'] = crawl_results.get('base_gump')
+    results_stream.write(session_record)
+    debug_message(f"Streaming crafting data to data/{filename}", 63)
+    return results_stream
+
+def item_stream_record(category_key, item_entry):
+    """One streamed item record shaped like shape_results would save it , None when the saved JSON leaves it out."""
+    if OUTPUT_ITEM and not OUTPUT_BASE:
+        parsed = item_entry.get('parsed') or {}
+        if not parsed or (parsed.get('name') or '').strip().lower() == _GLOBAL_CHAT_LINE_LOWER:
+            return None
+        return {'type': 'item', 'category': category_key, 'item': build_item_output(parsed)}
+    if OUTPUT_BASE and not OUTPUT_ITEM:
+        return None
+    return {'type': 'item', 'category': category_key, 'item': item_entry}
+
+def shape_results(results):
+    """Shape crawl results for the saved JSON according to OUTPUT_BASE / OUTPUT_ITEM."""
+    if OUTPUT_ITEM and not OUTPUT_BASE:
+        # Flatten to a succinct list of parsed items (no gump/base data)
+        items_only = []
         try:
-            os.makedirs(data_dir, exist_ok=True)
+            cats = results.get('categories', {})
+            for _, cat_data in cats.items():
+                for it in (cat_data.get('items') or []):
+                    parsed = (it or {}).get('parsed') or {}
+                    if not parsed:
+                        continue
+                    nm = (parsed.get('name') or '').strip().lower()
+                    if nm == _GLOBAL_CHAT_LINE_LOWER:
+                        # Skip leaked system banner lines entirely
+                        continue
+                    items_only.append(build_item_output(parsed))
         except Exception:
             pass
+        payload = {
+            'crafting_type': results.get('crafting_type') or CRAFTING_TYPE,
+            'crafting_type_key': results.get('crafting_type_key') or CRAFTING_TYPE_KEY,
+            'items': items_only
+        }
+    elif OUTPUT_BASE and not OUTPUT_ITEM:
+        # Include base/session and category scaffolding without items
+        shaped = {
+            'session_start': results.get('session_start'),
+            'tool_item_ids': results.get('tool_item_ids'),
+            'crafting_type': results.get('crafting_type') or CRAFTING_TYPE,
+            'crafting_type_key': results.get('crafting_type_key') or CRAFTING_TYPE_KEY,
+            'base_gump': results.get('base_gump'),
+            'known_gumps': results.get('known_gumps', {})
+        }
+        # categories without items
+        cats_out = {}
+        for cat_key, cat_data in (results.get('categories') or {}).items():
+            cats_out[cat_key] = {
+                'button': cat_data.get('button'),
+                'items': []
+            }
+        shaped['categories'] = cats_out
+        payload = shaped
+    else:
+        # Default: include full structure
+        payload = results
+    return payload
+
+def save_results(results):
+    if not DEBUG_TO_JSON:
+        return
+    try:
         dt = time.strftime("%Y%m%d%H%M%S", time.localtime())
         # Prefer the crafting type from results for flexibility; fallback to current toggle
         ct_key = (results.get('crafting_type_key') if isinstance(results, dict) else None) or CRAFTING_TYPE_KEY
         filename = f"gump_crafting_{ct_key}_{dt}.json"
-        file_path = os.path.join(data_dir, filename)
-
-        # Shape the output according to toggles
-        if OUTPUT_ITEM and not OUTPUT_BASE:
-            # Flatten to a succinct list of parsed items (no gump/base data)
-            items_only = []
-            try:
-                cats = results.get('categories', {})
-                for _, cat_data in cats.items():
-                    for it in (cat_data.get('items') or []):
-                        parsed = (it or {}).get('parsed') or {}
-                        if not parsed:
-                            continue
-                        nm = (parsed.get('name') or '').strip().lower()
-                        if nm == _GLOBAL_CHAT_LINE_LOWER:
-                            # Skip leaked system banner lines entirely
-                            continue
-                        items_only.append(build_item_output(parsed))
-            except Exception:
-                pass
-            payload = {
-                'crafting_type': results.get('crafting_type') or CRAFTING_TYPE,
-                'crafting_type_key': results.get('crafting_type_key') or CRAFTING_TYPE_KEY,
-                'items': items_only
-            }
-        elif OUTPUT_BASE and not OUTPUT_ITEM:
-            # Include base/session and category scaffolding without items
-            shaped = {
-                'session_start': results.get('session_start'),
-                'tool_item_ids': results.get('tool_item_ids'),
-                'crafting_type': results.get('crafting_type') or CRAFTING_TYPE,
-                'crafting_type_key': results.get('crafting_type_key') or CRAFTING_TYPE_KEY,
-                'base_gump': results.get('base_gump'),
-                'known_gumps': results.get('known_gumps', {})
-            }
-            # categories without items
-            cats_out = {}
-            for cat_key, cat_data in (results.get('categories') or {}).items():
-                cats_out[cat_key] = {
-                    'button': cat_data.get('button'),
-                    'items': []
-                }
-            shaped['categories'] = cats_out
-            payload = shaped
-        else:
-            # Default: include full structure
-            payload = results
-
+        file_path = os.path.join(data_directory(), filename)
+        payload = shape_results(results)
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(to_json(payload, indent=4))
         debug_message(f"Wrote crafting gump data to data/{filename}", 63)
@@ -2355,7 +2537,8 @@ def main():
     # Default: run the focused troublesome-recipes extractor (single item per category)
     #results = test_extract_troublesome_recipes()
     results = crawl_once(MAX_ITEMS_TO_EXTRACT)
-    save_results(results)
+    if not CAPTURE_ONLY and not STREAM_RESULTS:
+        save_results(results)
 
 if __name__ == "__main__":
     main()
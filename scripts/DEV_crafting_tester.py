@@ -5,7 +5,8 @@ test crafting recipes in game , verify the data written by DEV_crafting_gump_cra
 because the text_list is unsorted the data may have errors , this script attempts to check
 
 Overview:
-- Parse the latest crafting gump crawl JSON from `data/gump_crafting_*.json`.
+- Parse the latest crafting gump crawl JSON from `data/gump_crafting_*.json` , or a streamed crawl
+  `data/gump_crafting_*.ndjson` / `.json-seq` ( a crawl cut short still yields every item written before it ).
 - Build a proposed test plan per recipe (Target Item, Category, Item Graphic ID, Skill, Materials,
   and the json info for the gump Category button ID and the Target Item's Make/Info button IDs).
 - Test verification in-game to attempt crafting eligible recipes, then write
@@ -33,7 +34,7 @@ Outputs:
 - Live verified: `data/crafting_verified_<timestamp>.json`
 - Live failures: `data/crafting_failures_<timestamp>.json`
 
-VERSION::20250819
+VERSION::20261019
 """
 import json
 import os
@@ -60,6 +61,7 @@ BACKPACK_SNAPSHOT = {
 }
 
 VERIFIED_JSON_PATH = ""  # optional override; if empty and SKIP_VERIFIED, auto-pick latest crafting_verified_*.json in data/
+CRAWL_OUTPUT_EXTENSIONS = ('.json', '.ndjson', '.json-seq')  # crawler outputs , streamed crawls write .ndjson / .json-seq
 
 # Borrow patterns from DEV_crafting_gump_crawler.py
 # Category buttons pattern for Cooking (Skillet)
@@ -463,10 +465,13 @@ def _find_latest_crafting_json(data_dir: str) -> str:
         return None
     candidates = []
     for name in os.listdir(data_dir):
-        if not name.lower().endswith('.json'):
+        if not name.lower().endswith(CRAWL_OUTPUT_EXTENSIONS):
             continue
         if not name.lower().startswith('gump_crafting'):
             continue
+        if name.lower().startswith('gump_crafting_capture'):
+            # raw CAPTURE_ONLY dumps are parsed by tools/DEV_crafting_capture_parse.py first
+            continue
         full = os.path.join(data_dir, name)
         try:
             mtime = os.path.getmtime(full)
@@ -482,6 +487,38 @@ def _read_json(path: str):
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
+def _read_json_records(path: str) -> list:
+    """Records of an NDJSON or json-seq file , a partial last record from an interrupted crawl is skipped."""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    chunks = text.split('\x1e') if '\x1e' in text else text.splitlines()
+    records = []
+    for chunk in chunks:
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        try:
+            records.append(json.loads(chunk))
+        except ValueError:
+            debug_message(f"Skipping unreadable record in {os.path.basename(path)}")
+    return records
+
+def _read_crawl_output(path: str):
+    """Load a crawl output in a shape _normalize_items understands.
+    Streamed item records are regrouped per category like the full crawl JSON."""
+    if path.lower().endswith('.json'):
+        return _read_json(path)
+    categories = {}
+    for record in _read_json_records(path):
+        if record.get('type') == 'category':
+            categories.setdefault(record.get('category'), {'button': record.get('button'), 'items': []})
+        elif record.get('type') == 'item':
+            item = record.get('item') or {}
+            bucket = categories.setdefault(record.get('category'), {'button': None, 'items': []})
+            # items only records hold the parsed item itself , full records the crawl entry around it
+            bucket['items'].append(item if 'parsed' in item else {'parsed': item})
+    return {'categories': categories}
+
 def _write_json(path: str, obj):
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, 'w', encoding='utf-8') as f:
@@ -811,6 +848,9 @@ def _normalize_items(json_root):
     # Case 1: already a list of items
     if isinstance(json_root, list):
         return json_root
+    # Case 1b: items only output { crafting_type , crafting_type_key , items }
+    if isinstance(json_root, dict) and isinstance(json_root.get('items'), list):
+        return json_root['items']
     # Case 2: full structure with categories
     items = []
     cats = (json_root or {}).get('categories', {})
@@ -1241,7 +1281,7 @@ def main():
         sys.exit(1)
     print(f"Using source: {src_json}")
 
-    root = _read_json(src_json)
+    root = _read_crawl_output(src_json)
     items = _normalize_items(root)
     print(f"Loaded items: {len(items)}")
 
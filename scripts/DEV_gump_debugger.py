@@ -7,39 +7,57 @@ journal logs are stored in Classic U client folder =
 
 - gump property extraction
 - start script then open a gump in game to store properties to json
+- each analyzed gump is written as one record right away ( gump_debug_*.ndjson ) , a disconnect keeps every gump seen so far
 
 DOCUMENTATION:
 https://razorenhanced.net/dokuwiki/doku.php?id=gump_funcs
 
-VERSION::20250808
+VERSION::20261019
 """
 DEBUG_TO_INGAME_MESSAGE = True
 DEBUG_TO_JSON = True
+JSON_INDENT = None  # None = NDJSON one record per line , a number = pretty printed json-seq records
 
 import time
+import json
 import os
 
-def to_json(obj, indent=4, _level=0):
-    """Custom JSON serializer for dict, list, str, int, float, bool, None."""
-    sp = ' ' * (indent * _level)
-    if isinstance(obj, dict):
-        items = []
-        for k, v in obj.items():
-            items.append(f'{sp}    "{str(k)}": {to_json(v, indent, _level+1)}')
-        return '{\n' + ',\n'.join(items) + f'\n{sp}' + '}'
-    elif isinstance(obj, list):
-        items = [to_json(i, indent, _level+1) for i in obj]
-        return '[\n' + ',\n'.join(' ' * (indent * (_level+1)) + i for i in items) + f'\n{sp}]'
-    elif isinstance(obj, str):
-        return '"' + obj.replace('"', '\\"') + '"'
-    elif obj is True:
-        return 'true'
-    elif obj is False:
-        return 'false'
-    elif obj is None:
-        return 'null'
-    else:
-        return str(obj)
+class JsonRecordWriter:
+    """Streams records to a file as they are produced instead of dumping one structure at the end.
+    indent None writes NDJSON , one compact record per line. An indent pretty prints each record as json-seq ( RFC 7464 ) ,
+    every record starts with a record separator character so a reader can split them again.
+    Each record is flushed , a crawl stopped by a disconnect keeps every record written before it."""
+
+    RECORD_SEPARATOR = "\x1e"
+
+    def __init__(self, file_path, indent=None):
+        self.file_path = file_path
+        self.indent = indent
+        self.count = 0
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(file_path, 'w', encoding='utf-8')
+
+    @staticmethod
+    def extension(indent=None):
+        return ".ndjson" if indent is None else ".json-seq"
+
+    def write(self, record):
+        if self._file is None:
+            return
+        if self.indent is None:
+            text = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        else:
+            text = self.RECORD_SEPARATOR + json.dumps(record, indent=self.indent, ensure_ascii=False, default=str) + "\n"
+        self._file.write(text)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 
 class GumpDebugger:
@@ -72,10 +90,9 @@ class GumpDebugger:
         # For JSON logging
         self.session_log = {
             'session_start': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime()),
-
-            'gumps': []
         }
         self.current_gump_entry = None
+        self.log_writer = None  # JsonRecordWriter , gump entries stream to it as they finish
 
     def debug(self, message, color='info', indent=0):
         """Send formatted debug message and/or log to session based on global booleans"""
@@ -218,7 +235,6 @@ class GumpDebugger:
                 'raw_data': None,
                 'positions': [],
             }
-            self.session_log['gumps'].append(self.current_gump_entry)
 
             self.debug(f"\nAnalyzing Gump ID: {hex(gump_id)}", 'id')
             self.debug("Basic Information:", 'info', 1)
@@ -263,10 +279,33 @@ class GumpDebugger:
             self.debug(f"Text Lines: {self.stats['text_lines_found']}", 'text', 2)
             self.debug(f"Errors: {self.stats['errors']}", 'error', 2)
 
-            self.current_gump_entry = None  # Done with this gump
+            self.finish_gump_entry()  # Done with this gump
         except Exception as e:
             self.debug(f"Error in gump analysis: {str(e)}", 'error')
             self.stats['errors'] += 1
+            self.finish_gump_entry()
+
+    def open_log_writer(self):
+        """Open the JSON log next to this script and write the session record"""
+        try:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            dt = time.strftime("%Y%m%d%H%M%S", time.localtime())
+            filename = f"gump_debug_{dt}{JsonRecordWriter.extension(JSON_INDENT)}"
+            self.log_writer = JsonRecordWriter(os.path.join(base_dir, filename), indent=JSON_INDENT)
+            self.log_writer.write(dict({'type': 'session'}, **self.session_log))
+        except Exception as e:
+            self.log_writer = None
+            if DEBUG_TO_INGAME_MESSAGE:
+                Misc.SendMessage(f"[GumpDebug] Failed to open debug log: {str(e)}", 33)
+
+    def finish_gump_entry(self):
+        """Write the current gump entry to the log and drop it"""
+        if self.current_gump_entry is not None and self.log_writer:
+            try:
+                self.log_writer.write(dict({'type': 'gump'}, **self.current_gump_entry))
+            except Exception as e:
+                self.debug(f"Error writing gump entry: {str(e)}", 'error')
+        self.current_gump_entry = None
     
     def monitor_gumps(self):
         """Main monitoring loop"""
@@ -292,6 +331,8 @@ class GumpDebugger:
         try:
             # Reset any existing gump state
             Gumps.ResetGump()
+            if DEBUG_TO_JSON:
+                self.open_log_writer()
             # Start monitoring
             self.monitor_gumps()
         except Exception as e:
@@ -300,17 +341,14 @@ class GumpDebugger:
         finally:
             self.debug("Gump Debugger stopped.")
             self.debug(f"Total Gumps Analyzed: {self.stats['gumps_analyzed']}")
-            # Save JSON log if enabled
-            if DEBUG_TO_JSON:
+            # Close the JSON log , gump entries were already written as they finished
+            if self.log_writer:
                 try:
-                    base_dir = os.path.dirname(os.path.abspath(__file__))
-                    dt = time.strftime("%Y%m%d%H%M%S", time.localtime())
-                    filename = f"gump_debug_{dt}.json"
-                    file_path = os.path.join(base_dir, filename)
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(to_json(self.session_log, indent=4))
+                    self.finish_gump_entry()
+                    self.log_writer.write({'type': 'stats', 'stats': dict(self.stats)})
+                    self.log_writer.close()
                     if DEBUG_TO_INGAME_MESSAGE:
-                        Misc.SendMessage(f"[GumpDebug] Wrote debug log to {filename}", 63)
+                        Misc.SendMessage(f"[GumpDebug] Wrote debug log to {os.path.basename(self.log_writer.file_path)}", 63)
                 except Exception as e:
                     if DEBUG_TO_INGAME_MESSAGE:
                         Misc.SendMessage(f"[GumpDebug] Failed to write debug log: {str(e)}", 33)
@@ -23,8 +23,11 @@ Gump text lines vary so we map a few known example to categories
 then handle each troublesome item mapping 
 
 
+STREAM_RESULTS:: pages are written as records while crawling ( data/gump_daily_quests_*.ndjson ) ,
+a disconnect keeps every page written so far , STREAM_INDENT pretty prints records as json-seq
+
 STATUS:: in progress , tuned for daily quests
-VERSION = 20250818
+VERSION = 20261019
 """
 import time
 import os
@@ -48,6 +51,8 @@ MAX_ITEMS_TO_EXTRACT = 999
 OUTPUT_BASE = False
 OUTPUT_ITEM = True
 RUN_DETAIL_SCAN = True           # set True to also scan detail gumps per page
+STREAM_RESULTS = True  # write pages as records while crawling instead of one JSON at the end
+STREAM_INDENT = None  # None = NDJSON one record per line , a number = pretty printed json-seq records
 
 # Discovery probe (general)
 BUTTON_ID_MIN = 1
@@ -56,7 +61,6 @@ BUTTON_ID_MAX = 999           # keep small to be safe for broad probing
 # DELAYS
 LOOP_PAUSE_MS = 100
 JITTER_MS = 100
-ITEM_BUTTON_CLICK_PAUSE_MS = 500  # slower wait for item info panels to render reliably
 BUTTON_CLICK_PAUSE_MS = 100   # delay after clicking a button
 
 # Detection thresholds to avoid endless loops when item info panels
@@ -90,8 +94,7 @@ DETAIL_TEXT_HINTS = [
 ]
 
 WAIT_GUMP_MS = 10000
-CLICK_PAUSE_MS = 400
-PAGE_RESET_PAUSE_MS = 500
+CLICK_WAIT_MAX_MS = 3000  # longest wait for a button press to change the gump , shrinks to the learned latency
 MAX_PAGES = 200
 HOLD_DETAIL_MS = 800  # hold time on detail gump to ensure content fully renders before leaving
 
@@ -100,6 +103,12 @@ DETAIL_CAPTURE_MODE = "screenshot"     # "lines" or "screenshot"
 DETAIL_SCREENSHOT_DELAY_MS = 900  # if using screenshots, delay before capture
 DETAIL_OUTPUT_SUFFIX = "detail"   # used when saving separate detail files
 
+# Gump change detection , waits end as soon as the gump content changes and holds still
+GUMP_SETTLE_MS = 150  # content must stay unchanged this long after a change
+GUMP_POLL_MS = 40  # interval between gump content checks
+GUMP_TIMEOUT_MIN_MS = 800  # learned timeouts never drop below this
+GUMP_LATENCY_TIMEOUT_FACTOR = 4  # learned timeout = typical change latency x factor + settle
+
 # EXAMPLE OF GUMP RAW TEXT_LINES
 # here is an example of the RAW BASE HUMP text_lines
 """
@@ -167,26 +176,42 @@ DETAIL_OUTPUT_SUFFIX = "detail"   # used when saving separate detail files
 def pause_ms(ms):
     Misc.Pause(int(ms + random.randint(0, JITTER_MS)))
 
-def to_json(obj, indent=4, _level=0):
-    sp = ' ' * (indent * _level)
-    if isinstance(obj, dict):
-        items = []
-        for k, v in obj.items():
-            items.append(f'{sp}    "{str(k)}": {to_json(v, indent, _level+1)}')
-        return '{\n' + ',\n'.join(items) + f'\n{sp}' + '}'
-    elif isinstance(obj, list):
-        items = [to_json(i, indent, _level+1) for i in obj]
-        return '[\n' + ',\n'.join(' ' * (indent * (_level+1)) + i for i in items) + f'\n{sp}]'
-    elif isinstance(obj, str):
-        return '"' + obj.replace('"', '\\"') + '"'
-    elif obj is True:
-        return 'true'
-    elif obj is False:
-        return 'false'
-    elif obj is None:
-        return 'null'
-    else:
-        return str(obj)
+class JsonRecordWriter:
+    """Streams records to a file as they are produced instead of dumping one structure at the end.
+    indent None writes NDJSON , one compact record per line. An indent pretty prints each record as json-seq ( RFC 7464 ) ,
+    every record starts with a record separator character so a reader can split them again.
+    Each record is flushed , a crawl stopped by a disconnect keeps every record written before it."""
+
+    RECORD_SEPARATOR = "\x1e"
+
+    def __init__(self, file_path, indent=None):
+        self.file_path = file_path
+        self.indent = indent
+        self.count = 0
+        folder = os.path.dirname(file_path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder, exist_ok=True)
+        self._file = open(file_path, 'w', encoding='utf-8')
+
+    @staticmethod
+    def extension(indent=None):
+        return ".ndjson" if indent is None else ".json-seq"
+
+    def write(self, record):
+        if self._file is None:
+            return
+        if self.indent is None:
+            text = json.dumps(record, ensure_ascii=False, default=str) + "\n"
+        else:
+            text = self.RECORD_SEPARATOR + json.dumps(record, indent=self.indent, ensure_ascii=False, default=str) + "\n"
+        self._file.write(text)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
 
 def debug_message(msg, color=68):
     if DEBUG_TO_INGAME_MESSAGE:
@@ -214,20 +239,17 @@ def adj_pause(ms):
         return max(50, int(ms * 0.6))
     return ms
 
-def jitter_ms(a, b):
-    try:
-        import random as _r
-        return _r.randint(a, b)
-    except Exception:
-        return 0
-
-def send_action_and_wait(gid, btn, wait_ms=CLICK_PAUSE_MS):
+def send_action_and_wait(gid, btn, wait_ms=CLICK_WAIT_MAX_MS):
+    """Press a button and return as soon as the current gump changed and settled , or after the learned timeout."""
     log_debug("SendAction gid {} btn {}".format(hex(gid) if gid else gid, btn), 2)
+    baseline, _ = _GUMP_WATCHER.read()
     try:
         Gumps.SendAction(gid, btn)
     except Exception:
         return gid
-    pause_ms(adj_pause(wait_ms) + jitter_ms(25, 60))
+    changed, _ = _GUMP_WATCHER.wait_for_change(baseline, 0, wait_ms)
+    if not changed:
+        log_debug("No gump change after btn {}".format(btn), 2)
     try:
         ng = Gumps.CurrentGump()
     except Exception:
@@ -248,7 +270,6 @@ def navigate_to_available_page_index(target_index):
         gid = send_action_and_wait(gid, BUTTON_NEXT)
         if gid == 0:
             return 0
-        pause_ms(adj_pause(PAGE_RESET_PAUSE_MS))
     return gid
 
 def snap_text_lines():
@@ -267,85 +288,102 @@ def snap_text_lines():
     except Exception:
         return []
 
-def wait_for_lines_change(prev_lines, timeout_ms=3500):
-    """Poll gump text lines until they differ from prev_lines or timeout.
-    Returns tuple: (changed, new_lines)
-    """
-    start = int(time.time() * 1000)
-    prev = prev_lines or []
-    while int(time.time() * 1000) - start < timeout_ms:
-        cur = snap_text_lines()
-        if cur and cur != prev:
-            return True, cur
-        pause_ms(LOOP_PAUSE_MS)
-    return False, snap_text_lines()
+class GumpWatcher:
+    """Waits for gump content to change instead of sleeping a fixed time.
+    A gump fingerprint covers its id , text lines and raw layout. A wait returns once the fingerprint
+    differs from the baseline and then holds for GUMP_SETTLE_MS. Each change observed after an action updates a
+    running server latency estimate , later action waits time out after a few multiples of it instead of the full maximum."""
 
-def wait_for_stable_lines(initial_lines, settle_ms=600, max_wait_ms=2000):
-    """After a change is detected, wait until the lines stabilize for settle_ms or until max_wait_ms is reached."""
-    start = int(time.time() * 1000)
-    last = initial_lines or []
-    stable_start = None
-    while int(time.time() * 1000) - start < max_wait_ms:
-        cur = snap_text_lines()
-        if cur == last:
-            if stable_start is None:
-                stable_start = int(time.time() * 1000)
-            if int(time.time() * 1000) - stable_start >= settle_ms:
-                return cur
+    def __init__(self):
+        self.latency_ms = None  # running average of action -> first content change
+
+    def read(self, gump_id=0):
+        """Return (fingerprint, lines) for gump_id , 0 reads the current gump. fingerprint is None when nothing is readable."""
+        try:
+            if not gump_id:
+                gump_id = Gumps.CurrentGump()
+            if not gump_id:
+                return None, []
+            lines = [str(ln).strip() for ln in (Gumps.GetLineList(gump_id, True) or [])]
+            try:
+                layout = str(Gumps.GetGumpRawLayout(gump_id) or "")
+            except Exception:
+                layout = ""
+            if not lines and not layout:
+                return None, []
+            return hash((gump_id, tuple(lines), layout)), lines
+        except Exception:
+            return None, []
+
+    def timeout_ms(self, max_ms):
+        """Learned timeout , never above max_ms and never below GUMP_TIMEOUT_MIN_MS."""
+        if self.latency_ms is None:
+            return int(max_ms)
+        learned = self.latency_ms * GUMP_LATENCY_TIMEOUT_FACTOR + GUMP_SETTLE_MS
+        return int(min(max_ms, max(GUMP_TIMEOUT_MIN_MS, learned)))
+
+    def learn(self, elapsed_ms):
+        if self.latency_ms is None:
+            self.latency_ms = float(elapsed_ms)
         else:
-            last = cur
-            stable_start = None
-        pause_ms(LOOP_PAUSE_MS)
-    return snap_text_lines()
+            self.latency_ms = self.latency_ms * 0.75 + float(elapsed_ms) * 0.25
+
+    def wait_for_change(self, baseline, gump_id=0, max_ms=3000):
+        """Wait until the fingerprint of gump_id differs from baseline and holds for GUMP_SETTLE_MS.
+        baseline None waits for any readable content. Returns (changed, lines) , on timeout the last lines read.
+        Only waits after an action ( a real baseline ) teach the latency and use the learned timeout ,
+        a gump that is already readable would otherwise teach a latency of ~0 ms."""
+        start = int(time.time() * 1000)
+        learning = baseline is not None
+        timeout = self.timeout_ms(max_ms) if learning else int(max_ms)
+        candidate = None
+        candidate_since = 0
+        lines = []
+        while True:
+            now = int(time.time() * 1000)
+            fingerprint, current_lines = self.read(gump_id)
+            if current_lines:
+                lines = current_lines
+            if fingerprint is not None and fingerprint != baseline:
+                if candidate is None and learning:
+                    self.learn(now - start)
+                if fingerprint != candidate:
+                    candidate = fingerprint
+                    candidate_since = now
+                elif now - candidate_since >= GUMP_SETTLE_MS:
+                    return True, current_lines
+            if now - start >= timeout:
+                if candidate is None and learning:
+                    # a miss widens later timeouts
+                    self.learn(timeout)
+                return candidate is not None, lines
+            Misc.Pause(GUMP_POLL_MS)
+
+_GUMP_WATCHER = GumpWatcher()
 
 def click_probe_and_collect(gid, btn, baseline_lines):
     """Click a probe button and wait for either gump id or text lines to change.
     Returns (new_gid, detail_lines or None).
     """
     log_debug(f"Probing button {btn} from gid {hex(gid) if gid else gid}", 2)
+    baseline, _ = _GUMP_WATCHER.read()
     try:
         Gumps.SendAction(gid, btn)
     except Exception:
         return gid, None
-    # Initial small pause
-    pause_ms(adj_pause(ITEM_BUTTON_CLICK_PAUSE_MS))
-    # Poll for either gid change or line change, whichever comes first
-    poll_start = int(time.time() * 1000)
-    ng = gid
-    changed = False
-    new_lines = None
-    while int(time.time() * 1000) - poll_start < adj_pause(6500):
-        try:
-            cur_gid = Gumps.CurrentGump()
-        except Exception:
-            cur_gid = 0
-        cur_lines = snap_text_lines()
-        if cur_gid and cur_gid != gid:
-            ng = cur_gid
-            new_lines = cur_lines
-            changed = True
-            break
-        # Treat line changes or presence of detail anchors as a change
-        low_join = " ".join([x.lower() for x in (cur_lines or [])])
-        has_detail_hint = any(tok in low_join for tok in DETAIL_TEXT_HINTS)
-        if cur_lines and (cur_lines != (baseline_lines or []) or has_detail_hint):
-            ng = cur_gid or gid
-            new_lines = cur_lines
-            changed = True
-            break
-        pause_ms(LOOP_PAUSE_MS)
-    # If changed, let the content stabilize a bit before returning
+    # The fingerprint includes the gump id , so a new gump and changed lines both count
+    changed, new_lines = _GUMP_WATCHER.wait_for_change(baseline, 0, adj_pause(6500))
+    if not changed:
+        # Treat presence of detail anchors as a change
+        low_join = " ".join([x.lower() for x in (new_lines or [])])
+        changed = bool(new_lines) and any(tok in low_join for tok in DETAIL_TEXT_HINTS)
+    try:
+        ng = Gumps.CurrentGump() or gid
+    except Exception:
+        ng = gid
     if changed:
-        new_lines = wait_for_stable_lines(new_lines, settle_ms=900, max_wait_ms=2500)
         # Briefly hold the detail gump open to avoid racing back too quickly
         pause_ms(adj_pause(HOLD_DETAIL_MS))
-    else:
-        # Fallback: one more longer wait cycle in case shard/UI is slow
-        changed2, new_lines2 = wait_for_lines_change(baseline_lines, timeout_ms=adj_pause(4500))
-        if changed2:
-            new_lines = wait_for_stable_lines(new_lines2, settle_ms=900, max_wait_ms=2500)
-            changed = True
-            pause_ms(adj_pause(HOLD_DETAIL_MS))
     log_debug(
         f"After probe btn {btn}: gid {hex(ng) if ng else ng}, changed={changed}, lines={len(new_lines or [])}",
         1,
@@ -354,7 +392,7 @@ def click_probe_and_collect(gid, btn, baseline_lines):
     if DEBUG_MODE and (new_lines or []):
         preview = ", ".join((new_lines[:5] if len(new_lines) > 5 else new_lines))
         log_debug(f"Detail preview (btn {btn}): {preview}", 2)
-    return (ng or gid), (new_lines if changed else None)
+    return ng, (new_lines if changed else None)
 
 def is_confirm_gump(gid, lines=None):
     if gid in CONFIRM_GUMP_IDS:
@@ -589,17 +627,14 @@ def crawl_detail_for_current_page(gid, page_index, baseline_lines):
                 details.append({"button": btn, "detail": {"raw": snapshot_lines}})
             # Return to the target page for subsequent probes
             gid = navigate_to_available_page_index(target_page)
-            pause_ms(adj_pause(PAGE_RESET_PAUSE_MS))
         elif DETAIL_CAPTURE_MODE == "screenshot":
             if opened_detail:
                 shot = capture_detail_screenshot(page_index, btn)
                 details.append({"button": btn, "detail": {"screenshot": shot}})
             # Return to the target page for subsequent probes
             gid = navigate_to_available_page_index(target_page)
-            pause_ms(adj_pause(PAGE_RESET_PAUSE_MS))
         else:
             gid = navigate_to_available_page_index(target_page)
-            pause_ms(adj_pause(PAGE_RESET_PAUSE_MS))
     return details
 
 def crawl_available_pages_with_details(max_pages=9):
@@ -616,6 +651,13 @@ def crawl_available_pages_with_details(max_pages=9):
         "mode": DETAIL_CAPTURE_MODE,
         "pages": []
     }
+    detail_stream = None
+    if STREAM_RESULTS and DEBUG_TO_JSON:
+        detail_stream = open_results_stream(f"gump_daily_quests_{DETAIL_OUTPUT_SUFFIX}", {
+            "type": "session",
+            "session_start": all_details["session_start"],
+            "mode": DETAIL_CAPTURE_MODE,
+        })
     page_index = 0
     for _ in range(MAX_PAGES):
         if page_index >= max_pages:
@@ -626,16 +668,23 @@ def crawl_available_pages_with_details(max_pages=9):
             break
         seen.add(sig)
         page_details = crawl_detail_for_current_page(gid, page_index, lines)
-        all_details["pages"].append({
+        detail_page = {
             "index": page_index,
             "gump_id": hex(gid),
             "details": page_details,
-        })
+        }
+        if detail_stream:
+            detail_stream.write(dict({"type": "page"}, **detail_page))
+        else:
+            all_details["pages"].append(detail_page)
         gid = send_action_and_wait(gid, BUTTON_NEXT)
         if gid == 0:
             break
         page_index += 1
-        pause_ms(adj_pause(PAGE_RESET_PAUSE_MS))
+    if detail_stream:
+        detail_stream.close()
+        debug_message(f"Streamed {detail_stream.count} detail records to data/{os.path.basename(detail_stream.file_path)}", 63)
+        return
     # Save separate detail file
     try:
         scripts_dir = os.path.dirname(os.path.abspath(__file__))
@@ -681,6 +730,12 @@ def crawl_once(max_items=1):
 
     seen_pages = []
     page_index = 0
+    results_stream = None
+    if STREAM_RESULTS and DEBUG_TO_JSON:
+        session_record = {"type": "session"}
+        if OUTPUT_BASE:
+            session_record.update({k: v for k, v in results.items() if k not in ("pages", "stats")})
+        results_stream = open_results_stream("gump_daily_quests", session_record)
 
     for _ in range(MAX_PAGES):
         if page_index >= max_items:
@@ -702,15 +757,38 @@ def crawl_once(max_items=1):
             page_record["list"] = {"raw": lines}
         results["stats"]["pages_scanned"] += 1
 
-        results["pages"].append(page_record)
+        if results_stream:
+            # Written now and dropped , shaped like save_results would save it
+            if not OUTPUT_BASE and OUTPUT_ITEM:
+                for quest in page_record["quests"] or []:
+                    results_stream.write({"type": "quest", "page": page_index, "quest": quest})
+            else:
+                results_stream.write(dict({"type": "page"}, **page_record))
+        else:
+            results["pages"].append(page_record)
         gid = send_action_and_wait(gid, BUTTON_NEXT)
         if gid == 0:
             break
         page_index += 1
-        pause_ms(adj_pause(PAGE_RESET_PAUSE_MS))
 
+    if results_stream:
+        if OUTPUT_BASE:
+            results_stream.write({"type": "stats", "stats": results["stats"]})
+        results_stream.close()
+        debug_message(f"Streamed {results_stream.count} records to data/{os.path.basename(results_stream.file_path)}", 63)
     return results
 
+def open_results_stream(name_prefix, session_record):
+    """Open data/<name_prefix>_<timestamp>.ndjson ( .json-seq when STREAM_INDENT is set ) and write the session record."""
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.join(os.path.dirname(scripts_dir), 'data')
+    dt = time.strftime('%Y%m%d%H%M%S', time.localtime())
+    filename = f"{name_prefix}_{dt}{JsonRecordWriter.extension(STREAM_INDENT)}"
+    results_stream = JsonRecordWriter(os.path.join(data_dir, filename), indent=STREAM_INDENT)
+    results_stream.write(session_record)
+    debug_message(f"Streaming to data/{filename}", 63)
+    return results_stream
+
 def save_results(results):
     if not DEBUG_TO_JSON:
         return
@@ -746,7 +824,8 @@ def save_results(results):
 
 def main():
     results = crawl_once(MAX_ITEMS_TO_EXTRACT)
-    save_results(results)
+    if not STREAM_RESULTS:
+        save_results(results)
     # Optional pass: open each quest's extra info button per page and capture (screenshots by default)
     if RUN_DETAIL_SCAN:
         try:
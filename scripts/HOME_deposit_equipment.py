@@ -14,9 +14,12 @@ maybe this could try to find a suitable container based on what it finds inside?
 unknown items get sent into what it thinks might be the "misc" container or a designated "unknown" container
 
 HOTKEY::
-VERSION::20250904
+VERSION::20261019
 """
+import time
+
 DEBUG_MODE = False  # Set True to see debug messages
+DEPOSIT_FROM_NESTED_BAGS = False  # Also deposit matching items found inside bags within the backpack
 MOVE_ARMOR = True
 MOVE_SHIELDS = True
 
@@ -169,35 +172,216 @@ def pick_target_container():
 
     return found[TARGET_PRIORITY_INDEX]
 
+#//========================================================================
+# CONTAINER CRAWL
+# Nested containers are walked level by level, unseen sub-containers are opened in batches,
+# and the result is a flat snapshot so later lookups don't re-query the client per bag.
+
+CRAWL_OPEN_UNSEEN_CONTAINERS = True  # Open sub-containers the client has not received contents for yet
+CRAWL_OPEN_BATCH_SIZE = 4  # Sub-containers requested back to back before waiting on their contents
+CRAWL_OPEN_TIMEOUT_MS = 800  # Max wait for a batch of containers to load
+CRAWL_MAX_DEPTH = 8  # Nesting levels to descend below the root container
+# Nested containers are only opened with UseItem when they are plain bags , using a trapped pouch , spellbook or runebook triggers it
+CRAWL_OPEN_CONTAINER_IDS = {
+    0x0E75,  # Backpack
+    0x09B2,  # Backpack
+    0x0E76,  # Bag
+    0x0E79,  # Pouch
+    0x09B0,  # Pouch
+}
+CRAWL_SKIP_OPEN_HUES = {0x0021, 0x0026, 0x002B}  # red hues , trapped pouches and marked salvage bags are never opened
+
+def _is_crawl_container(item):
+    """True if the item is a container worth descending into."""
+    return bool(getattr(item, 'IsContainer', False) or getattr(item, 'Contains', None))
+
+def _is_unseen_container(item):
+    """True if the item is a container whose contents have not been loaded client-side."""
+    if not getattr(item, 'IsContainer', False):
+        return False
+    if getattr(item, 'ContainerOpened', False):
+        return False
+    return not getattr(item, 'Contains', None)
+
+def _is_openable_container(item):
+    """True if a nested container is a known bag or pouch that is safe to open with UseItem."""
+    if int(getattr(item, 'ItemID', -1)) not in CRAWL_OPEN_CONTAINER_IDS:
+        return False
+    return int(getattr(item, 'Hue', 0)) not in CRAWL_SKIP_OPEN_HUES
+
+def _open_containers_batch(containers):
+    """Load the contents of several containers , skipping any an earlier wait already filled in.
+    Items.WaitForContents uses the container itself , so no separate UseItem is sent."""
+    for container in containers:
+        if _is_unseen_container(container):
+            Items.WaitForContents(int(container.Serial), CRAWL_OPEN_TIMEOUT_MS)
+
+def crawl_container(root_serial, skip_container=None, max_depth=CRAWL_MAX_DEPTH, open_unseen=CRAWL_OPEN_UNSEEN_CONTAINERS):
+    """Iteratively walk a container and its nested containers, returning a flat snapshot.
+    Each entry is (item, parent_serial, depth) with depth 0 for direct children of the root,
+    parents always listed before their children. skip_container(item) returning True keeps the
+    container in the snapshot but does not descend into it. A visited set guards against cycles.
+    """
+    snapshot = []
+    root = Items.FindBySerial(int(root_serial))
+    if root is None:
+        return snapshot
+    visited = set([int(root.Serial)])
+    level = [root]
+    depth = 0
+    while level and depth < max_depth:
+        if open_unseen:
+            # The root was chosen by the caller , nested containers must be known bags or pouches
+            unseen = [container for container in level if _is_unseen_container(container) and (depth == 0 or _is_openable_container(container))]
+            for start in range(0, len(unseen), CRAWL_OPEN_BATCH_SIZE):
+                _open_containers_batch(unseen[start:start + CRAWL_OPEN_BATCH_SIZE])
+        next_level = []
+        for container in level:
+            parent_serial = int(container.Serial)
+            for child in list(getattr(container, 'Contains', None) or []):
+                child_serial = int(child.Serial)
+                if child_serial in visited:
+                    continue
+                visited.add(child_serial)
+                snapshot.append((child, parent_serial, depth))
+                if _is_crawl_container(child) and not (skip_container and skip_container(child)):
+                    next_level.append(child)
+        level = next_level
+        depth += 1
+    return snapshot
+
+_CONTAINER_INDEX = {}  # container serial -> {ItemID: [items]} , built from a container crawl and updated after each confirmed move
+
+def get_container_index(container_serial, refresh=False):
+    """Return an ItemID -> items index for a container, crawling it only when no current index is cached."""
+    container_serial = int(container_serial)
+    if refresh or container_serial not in _CONTAINER_INDEX:
+        max_depth = CRAWL_MAX_DEPTH if DEPOSIT_FROM_NESTED_BAGS else 1
+        index = {}
+        for item, parent_serial, depth in crawl_container(container_serial, max_depth=max_depth):
+            index.setdefault(int(item.ItemID), []).append(item)
+        _CONTAINER_INDEX[container_serial] = index
+    return _CONTAINER_INDEX[container_serial]
+
+def update_container_index_after_move(serial, target_serial):
+    """Keep the cached indexes in step with a confirmed move.
+    The target is crawled again on next use , a whole stack that left is dropped from every other index."""
+    serial = int(serial)
+    _CONTAINER_INDEX.pop(int(target_serial), None)
+    item = Items.FindBySerial(serial)
+    if item is not None and int(item.Container) != int(target_serial):
+        return  # part of the stack stayed behind and is still indexed where it is
+    for index in _CONTAINER_INDEX.values():
+        for item_id, items in list(index.items()):
+            index[item_id] = [it for it in items if int(it.Serial) != serial]
+
 def find_all_item_variants(item_id, container_serial):
     """Find all variants (different hues) of an item in a container.
     Returns a list of all item objects with the specified ItemID, regardless of hue.
     """
-    variants = []
-    all_items = Items.FindAllByID(item_id, -1, container_serial, -1)
-    if not all_items:
-        return variants
-    if not isinstance(all_items, list):
-        all_items = [all_items]
-    for it in all_items:
-        if it and it.Container == container_serial:
-            variants.append(it)
-    return variants
+    return list(get_container_index(container_serial).get(int(item_id), []))
+
+#//========================================================================
+# MOVE SCHEDULER
+# Moves are issued as fast as the server accepts them. Pacing tightens after each confirmed
+# move and backs off when the journal reports a throttle ("You must wait ...").
+# A move is confirmed by watching the item leave its source container , not by a fixed sleep.
+
+MOVE_DELAY_START_MS = 600  # pacing between moves before the server has been measured , the fixed spacing this replaced
+MOVE_DELAY_MIN_MS = 500  # fastest pacing the scheduler will try , servers commonly allow one item lift per ~500 ms and faster only earns throttle retries
+MOVE_DELAY_MAX_MS = 1500  # slowest pacing after repeated throttling
+MOVE_CONFIRM_TIMEOUT_MS = 1200  # how long to watch for the item to leave its container
+MOVE_CONFIRM_POLL_MS = 25
+MOVE_MAX_RETRIES = 2
+MOVE_THROTTLE_PATTERNS = ['you must wait', 'too many', 'too fast']
+
+class MoveScheduler:
+    """Item moves with adaptive pacing and container-change confirmation."""
+    def __init__(self):
+        self.delay_ms = MOVE_DELAY_START_MS
+        self.last_move_time = 0.0
+        self.stats = {'moved': 0, 'failed': 0, 'throttled': 0}
+
+    def move(self, serial, target_serial, amount=0):
+        """Move one item now (retrying on throttle or timeout) and return True once the server has applied it.
+        amount 0 moves the whole stack."""
+        serial = int(serial)
+        for attempt in range(MOVE_MAX_RETRIES + 1):
+            item = Items.FindBySerial(serial)
+            if attempt and self._arrived(item, target_serial, amount_before):
+                # The previous move was applied after its confirmation window , sending it again would move more
+                self.stats['moved'] += 1
+                return True
+            if item is None:
+                return False
+            source_container = int(item.Container)
+            amount_before = int(getattr(item, 'Amount', 1) or 1)
+
+            # The pacing window counts from the last move , so time spent confirming is not slept again
+            elapsed_ms = (time.time() - self.last_move_time) * 1000.0
+            if elapsed_ms < self.delay_ms:
+                Misc.Pause(int(self.delay_ms - elapsed_ms))
+            issued_at = time.time()
+            self.last_move_time = issued_at
+            try:
+                Items.Move(serial, int(target_serial), int(amount))
+            except Exception:
+                self.stats['failed'] += 1
+                return False
+
+            result = self._confirm(serial, source_container, amount_before, issued_at)
+            if result == 'moved':
+                self.stats['moved'] += 1
+                self.delay_ms = max(MOVE_DELAY_MIN_MS, int(self.delay_ms * 0.85))
+                return True
+            if result == 'throttled':
+                self.stats['throttled'] += 1
+            self.delay_ms = min(MOVE_DELAY_MAX_MS, self.delay_ms * 2)
+        self.stats['failed'] += 1
+        return False
+
+    def _confirm(self, serial, source_container, amount_before, issued_at):
+        """Watch the item until it changes container , merges away or its stack shrinks.
+        Returns 'moved' , 'throttled' or 'timeout'."""
+        deadline = issued_at + MOVE_CONFIRM_TIMEOUT_MS / 1000.0
+        while time.time() < deadline:
+            item = Items.FindBySerial(serial)
+            if item is None or int(item.Container) != source_container or int(getattr(item, 'Amount', 1) or 1) < amount_before:
+                return 'moved'
+            if self._throttled_since(issued_at):
+                return 'throttled'
+            Misc.Pause(MOVE_CONFIRM_POLL_MS)
+        return 'timeout'
+
+    def _arrived(self, item, target_serial, amount_before):
+        """True if an earlier move already landed , the item merged away , sits in the target or its stack shrank."""
+        if item is None or int(item.Container) == int(target_serial):
+            return True
+        return int(getattr(item, 'Amount', 1) or 1) < amount_before
+
+    def _throttled_since(self, since):
+        try:
+            for entry in Journal.GetJournalEntry(since) or []:
+                text = str(getattr(entry, 'Text', entry)).lower()
+                if any(pattern in text for pattern in MOVE_THROTTLE_PATTERNS):
+                    return True
+        except Exception:
+            pass
+        return False
+
+_MOVER = MoveScheduler()
 
 def move_item_stack_safe(item_obj, target_container_serial, amount):
-    """Move a specific amount from a stack to target container, with pauses and basic retry prevention.
-    After move, waits and returns True if action attempted.
+    """Move a specific amount from a stack to target container through the move scheduler.
+    Returns True once the server has applied the move.
     """
     if not item_obj or amount <= 0:
         return False
-    try:
-        Items.Move(item_obj, target_container_serial, amount)
-        Misc.Pause(600)
+    if _MOVER.move(item_obj.Serial, target_container_serial, amount):
+        update_container_index_after_move(item_obj.Serial, target_container_serial)
         return True
-    except Exception as e:
-        debug_message(f"Move error for {hex(item_obj.ItemID)}: {e}", 33)
-        Misc.Pause(300)
-        return False
+    debug_message(f"Move not confirmed for {hex(item_obj.ItemID)}", 33)
+    return False
 
 def deposit_all_matching(item_info, target_container):
     """Deposit all instances of an item from backpack into target container.
@@ -207,11 +391,9 @@ def deposit_all_matching(item_info, target_container):
     hue = item_info.get("hue", None)
 
     if hue is not None:
-        items = Items.FindByID(item_id, hue, Player.Backpack.Serial)
+        items = [it for it in find_all_item_variants(item_id, Player.Backpack.Serial) if int(it.Hue) == int(hue)]
         if not items:
             return 0
-        if not isinstance(items, list):
-            items = [items]
         moved_total = 0
         for it in items:
             amt = it.Amount if hasattr(it, "Amount") else 1
@@ -21,9 +21,11 @@ Requirements:
 ** WARNING item properties are clipped to 4, this script may miss important properties if they are listed last **
 
 HOTKEY:: O
-VERSION::20250918
+VERSION::20261019
 """
 
+import time
+
 DEBUG_MODE = False  # Set to True to enable debug/info messages
 
 SALVAGE_JUNK_ITEMS = True      # Set to False to skip the salvaging , only moving in tot he junk container
@@ -140,6 +142,7 @@ MIN_WEAPON_TIER = 2  # 1=Vanquishing/Greater only, 2=Power+, 3=Force+, 4=Might+,
 # Junk Backpack Configuration
 JUNK_BACKPACK_ID = 0x0E75 # a backpack 
 JUNK_BACKPACK_HUES = [0x0021, 0x0026, 0x002B]  # Range of red hues that are acceptable
+JUNK_BACKPACK_HUE_SET = frozenset(int(h) for h in JUNK_BACKPACK_HUES)  # built once for per-item checks
 JUNK_BACKPACK_SERIAL = 0  # Will be auto-set by find_junk_backpack()
 
 # Arcane Dust
@@ -406,7 +409,6 @@ ITEM_SLOTS = ['head', 'neck', 'body', 'legs', 'arms', 'hand', 'weapon1h', 'weapo
 # TODO: have equip_slot be apart of the item dicts properties 
 
 # Timing Configuration
-MOVE_DELAY = 1000      # Delay moving items (in milliseconds) , depends on server and object delay , 600 works but we are being safe
 SCAN_DELAY = 100       # Delay scanning items (in milliseconds) , this is done to not freeze the rendering 
 
 # Salvage Tool Configuration 0x1EBC
@@ -417,6 +419,177 @@ SALVAGE_TOOLS = {
 }
 
 #//========================================================================================
+# CONTAINER CRAWL
+# Nested containers are walked level by level, unseen sub-containers are opened in batches,
+# and the result is a flat snapshot so later lookups don't re-query the client per bag.
+
+CRAWL_OPEN_UNSEEN_CONTAINERS = True  # Open sub-containers the client has not received contents for yet
+CRAWL_OPEN_BATCH_SIZE = 4  # Sub-containers requested back to back before waiting on their contents
+CRAWL_OPEN_TIMEOUT_MS = 800  # Max wait for a batch of containers to load
+CRAWL_MAX_DEPTH = 8  # Nesting levels to descend below the root container
+# Nested containers are only opened with UseItem when they are plain bags , using a trapped pouch , spellbook or runebook triggers it
+CRAWL_OPEN_CONTAINER_IDS = {
+    0x0E75,  # Backpack
+    0x09B2,  # Backpack
+    0x0E76,  # Bag
+    0x0E79,  # Pouch
+    0x09B0,  # Pouch
+}
+CRAWL_SKIP_OPEN_HUES = {0x0021, 0x0026, 0x002B}  # red hues , trapped pouches and marked salvage bags are never opened
+
+def _is_crawl_container(item):
+    """True if the item is a container worth descending into."""
+    return bool(getattr(item, 'IsContainer', False) or getattr(item, 'Contains', None))
+
+def _is_unseen_container(item):
+    """True if the item is a container whose contents have not been loaded client-side."""
+    if not getattr(item, 'IsContainer', False):
+        return False
+    if getattr(item, 'ContainerOpened', False):
+        return False
+    return not getattr(item, 'Contains', None)
+
+def _is_openable_container(item):
+    """True if a nested container is a known bag or pouch that is safe to open with UseItem."""
+    if int(getattr(item, 'ItemID', -1)) not in CRAWL_OPEN_CONTAINER_IDS:
+        return False
+    return int(getattr(item, 'Hue', 0)) not in CRAWL_SKIP_OPEN_HUES
+
+def _open_containers_batch(containers):
+    """Load the contents of several containers , skipping any an earlier wait already filled in.
+    Items.WaitForContents uses the container itself , so no separate UseItem is sent."""
+    for container in containers:
+        if _is_unseen_container(container):
+            Items.WaitForContents(int(container.Serial), CRAWL_OPEN_TIMEOUT_MS)
+
+def crawl_container(root_serial, skip_container=None, max_depth=CRAWL_MAX_DEPTH, open_unseen=CRAWL_OPEN_UNSEEN_CONTAINERS):
+    """Iteratively walk a container and its nested containers, returning a flat snapshot.
+    Each entry is (item, parent_serial, depth) with depth 0 for direct children of the root,
+    parents always listed before their children. skip_container(item) returning True keeps the
+    container in the snapshot but does not descend into it. A visited set guards against cycles.
+    """
+    snapshot = []
+    root = Items.FindBySerial(int(root_serial))
+    if root is None:
+        return snapshot
+    visited = set([int(root.Serial)])
+    level = [root]
+    depth = 0
+    while level and depth < max_depth:
+        if open_unseen:
+            # The root was chosen by the caller , nested containers must be known bags or pouches
+            unseen = [container for container in level if _is_unseen_container(container) and (depth == 0 or _is_openable_container(container))]
+            for start in range(0, len(unseen), CRAWL_OPEN_BATCH_SIZE):
+                _open_containers_batch(unseen[start:start + CRAWL_OPEN_BATCH_SIZE])
+        next_level = []
+        for container in level:
+            parent_serial = int(container.Serial)
+            for child in list(getattr(container, 'Contains', None) or []):
+                child_serial = int(child.Serial)
+                if child_serial in visited:
+                    continue
+                visited.add(child_serial)
+                snapshot.append((child, parent_serial, depth))
+                if _is_crawl_container(child) and not (skip_container and skip_container(child)):
+                    next_level.append(child)
+        level = next_level
+        depth += 1
+    return snapshot
+
+def is_junk_backpack(item):
+    """True if the item matches the junk backpack signature (ItemID and red hue)."""
+    return int(getattr(item, 'ItemID', -1)) == int(JUNK_BACKPACK_ID) and int(getattr(item, 'Hue', -1)) in JUNK_BACKPACK_HUE_SET
+
+#//========================================================================================
+# MOVE SCHEDULER
+# Moves are issued as fast as the server accepts them. Pacing tightens after each confirmed
+# move and backs off when the journal reports a throttle ("You must wait ...").
+# A move is confirmed by watching the item leave its source container , not by a fixed sleep.
+
+MOVE_DELAY_START_MS = 600  # pacing between moves before the server has been measured , the fixed spacing this replaced
+MOVE_DELAY_MIN_MS = 500  # fastest pacing the scheduler will try , servers commonly allow one item lift per ~500 ms and faster only earns throttle retries
+MOVE_DELAY_MAX_MS = 1500  # slowest pacing after repeated throttling
+MOVE_CONFIRM_TIMEOUT_MS = 1200  # how long to watch for the item to leave its container
+MOVE_CONFIRM_POLL_MS = 25
+MOVE_MAX_RETRIES = 2
+MOVE_THROTTLE_PATTERNS = ['you must wait', 'too many', 'too fast']
+
+class MoveScheduler:
+    """Item moves with adaptive pacing and container-change confirmation."""
+    def __init__(self):
+        self.delay_ms = MOVE_DELAY_START_MS
+        self.last_move_time = 0.0
+        self.stats = {'moved': 0, 'failed': 0, 'throttled': 0}
+
+    def move(self, serial, target_serial, amount=0):
+        """Move one item now (retrying on throttle or timeout) and return True once the server has applied it.
+        amount 0 moves the whole stack."""
+        serial = int(serial)
+        for attempt in range(MOVE_MAX_RETRIES + 1):
+            item = Items.FindBySerial(serial)
+            if attempt and self._arrived(item, target_serial, amount_before):
+                # The previous move was applied after its confirmation window , sending it again would move more
+                self.stats['moved'] += 1
+                return True
+            if item is None:
+                return False
+            source_container = int(item.Container)
+            amount_before = int(getattr(item, 'Amount', 1) or 1)
+
+            # The pacing window counts from the last move , so time spent confirming is not slept again
+            elapsed_ms = (time.time() - self.last_move_time) * 1000.0
+            if elapsed_ms < self.delay_ms:
+                Misc.Pause(int(self.delay_ms - elapsed_ms))
+            issued_at = time.time()
+            self.last_move_time = issued_at
+            try:
+                Items.Move(serial, int(target_serial), int(amount))
+            except Exception:
+                self.stats['failed'] += 1
+                return False
+
+            result = self._confirm(serial, source_container, amount_before, issued_at)
+            if result == 'moved':
+                self.stats['moved'] += 1
+                self.delay_ms = max(MOVE_DELAY_MIN_MS, int(self.delay_ms * 0.85))
+                return True
+            if result == 'throttled':
+                self.stats['throttled'] += 1
+            self.delay_ms = min(MOVE_DELAY_MAX_MS, self.delay_ms * 2)
+        self.stats['failed'] += 1
+        return False
+
+    def _confirm(self, serial, source_container, amount_before, issued_at):
+        """Watch the item until it changes container , merges away or its stack shrinks.
+        Returns 'moved' , 'throttled' or 'timeout'."""
+        deadline = issued_at + MOVE_CONFIRM_TIMEOUT_MS / 1000.0
+        while time.time() < deadline:
+            item = Items.FindBySerial(serial)
+            if item is None or int(item.Container) != source_container or int(getattr(item, 'Amount', 1) or 1) < amount_before:
+                return 'moved'
+            if self._throttled_since(issued_at):
+                return 'throttled'
+            Misc.Pause(MOVE_CONFIRM_POLL_MS)
+        return 'timeout'
+
+    def _arrived(self, item, target_serial, amount_before):
+        """True if an earlier move already landed , the item merged away , sits in the target or its stack shrank."""
+        if item is None or int(item.Container) == int(target_serial):
+            return True
+        return int(getattr(item, 'Amount', 1) or 1) < amount_before
+
+    def _throttled_since(self, since):
+        try:
+            for entry in Journal.GetJournalEntry(since) or []:
+                text = str(getattr(entry, 'Text', entry)).lower()
+                if any(pattern in text for pattern in MOVE_THROTTLE_PATTERNS):
+                    return True
+        except Exception:
+            pass
+        return False
+
+#//========================================================================================
+
 class JunkSalvager:
     def __init__(self):
         # Debug colors
@@ -442,6 +615,12 @@ class JunkSalvager:
             'subtype_saved': 0
         }
         
+        # Cached container crawls keyed by (root serial, skipped serials)
+        self._container_snapshots = {}
+
+        # Paced, confirmed moves into the junk backpack
+        self.mover = MoveScheduler()
+
         # Show current configuration
         self.show_config()
 
@@ -462,7 +641,7 @@ class JunkSalvager:
         self.debug_message(f"Min weapon tier: {MIN_WEAPON_TIER} (1=Vanq/Greater, 2=Power+, 3=Force+, 4=Might+, 5=Ruin+)", self.colors['config'])
         self.debug_message(f"Min score threshold: {MIN_SCORE_THRESHOLD}", self.colors['config'])
         self.debug_message(f"Save one basic dagger: {'Yes' if SAVE_ONE_DAGGER else 'No'}", self.colors['config'])
-        self.debug_message(f"Move delay: {str(MOVE_DELAY)}ms", self.colors['config'])
+        self.debug_message(f"Move pacing: {MOVE_DELAY_MIN_MS}-{MOVE_DELAY_MAX_MS}ms (adaptive)", self.colors['config'])
         self.debug_message(f"Auto-salvage: {'Yes' if SALVAGE_JUNK_ITEMS else 'No'}", self.colors['config'])
         self.debug_message(f"Junk backpack serial: 0x{JUNK_BACKPACK_SERIAL:X}", self.colors['config'])
         self.debug_message("==================", self.colors['config'])
@@ -475,33 +654,30 @@ class JunkSalvager:
 
     def _iter_container_items_recursive(self, container_serial, skip_serials=None):
         """Yield items within a container recursively, skipping any containers in skip_serials.
-        Also skips any container that matches the configured junk backpack ID/hues (defensive)."""
+        Also skips any container that matches the configured junk backpack ID/hues (defensive).
+        The crawl snapshot is cached until invalidate_container_snapshot() is called after a move."""
         try:
-            skip_serials = skip_serials or set()
-            container = Items.FindBySerial(int(container_serial))
-            if not container:
+            skip_serials = frozenset(int(s) for s in (skip_serials or ()))
+            root = Items.FindBySerial(int(container_serial))
+            if not root or int(root.Serial) in skip_serials or is_junk_backpack(root):
                 return
-            # Skip explicit serials or any container that matches junk bag signature
-            if container.Serial in skip_serials or (
-                int(getattr(container, 'ItemID', -1)) == int(JUNK_BACKPACK_ID) and int(getattr(container, 'Hue', -1)) in [int(h) for h in JUNK_BACKPACK_HUES]
-            ):
-                return
-            children = getattr(container, 'Contains', None)
-            if not children:
-                return
-            for child in children:
-                yield child
-                # If child is a container, recurse
-                if getattr(child, 'Contains', None):
-                    # Avoid recursing into explicitly skipped containers or junk-bag lookalikes
-                    if child.Serial not in skip_serials and not (
-                        int(getattr(child, 'ItemID', -1)) == int(JUNK_BACKPACK_ID) and int(getattr(child, 'Hue', -1)) in [int(h) for h in JUNK_BACKPACK_HUES]
-                    ):
-                        for sub in self._iter_container_items_recursive(child.Serial, skip_serials):
-                            yield sub
+            cache_key = (int(container_serial), skip_serials)
+            snapshot = self._container_snapshots.get(cache_key)
+            if snapshot is None:
+                snapshot = crawl_container(
+                    container_serial,
+                    skip_container=lambda child: int(child.Serial) in skip_serials or is_junk_backpack(child),
+                )
+                self._container_snapshots[cache_key] = snapshot
+            for item, parent_serial, depth in snapshot:
+                yield item
         except Exception as e:
             self.debug_message(f"Error iterating container 0x{int(container_serial):X}: {str(e)}", 'warning')
 
+    def invalidate_container_snapshot(self):
+        """Drop cached container crawls, call after moving items between containers."""
+        self._container_snapshots = {}
+
     def _is_basic_dagger(self, item):
         """Return True if item is a basic dagger (0x0F52) with no magical properties"""
         try:
@@ -943,9 +1119,12 @@ class JunkSalvager:
             self.stats['items_checked'] += 1
             
             if self.should_move_to_junk(item):
-                Items.Move(item, junk_backpack, 0)
-                self.stats['items_moved'] += 1
-                Misc.Pause(MOVE_DELAY)
+                # moved one at a time so the next should_move_to_junk sees the updated backpack
+                if self.mover.move(item.Serial, junk_backpack.Serial, 0):
+                    self.stats['items_moved'] += 1
+                else:
+                    self.debug_message(f"Move not confirmed: {item.Name}", 'warning')
+                self.invalidate_container_snapshot()
                 
         self.show_stats()
         return True
@@ -7,16 +7,23 @@ for each a corresponding image of the approximate objective and "preferred" rewa
 Navigates the quest gump that displays the status and progress of daily quests,
 reads the information to present a combined list.
 
-Uses server-synced timing via Items.GetLabel() instead of delay
+Uses server-synced timing via Items.GetLabel() instead of delay ,
+page turns wait for the gump content to change rather than a fixed time .
+Each page is saved to a daily snapshot , later refreshes only revisit pages that still have unfinished quests
+Rendered rows are cached for the client session , a refresh only renders rows whose quest changed
 
 TROUBLESHOOTING:
 - if "import" errors , download iron python 3.4.2 and copy the files in its "Lib" folder into your RazorEnhanced "Lib" folder 
 
 STATUS:: WIP
-VERSION:: 20251014
+VERSION:: 20261019
 """
 
+import hashlib
+import json
+import os
 import re # regex , regular expressions to parse the quest info
+import time
 from System.Collections.Generic import List
 
 DEBUG_MODE = False
@@ -213,8 +220,31 @@ MAX_PAGE_1_RETRIES = 5  # Maximum times to retry page 1
 WAIT_GUMP_MS = 3000
 LOOP_PAUSE_MS = 100
 JITTER_MS = 50
-GUMP_WAIT_AFTER_BUTTON = 3000  # Wait for gump to update after button click using WaitForGump
-COMMAND_DELAY = 1200  # Delay before sending button command 
+GUMP_WAIT_AFTER_BUTTON = 3000  # Longest wait for the page to change after a button press , shrinks to the learned latency
+
+# Gump change detection , waits end as soon as the gump content changes and holds still
+GUMP_SETTLE_MS = 150  # content must stay unchanged this long after a change
+GUMP_POLL_MS = 40  # interval between gump content checks
+GUMP_TIMEOUT_MIN_MS = 800  # learned timeouts never drop below this
+GUMP_LATENCY_TIMEOUT_FACTOR = 4  # learned timeout = typical change latency x factor + settle
+
+# Text command pacing , one token bucket in Misc shared values paces "[" commands from every running script
+TEXT_COMMAND_INTERVAL_MS = 800  # starting spacing between text commands across all scripts
+TEXT_COMMAND_INTERVAL_MIN_MS = 250  # learned spacing never drops below this
+TEXT_COMMAND_INTERVAL_MAX_MS = 4000  # learned spacing never rises above this
+TEXT_COMMAND_BURST = 2  # commands allowed back to back before the spacing applies
+TEXT_COMMAND_BACKOFF = 1.5  # spacing multiplier after a throttle warning in the journal
+TEXT_COMMAND_RECOVERY_MS = 20  # spacing reduction after each command without a warning
+TEXT_COMMAND_WARNING_WINDOW_MS = 600  # how long after a command its throttle warning can still arrive
+TEXT_COMMAND_GUMP_CONFLICT_MS = 1500  # longest wait for an earlier command's same response gump before sending
+TEXT_COMMAND_POLL_MS = 50
+TEXT_COMMAND_WARNING_PATTERNS = [
+    'too many',
+    'too quickly',
+    'too fast',
+    'must wait',
+    'you have to wait',
+]
 
 # Custom gump output results 
 # example max  =  4294967295 #  a high pseudo-random gump id to avoid other existing gump ids
@@ -224,8 +254,19 @@ DISPLAY_Y = 100
 DISPLAY_WIDTH = 402
 DISPLAY_HEIGHT = 700
 
+# HUD render cache , rows rendered once per ( name , progress , difficulty , color scheme ) and reused across refreshes
+HUD_RENDER_CACHE_ENABLED = True
+HUD_RENDER_CACHE_SHARED = "quest_daily_hud_render"  # Misc shared value holding the cache between runs
+HUD_RENDER_CACHE_MAX_ROWS = 400  # cached rows are dropped when the cache grows past this
+
 MAX_PAGES = 15  # Set higher than expected 11 pages for future quests added
 
+# Snapshot of the last crawl , refreshes read page 1 and then only the pages with unfinished quests
+QUEST_SNAPSHOT_ENABLED = True
+QUEST_SNAPSHOT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "quest_daily_snapshot.json")
+QUEST_SNAPSHOT_FORMAT_VERSION = 1
+QUEST_DAY_RESET_HOUR_UTC = 0  # hour (UTC) the server resets daily quests , a snapshot from an earlier quest day is discarded
+
 # Colors for gump display
 COLORS = {
     'title': 68,       # blue
@@ -326,13 +367,237 @@ def pause_ms(ms):
     except Exception:
         Misc.Pause(int(ms))
 
+class GumpWatcher:
+    """Waits for gump content to change instead of sleeping a fixed time.
+    A gump fingerprint covers its id , text lines and raw layout. A wait returns once the fingerprint
+    differs from the baseline and then holds for GUMP_SETTLE_MS. Each change observed after an action updates a
+    running server latency estimate , later action waits time out after a few multiples of it instead of the full maximum."""
+
+    def __init__(self):
+        self.latency_ms = None  # running average of action -> first content change
+
+    def read(self, gump_id=0):
+        """Return (fingerprint, lines) for gump_id , 0 reads the current gump. fingerprint is None when nothing is readable."""
+        try:
+            if not gump_id:
+                gump_id = Gumps.CurrentGump()
+            if not gump_id:
+                return None, []
+            lines = [str(ln).strip() for ln in (Gumps.GetLineList(gump_id, True) or [])]
+            try:
+                layout = str(Gumps.GetGumpRawLayout(gump_id) or "")
+            except Exception:
+                layout = ""
+            if not lines and not layout:
+                return None, []
+            return hash((gump_id, tuple(lines), layout)), lines
+        except Exception:
+            return None, []
+
+    def timeout_ms(self, max_ms):
+        """Learned timeout , never above max_ms and never below GUMP_TIMEOUT_MIN_MS."""
+        if self.latency_ms is None:
+            return int(max_ms)
+        learned = self.latency_ms * GUMP_LATENCY_TIMEOUT_FACTOR + GUMP_SETTLE_MS
+        return int(min(max_ms, max(GUMP_TIMEOUT_MIN_MS, learned)))
+
+    def learn(self, elapsed_ms):
+        if self.latency_ms is None:
+            self.latency_ms = float(elapsed_ms)
+        else:
+            self.latency_ms = self.latency_ms * 0.75 + float(elapsed_ms) * 0.25
+
+    def wait_for_change(self, baseline, gump_id=0, max_ms=3000):
+        """Wait until the fingerprint of gump_id differs from baseline and holds for GUMP_SETTLE_MS.
+        baseline None waits for any readable content. Returns (changed, lines) , on timeout the last lines read.
+        Only waits after an action ( a real baseline ) teach the latency and use the learned timeout ,
+        a gump that is already readable would otherwise teach a latency of ~0 ms."""
+        start = int(time.time() * 1000)
+        learning = baseline is not None
+        timeout = self.timeout_ms(max_ms) if learning else int(max_ms)
+        candidate = None
+        candidate_since = 0
+        lines = []
+        while True:
+            now = int(time.time() * 1000)
+            fingerprint, current_lines = self.read(gump_id)
+            if current_lines:
+                lines = current_lines
+            if fingerprint is not None and fingerprint != baseline:
+                if candidate is None and learning:
+                    self.learn(now - start)
+                if fingerprint != candidate:
+                    candidate = fingerprint
+                    candidate_since = now
+                elif now - candidate_since >= GUMP_SETTLE_MS:
+                    return True, current_lines
+            if now - start >= timeout:
+                if candidate is None and learning:
+                    # a miss widens later timeouts
+                    self.learn(timeout)
+                return candidate is not None, lines
+            Misc.Pause(GUMP_POLL_MS)
+
+_GUMP_WATCHER = GumpWatcher()
+
+# shared value keys , identical in every script using TextCommandQueue
+TEXT_COMMAND_SHARED_NEXT = "text_command_next_ms"  # token bucket theoretical send time
+TEXT_COMMAND_SHARED_INTERVAL = "text_command_interval_ms"  # learned spacing
+TEXT_COMMAND_SHARED_FLOOR = "text_command_floor_ms"  # spacing that once drew a warning , plus a margin
+TEXT_COMMAND_SHARED_BURST = "text_command_burst"  # learned burst , drops to 1 when a burst draws a warning
+TEXT_COMMAND_SHARED_HANDLED = "text_command_handled"  # journal time up to which warnings were already acted on
+TEXT_COMMAND_SHARED_GUMP = "text_command_gump"  # "gump_id|deadline_ms" of the last command awaiting a gump
+
+class TextCommandQueue:
+    """Paces "[" text commands across every running script instead of fixed per-script delays.
+    The token bucket ( next send time plus learned spacing ) lives in Misc shared values , so quest and
+    UI scripts running together queue behind each other. A throttle warning in the journal first drops the burst
+    to single commands , later warnings widen the spacing and set a floor it never narrows below again ,
+    clean commands narrow it slowly.
+    Sending does not wait on the journal , a command's warning check runs when the next one is queued.
+    The last command of a batch has no next one , flush() waits out its warning window and checks it.
+    A command answering with a gump waits while an earlier command's same gump is still pending ,
+    commands with distinct response gumps or none pipeline."""
+
+    def __init__(self, source):
+        self.source = source  # message prefix
+        self.pending_since = None  # journal time of the oldest command not yet checked for warnings
+        self.last_sent_at = 0.0  # time the newest command was said
+
+    def _read(self, key, default):
+        try:
+            if Misc.CheckSharedValue(key):
+                return Misc.ReadSharedValue(key)
+        except Exception:
+            pass
+        return default
+
+    def _write(self, key, value):
+        try:
+            Misc.SetSharedValue(key, value)
+        except Exception:
+            pass
+
+    def interval_ms(self):
+        interval = float(self._read(TEXT_COMMAND_SHARED_INTERVAL, TEXT_COMMAND_INTERVAL_MS))
+        floor = float(self._read(TEXT_COMMAND_SHARED_FLOOR, TEXT_COMMAND_INTERVAL_MIN_MS))
+        return min(TEXT_COMMAND_INTERVAL_MAX_MS, max(TEXT_COMMAND_INTERVAL_MIN_MS, floor, interval))
+
+    def burst(self):
+        return max(1, int(self._read(TEXT_COMMAND_SHARED_BURST, TEXT_COMMAND_BURST)))
+
+    def check_warnings(self):
+        """Scan the journal since the oldest unchecked command and tune the shared spacing. Returns the warning line or None."""
+        if self.pending_since is None:
+            return None
+        # the journal is shared , skip warnings another script already acted on
+        since = max(self.pending_since, float(self._read(TEXT_COMMAND_SHARED_HANDLED, 0)))
+        warning_line = None
+        try:
+            for entry in Journal.GetJournalEntry(since) or []:
+                text = str(getattr(entry, 'Text', entry))
+                low = text.lower()
+                if any(pattern in low for pattern in TEXT_COMMAND_WARNING_PATTERNS):
+                    warning_line = text
+                    break
+        except Exception:
+            pass
+        interval = self.interval_ms()
+        if warning_line:
+            self.pending_since = None
+            now = int(time.time() * 1000)
+            self._write(TEXT_COMMAND_SHARED_HANDLED, time.time())
+            if self.burst() > 1:
+                # the server counts bursts , keep the spacing and send one at a time
+                self._write(TEXT_COMMAND_SHARED_BURST, 1)
+            else:
+                # the server limit sits above the current spacing , never probe below it again
+                self._write(TEXT_COMMAND_SHARED_FLOOR, min(TEXT_COMMAND_INTERVAL_MAX_MS, interval + TEXT_COMMAND_RECOVERY_MS * 5))
+                interval = min(TEXT_COMMAND_INTERVAL_MAX_MS, interval * TEXT_COMMAND_BACKOFF)
+                self._write(TEXT_COMMAND_SHARED_INTERVAL, interval)
+            self._write(TEXT_COMMAND_SHARED_NEXT, now + int(interval))
+            try:
+                Misc.SendMessage(f"[{self.source}] Command throttled , spacing now {int(interval)}ms: {warning_line}", 53)
+            except Exception:
+                print(f"[{self.source}] Command throttled , spacing now {int(interval)}ms: {warning_line}")
+        elif (time.time() - self.pending_since) * 1000 >= TEXT_COMMAND_WARNING_WINDOW_MS:
+            # a late warning can no longer arrive , count it clean
+            self.pending_since = None
+            self._write(TEXT_COMMAND_SHARED_INTERVAL, max(TEXT_COMMAND_INTERVAL_MIN_MS, interval - TEXT_COMMAND_RECOVERY_MS))
+        return warning_line
+
+    def _wait_for_pending_gump(self, response_gump_id):
+        """Wait while an earlier command answered by the same gump has not opened it yet , bounded by its deadline."""
+        pending = str(self._read(TEXT_COMMAND_SHARED_GUMP, "") or "")
+        if "|" not in pending:
+            return
+        try:
+            gump_id, deadline = [int(part) for part in pending.split("|", 1)]
+        except ValueError:
+            return
+        if gump_id != int(response_gump_id):
+            return
+        while int(time.time() * 1000) < deadline:
+            try:
+                if Gumps.HasGump(gump_id):
+                    return
+            except Exception:
+                return
+            Misc.Pause(TEXT_COMMAND_POLL_MS)
+
+    def send(self, command_text, response_gump_id=None):
+        """Queue command_text behind earlier commands from any script , then send it.
+        response_gump_id marks a command answered by that gump , a later command for the same gump waits for it to open.
+        Returns False when the command could not be said."""
+        if response_gump_id:
+            self._wait_for_pending_gump(response_gump_id)
+        while True:
+            self.check_warnings()
+            handled = self._read(TEXT_COMMAND_SHARED_HANDLED, 0)
+            # token bucket as a theoretical send time , reserve the slot before sleeping so other scripts queue behind it
+            now = int(time.time() * 1000)
+            interval = self.interval_ms()
+            next_ms = int(self._read(TEXT_COMMAND_SHARED_NEXT, 0))
+            slot = max(now, next_ms - int(interval * (self.burst() - 1)))
+            self._write(TEXT_COMMAND_SHARED_NEXT, int(max(next_ms, slot) + interval))
+            if slot <= now:
+                break
+            Misc.Pause(int(slot - now))
+            # a warning handled while waiting moved the bucket , queue again behind it
+            self.check_warnings()
+            if self._read(TEXT_COMMAND_SHARED_HANDLED, 0) == handled:
+                break
+        if response_gump_id:
+            self._write(TEXT_COMMAND_SHARED_GUMP, f"{int(response_gump_id)}|{int(time.time() * 1000) + TEXT_COMMAND_GUMP_CONFLICT_MS}")
+        if self.pending_since is None:
+            self.pending_since = time.time()
+        try:
+            Player.ChatSay(0, command_text)
+        except Exception:
+            return False
+        self.last_sent_at = time.time()
+        return True
+
+    def flush(self):
+        """Wait until the newest command's warning can no longer arrive , then check the journal once more.
+        Call it after the last command of a batch. Returns the warning line or None."""
+        if self.pending_since is None:
+            return None
+        remaining_ms = TEXT_COMMAND_WARNING_WINDOW_MS - (time.time() - self.last_sent_at) * 1000
+        if remaining_ms > 0:
+            Misc.Pause(int(remaining_ms))
+        return self.check_warnings()
+
+_TEXT_COMMANDS = TextCommandQueue("QuestProgress")
+
 def wait_for_quest_gump(timeout_ms=WAIT_GUMP_MS):
     """Wait for the specific quest gump ID to appear using WaitForGump."""
     try:
         # Use Gumps.WaitForGump to wait for the specific quest gump
         result = Gumps.WaitForGump(QUEST_GUMP_ID, timeout_ms)
         if result:
-            pause_ms(200)  # Small stabilization delay
+            # Return once the content is readable and holding still
+            _GUMP_WATCHER.wait_for_change(None, QUEST_GUMP_ID, timeout_ms)
             return True
         return False
     except Exception as e:
@@ -351,6 +616,14 @@ def ensure_gump_open(allow_reopen=True):
     # Just assume gump is open - if it's really closed, GetLineList will fail
     return True
 
+def press_quest_button(button_id, max_ms=GUMP_WAIT_AFTER_BUTTON):
+    """Press a quest gump button and wait until the page content changes and settles.
+    Returns False when the page did not change in time , usually because the gump closed."""
+    baseline, _ = _GUMP_WATCHER.read(QUEST_GUMP_ID)
+    Gumps.SendAction(QUEST_GUMP_ID, button_id)
+    changed, _ = _GUMP_WATCHER.wait_for_change(baseline, QUEST_GUMP_ID, max_ms)
+    return changed
+
 def skip_to_page(target_page, current_page=1, max_attempts=20):
     """Quickly skip ahead to a target page by pressing NEXT multiple times with server sync.
     BLIND NAVIGATION - just presses NEXT repeatedly without reading pages.
@@ -366,18 +639,9 @@ def skip_to_page(target_page, current_page=1, max_attempts=20):
     # Press NEXT button the required number of times using reliable pattern
     for i in range(min(pages_to_skip, max_attempts)):
         try:
-            # Double server sync before button press to avoid command spam
-            server_sync_delay()
-            server_sync_delay()
-            
-            Gumps.SendAction(QUEST_GUMP_ID, BUTTON_NEXT)
-            
-            if not Gumps.WaitForGump(QUEST_GUMP_ID, 10000):
+            if not press_quest_button(BUTTON_NEXT):
                 debug_message(f"Gump closed during skip ahead at press {i+1}", COLORS['bad'])
                 return False
-            
-            # Single sync after gump response
-            server_sync_delay()
         except Exception as e:
             debug_message(f"Error during skip ahead at press {i+1}: {e}", COLORS['bad'])
             return False
@@ -394,9 +658,7 @@ def snap_text_lines():
     try:
         debug_message(f"snap_text_lines: Reading from quest gump {hex(QUEST_GUMP_ID)}", 115, 2)
         
-        # Server-sync before first read
-        server_sync_delay()
-        
+        # First read is direct , page turns already waited for the content to settle
         # Try multiple times with server-synced retries
         for attempt in range(3):  # Reduced from 5 since server sync is more reliable
             try:
@@ -462,12 +724,8 @@ def open_quest_gump():
         except Exception:
             pass
         
-        # Server sync to avoid command spam
-        server_sync_delay()
-        server_sync_delay()  # Double sync for command cooldown
-        
-        # Send the [quest command
-        Player.ChatSay(0, "[quest")
+        # Send the [quest command , paced with every other script's text commands
+        _TEXT_COMMANDS.send("[quest", QUEST_GUMP_ID)
         
         # Wait for the SPECIFIC quest gump to appear
         if not wait_for_quest_gump(WAIT_GUMP_MS):
@@ -476,10 +734,6 @@ def open_quest_gump():
         
         debug_message(f"Quest gump {hex(QUEST_GUMP_ID)} opened successfully", COLORS['ok'])
         
-        # Server sync for gump to fully load
-        server_sync_delay()
-        server_sync_delay()
-        
         # Initial validation - just check if we can read SOMETHING
         # Don't retry here - let the main crawl loop handle retries
         lines = snap_text_lines()
@@ -715,6 +969,7 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
     all_quests = []
     seen_page_numbers = set()  # Track which page numbers we've collected
     pages_with_quests = {}  # Track quest count per page: {page_num: quest_count}
+    page_snapshots = {}  # {page_num: {'hash', 'quests'}} saved for the next refresh
     pages_scanned = 0
     expected_total_pages = None
     consecutive_failures = 0
@@ -724,8 +979,7 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
     unstick_attempts = 0  # Track consecutive unstick NEXT attempts
     page_1_retry_count = 0  # Track retries for page 1
     
-    # Give initial gump time to stabilize (already waited in open_quest_gump)
-    server_sync_delay()  # Server sync instead of fixed delay 
+    # The initial gump content already settled in open_quest_gump
     
     # Keep trying until we get all pages - repeat if we have missing pages
     while pages_scanned < max_pages:
@@ -746,8 +1000,6 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                         break
                     
                     if skip_to_page(missing_page, current_page=1):
-                        server_sync_delay()
-                        server_sync_delay()  # Extra sync after skip-ahead
                         lines = snap_text_lines()
                         if lines:
                             current_page, _ = extract_page_info(lines)
@@ -755,6 +1007,7 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                                 page_quests = parse_quest_page(lines)
                                 all_quests.extend(page_quests)
                                 seen_page_numbers.add(current_page)
+                                page_snapshots[current_page] = snapshot_page(lines, page_quests)
                                 debug_message(f"Recovered missing page {current_page}!", COLORS['ok'])
                 
                 # Check if we got everything
@@ -875,8 +1128,6 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                         next_missing = min(missing)
                         debug_message(f"Stuck on duplicate page {current_page}, using skip-ahead to page {next_missing}", COLORS['warn'])
                         if skip_to_page(next_missing, current_page=current_page):
-                            server_sync_delay()
-                            server_sync_delay()  # Extra sync after skip-ahead
                             continue
                         else:
                             debug_message("Skip-ahead failed, trying normal NEXT", COLORS['warn'])
@@ -884,14 +1135,9 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                 # Normal skip forward
                 try:
                     debug_message(f"Clicking NEXT to skip duplicate page {current_page}...", COLORS['info'])
-                    # Double server sync before NEXT to avoid command spam
-                    server_sync_delay()
-                    server_sync_delay()
-                    Gumps.SendAction(QUEST_GUMP_ID, BUTTON_NEXT)
-                    if not Gumps.WaitForGump(QUEST_GUMP_ID, 10000):
+                    if not press_quest_button(BUTTON_NEXT):
                         debug_message("Gump closed during duplicate skip", COLORS['bad'])
                         break
-                    server_sync_delay()  # Sync after response
                 except Exception:
                     break
                 continue
@@ -910,6 +1156,7 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
         # Track quest count per page (0 quests is iregular and needs recovery)
         if current_page:
             pages_with_quests[current_page] = quest_count_on_page
+            page_snapshots[current_page] = snapshot_page(lines, page_quests)
             if quest_count_on_page == 0:
                 debug_message(f"WARNING: Page {current_page} returned 0 quests - marking for recovery", COLORS['warn'])
         
@@ -932,19 +1179,12 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                 debug_message(f"All remaining pages already collected, stopping", COLORS['info'])
                 break
         
-        # Double server sync before clicking NEXT to avoid command spam
-        server_sync_delay()
-        server_sync_delay()
-        
         # Try to go to next page
         try:
             debug_message(f"Clicking NEXT to advance from page {current_page or '?'}...", COLORS['info'])
             
-            # Send NEXT button action
-            Gumps.SendAction(QUEST_GUMP_ID, BUTTON_NEXT)
-            
-            # Wait for gump to update - use shorter timeout to detect closure faster
-            if not Gumps.WaitForGump(QUEST_GUMP_ID, 5000):
+            # Send NEXT and wait for the page content to change
+            if not press_quest_button(BUTTON_NEXT):
                 debug_message("Gump closed or didn't update after NEXT!", COLORS['warn'])
                 # Gump likely closed - reopen immediately
                 server_sync_delay()
@@ -963,9 +1203,6 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                 else:
                     debug_message("Failed to reopen after NEXT closure", COLORS['bad'])
                     break
-            
-            # Server sync after successful NEXT
-            server_sync_delay()
         except Exception as e:
             debug_message(f"Error clicking NEXT: {e}", COLORS['bad'])
             break
@@ -1013,8 +1250,6 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
             # Skip to the target page 
             debug_message(f"Attempting to recover page {target_page}...", COLORS['info'])
             if skip_to_page(target_page, current_page=1):
-                server_sync_delay()
-                server_sync_delay()  # Extra sync after skip-ahead to let gump refresh
                 lines = snap_text_lines()
                 if lines:
                     current_page, _ = extract_page_info(lines)
@@ -1024,6 +1259,7 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                         
                         # Update quest count for this page
                         pages_with_quests[current_page] = quest_count
+                        page_snapshots[current_page] = snapshot_page(lines, page_quests)
                         
                         if quest_count > 0:
                             # Remove old quests from this page if retrying
@@ -1056,12 +1292,7 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                 if not ensure_gump_open(allow_reopen=True):
                     break
                 
-                # Double server sync before NEXT to avoid command spam
-                server_sync_delay()
-                server_sync_delay()
-                Gumps.SendAction(QUEST_GUMP_ID, BUTTON_NEXT)
-                if Gumps.WaitForGump(QUEST_GUMP_ID, 10000):
-                    server_sync_delay()  # Sync after response
+                if press_quest_button(BUTTON_NEXT):
                     lines = snap_text_lines()
                     if lines:
                         current_page, _ = extract_page_info(lines)
@@ -1070,6 +1301,7 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
                             if page_quests:
                                 all_quests.extend(page_quests)
                                 seen_page_numbers.add(current_page)
+                                page_snapshots[current_page] = snapshot_page(lines, page_quests)
                                 debug_message(f"Found page {current_page} via navigation!", COLORS['ok'])
     
     # Final validation - check pages and identify empty pages
@@ -1139,7 +1371,138 @@ def crawl_all_quest_pages(max_pages=MAX_PAGES, retry_attempt=0):
         'timestamp': 'N/A',
         'quest_count': quest_count,
         'empty_pages': empty_pages_final,  # List of pages that returned 0 quests
-        'is_complete': len(empty_pages_final) == 0 and (not expected_total_pages or pages_collected >= expected_total_pages)
+        'is_complete': len(empty_pages_final) == 0 and (not expected_total_pages or pages_collected >= expected_total_pages),
+        'page_snapshots': page_snapshots,
+    }
+
+# ===== Quest Snapshot =====
+
+def current_quest_day():
+    """Server quest day as YYYY-MM-DD , rolling over at QUEST_DAY_RESET_HOUR_UTC."""
+    return time.strftime('%Y-%m-%d', time.gmtime(time.time() - QUEST_DAY_RESET_HOUR_UTC * 3600))
+
+def hash_page_lines(lines):
+    return hashlib.sha1("\n".join(lines or []).encode("utf-8")).hexdigest()
+
+def snapshot_page(lines, page_quests):
+    return {'hash': hash_page_lines(lines), 'quests': page_quests}
+
+def page_can_change(page_entry):
+    """A page needs a revisit unless every quest on it is already completed today."""
+    if not page_entry or not page_entry.get('quests'):
+        return True
+    return any(not str(quest.get('status', '')).startswith('Completed') for quest in page_entry['quests'])
+
+def load_quest_snapshot():
+    """Return today's snapshot or None when it is missing , unreadable or from an earlier quest day."""
+    try:
+        if not os.path.isfile(QUEST_SNAPSHOT_FILE):
+            return None
+        with open(QUEST_SNAPSHOT_FILE, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except Exception as e:
+        debug_message(f"Could not read quest snapshot: {e}", COLORS['warn'])
+        return None
+    if snapshot.get('format_version') != QUEST_SNAPSHOT_FORMAT_VERSION:
+        return None
+    if snapshot.get('server_day') != current_quest_day():
+        debug_message(f"Quest snapshot is from {snapshot.get('server_day')} , starting a new day", COLORS['info'])
+        return None
+    if not snapshot.get('total_pages') or len(snapshot.get('pages', {})) < snapshot['total_pages']:
+        return None
+    return snapshot
+
+def save_quest_snapshot(total_pages, page_snapshots):
+    try:
+        folder = os.path.dirname(QUEST_SNAPSHOT_FILE)
+        if not os.path.exists(folder):
+            os.makedirs(folder)
+        snapshot = {
+            'format_version': QUEST_SNAPSHOT_FORMAT_VERSION,
+            'server_day': current_quest_day(),
+            'saved_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime()),
+            'total_pages': total_pages,
+            'pages': {str(page): entry for page, entry in page_snapshots.items()},
+        }
+        with open(QUEST_SNAPSHOT_FILE, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, indent=1)
+    except Exception as e:
+        debug_message(f"Could not save quest snapshot: {e}", COLORS['warn'])
+
+def crawl_and_snapshot():
+    """Full crawl of every page , saved as today's snapshot when complete."""
+    quest_data = crawl_all_quest_pages()
+    if QUEST_SNAPSHOT_ENABLED and quest_data.get('is_complete') and quest_data.get('page_snapshots'):
+        save_quest_snapshot(quest_data.get('expected_pages') or len(quest_data['page_snapshots']), quest_data['page_snapshots'])
+    return quest_data
+
+def refresh_page_snapshot(pages, page, lines):
+    """Update one snapshot page from freshly read lines , unchanged content keeps the parsed quests."""
+    entry = pages.get(str(page))
+    page_hash = hash_page_lines(lines)
+    if entry and entry.get('hash') == page_hash:
+        return False
+    page_quests = parse_quest_page(lines)
+    if not page_quests and entry:
+        debug_message(f"Page {page} parsed to 0 quests , keeping snapshot", COLORS['warn'])
+        return False
+    pages[str(page)] = {'hash': page_hash, 'quests': page_quests}
+    return True
+
+def refresh_quest_pages():
+    """Refresh quest data starting from today's snapshot.
+    Reads page 1 for the page total , then presses NEXT only as far as the last page with unfinished quests.
+    Falls back to a full crawl when there is no snapshot or the gump does not match it."""
+    snapshot = load_quest_snapshot()
+    if snapshot is None:
+        return crawl_and_snapshot()
+
+    if not open_quest_gump():
+        return crawl_and_snapshot()
+    lines = snap_text_lines()
+    current_page, total_pages = extract_page_info(lines)
+    if current_page != 1 or total_pages != snapshot['total_pages']:
+        debug_message(f"Quest gump shows page {current_page} of {total_pages} , snapshot has {snapshot['total_pages']} pages , full crawl", COLORS['warn'])
+        return crawl_and_snapshot()
+
+    pages = snapshot['pages']
+    stale_pages = [page for page in range(1, total_pages + 1) if page_can_change(pages.get(str(page)))]
+    changed_pages = []
+    if refresh_page_snapshot(pages, 1, lines):
+        changed_pages.append(1)
+    last_needed = max(stale_pages) if stale_pages else 1
+    debug_message(f"Snapshot refresh: {len(stale_pages)} of {total_pages} pages can still change , reading up to page {last_needed}", COLORS['info'])
+
+    page = 1
+    while page < last_needed:
+        if not press_quest_button(BUTTON_NEXT):
+            debug_message(f"Page did not advance from {page} , full crawl", COLORS['warn'])
+            return crawl_and_snapshot()
+        page += 1
+        if page not in stale_pages:
+            continue  # completed pages are passed through without reading
+        lines = snap_text_lines()
+        read_page, _ = extract_page_info(lines)
+        if read_page != page:
+            debug_message(f"Expected page {page} but read {read_page} , full crawl", COLORS['warn'])
+            return crawl_and_snapshot()
+        if refresh_page_snapshot(pages, page, lines):
+            changed_pages.append(page)
+
+    save_quest_snapshot(total_pages, pages)
+    debug_message(f"Snapshot refresh done: {len(changed_pages)} pages changed {changed_pages}", COLORS['ok'])
+    all_quests = []
+    for page in range(1, total_pages + 1):
+        all_quests.extend(pages.get(str(page), {}).get('quests', []))
+    return {
+        'quests': all_quests,
+        'pages_scanned': total_pages,
+        'expected_pages': total_pages,
+        'timestamp': 'N/A',
+        'quest_count': len(all_quests),
+        'empty_pages': [],
+        'is_complete': True,
+        'pages_refreshed': len(stale_pages),
     }
 
 # ===== Quest Data Enrichment Functions =====
@@ -1306,30 +1669,36 @@ def enrich_quest_data(quest):
         - 'reward_icon': dict with item_id and hue, or None
     
     Modifies the quest dictionary in place and returns it.
+    The lookups depend only on the quest name , they are cached in the HUD render cache.
     """
     quest_name = quest.get('name', '')
+    enrichment_cache = hud_render_cache()['quests']
+    enrichment = enrichment_cache.get(quest_name)
+    if enrichment is None:
+        enrichment = {}
+        # Get quest details
+        details = get_quest_details(quest_name)
+        enrichment['quest_details'] = details
+        
+        # Extract difficulty
+        if details:
+            enrichment['difficulty'] = details.get('difficulty', '')
+            enrichment['difficulty_color'] = get_difficulty_color(enrichment['difficulty'])
+        else:
+            enrichment['difficulty'] = ''
+            enrichment['difficulty_color'] = get_active_colors()['header']
+        
+        # Check if mastery orb quest
+        enrichment['is_mastery_orb'] = is_mastery_orb_quest(quest_name)
+        
+        # Get reward icon info , a cached mastery orb keeps its hue across refreshes
+        enrichment['reward_icon'] = get_reward_icon_info(quest_name)
+        
+        # Get objective icon info (what you collect/kill)
+        enrichment['objective_icon'] = get_quest_objective_icon(quest_name)
+        enrichment_cache[quest_name] = enrichment
     
-    # Get quest details
-    details = get_quest_details(quest_name)
-    quest['quest_details'] = details
-    
-    # Extract difficulty
-    if details:
-        quest['difficulty'] = details.get('difficulty', '')
-        quest['difficulty_color'] = get_difficulty_color(quest['difficulty'])
-    else:
-        quest['difficulty'] = ''
-        quest['difficulty_color'] = get_active_colors()['header']
-    
-    # Check if mastery orb quest
-    quest['is_mastery_orb'] = is_mastery_orb_quest(quest_name)
-    
-    # Get reward icon info
-    quest['reward_icon'] = get_reward_icon_info(quest_name)
-    
-    # Get objective icon info (what you collect/kill)
-    quest['objective_icon'] = get_quest_objective_icon(quest_name)
-    
+    quest.update(enrichment)
     return quest
 
 # ===== Quest Categorization =====
@@ -1617,64 +1986,107 @@ def build_quest_lines(quest_data):
             'quest': None
         })
     
-    # Mastery Orb Active Quests
-    for quest in categories.get('mastery_orb_active', []):
-        formatted_line = format_quest_line(quest['name'], quest.get('progress', ''), quest.get('difficulty_color', colors['header']))
-        lines.append({
-            'html': formatted_line,
-            'type': 'quest',
-            'quest': quest
-        })
-    
-    # Other Active Quests
-    for quest in categories.get('active', []):
-        formatted_line = format_quest_line(quest['name'], quest.get('progress', ''), quest.get('difficulty_color', colors['header']))
-        lines.append({
-            'html': formatted_line,
-            'type': 'quest',
-            'quest': quest
-        })
-    
-    # Completed Quests - display with completed color including cooldown text
-    for quest in categories.get('completed', []):
-        progress = quest.get('progress', '')
-        # Format completed quests similar to active quests but with completed color
-        if progress:
-            # Use format_quest_line but override the color to completed color
-            quest_name = quest['name']
-            # Build line manually to ensure both name and progress are in completed color
-            html = f"<basefont color={colors['completed']}>{quest_name}  {progress}</basefont>"
-        else:
-            html = f"<basefont color={colors['completed']}>{quest['name']}</basefont>"
-        lines.append({
-            'html': html,
-            'type': 'completed',
-            'quest': quest
-        })
-    
-    # Available Quests
-    for quest in categories.get('available', []):
-        lines.append({
-            'html': f"<basefont color={colors['available']}>{quest['name']}</basefont>",
-            'type': 'available',
-            'quest': quest
-        })
-    
-    # Other Quests - display in completed color
-    for quest in categories.get('other', []):
-        progress = quest.get('progress', '')
-        if progress:
-            html = f"<basefont color={colors['completed']}>{quest['name']}  {progress}</basefont>"
-        else:
-            html = f"<basefont color={colors['completed']}>{quest['name']}</basefont>"
-        lines.append({
-            'html': html,
-            'type': 'other',
-            'quest': quest
-        })
+    # Quest rows in display order , each row comes from the render cache when its quest is unchanged
+    # Mastery Orb Active Quests , Other Active Quests , Completed (with cooldown text) , Available , Other
+    for category_name, row_type in (('mastery_orb_active', 'quest'), ('active', 'quest'), ('completed', 'completed'),
+                                    ('available', 'available'), ('other', 'other')):
+        for quest in categories.get(category_name, []):
+            row = get_quest_row(row_type, quest)
+            lines.append({
+                'html': row['html'],
+                'outline': row['outline'],
+                'type': row_type,
+                'quest': quest
+            })
     
     return lines
 
+def render_quest_row_html(row_type, quest):
+    """HTML for one quest row of the given type."""
+    colors = get_active_colors()
+    progress = quest.get('progress', '')
+    if row_type == 'quest':
+        return format_quest_line(quest['name'], progress, quest.get('difficulty_color', colors['header']))
+    if row_type == 'available':
+        return f"<basefont color={colors['available']}>{quest['name']}</basefont>"
+    # Completed and other quests - name and progress both in completed color
+    if progress:
+        return f"<basefont color={colors['completed']}>{quest['name']}  {progress}</basefont>"
+    return f"<basefont color={colors['completed']}>{quest['name']}</basefont>"
+
+# ===== HUD Render Cache =====
+
+_HUD_RENDER_CACHE = None
+_OUTLINE_OFFSETS = None
+
+def hud_render_settings():
+    """Settings that change how rows render , a cache built under other settings is discarded."""
+    return (USE_BURNT_COLOR_SCHEME, SHOW_TEXT_OUTLINE, TEXT_OUTLINE_THICKNESS, QUEST_NAME_MAX_LENGTH,
+            PROGRESS_MAX_LENGTH, COLUMN_SEPARATOR_SPACES)
+
+def hud_render_cache():
+    """Render cache kept in a Misc shared value so it outlives this run for the client session.
+    quests : name -> enrichment , rows : row key -> { html , outline } , sent_rows : row html of the last HUD sent."""
+    global _HUD_RENDER_CACHE
+    if _HUD_RENDER_CACHE is not None:
+        return _HUD_RENDER_CACHE
+    cache = None
+    if HUD_RENDER_CACHE_ENABLED:
+        try:
+            if Misc.CheckSharedValue(HUD_RENDER_CACHE_SHARED):
+                cache = Misc.ReadSharedValue(HUD_RENDER_CACHE_SHARED)
+        except Exception:
+            cache = None
+    if not isinstance(cache, dict) or cache.get('settings') != hud_render_settings():
+        cache = {'settings': hud_render_settings(), 'quests': {}, 'rows': {}, 'sent_rows': None}
+        if HUD_RENDER_CACHE_ENABLED:
+            try:
+                Misc.SetSharedValue(HUD_RENDER_CACHE_SHARED, cache)
+            except Exception:
+                pass
+    _HUD_RENDER_CACHE = cache
+    return cache
+
+def outline_offsets():
+    """8 directional offsets per outline thickness level , computed once."""
+    global _OUTLINE_OFFSETS
+    if _OUTLINE_OFFSETS is None:
+        _OUTLINE_OFFSETS = []
+        for thickness in range(1, TEXT_OUTLINE_THICKNESS + 1):
+            _OUTLINE_OFFSETS.extend([
+                (-thickness, 0), (thickness, 0), (0, -thickness), (0, thickness),
+                (-thickness, -thickness), (thickness, -thickness), (-thickness, thickness), (thickness, thickness)
+            ])
+    return _OUTLINE_OFFSETS
+
+def outline_html(html_content):
+    """Same HTML with every color replaced by pure black (#000000) , None when outlines are off."""
+    if not SHOW_TEXT_OUTLINE:
+        return None
+    return re.sub(r'#[0-9A-Fa-f]{6}', '#000000', html_content)
+
+def get_quest_row(row_type, quest):
+    """Rendered { html , outline } for a quest row , cached by (type , name , progress , difficulty , color scheme)."""
+    rows = hud_render_cache()['rows']
+    row_key = (row_type, quest.get('name', ''), quest.get('progress', ''), quest.get('difficulty', ''), USE_BURNT_COLOR_SCHEME)
+    row = rows.get(row_key)
+    if row is None:
+        if len(rows) >= HUD_RENDER_CACHE_MAX_ROWS:
+            rows.clear()
+        html = render_quest_row_html(row_type, quest)
+        row = {'html': html, 'outline': outline_html(html)}
+        rows[row_key] = row
+    return row
+
+def add_outlined_html(gump, x, y, width, height, html_content, html_outline):
+    """Draw html_content over its black outline.
+    The outline html is rendered once per row and cached , each offset copy passes that string."""
+    if html_outline:
+        for dx, dy in outline_offsets():
+            Gumps.AddHtml(gump, x + dx, y + dy, width, height, html_outline, False, False)
+    # Draw main colored HTML on top
+    Gumps.AddHtml(gump, x, y, width, height, html_content, False, False)
+
 def add_quest_icons(gump, quests, start_y):
     """Add objective and reward item icons to the gump for each quest.
     
@@ -1720,6 +2132,17 @@ def show_quest_status_gump(quest_data):
     """
     debug_message("Building quest status display gump", COLORS['info'])
     
+    # Build quest lines for individual rendering
+    quest_lines = build_quest_lines(quest_data)
+    
+    # Nothing changed since the HUD that is still open , leave it as is
+    render_cache = hud_render_cache()
+    sent_rows = [line_data['html'] for line_data in quest_lines]
+    if HUD_RENDER_CACHE_ENABLED and sent_rows == render_cache.get('sent_rows') and Gumps.HasGump(DISPLAY_GUMP_ID):
+        debug_message("Quest status unchanged , display gump kept", COLORS['info'])
+        close_quest_gump()
+        return
+    
     # Create gump
     gump = Gumps.CreateGump(movable=True)
     Gumps.AddPage(gump, 0)
@@ -1728,9 +2151,6 @@ def show_quest_status_gump(quest_data):
     Gumps.AddBackground(gump, 0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT, 30546)
     Gumps.AddAlphaRegion(gump, 0, 0, DISPLAY_WIDTH, DISPLAY_HEIGHT)
     
-    # Build quest lines for individual rendering
-    quest_lines = build_quest_lines(quest_data)
-    
     # Render each line separately with precise Y positioning
     current_y = 10
     line_height = 21  # 20px text + 1px spacing
@@ -1738,45 +2158,11 @@ def show_quest_status_gump(quest_data):
     
     for line_data in quest_lines:
         html_content = line_data['html']
+        # Quest rows carry a cached outline , title and header lines are outlined here
+        html_outline = line_data['outline'] if 'outline' in line_data else outline_html(html_content)
         
-        # Add black outline if enabled
-        if SHOW_TEXT_OUTLINE:
-            # Generate outline offsets based on thickness
-            outline_offsets = []
-            for thickness in range(1, TEXT_OUTLINE_THICKNESS + 1):
-                # 8-directional offsets for each thickness level
-                outline_offsets.extend([
-                    (-thickness, 0), (thickness, 0), (0, -thickness), (0, thickness),
-                    (-thickness, -thickness), (thickness, -thickness), (-thickness, thickness), (thickness, thickness)
-                ])
-            
-            # Replace all color codes with pure black (#000000) for outline
-            html_outline = re.sub(r'#[0-9A-Fa-f]{6}', '#000000', html_content)
-            
-            # Draw black outline at all offset positions
-            for dx, dy in outline_offsets:
-                Gumps.AddHtml(
-                    gump,
-                    10 + dx,
-                    current_y + dy,
-                    DISPLAY_WIDTH - 60,
-                    line_height,
-                    html_outline,
-                    False,
-                    False
-                )
-        
-        # Draw main colored HTML on top
-        Gumps.AddHtml(
-            gump,
-            10,
-            current_y,
-            DISPLAY_WIDTH - 60,  # Leave room for icons
-            line_height,
-            html_content,
-            False,  # no background
-            False   # no scrollbar
-        )
+        # Black outline if enabled , then the colored HTML on top ( width leaves room for icons )
+        add_outlined_html(gump, 10, current_y, DISPLAY_WIDTH - 60, line_height, html_content, html_outline)
         
         # Add icons for quest lines
         quest = line_data.get('quest')
@@ -1807,9 +2193,14 @@ def show_quest_status_gump(quest_data):
     
     # Send gump (right-click to close)
     Gumps.SendGump(DISPLAY_GUMP_ID, Player.Serial, DISPLAY_X, DISPLAY_Y, gump.gumpDefinition, gump.gumpStrings)
+    render_cache['sent_rows'] = sent_rows
     debug_message("Quest status gump displayed", COLORS['ok'])
     
     # Close the daily quest gump now that we've displayed results
+    close_quest_gump()
+
+def close_quest_gump():
+    """Close the daily quest gump once its results are displayed."""
     try:
         Gumps.CloseGump(QUEST_GUMP_ID)
         debug_message("Closed daily quest gump", COLORS['info'])
@@ -1821,8 +2212,12 @@ def show_quest_status_gump(quest_data):
 def main():
     """Main entry point - crawl quests and display results."""
     try:
-        # Crawl all quest pages
-        quest_data = crawl_all_quest_pages()
+        # Refresh from today's snapshot , or crawl all quest pages
+        quest_data = refresh_quest_pages() if QUEST_SNAPSHOT_ENABLED else crawl_all_quest_pages()
+        # the last [quest of the crawl has no next send to check it
+        warning_line = _TEXT_COMMANDS.flush()
+        if warning_line:
+            debug_message(f"[quest command throttled: {warning_line}", COLORS['warn'])
         
         # Display results in custom gump
         show_quest_status_gump(quest_data)
@@ -17,13 +17,14 @@ Close all gumps at end
 Auto-Claim ( off by default ) config by target number of points , saving specific events for higher rewards ( 750 )
 
 STATUS:: WIP
-VERSION:: 20251027
+VERSION:: 20261019
 """
 
 import re
 import os
 import json
 import time
+import hashlib
 
 DEBUG_MODE = False
 SKIP_SEASONAL_EVENTS = True  # Skip seasonal events 
@@ -51,6 +52,12 @@ EXPORT_TO_JSON = False  # Export all extracted gump data to JSON
 BASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
 OUTPUT_FILE = os.path.join(BASE_PATH, "global_events_data.json")
 
+# Incremental refresh , an event detail is reopened only when its events list row changed or its cached read is stale
+EVENT_CACHE_ENABLED = True
+EVENT_CACHE_FILE = os.path.join(BASE_PATH, "global_events_cache.json")
+EVENT_CACHE_FORMAT_VERSION = 1
+EVENT_CACHE_TTL_SECONDS = 900  # cached details older than this are reread even when the list row is unchanged
+
 EVENT_PAGE_BUTTONS = list(range(10, 170, 10))  # [10, 20, 30, ..., 150, 160]
 
 KNOWN_EVENTS_BUTTON_ID = {
@@ -213,6 +220,14 @@ DANGER_ZONES_GUMP_ID = 0x4a319301  # [rotation command
 HAVEN_AREAS_GUMP_ID = 0x7fd25f55   # [HavenAreas command
 CHALLENGE_GUMP_ID = 0x260d2c93     # [challenge command
 
+# Zone status gumps , the commands go out back to back and each gump is harvested by its ID as it arrives
+ZONE_STATUS_GUMPS = [
+    ('danger', "[rotation", DANGER_ZONES_GUMP_ID, "Danger Zones"),
+    ('haven', "[HavenAreas", HAVEN_AREAS_GUMP_ID, "Haven Areas"),
+    ('challenge', "[challenge", CHALLENGE_GUMP_ID, "Challenge"),
+]
+ZONE_STATUS_ATTEMPTS = 3  # sends per zone status command before giving up on its gump
+
 # Gump IDs
 EVENTS_LIST_GUMP_ID = 0x9564fc6d  # Global events list gump (opened by [event command)
 CLAIM_CONFIRM_GUMP_ID = 0x11775c2e  # Claim confirmation gump
@@ -228,8 +243,16 @@ COMMAND_DELAY = 50  # Legacy delay
 RECOVERY_TIMEOUT = 3  # Max recovery attempts before giving up
 MAX_EVENT_READ_RETRIES = 2  # Number of times to retry reading an event page before marking as error
 
-TEXT_COMMAND_MIN_GAP_MS = 800
-TEXT_COMMAND_JOURNAL_WAIT_MS = 450
+# Text command pacing , one token bucket in Misc shared values paces "[" commands from every running script
+TEXT_COMMAND_INTERVAL_MS = 800  # starting spacing between text commands across all scripts
+TEXT_COMMAND_INTERVAL_MIN_MS = 250  # learned spacing never drops below this
+TEXT_COMMAND_INTERVAL_MAX_MS = 4000  # learned spacing never rises above this
+TEXT_COMMAND_BURST = 2  # commands allowed back to back before the spacing applies
+TEXT_COMMAND_BACKOFF = 1.5  # spacing multiplier after a throttle warning in the journal
+TEXT_COMMAND_RECOVERY_MS = 20  # spacing reduction after each command without a warning
+TEXT_COMMAND_WARNING_WINDOW_MS = 600  # how long after a command its throttle warning can still arrive
+TEXT_COMMAND_GUMP_CONFLICT_MS = 1500  # longest wait for an earlier command's same response gump before sending
+TEXT_COMMAND_POLL_MS = 50
 TEXT_COMMAND_WARNING_PATTERNS = [
     'too many',
     'too quickly',
@@ -238,12 +261,16 @@ TEXT_COMMAND_WARNING_PATTERNS = [
     'you have to wait',
 ]
 
-DELAY_BEFORE_EVENT_COMMAND = 100  # Wait before using [event command to avoid "too many commands" warning
-DELAY_AFTER_DETAIL_GUMP_OPEN = 20  # Wait after clicking event button for detail gump
 DELAY_AFTER_BACK_BUTTON = 15  # Wait after pressing back button to return to events list
 DELAY_AFTER_EVENTS_LIST_ALREADY_OPEN = 10  # When events list is already open
 DELAY_RECOVERY_REOPEN = 20  # When reopening after failure
 
+# Gump change detection , waits end as soon as the gump content changes and holds still
+GUMP_SETTLE_MS = 150  # content must stay unchanged this long after a change
+GUMP_POLL_MS = 40  # interval between gump content checks
+GUMP_TIMEOUT_MIN_MS = 800  # learned timeouts never drop below this
+GUMP_LATENCY_TIMEOUT_FACTOR = 4  # learned timeout = typical change latency x factor + settle
+
 # Display gump configuration
 DISPLAY_GUMP_ID = 4125312742  # Unique ID for display gump
 DISPLAY_X = 400
@@ -308,82 +335,251 @@ def server_sync_delay():
         # Fallback to minimal pause if GetLabel fails
         Misc.Pause(50)
 
-_LAST_TEXT_COMMAND_MS = 0
-
 def _now_ms():
     try:
         return int(time.time() * 1000)
     except Exception:
         return 0
 
-def _notify_throttle_warning(msg):
-    try:
-        Misc.SendMessage(msg, COLORS['warn'])
-    except Exception:
-        print(msg)
-
-def send_text_command(command_text, min_gap_ms=None, journal_wait_ms=None):
-    global _LAST_TEXT_COMMAND_MS
-
-    if min_gap_ms is None:
-        min_gap_ms = TEXT_COMMAND_MIN_GAP_MS
-    if journal_wait_ms is None:
-        journal_wait_ms = TEXT_COMMAND_JOURNAL_WAIT_MS
+# shared value keys , identical in every script using TextCommandQueue
+TEXT_COMMAND_SHARED_NEXT = "text_command_next_ms"  # token bucket theoretical send time
+TEXT_COMMAND_SHARED_INTERVAL = "text_command_interval_ms"  # learned spacing
+TEXT_COMMAND_SHARED_FLOOR = "text_command_floor_ms"  # spacing that once drew a warning , plus a margin
+TEXT_COMMAND_SHARED_BURST = "text_command_burst"  # learned burst , drops to 1 when a burst draws a warning
+TEXT_COMMAND_SHARED_HANDLED = "text_command_handled"  # journal time up to which warnings were already acted on
+TEXT_COMMAND_SHARED_GUMP = "text_command_gump"  # "gump_id|deadline_ms" of the last command awaiting a gump
+
+class TextCommandQueue:
+    """Paces "[" text commands across every running script instead of fixed per-script delays.
+    The token bucket ( next send time plus learned spacing ) lives in Misc shared values , so quest and
+    UI scripts running together queue behind each other. A throttle warning in the journal first drops the burst
+    to single commands , later warnings widen the spacing and set a floor it never narrows below again ,
+    clean commands narrow it slowly.
+    Sending does not wait on the journal , a command's warning check runs when the next one is queued.
+    The last command of a batch has no next one , flush() waits out its warning window and checks it.
+    A command answering with a gump waits while an earlier command's same gump is still pending ,
+    commands with distinct response gumps or none pipeline."""
+
+    def __init__(self, source):
+        self.source = source  # message prefix
+        self.pending_since = None  # journal time of the oldest command not yet checked for warnings
+        self.last_sent_at = 0.0  # time the newest command was said
+
+    def _read(self, key, default):
+        try:
+            if Misc.CheckSharedValue(key):
+                return Misc.ReadSharedValue(key)
+        except Exception:
+            pass
+        return default
 
-    gap_waited = 0
-    now_ms = _now_ms()
-    if _LAST_TEXT_COMMAND_MS and now_ms:
-        elapsed = now_ms - _LAST_TEXT_COMMAND_MS
-        if elapsed < min_gap_ms:
-            gap_waited = min_gap_ms - elapsed
-            Misc.Pause(int(gap_waited))
+    def _write(self, key, value):
+        try:
+            Misc.SetSharedValue(key, value)
+        except Exception:
+            pass
 
-    after_ts = time.time()
-    try:
-        Player.ChatSay(0, command_text)
-    except Exception as e:
-        debug_message(f"ChatSay failed for '{command_text}': {e}", COLORS['bad'])
-        return False
+    def interval_ms(self):
+        interval = float(self._read(TEXT_COMMAND_SHARED_INTERVAL, TEXT_COMMAND_INTERVAL_MS))
+        floor = float(self._read(TEXT_COMMAND_SHARED_FLOOR, TEXT_COMMAND_INTERVAL_MIN_MS))
+        return min(TEXT_COMMAND_INTERVAL_MAX_MS, max(TEXT_COMMAND_INTERVAL_MIN_MS, floor, interval))
 
-    Misc.Pause(int(journal_wait_ms))
-    _LAST_TEXT_COMMAND_MS = _now_ms()
+    def burst(self):
+        return max(1, int(self._read(TEXT_COMMAND_SHARED_BURST, TEXT_COMMAND_BURST)))
 
-    warning_line = None
-    try:
-        entries = Journal.GetJournalEntry(after_ts)
-        for ent in entries or []:
-            txt = str(getattr(ent, 'Text', ent))
-            low = txt.lower()
-            for pat in TEXT_COMMAND_WARNING_PATTERNS:
-                if pat in low:
-                    warning_line = txt
+    def check_warnings(self):
+        """Scan the journal since the oldest unchecked command and tune the shared spacing. Returns the warning line or None."""
+        if self.pending_since is None:
+            return None
+        # the journal is shared , skip warnings another script already acted on
+        since = max(self.pending_since, float(self._read(TEXT_COMMAND_SHARED_HANDLED, 0)))
+        warning_line = None
+        try:
+            for entry in Journal.GetJournalEntry(since) or []:
+                text = str(getattr(entry, 'Text', entry))
+                low = text.lower()
+                if any(pattern in low for pattern in TEXT_COMMAND_WARNING_PATTERNS):
+                    warning_line = text
                     break
-            if warning_line:
+        except Exception:
+            pass
+        interval = self.interval_ms()
+        if warning_line:
+            self.pending_since = None
+            now = int(time.time() * 1000)
+            self._write(TEXT_COMMAND_SHARED_HANDLED, time.time())
+            if self.burst() > 1:
+                # the server counts bursts , keep the spacing and send one at a time
+                self._write(TEXT_COMMAND_SHARED_BURST, 1)
+            else:
+                # the server limit sits above the current spacing , never probe below it again
+                self._write(TEXT_COMMAND_SHARED_FLOOR, min(TEXT_COMMAND_INTERVAL_MAX_MS, interval + TEXT_COMMAND_RECOVERY_MS * 5))
+                interval = min(TEXT_COMMAND_INTERVAL_MAX_MS, interval * TEXT_COMMAND_BACKOFF)
+                self._write(TEXT_COMMAND_SHARED_INTERVAL, interval)
+            self._write(TEXT_COMMAND_SHARED_NEXT, now + int(interval))
+            try:
+                Misc.SendMessage(f"[{self.source}] Command throttled , spacing now {int(interval)}ms: {warning_line}", 53)
+            except Exception:
+                print(f"[{self.source}] Command throttled , spacing now {int(interval)}ms: {warning_line}")
+        elif (time.time() - self.pending_since) * 1000 >= TEXT_COMMAND_WARNING_WINDOW_MS:
+            # a late warning can no longer arrive , count it clean
+            self.pending_since = None
+            self._write(TEXT_COMMAND_SHARED_INTERVAL, max(TEXT_COMMAND_INTERVAL_MIN_MS, interval - TEXT_COMMAND_RECOVERY_MS))
+        return warning_line
+
+    def _wait_for_pending_gump(self, response_gump_id):
+        """Wait while an earlier command answered by the same gump has not opened it yet , bounded by its deadline."""
+        pending = str(self._read(TEXT_COMMAND_SHARED_GUMP, "") or "")
+        if "|" not in pending:
+            return
+        try:
+            gump_id, deadline = [int(part) for part in pending.split("|", 1)]
+        except ValueError:
+            return
+        if gump_id != int(response_gump_id):
+            return
+        while int(time.time() * 1000) < deadline:
+            try:
+                if Gumps.HasGump(gump_id):
+                    return
+            except Exception:
+                return
+            Misc.Pause(TEXT_COMMAND_POLL_MS)
+
+    def send(self, command_text, response_gump_id=None):
+        """Queue command_text behind earlier commands from any script , then send it.
+        response_gump_id marks a command answered by that gump , a later command for the same gump waits for it to open.
+        Returns False when the command could not be said."""
+        if response_gump_id:
+            self._wait_for_pending_gump(response_gump_id)
+        while True:
+            self.check_warnings()
+            handled = self._read(TEXT_COMMAND_SHARED_HANDLED, 0)
+            # token bucket as a theoretical send time , reserve the slot before sleeping so other scripts queue behind it
+            now = int(time.time() * 1000)
+            interval = self.interval_ms()
+            next_ms = int(self._read(TEXT_COMMAND_SHARED_NEXT, 0))
+            slot = max(now, next_ms - int(interval * (self.burst() - 1)))
+            self._write(TEXT_COMMAND_SHARED_NEXT, int(max(next_ms, slot) + interval))
+            if slot <= now:
                 break
-    except Exception:
-        warning_line = None
+            Misc.Pause(int(slot - now))
+            # a warning handled while waiting moved the bucket , queue again behind it
+            self.check_warnings()
+            if self._read(TEXT_COMMAND_SHARED_HANDLED, 0) == handled:
+                break
+        if response_gump_id:
+            self._write(TEXT_COMMAND_SHARED_GUMP, f"{int(response_gump_id)}|{int(time.time() * 1000) + TEXT_COMMAND_GUMP_CONFLICT_MS}")
+        if self.pending_since is None:
+            self.pending_since = time.time()
+        try:
+            Player.ChatSay(0, command_text)
+        except Exception:
+            return False
+        self.last_sent_at = time.time()
+        return True
 
-    if warning_line:
-        _notify_throttle_warning(
-            f"[GlobalEvents] Command warning after '{command_text}' "
-            f"(min_gap_ms={int(min_gap_ms)}, waited_ms={int(gap_waited)}, journal_wait_ms={int(journal_wait_ms)}): {warning_line}"
-        )
+    def flush(self):
+        """Wait until the newest command's warning can no longer arrive , then check the journal once more.
+        Call it after the last command of a batch. Returns the warning line or None."""
+        if self.pending_since is None:
+            return None
+        remaining_ms = TEXT_COMMAND_WARNING_WINDOW_MS - (time.time() - self.last_sent_at) * 1000
+        if remaining_ms > 0:
+            Misc.Pause(int(remaining_ms))
+        return self.check_warnings()
+
+_TEXT_COMMANDS = TextCommandQueue("GlobalEvents")
+
+def send_text_command(command_text, response_gump_id=None):
+    """Send a "[" command through the shared text command queue.
+    Returns True once the command was said , a throttle rejection only shows up in the journal and is
+    reported by the next send or by _TEXT_COMMANDS.flush() after the last command of a batch."""
+    if not _TEXT_COMMANDS.send(command_text, response_gump_id):
+        debug_message(f"ChatSay failed for '{command_text}'", COLORS['bad'])
         return False
+    debug_message(f"Sent command '{command_text}' (spacing {int(_TEXT_COMMANDS.interval_ms())}ms)", COLORS['info'])
+    return True
 
-    if DEBUG_MODE:
-        debug_message(
-            f"Sent command '{command_text}' (min_gap_ms={int(min_gap_ms)}, waited_ms={int(gap_waited)}, journal_wait_ms={int(journal_wait_ms)})",
-            COLORS['info']
-        )
+class GumpWatcher:
+    """Waits for gump content to change instead of sleeping a fixed time.
+    A gump fingerprint covers its id , text lines and raw layout. A wait returns once the fingerprint
+    differs from the baseline and then holds for GUMP_SETTLE_MS. Each change observed after an action updates a
+    running server latency estimate , later action waits time out after a few multiples of it instead of the full maximum."""
 
-    return True
+    def __init__(self):
+        self.latency_ms = None  # running average of action -> first content change
+
+    def read(self, gump_id=0):
+        """Return (fingerprint, lines) for gump_id , 0 reads the current gump. fingerprint is None when nothing is readable."""
+        try:
+            if not gump_id:
+                gump_id = Gumps.CurrentGump()
+            if not gump_id:
+                return None, []
+            lines = [str(ln).strip() for ln in (Gumps.GetLineList(gump_id, True) or [])]
+            try:
+                layout = str(Gumps.GetGumpRawLayout(gump_id) or "")
+            except Exception:
+                layout = ""
+            if not lines and not layout:
+                return None, []
+            return hash((gump_id, tuple(lines), layout)), lines
+        except Exception:
+            return None, []
+
+    def timeout_ms(self, max_ms):
+        """Learned timeout , never above max_ms and never below GUMP_TIMEOUT_MIN_MS."""
+        if self.latency_ms is None:
+            return int(max_ms)
+        learned = self.latency_ms * GUMP_LATENCY_TIMEOUT_FACTOR + GUMP_SETTLE_MS
+        return int(min(max_ms, max(GUMP_TIMEOUT_MIN_MS, learned)))
+
+    def learn(self, elapsed_ms):
+        if self.latency_ms is None:
+            self.latency_ms = float(elapsed_ms)
+        else:
+            self.latency_ms = self.latency_ms * 0.75 + float(elapsed_ms) * 0.25
+
+    def wait_for_change(self, baseline, gump_id=0, max_ms=3000):
+        """Wait until the fingerprint of gump_id differs from baseline and holds for GUMP_SETTLE_MS.
+        baseline None waits for any readable content. Returns (changed, lines) , on timeout the last lines read.
+        Only waits after an action ( a real baseline ) teach the latency and use the learned timeout ,
+        a gump that is already readable would otherwise teach a latency of ~0 ms."""
+        start = int(time.time() * 1000)
+        learning = baseline is not None
+        timeout = self.timeout_ms(max_ms) if learning else int(max_ms)
+        candidate = None
+        candidate_since = 0
+        lines = []
+        while True:
+            now = int(time.time() * 1000)
+            fingerprint, current_lines = self.read(gump_id)
+            if current_lines:
+                lines = current_lines
+            if fingerprint is not None and fingerprint != baseline:
+                if candidate is None and learning:
+                    self.learn(now - start)
+                if fingerprint != candidate:
+                    candidate = fingerprint
+                    candidate_since = now
+                elif now - candidate_since >= GUMP_SETTLE_MS:
+                    return True, current_lines
+            if now - start >= timeout:
+                if candidate is None and learning:
+                    # a miss widens later timeouts
+                    self.learn(timeout)
+                return candidate is not None, lines
+            Misc.Pause(GUMP_POLL_MS)
+
+_GUMP_WATCHER = GumpWatcher()
 
 def wait_for_gump(gump_id, timeout_ms=WAIT_GUMP_MS):
-    """Wait for a specific gump ID to appear."""
+    """Wait for a specific gump ID to appear , then until its content is readable and holding still."""
     try:
         result = Gumps.WaitForGump(gump_id, timeout_ms)
         if result:
-            Misc.Pause(200)
+            _GUMP_WATCHER.wait_for_change(None, gump_id, timeout_ms)
             return True
         return False
     except Exception as e:
@@ -472,9 +668,8 @@ def snap_text_lines(gump_id, event_name="Unknown"):
     CRITICAL: Always uses the specific gump_id serial provided to avoid reading wrong gumps.
     """
     try:
-        # Give gump time to fully populate
-        #Misc.Pause(800)
-        server_sync_delay()
+        # Give gump time to fully populate , returns as soon as its content holds still
+        _GUMP_WATCHER.wait_for_change(None, gump_id, WAIT_GUMP_MS)
         
         # CRITICAL: Verify we're reading from the correct gump serial
         debug_message(f"    [GUMP READ] Targeting gump serial: {hex(gump_id)}", COLORS['info'])
@@ -536,14 +731,13 @@ def open_events_list_gump():
         
         server_sync_delay()
         
-        send_text_command("[event", min_gap_ms=max(TEXT_COMMAND_MIN_GAP_MS, DELAY_BEFORE_EVENT_COMMAND))
+        send_text_command("[event", EVENTS_LIST_GUMP_ID)
          
         # Wait for gump but don't fail if WaitForGump is unreliable
         wait_for_gump(EVENTS_LIST_GUMP_ID, WAIT_GUMP_MS)
-        
-        # Double sync for gump to fully load
-        server_sync_delay()
-        server_sync_delay()
+        warning_line = _TEXT_COMMANDS.flush()
+        if warning_line:
+            debug_message(f"[event command throttled: {warning_line}", COLORS['warn'])
         
         debug_message(f"Events list gump should be open, proceeding...", COLORS['ok'])
         return True
@@ -646,6 +840,67 @@ def read_events_list_for_claimed_status():
         debug_message(f"Error reading events list for claimed status: {e}", COLORS['bad'])
         return []
 
+# ===== Event Detail Cache =====
+
+def event_list_row_hashes(lines):
+    """Hash the events list row of every known event , the same nearby lines the claimed status check reads.
+    Returns {event_name: hash} , events missing from the list have no entry."""
+    names = [(event_name, event_name) for event_name in KNOWN_EVENTS_BUTTON_ID.values()]
+    names += list(EVENT_NAME_REMAPPING.items())
+    cleaned_lines = [clean_html_tags(line).strip() for line in (lines or [])]
+    row_hashes = {}
+    for i, cleaned in enumerate(cleaned_lines):
+        low = cleaned.lower()
+        for shown_name, event_name in names:
+            if shown_name.lower() in low:
+                if event_name not in row_hashes:
+                    row = cleaned_lines[max(0, i - 3):min(len(cleaned_lines), i + 6)]
+                    row_hashes[event_name] = hashlib.sha1("\n".join(row).encode("utf-8")).hexdigest()
+                break
+    return row_hashes
+
+def load_event_cache():
+    """Return {event_name: cache entry} , empty when the cache is missing , unreadable or from another format."""
+    try:
+        if not os.path.isfile(EVENT_CACHE_FILE):
+            return {}
+        with open(EVENT_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except Exception as e:
+        debug_message(f"Could not read event cache: {e}", COLORS['warn'])
+        return {}
+    if cache.get('format_version') != EVENT_CACHE_FORMAT_VERSION:
+        return {}
+    return cache.get('events', {})
+
+def save_event_cache(cached_events):
+    try:
+        if not os.path.exists(BASE_PATH):
+            os.makedirs(BASE_PATH)
+        cache = {
+            'format_version': EVENT_CACHE_FORMAT_VERSION,
+            'saved_at': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime()),
+            'events': cached_events,
+        }
+        with open(EVENT_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=1)
+    except Exception as e:
+        debug_message(f"Could not save event cache: {e}", COLORS['warn'])
+
+def cached_event_is_current(cache_entry, row_hash):
+    """A cached detail is reused when its list row still hashes the same and it is younger than the TTL."""
+    if not cache_entry or not row_hash:
+        return False
+    if cache_entry.get('row_hash') != row_hash:
+        return False
+    return time.time() - float(cache_entry.get('read_at', 0)) < EVENT_CACHE_TTL_SECONDS
+
+def forget_cached_event(event_name):
+    """Drop one event from the cache , its next refresh reopens the detail gump."""
+    cached_events = load_event_cache()
+    if cached_events.pop(event_name, None) is not None:
+        save_event_cache(cached_events)
+
 def read_events_list_gump(skip_read=False):
     """Read and debug the events list gump content.
     
@@ -678,19 +933,18 @@ def open_event_detail(event_name, button_id, detail_gump_id):
     """Open detail gump for a specific event."""
     debug_message(f"\n>>> Opening {event_name} detail page (button {button_id})...", COLORS['info'])
     try:
-        server_sync_delay()
+        baseline, _ = _GUMP_WATCHER.read()
         Gumps.SendAction(EVENTS_LIST_GUMP_ID, button_id)
         
         if detail_gump_id:
             # Wait but don't fail on unreliable WaitForGump
             wait_for_gump(detail_gump_id, WAIT_GUMP_MS)
-            Misc.Pause(800)  # Extra time for gump data
             debug_message(f"    {event_name} gump should be open (ID: {hex(detail_gump_id)})", COLORS['ok'])
         else:
-            Misc.Pause(1200)  # Longer wait without specific gump ID
-            debug_message(f"    [WARN] {event_name} gump ID unknown, using delay", COLORS['warn'])
+            # Without a specific gump ID wait for the current gump to change
+            _GUMP_WATCHER.wait_for_change(baseline, 0, 1200)
+            debug_message(f"    [WARN] {event_name} gump ID unknown, waited for any gump change", COLORS['warn'])
         
-        server_sync_delay()
         return True
     except Exception as e:
         debug_message(f"    [ERROR] Failed to open {event_name}: {e}", COLORS['bad'])
@@ -933,191 +1187,62 @@ def create_error_event_entry(event_name, button_id, error_message):
         'raw_lines': []
     }
 
-def read_danger_zones_gump():
-    """Open and read danger zones gump to get list of active danger zones.
-    
-    Returns:
-        List of danger zone names (e.g., ['Deceit', 'Wrong', 'Shame'])
-    """
-    danger_zones = []
-    
-    try:
-        debug_message("Reading danger zones from [rotation gump...", COLORS['info'])
-        
-        # Retry up to 3 times if gump fails to open
-        for attempt in range(3):
-            if attempt > 0:
-                debug_message(f"  Retry {attempt}/3 for danger zones gump...", COLORS['warn'])
-                Misc.Pause(1000)
-            
-            # Open danger zones gump
-            send_text_command("[rotation")
-             
-            if wait_for_gump(DANGER_ZONES_GUMP_ID, WAIT_GUMP_MS):
-                server_sync_delay()
-                break
-        else:
-            debug_message("  Failed to open danger zones gump after 3 attempts", COLORS['bad'])
-            return []
-        
-        if wait_for_gump(DANGER_ZONES_GUMP_ID, WAIT_GUMP_MS):
-            server_sync_delay()
-            
-            # Read gump lines
-            lines = snap_text_lines(DANGER_ZONES_GUMP_ID, "Danger Zones")
-            
-            if lines:
-                # Parse zone names from lines
-                # Look for lines that match known event names
-                for line in lines:
-                    cleaned = clean_html_tags(line)
-                    if not cleaned or cleaned.isdigit():
-                        continue
-                    
-                    # Check if line contains any known event name
-                    for event_name in KNOWN_EVENTS_BUTTON_ID.values():
-                        if event_name in cleaned:
-                            if event_name not in danger_zones:
-                                danger_zones.append(event_name)
-                                debug_message(f"  Found danger zone: {event_name}", COLORS['ok'])
-                            break
-            
-            # Close gump
-            try:
-                Gumps.CloseGump(DANGER_ZONES_GUMP_ID)
-            except Exception:
-                pass
-        
-        debug_message(f"Danger zones found: {len(danger_zones)}", COLORS['info'])
-        return danger_zones
-        
-    except Exception as e:
-        debug_message(f"Error reading danger zones: {e}", COLORS['bad'])
-        return []
-
-def read_haven_areas_gump():
-    """Open and read haven areas gump to get list of safe haven areas.
-    
-    Returns:
-        List of haven area names (e.g., ['Luna', 'Delucia'])
-    """
-    haven_areas = []
-    
-    try:
-        debug_message("Reading haven areas from [HavenAreas gump...", COLORS['info'])
-        
-        # Retry up to 3 times if gump fails to open
-        for attempt in range(3):
-            if attempt > 0:
-                debug_message(f"  Retry {attempt}/3 for haven areas gump...", COLORS['warn'])
-                Misc.Pause(1000)
-            
-            # Open haven areas gump
-            send_text_command("[HavenAreas")
-             
-            if wait_for_gump(HAVEN_AREAS_GUMP_ID, WAIT_GUMP_MS):
-                server_sync_delay()
+def find_known_event_names(lines):
+    """Known event names mentioned in gump lines , in order of first appearance."""
+    found = []
+    for line in lines or []:
+        cleaned = clean_html_tags(line)
+        if not cleaned or cleaned.isdigit():
+            continue
+        # Check if line contains any known event name
+        for event_name in KNOWN_EVENTS_BUTTON_ID.values():
+            if event_name in cleaned:
+                if event_name not in found:
+                    found.append(event_name)
                 break
-        else:
-            debug_message("  Failed to open haven areas gump after 3 attempts", COLORS['bad'])
-            return []
-        
-        if wait_for_gump(HAVEN_AREAS_GUMP_ID, WAIT_GUMP_MS):
-            server_sync_delay()
-            
-            # Read gump lines
-            lines = snap_text_lines(HAVEN_AREAS_GUMP_ID, "Haven Areas")
-            
-            if lines:
-                # Parse area names from lines
-                # Look for lines that match known event names
-                for line in lines:
-                    cleaned = clean_html_tags(line)
-                    if not cleaned or cleaned.isdigit():
-                        continue
-                    
-                    # Check if line contains any known event name
-                    for event_name in KNOWN_EVENTS_BUTTON_ID.values():
-                        if event_name in cleaned:
-                            if event_name not in haven_areas:
-                                haven_areas.append(event_name)
-                                debug_message(f"  Found haven area: {event_name}", COLORS['ok'])
-                            break
-            
-            # Close gump
-            try:
-                Gumps.CloseGump(HAVEN_AREAS_GUMP_ID)
-            except Exception:
-                pass
-        
-        debug_message(f"Haven areas found: {len(haven_areas)}", COLORS['info'])
-        return haven_areas
-        
-    except Exception as e:
-        debug_message(f"Error reading haven areas: {e}", COLORS['bad'])
-        return []
+    return found
 
-def read_challenge_gump():
-    """Open and read challenge gump to get current challenge event.
+def harvest_zone_status_gumps():
+    """Send every zone status command back to back through the text command queue ,
+    then harvest each gump by its ID as it arrives. Commands whose gump never showed are resent.
     
     Returns:
-        List with challenge event name (e.g., ['Deceit']) or empty list
+        Dict of zone status key -> gump lines , keys missing when their gump never opened
     """
-    challenge_events = []
-    
-    try:
-        debug_message("Reading challenge from [challenge gump...", COLORS['info'])
-        
-        # Retry up to 3 times if gump fails to open
-        for attempt in range(3):
-            if attempt > 0:
-                debug_message(f"  Retry {attempt}/3 for challenge gump...", COLORS['warn'])
-                Misc.Pause(1000)
-            
-            # Open challenge gump
-            send_text_command("[challenge")
-             
-            if wait_for_gump(CHALLENGE_GUMP_ID, WAIT_GUMP_MS):
-                server_sync_delay()
-                break
-        else:
-            debug_message("  Failed to open challenge gump after 3 attempts", COLORS['bad'])
-            return []
-        
-        if wait_for_gump(CHALLENGE_GUMP_ID, WAIT_GUMP_MS):
-            server_sync_delay()
-            
-            # Read gump lines
-            lines = snap_text_lines(CHALLENGE_GUMP_ID, "Challenge")
-            
-            if lines:
-                # Parse challenge event names from lines
-                # Look for lines that match known event names
-                for line in lines:
-                    cleaned = clean_html_tags(line)
-                    if not cleaned or cleaned.isdigit():
-                        continue
-                    
-                    # Check if line contains any known event name
-                    for event_name in KNOWN_EVENTS_BUTTON_ID.values():
-                        if event_name in cleaned:
-                            if event_name not in challenge_events:
-                                challenge_events.append(event_name)
-                                debug_message(f"  Found challenge event: {event_name}", COLORS['ok'])
-                            break
-            
-            # Close gump
-            try:
-                Gumps.CloseGump(CHALLENGE_GUMP_ID)
-            except Exception:
-                pass
-        
-        debug_message(f"Challenge events found: {len(challenge_events)}", COLORS['info'])
-        return challenge_events
-        
-    except Exception as e:
-        debug_message(f"Error reading challenge: {e}", COLORS['bad'])
-        return []
+    pending = dict((key, (command, gump_id, label)) for key, command, gump_id, label in ZONE_STATUS_GUMPS)
+    harvested = {}
+    for attempt in range(ZONE_STATUS_ATTEMPTS):
+        if attempt > 0:
+            debug_message(f"  Retry {attempt}/{ZONE_STATUS_ATTEMPTS} for {', '.join(pending)} gumps...", COLORS['warn'])
+        for key, (command, gump_id, label) in pending.items():
+            send_text_command(command, gump_id)
+        # the slowest response bounds the wait , not the sum of all three
+        deadline = _now_ms() + WAIT_GUMP_MS
+        while pending and _now_ms() < deadline:
+            for key, (command, gump_id, label) in list(pending.items()):
+                try:
+                    arrived = Gumps.HasGump(gump_id)
+                except Exception:
+                    arrived = False
+                if not arrived:
+                    continue
+                harvested[key] = snap_text_lines(gump_id, label)
+                del pending[key]
+                try:
+                    Gumps.CloseGump(gump_id)
+                except Exception:
+                    pass
+            if pending:
+                Misc.Pause(GUMP_POLL_MS)
+        # the last command of the batch has no next send to check it
+        warning_line = _TEXT_COMMANDS.flush()
+        if warning_line and pending:
+            debug_message(f"  Zone status commands throttled ({warning_line}) , {', '.join(pending)} not answered", COLORS['warn'])
+        if not pending:
+            break
+    for key in pending:
+        debug_message(f"  Failed to open {pending[key][2]} gump after {ZONE_STATUS_ATTEMPTS} attempts", COLORS['bad'])
+    return harvested
 
 def get_dynamic_zone_status():
     """Get current danger zones, haven areas, and challenge events by reading gumps.
@@ -1133,15 +1258,21 @@ def get_dynamic_zone_status():
     debug_message("READING DYNAMIC ZONE STATUS", COLORS['title'])
     debug_message("="*60, COLORS['title'])
     
-    danger_zones = read_danger_zones_gump()
-    Misc.Pause(500)  # Brief pause between gump commands
-    haven_areas = read_haven_areas_gump()
-    Misc.Pause(500)  # Brief pause between gump commands
-    challenge_events = read_challenge_gump()
+    harvested = {}
+    try:
+        harvested = harvest_zone_status_gumps()
+    except Exception as e:
+        debug_message(f"Error reading zone status gumps: {e}", COLORS['bad'])
+    
+    # Parse every harvested gump in one pass
+    zone_status = {}
+    for key, command, gump_id, label in ZONE_STATUS_GUMPS:
+        zone_status[key] = find_known_event_names(harvested.get(key))
+        debug_message(f"{label} found: {', '.join(zone_status[key]) or 'none'}", COLORS['info'])
     
     debug_message("="*60 + "\n", COLORS['title'])
     
-    return (danger_zones, haven_areas, challenge_events)
+    return (zone_status['danger'], zone_status['haven'], zone_status['challenge'])
 
 def process_event_page(button_id, all_events_data, raw_gump_data, page_number, total_pages, retry_count=0):
     """Process a single event page by clicking its button and reading the detail gump."""
@@ -1165,9 +1296,7 @@ def process_event_page(button_id, all_events_data, raw_gump_data, page_number, t
             debug_message(f"    [ERROR] Failed to click button {button_id}: {e}", COLORS['bad'])
             return 'no_gump'
         
-        # Wait for a detail gump to appear
-        Misc.Pause(DELAY_AFTER_DETAIL_GUMP_OPEN)
-        server_sync_delay()
+        # The detail gump is polled for below , no fixed wait here
         
         # Determine event name from button ID first
         event_name = KNOWN_EVENTS_BUTTON_ID.get(button_id, f"Event_Button_{button_id}")
@@ -1306,6 +1435,9 @@ def collect_all_events_data():
     
     total_pages = len(EVENT_PAGE_BUTTONS)
     current_page = 0
+    cached_events = load_event_cache() if EVENT_CACHE_ENABLED else {}
+    row_hashes = event_list_row_hashes(events_list_lines) if EVENT_CACHE_ENABLED else {}
+    details_opened = 0
     
     # Visit each event page
     for button_id in EVENT_PAGE_BUTTONS:
@@ -1317,6 +1449,15 @@ def collect_all_events_data():
             debug_message(f"\n[PAGE {current_page}/{total_pages}] Skipping seasonal event: {event_name} (button {button_id})", COLORS['warn'])
             continue
         
+        # Reuse the cached detail while its list row is unchanged and fresh
+        event_name = KNOWN_EVENTS_BUTTON_ID.get(button_id, f"Event_Button_{button_id}")
+        cache_entry = cached_events.get(event_name)
+        if EVENT_CACHE_ENABLED and cached_event_is_current(cache_entry, row_hashes.get(event_name)):
+            debug_message(f"\n[PAGE {current_page}/{total_pages}] {event_name} list row unchanged , using cached detail", COLORS['info'])
+            all_events_data.append(cache_entry['event'])
+            raw_gump_data[event_name] = cache_entry.get('raw', {})
+            continue
+        
         # Verify events list is still open before processing
         if not Gumps.HasGump(EVENTS_LIST_GUMP_ID):
             debug_message(f"\n[PAGE {current_page}/{total_pages}] Events list gump closed, reopening...", COLORS['warn'])
@@ -1328,6 +1469,7 @@ def collect_all_events_data():
                 break
         
         # Process this event page with retry logic
+        details_opened += 1
         result = process_event_page(button_id, all_events_data, raw_gump_data, current_page, total_pages, retry_count=0)
         
         # Retry if failed
@@ -1389,6 +1531,16 @@ def collect_all_events_data():
                     "lines": [],
                     "error": error_msg
                 }
+                # never serve a failed read from the cache
+                cached_events.pop(event_name, None)
+        elif EVENT_CACHE_ENABLED:
+            event_name = KNOWN_EVENTS_BUTTON_ID.get(button_id, f"Event_Button_{button_id}")
+            cached_events[event_name] = {
+                'row_hash': row_hashes.get(event_name),
+                'read_at': time.time(),
+                'event': all_events_data[-1],
+                'raw': raw_gump_data.get(event_name, {}),
+            }
         
         _close_open_event_detail_gumps()
         
@@ -1397,7 +1549,7 @@ def collect_all_events_data():
         server_sync_delay()  # Sync between pages
     
     debug_message(f"\n" + "#"*60, COLORS['title'])
-    debug_message(f"#  COLLECTION COMPLETE: {len(all_events_data)} events processed from {total_pages} pages", COLORS['ok'])
+    debug_message(f"#  COLLECTION COMPLETE: {len(all_events_data)} events processed from {total_pages} pages , {details_opened} details opened", COLORS['ok'])
     debug_message("#"*60 + "\n", COLORS['title'])
     
     # Report discovered events
@@ -1442,6 +1594,9 @@ def collect_all_events_data():
         
         debug_message("="*60 + "\n", COLORS['info'])
     
+    if EVENT_CACHE_ENABLED:
+        save_event_cache(cached_events)
+    
     # Save to JSON if enabled
     if EXPORT_TO_JSON:
         save_events_to_json(all_events_data, raw_gump_data)
@@ -1525,7 +1680,6 @@ def claim_event_points(event_name, event_button_id, detail_gump_id):
         
         # Wait for confirmation gump (0x11775c2e)
         debug_message(f"Waiting for confirmation gump ({hex(CLAIM_CONFIRM_GUMP_ID)})...", COLORS['info'])
-        Misc.Pause(800)
         
         if wait_for_gump(CLAIM_CONFIRM_GUMP_ID, WAIT_GUMP_MS):
             debug_message(f"  Confirmation gump appeared!", COLORS['ok'])
@@ -1548,6 +1702,8 @@ def claim_event_points(event_name, event_button_id, detail_gump_id):
             debug_message(f"\n{'='*60}", COLORS['ok'])
             debug_message(f" Successfully claimed {event_name} points!", COLORS['ok'])
             debug_message(f"{'='*60}\n", COLORS['ok'])
+            # the cached detail still shows the points before the claim
+            forget_cached_event(event_name)
             
             return True
         else:
@@ -1956,9 +2112,7 @@ def main():
         challenge_events = []
         
         if USE_DYNAMIC_ZONE_STATUS:
-            # Add delay before reading status gumps to avoid "too many commands"
-            debug_message("\nWaiting before reading zone status gumps...", COLORS['info'])
-            Misc.Pause(2000)  # 2 second delay
+            # the text command queue spaces these commands after the event collection
             danger_zones, safe_zones, challenge_events = get_dynamic_zone_status()
         
         # Auto-claim events if enabled and configured
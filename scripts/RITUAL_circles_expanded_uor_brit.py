@@ -32,10 +32,14 @@ Black pearl , nightshade
 
 for UOR Britain location , a large open area with the moongate at center , 
 
-VERSION = 20250621
+VERSION = 20261019
 """
 
+import hashlib
+import json
 import math
+import os
+import time
 from System.Collections.Generic import List
 import datetime
 
@@ -174,6 +178,14 @@ PAUSE_DURATION = 600  # Pause between actions
 PAUSE_DURATION_SHORT = 400
 PAUSE_DURATION_PLACE = 700
 
+# Placement log , append-only record of each placement so an interrupted run resumes where it stopped
+PLACEMENT_LOG_ENABLED = True
+PLACEMENT_LOG_SYNC_EVERY = 10  # fsync the log after this many placements
+PLACEMENT_LOG_VERIFY_RANGE = 18  # a logged placement is only skipped while it is seen on the ground within this range
+PLACEMENT_LOG_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "ritual_runs")
+_PLACEMENT_LOG = None
+_PLACEMENT_INCOMPLETE = []  # parts of the layout this run did not place , any keeps the log for the next run
+
 # Item IDs
 # Main circle items
 ITEM_CIRCLE_A_ID = 0x0C70  # Lettuce
@@ -272,6 +284,172 @@ def is_valid_position(x, y, z=None):
     except:
         return False
 
+def items_on_ground_at(item_id, x, y):
+    """How many item_id items lie on the ground at (x, y) , None when the tile is out of view and cannot be checked."""
+    if max(abs(Player.Position.X - int(x)), abs(Player.Position.Y - int(y))) > PLACEMENT_LOG_VERIFY_RANGE:
+        return None
+    try:
+        ground_filter = Items.Filter()
+        ground_filter.Enabled = True
+        ground_filter.OnGround = True
+        ground_filter.RangeMin = 0
+        ground_filter.RangeMax = PLACEMENT_LOG_VERIFY_RANGE
+        ground_items = Items.ApplyFilter(ground_filter) or []
+    except Exception:
+        return None
+    return sum(1 for ground_item in ground_items
+               if ground_item.ItemID == item_id and ground_item.Position.X == int(x) and ground_item.Position.Y == int(y))
+
+class PlacementLog:
+    """Append-only record of the placements made for one layout at one center.
+    Each placement is one JSON line , flushed as it is written and fsynced every PLACEMENT_LOG_SYNC_EVERY lines.
+    A later session with the same layout and center replays the log and skips what was already placed."""
+
+    def __init__(self, ritual_name, layout, center_x, center_y):
+        layout_json = json.dumps(layout, sort_keys=True, default=str)
+        layout_hash = hashlib.sha1(layout_json.encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(PLACEMENT_LOG_FOLDER, f"{ritual_name}_{layout_hash}_{center_x}_{center_y}.ndjson")
+        self.logged = {}    # (item_id, x, y) -> placements recorded by earlier sessions
+        self.reached = {}   # (item_id, x, y) -> placements reached in this session
+        self.unsynced = 0
+        self.file = None
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a disconnect
+                    key = (record["i"], record["x"], record["y"])
+                    self.logged[key] = self.logged.get(key, 0) + 1
+        except Exception as e:
+            Misc.SendMessage(f"Could not read placement log: {e}", 33)
+        total = sum(self.logged.values())
+        if total:
+            Misc.SendMessage(f"Resuming: {total} placements already logged in {os.path.basename(self.path)}", 67)
+
+    def is_logged(self, item_id, x, y):
+        """True when the next placement of item_id at (x, y) was made by an earlier session and still lies there.
+        The items on the tile are counted against the placements reached so far , on a stacked tile only as many
+        logged drops are skipped as items remain and the rest are forgotten so they are placed again.
+        A tile out of view is not skipped yet and is checked again once the player walks there."""
+        key = (item_id, int(x), int(y))
+        reached = self.reached.get(key, 0)
+        if reached >= self.logged.get(key, 0):
+            return False
+        on_ground = items_on_ground_at(item_id, x, y)
+        if on_ground is None:
+            return False
+        if on_ground <= reached:
+            self.logged[key] = reached
+            return False
+        return True
+
+    def consume(self, item_id, x, y):
+        """Step past an already logged placement , False when it still has to be made."""
+        if not self.is_logged(item_id, x, y):
+            return False
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        return True
+
+    def logged_for(self, item_id):
+        """Placements of item_id recorded by earlier sessions."""
+        return sum(count for (logged_id, _, _), count in self.logged.items() if logged_id == item_id)
+
+    def record(self, item_id, x, y):
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        try:
+            if self.file is None:
+                if not os.path.exists(PLACEMENT_LOG_FOLDER):
+                    os.makedirs(PLACEMENT_LOG_FOLDER)
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(json.dumps({"i": item_id, "x": int(x), "y": int(y), "t": int(time.time())}) + "\n")
+            self.file.flush()
+            self.unsynced += 1
+            if self.unsynced >= PLACEMENT_LOG_SYNC_EVERY:
+                self.sync()
+        except Exception as e:
+            Misc.SendMessage(f"Could not write placement log: {e}", 33)
+
+    def sync(self):
+        if self.file is None or not self.unsynced:
+            return
+        try:
+            os.fsync(self.file.fileno())
+        except (AttributeError, OSError):
+            pass
+        self.unsynced = 0
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def finish(self):
+        """The ritual completed , the log is removed so a later ritual at this center starts fresh."""
+        self.close()
+        try:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            Misc.SendMessage(f"Could not remove placement log: {e}", 33)
+
+def open_placement_log(ritual_name, layout, center_x, center_y):
+    """Start or resume the placement log for this layout and center."""
+    global _PLACEMENT_LOG
+    close_placement_log()
+    del _PLACEMENT_INCOMPLETE[:]
+    if not PLACEMENT_LOG_ENABLED:
+        return None
+    _PLACEMENT_LOG = PlacementLog(ritual_name, layout, int(center_x), int(center_y))
+    return _PLACEMENT_LOG
+
+def close_placement_log():
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.close()
+        _PLACEMENT_LOG = None
+
+def finish_placement_log():
+    """Remove the log of a completed ritual , only an interrupted run leaves one to resume from."""
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.finish()
+        _PLACEMENT_LOG = None
+
+def mark_placement_incomplete(reason):
+    """Note a part of the layout that was not placed , the run then keeps its log to resume from."""
+    if reason in _PLACEMENT_INCOMPLETE:
+        return
+    _PLACEMENT_INCOMPLETE.append(reason)
+
+def end_placement_log():
+    """Remove the log only when every point was placed or already logged , otherwise keep it for the next run.
+    Returns True when the ritual is complete."""
+    if _PLACEMENT_INCOMPLETE:
+        shown = ", ".join(_PLACEMENT_INCOMPLETE[:3]) + (" ..." if len(_PLACEMENT_INCOMPLETE) > 3 else "")
+        Misc.SendMessage(f"Placement incomplete ( {len(_PLACEMENT_INCOMPLETE)} parts missed : {shown} ) , run again here to resume", 33)
+        close_placement_log()
+        return False
+    finish_placement_log()
+    return True
+
+def placements_logged_for(item_id):
+    """Placements of item_id already made by earlier sessions , taken off the backpack requirement on resume."""
+    return _PLACEMENT_LOG.logged_for(item_id) if _PLACEMENT_LOG is not None else 0
+
+def placement_logged(item_id, x, y):
+    """True when this placement was already made by an earlier session , used to skip walking to it."""
+    return _PLACEMENT_LOG is not None and _PLACEMENT_LOG.is_logged(item_id, x, y)
+
 def place_item(point_x, point_y, item_id, z=None):
     """Place a single item at the specified coordinates with verification.
     Returns True if placement was successful."""
@@ -283,9 +461,14 @@ def place_item(point_x, point_y, item_id, z=None):
     if z is None:
         z = Player.Position.Z
     
+    # Already placed by an earlier session of this layout
+    if _PLACEMENT_LOG is not None and _PLACEMENT_LOG.consume(item_id, point_x, point_y):
+        return True
+    
     # First check if position is valid
     if not is_valid_position(point_x, point_y):
         Misc.SendMessage(f"Warning: Invalid position at ({point_x}, {point_y}), skipping...", 33)
+        mark_placement_incomplete(f"0x{item_id:X} at ({point_x},{point_y})")
         return False
     
     # Check cached item count first, retry if empty
@@ -298,6 +481,7 @@ def place_item(point_x, point_y, item_id, z=None):
         Misc.Pause(PAUSE_DURATION * 2)  # Wait longer to allow for restock or pickup
     else:
         Misc.SendMessage(f"Error: Still no items of type {hex(item_id)} after {cache_retry_attempts} cache updates. Skipping point.", 33)
+        mark_placement_incomplete(f"0x{item_id:X} at ({point_x},{point_y})")
         return False
     
     for attempt in range(max_retries):
@@ -306,6 +490,7 @@ def place_item(point_x, point_y, item_id, z=None):
             while abs(Player.Position.X - point_x) > 1 or abs(Player.Position.Y - point_y) > 1:
                 if move_attempts >= max_move_attempts:
                     Misc.SendMessage(f"Warning: Failed to reach position ({point_x}, {point_y}) after {max_move_attempts} attempts", 33)
+                    mark_placement_incomplete(f"0x{item_id:X} at ({point_x},{point_y})")
                     return False
                     
                 if not gotoLocation(point_x, point_y):
@@ -335,10 +520,13 @@ def place_item(point_x, point_y, item_id, z=None):
             placement_time = (datetime.datetime.now() - placement_start).total_seconds()
             if placement_time > 2.0:  # If placement takes more than 2 seconds
                 Misc.SendMessage(f"Warning: Placement timed out at ({point_x}, {point_y})", 33)
+                mark_placement_incomplete(f"0x{item_id:X} at ({point_x},{point_y})")
                 return False
             
             # Update cache after successful placement
             ITEM_CACHE.decrement_count(item_id)
+            if _PLACEMENT_LOG is not None:
+                _PLACEMENT_LOG.record(item_id, point_x, point_y)
             return True
             
         except Exception as e:
@@ -346,6 +534,7 @@ def place_item(point_x, point_y, item_id, z=None):
             Misc.Pause(base_delay)
             continue
     
+    mark_placement_incomplete(f"0x{item_id:X} at ({point_x},{point_y})")
     return False
 
 def generate_circle_concentric_points(center_x, center_y, radius, _, circle_num):
@@ -570,15 +759,18 @@ def place_items_at_points(points, item_id, z=None, progress_msg="Placing items")
     points_placed = 0
     total_points = len(points)
     
-    # First check if we have enough items
+    # First check if we have enough items , points placed by an earlier session need none
+    needed_items = sum(1 for point_x, point_y in points if not placement_logged(item_id, point_x, point_y))
     available_items = ITEM_CACHE.get_count(item_id)
-    if available_items < total_points:
-        Misc.SendMessage(f"Warning: Not enough items for this pattern. Have {available_items}, need {total_points}. Skipping this pattern.", 33)
+    if available_items < needed_items:
+        Misc.SendMessage(f"Warning: Not enough items for this pattern. Have {available_items}, need {needed_items}. Skipping this pattern.", 33)
+        mark_placement_incomplete(progress_msg)
         return set()
     
     Misc.SendMessage(f"{progress_msg}... (0/{total_points})", 68)
     for point_x, point_y in points:
         try:
+            resumed = placement_logged(item_id, point_x, point_y)
             if place_item(point_x, point_y, item_id, z):
                 placed_positions.add((point_x, point_y))
                 points_placed += 1
@@ -588,10 +780,12 @@ def place_items_at_points(points, item_id, z=None, progress_msg="Placing items")
                 Misc.SendMessage(f"Warning: Failed to place item at ({point_x}, {point_y})", 33)
             
             # Throttle between placements to prevent client overload
-            Misc.Pause(500)
+            if not resumed:
+                Misc.Pause(500)
             
         except Exception as e:
             Misc.SendMessage(f"Warning: Error placing item at ({point_x}, {point_y}): {str(e)}", 33)
+            mark_placement_incomplete(f"0x{item_id:X} at ({point_x},{point_y})")
             continue
     
     if points_placed < total_points:
@@ -722,7 +916,8 @@ def gotoLocation(x, y, max_retries=3):
     return False
 
 def complete_ritual(center_x, center_y):
-    """Complete the ritual circle placement at the specified center point."""
+    """Complete the ritual circle placement at the specified center point.
+    Returns True when every point was placed , an incomplete run keeps its placement log to resume from."""
     center_z = Player.Position.Z
     all_positions = set()
     
@@ -771,8 +966,10 @@ def complete_ritual(center_x, center_y):
     if PLACE_COMPONENTS["Y_final_12"] or PLACE_COMPONENTS["Z_final_13"]:
         place_outer_ring(center_x, center_y, center_z)
     
+    if not end_placement_log():
+        return False
     Misc.SendMessage(f"Ritual circle placement complete. Total positions: {len(all_positions)}", 68)
-    return all_positions
+    return True
 
 def finalize_ritual(center_x, center_y):
     """Complete the ritual by returning to center and using Spirit Speak."""
@@ -1226,13 +1423,18 @@ def main():
         
         Misc.SendMessage(f"=== Starting Ritual at ({center_x}, {center_y}) ===", 68)
         
-        # Place all ritual components
-        complete_ritual(center_x, center_y)
+        # Place all ritual components , resuming from the placement log of an earlier run here
+        open_placement_log("circles_expanded", {"components": PLACE_COMPONENTS, "config": RITUAL_CONFIG}, center_x, center_y)
+        try:
+            completed = complete_ritual(center_x, center_y)
+        finally:
+            close_placement_log()
         
         # Complete ritual by returning to center
         finalize_ritual(center_x, center_y)
         
-        Misc.SendMessage("=== Ritual Complete ===", 68)
+        if completed:
+            Misc.SendMessage("=== Ritual Complete ===", 68)
         
     except Exception as e:
         Misc.SendMessage(f"Error in ritual: {str(e)}", 33)
@@ -7,10 +7,14 @@ dark cloth, black pearl, eye of newt ,
 bones, bone piles, rib cages
 stacked plant bowls , lantern , death orb 
 
-VERSION::20250917
+VERSION::20261019
 """
+import hashlib
+import json
+import os
 import math
 import time
+import struct
 import random
 
 DEBUG_MODE = False            # debug messages in journal
@@ -106,6 +110,9 @@ CENTER_NUDGE_STEPS = 2
 
 PLACE_MAX_RETRIES = 2
 PLACE_BACKOFF_BASE = 250
+INVENTORY_RECONCILE_EVERY = 25  # re-read BackpackCount after this many locally counted drops
+INVENTORY_GROUND_POLLS = 2  # ground scans for a dropped item before asking the server
+INVENTORY_GROUND_SCAN_RANGE = 6  # tiles around the player scanned for dropped items
 POINT_TIMEOUT_MS = 1500
 POINT_BREATHER_MS = 250
 
@@ -124,6 +131,16 @@ PREVIEW_RANDOM_POOL_DELAY_MS = 400  # extra delay per preview random-pool item
 MAX_PHASE_FAILURES = 6
 PLACED_COORDS_BY_ITEM = {}
 BAD_COORDS = set()
+FOOTPRINT_PREPASS = True  # classify every layout tile before walking , unplaceable tiles are reported and skipped
+PLACEMENT_LOG_ENABLED = True  # append each live placement to data/ritual_runs , a rerun at the same center resumes
+PLACEMENT_LOG_SYNC_EVERY = 10  # fsync the placement log after this many placements
+PLACEMENT_LOG_VERIFY_RANGE = 18  # a logged placement is only skipped while it is seen on the ground within this range
+PLACEMENT_LOG_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "ritual_runs")
+_PLACEMENT_LOG = None  # set by open_placement_log() for a live run
+_PLACEMENT_INCOMPLETE = []  # parts of the layout this run did not place , any keeps the log for the next run
+LAND_ID_CACHE = {}  # (map, x, y) -> land id , land never changes during a ritual
+GROUND_Z_CACHE = {}  # (map, x, y) -> ground Z from land and statics
+SHAPE_CACHE = {}  # generator parameters -> point offsets around the origin , translated per center
 EXCLUDED_COORDS = set()  # Global exclusion zone coordinates
 ENABLE_STACK_TRACKING = True
 # Tracks the next available Z at a given (x,y) after successful placements.
@@ -233,7 +250,10 @@ def throttle(min_gap_ms=RATE_MIN_GAP_MS):
     LAST_ACTION_MS = now_ms()
 
 def get_ground_z(x, y):
-    """Get the actual ground Z coordinate at the specified tile."""
+    """Get the actual ground Z coordinate at the specified tile , cached once a lookup succeeds."""
+    key = (Player.Map, x, y)
+    if key in GROUND_Z_CACHE:
+        return GROUND_Z_CACHE[key]
     try:
         # Get static tiles at this position
         tiles = Statics.GetStaticsTileInfo(x, y, Player.Map)
@@ -243,10 +263,12 @@ def get_ground_z(x, y):
             if walkable_tiles:
                 ground_z = max(t.StaticZ for t in walkable_tiles)
                 debug_message(f"get_ground_z({x},{y}): found static tiles, using Z={ground_z}", 68)
+                GROUND_Z_CACHE[key] = ground_z
                 return ground_z
         # Fallback to land tile Z
         land_z = Statics.GetLandZ(x, y, Player.Map)
         debug_message(f"get_ground_z({x},{y}): using land Z={land_z}", 68)
+        GROUND_Z_CACHE[key] = land_z
         return land_z
     except Exception as e:
         debug_message(f"get_ground_z({x},{y}): error {e}, using player Z={Player.Position.Z}", 68)
@@ -269,88 +291,93 @@ def compute_target_z(x, y, proposed_z):
     # Use ground Z as base instead of proposed Z
     return ground_z
 
+def get_land_id(x, y, game_map=None):
+    """Land tile id at (x, y) , looked up once per session. None when the lookup fails."""
+    if game_map is None:
+        game_map = Player.Map
+    key = (game_map, x, y)
+    if key not in LAND_ID_CACHE:
+        try:
+            LAND_ID_CACHE[key] = Statics.GetLandID(x, y, game_map)
+        except Exception:
+            LAND_ID_CACHE[key] = None
+    return LAND_ID_CACHE[key]
+
 def is_safe_ground(x, y, game_map=None):
     if game_map is None:
         game_map = Player.Map
     if (x, y) in BAD_COORDS:
         return False
-    try:
-        land_id = Statics.GetLandID(x, y, game_map)
-    except Exception:
+    land_id = get_land_id(x, y, game_map)
+    if land_id is None:
         return False
     BAD_LAND_IDS = {0x0001}
     if land_id in BAD_LAND_IDS:
         return False
     return True
 
+def classify_footprint(tiles, label="Layout"):
+    """Check every tile of a layout in one sweep before any walking or placing.
+    Unplaceable tiles go into BAD_COORDS and are reported up front. Returns them as a list."""
+    unique_tiles = []
+    seen = set()
+    for tile in tiles:
+        xy = (int(tile[0]), int(tile[1]))
+        if xy not in seen:
+            seen.add(xy)
+            unique_tiles.append(xy)
+    unplaceable = [xy for xy in unique_tiles if not is_safe_ground(xy[0], xy[1])]
+    BAD_COORDS.update(unplaceable)
+    if unplaceable:
+        sample = ", ".join(f"({x},{y})" for x, y in unplaceable[:8])
+        more = " ..." if len(unplaceable) > 8 else ""
+        debug_message(f"{label}: {len(unplaceable)} of {len(unique_tiles)} tiles unplaceable , skipping {sample}{more}", 33)
+    else:
+        debug_message(f"{label}: all {len(unique_tiles)} tiles placeable", 68)
+    return unplaceable
+
+def footprint_disk(center_x, center_y, radius):
+    """Every tile within radius of the center , for layouts whose points are only known while placing."""
+    return [
+        (center_x + dx, center_y + dy)
+        for dx in range(-radius, radius + 1)
+        for dy in range(-radius, radius + 1)
+        if dx * dx + dy * dy <= radius * radius
+    ]
+
 # ===== PREVIEW FUNCTIONS =====
-def _convert_packet_to_bytes(packet_list):
-    byte_list = []
-    for value in packet_list:
-        if value:
-            byte_list.append(int(value, 16))
-        else:
-            byte_list.append(0)
-    return byte_list
+# client-only serials keep the high byte 0x48 of the original packet template
+FAKE_SERIAL_MIN = 0x48000000
+FAKE_SERIAL_MAX = 0x48FFFFFF
+
+# 0xF3 world item packet , 26 bytes , rendered by the client only
+# serial at 4 , graphic at 8 , x y z at 15 , hue at 21 , every other byte is fixed
+_FAKE_ITEM_TEMPLATE = (
+    0xF3, 0x00, 0x01, 0x00, 0x48, 0xFC, 0xBB, 0x12, 0x00, 0x00, 0x00, 0x00, 0x01,
+    0x00, 0x01, 0x05, 0x88, 0x06, 0x88, 0x0A, 0x00, 0x04, 0x15, 0x20, 0x00, 0x00,
+)
+_FAKE_ITEM_PACKET = bytearray(_FAKE_ITEM_TEMPLATE)
+_PACK_SERIAL_GRAPHIC = struct.Struct('>IH')
+_PACK_LOCATION = struct.Struct('>HHB')
+_PACK_HUE = struct.Struct('>H')
+
+def build_fake_item_packet(serial, item_x, item_y, item_z, item_id, hue=0):
+    """Fill the reusable 0xF3 buffer in place and return it as a list of byte values."""
+    packet = _FAKE_ITEM_PACKET
+    _PACK_SERIAL_GRAPHIC.pack_into(packet, 4, serial & 0xFFFFFFFF, int(item_id) & 0xFFFF)
+    # Z is a signed byte on the wire , -1 encodes as 0xFF
+    _PACK_LOCATION.pack_into(packet, 15, int(item_x) & 0xFFFF, int(item_y) & 0xFFFF, int(item_z) & 0xFF)
+    _PACK_HUE.pack_into(packet, 21, int(hue) & 0xFFFF)
+    return list(packet)
 
-def _send_fake_item(item_x, item_y, item_z, item_id_4hex_with_space, hue_4hex_with_space):
+def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
+    if isinstance(item_id, str):
+        item_id = int(item_id, 16)
     try:
-        packet = (
-            "F3 00 01 00 48 FC BB 12 "
-            + item_id_4hex_with_space
-            + " 00 00 01 00 01 05 88 06 88 0A 00 04 15 20 00 00"
-        )
-        packet_list = packet.split(" ")
-
-        serial_hex = hex(random.randrange(0, 0xFFFFFF))[2:].zfill(6)
-
-        i_loc_x = hex(int(item_x))[2:].zfill(4)
-        i_loc_y = hex(int(item_y))[2:].zfill(4)
-        i_loc_z = hex(int(item_z))[2:].zfill(2)
-
-        x1, x2 = i_loc_x[:2], i_loc_x[2:]
-        y1, y2 = i_loc_y[:2], i_loc_y[2:]
-
-        hues = hue_4hex_with_space.split(" ")
-
-        packet_list[5] = serial_hex[0:2]
-        packet_list[6] = serial_hex[2:4]
-        packet_list[7] = serial_hex[4:6]
-        packet_list[15] = x1
-        packet_list[16] = x2
-        packet_list[17] = y1
-        packet_list[18] = y2
-        packet_list[19] = i_loc_z
-        packet_list[21] = hues[0]
-        packet_list[22] = hues[1]
-
-        byte_list = _convert_packet_to_bytes(packet_list)
-        PacketLogger.SendToClient(byte_list)
+        serial = random.randrange(FAKE_SERIAL_MIN, FAKE_SERIAL_MAX)
+        PacketLogger.SendToClient(build_fake_item_packet(serial, x, y, z, item_id, hue))
     except Exception as e:
-        debug_message(f"Preview send failed: {e}", 33)
-
-def _format_hex_4_with_space(value):
-    """Convert a value to a 4-digit hex string with space in the middle.
-    Handles both integer and string inputs, including '0x' prefixed strings.
-    """
-    try:
-        # If value is a string with '0x' prefix, convert it to int first
-        if isinstance(value, str) and value.lower().startswith('0x'):
-            value = int(value, 16)
-        # Convert to integer and ensure it's 16-bit
-        value_int = int(value) & 0xFFFF
-        # Format as 4-digit hex, uppercase, zero-padded
-        hex_str = f"{value_int:04X}"
-        # Insert space in the middle (e.g., '0010' -> '00 10')
-        return f"{hex_str[:2]} {hex_str[2:]}"
-    except (ValueError, TypeError) as e:
-        debug_message(f"ERROR: Could not format value '{value}' as hex: {e}", 33)
-        return "00 00"  # Return a safe default
-
-def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
-    item_hex = _format_hex_4_with_space(item_id)
-    hue_hex = _format_hex_4_with_space(hue)
-    _send_fake_item(x, y, z, item_hex, hue_hex)
+        debug_message(f"Failed to send item packet: {e}", 33)
 
 # ===== MOVEMENT FUNCTIONS =====
 def dir_to_str(direction):
@@ -510,26 +537,37 @@ def goto_location_with_wiggle(target_x, target_y, center=None):
     return False
 
 # ===== GEOMETRIC FUNCTIONS =====
+def cached_shape(key, build):
+    """Offsets around the origin for one generator parameter set , built once per session.
+    Pillar rings , crack arms and branches reuse the shape at each start point."""
+    shape = SHAPE_CACHE.get(key)
+    if shape is None:
+        shape = tuple(build())
+        SHAPE_CACHE[key] = shape
+    return shape
+
+def translate_points(offsets, center_x, center_y):
+    return [(center_x + dx, center_y + dy) for dx, dy in offsets]
+
+def _circle_offsets(radius, num_points, rotation_deg):
+    angles = [math.radians((360.0 * i / num_points) + rotation_deg) for i in range(num_points)]
+    return [(int(round(radius * math.cos(angle_rad))), int(round(radius * math.sin(angle_rad)))) for angle_rad in angles]
+
+def _line_offsets(angle_deg, length, spacing):
+    angle_rad = math.radians(angle_deg)
+    cos_a = math.cos(angle_rad)
+    sin_a = math.sin(angle_rad)
+    return [(int(round(i * cos_a)), int(round(i * sin_a))) for i in range(0, length, spacing)]
+
 def generate_circle_points(center_x, center_y, radius, num_points, rotation_deg=0):
     """Generate points in a circle around center"""
-    points = []
-    for i in range(num_points):
-        angle_deg = (360.0 * i / num_points) + rotation_deg
-        angle_rad = math.radians(angle_deg)
-        x = center_x + int(round(radius * math.cos(angle_rad)))
-        y = center_y + int(round(radius * math.sin(angle_rad)))
-        points.append((x, y))
-    return points
+    offsets = cached_shape(("circle", radius, num_points, rotation_deg), lambda: _circle_offsets(radius, num_points, rotation_deg))
+    return translate_points(offsets, center_x, center_y)
 
 def generate_line_points(start_x, start_y, angle_deg, length, spacing=1):
     """Generate points along a line from start position"""
-    points = []
-    angle_rad = math.radians(angle_deg)
-    for i in range(0, length, spacing):
-        x = start_x + int(round(i * math.cos(angle_rad)))
-        y = start_y + int(round(i * math.sin(angle_rad)))
-        points.append((x, y))
-    return points
+    offsets = cached_shape(("line", angle_deg, length, spacing), lambda: _line_offsets(angle_deg, length, spacing))
+    return translate_points(offsets, start_x, start_y)
 
 def generate_crack_arm(start_x, start_y, angle_deg, min_len, max_len, branch_chance=0.0, max_branches=0):
     """Generate a crack arm with potential branching"""
@@ -581,23 +619,11 @@ def filter_points_outside_radius(points, center, min_radius, forbidden=None):
         forbidden = set()
     
     cx, cy = center
-    filtered = []
+    min_radius_sq = float(min_radius) * float(min_radius)
+    filtered = [(x, y) for x, y in points
+                if (x, y) not in forbidden and (x - cx) * (x - cx) + (y - cy) * (y - cy) >= min_radius_sq]
     
-    debug_message(f"Filtering {len(points)} points: center=({cx},{cy}), min_radius={min_radius}, forbidden={forbidden}", 68)
-    
-    for x, y in points:
-        if (x, y) in forbidden:
-            debug_message(f"Point ({x},{y}) filtered out: in forbidden set", 68)
-            continue
-        
-        distance = math.hypot(x - cx, y - cy)
-        if distance >= min_radius:
-            filtered.append((x, y))
-            debug_message(f"Point ({x},{y}) kept: distance={distance:.2f} >= {min_radius}", 68)
-        else:
-            debug_message(f"Point ({x},{y}) filtered out: distance={distance:.2f} < {min_radius}", 68)
-    
-    debug_message(f"Filter result: {len(filtered)}/{len(points)} points kept", 67)
+    debug_message(f"Filter result: {len(filtered)}/{len(points)} points kept , center=({cx},{cy}), min_radius={min_radius}, forbidden={len(forbidden)}", 67)
     return filtered
 
 # ===== ITEM PLACEMENT FUNCTIONS =====
@@ -631,6 +657,259 @@ def get_first_available_item_id(item_ids, min_count=0):
     # If no items meet min_count, return first valid ID anyway to attempt placement
     return valid_ids[0] if valid_ids else None
 
+class BackpackInventory:
+    """Local model of the backpack stacks drops are taken from.
+    Counts are read once , decremented on each verified drop , and re-read from the server only every
+    INVENTORY_RECONCILE_EVERY drops or when a drop does not show up on the ground."""
+
+    def __init__(self):
+        self.counts = {}             # item_id -> backpack count
+        self.stacks = {}             # item_id -> [serial, amount] of the stack drops are taken from
+        self.drops_since_sync = {}   # item_id -> drops credited since the last BackpackCount
+        self.seen_ground = set()     # ground serials already seen , a drop is confirmed by a serial not in here
+
+    def sync(self, item_id):
+        """Re-read the server count and forget the cached stack."""
+        try:
+            count = Items.BackpackCount(item_id, -1)
+        except Exception as e:
+            debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
+            count = 0
+        self.counts[item_id] = count
+        self.drops_since_sync[item_id] = 0
+        self.stacks.pop(item_id, None)
+        # items already lying around must not be mistaken for the next drop
+        self._scan_ground_for(None, None, None)
+        return count
+
+    def count(self, item_id):
+        if item_id not in self.counts or self.drops_since_sync.get(item_id, 0) >= INVENTORY_RECONCILE_EVERY:
+            return self.sync(item_id)
+        return self.counts[item_id]
+
+    def next_stack(self, item_id):
+        """Serial of a backpack stack to drop from , None when the model has none left."""
+        if self.count(item_id) <= 0:
+            return None
+        stack = self.stacks.get(item_id)
+        if stack is None or stack[1] <= 0:
+            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
+            if not item:
+                self.counts[item_id] = 0
+                return None
+            stack = [item.Serial, max(1, int(getattr(item, 'Amount', 1) or 1))]
+            self.stacks[item_id] = stack
+        return stack[0]
+
+    def forget_stack(self, item_id):
+        self.stacks.pop(item_id, None)
+
+    def dropped(self, item_id, amount):
+        self.counts[item_id] = max(0, self.counts.get(item_id, 0) - amount)
+        self.drops_since_sync[item_id] = self.drops_since_sync.get(item_id, 0) + 1
+        stack = self.stacks.get(item_id)
+        if stack is not None:
+            stack[1] -= amount
+
+    def verify_drop(self, item_id, amount, x, y, count_before):
+        """True once a new ground item of item_id shows up at (x, y).
+        If nothing new appears the server count decides , which also resyncs the model."""
+        for _ in range(INVENTORY_GROUND_POLLS):
+            if self._scan_ground_for(item_id, x, y):
+                self.dropped(item_id, amount)
+                return True
+            pause_ms(PAUSE_DURATION)
+        return self.sync(item_id) <= count_before - amount
+
+    def _scan_ground_for(self, item_id, x, y):
+        try:
+            ground_filter = Items.Filter()
+            ground_filter.Enabled = True
+            ground_filter.OnGround = True
+            ground_filter.RangeMin = 0
+            ground_filter.RangeMax = INVENTORY_GROUND_SCAN_RANGE
+            ground_items = Items.ApplyFilter(ground_filter) or []
+        except Exception as e:
+            debug_message(f"Ground scan error: {e}", 33)
+            return False
+        found = False
+        for ground_item in ground_items:
+            serial = int(ground_item.Serial)
+            if serial in self.seen_ground:
+                continue
+            self.seen_ground.add(serial)
+            if ground_item.ItemID == item_id and ground_item.Position.X == x and ground_item.Position.Y == y:
+                found = True
+        return found
+
+_INVENTORY = BackpackInventory()
+
+def items_on_ground_at(item_id, x, y):
+    """How many item_id items lie on the ground at (x, y) , None when the tile is out of view and cannot be checked."""
+    if max(abs(Player.Position.X - int(x)), abs(Player.Position.Y - int(y))) > PLACEMENT_LOG_VERIFY_RANGE:
+        return None
+    try:
+        ground_filter = Items.Filter()
+        ground_filter.Enabled = True
+        ground_filter.OnGround = True
+        ground_filter.RangeMin = 0
+        ground_filter.RangeMax = PLACEMENT_LOG_VERIFY_RANGE
+        ground_items = Items.ApplyFilter(ground_filter) or []
+    except Exception:
+        return None
+    return sum(1 for ground_item in ground_items
+               if ground_item.ItemID == item_id and ground_item.Position.X == int(x) and ground_item.Position.Y == int(y))
+
+class PlacementLog:
+    """Append-only record of the placements made for one layout at one center.
+    Each placement is one JSON line , flushed as it is written and fsynced every PLACEMENT_LOG_SYNC_EVERY lines.
+    A later session with the same layout and center replays the log and skips what was already placed."""
+
+    def __init__(self, ritual_name, layout, center_x, center_y):
+        layout_json = json.dumps(layout, sort_keys=True, default=str)
+        layout_hash = hashlib.sha1(layout_json.encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(PLACEMENT_LOG_FOLDER, f"{ritual_name}_{layout_hash}_{center_x}_{center_y}.ndjson")
+        self.logged = {}    # (item_id, x, y) -> placements recorded by earlier sessions
+        self.reached = {}   # (item_id, x, y) -> placements reached in this session
+        self.unsynced = 0
+        self.file = None
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a disconnect
+                    key = (record["i"], record["x"], record["y"])
+                    self.logged[key] = self.logged.get(key, 0) + 1
+        except Exception as e:
+            debug_message(f"Could not read placement log: {e}", 33)
+        total = sum(self.logged.values())
+        if total:
+            debug_message(f"Resuming: {total} placements already logged in {os.path.basename(self.path)}", 67)
+
+    def is_logged(self, item_id, x, y):
+        """True when the next placement of item_id at (x, y) was made by an earlier session and still lies there.
+        The items on the tile are counted against the placements reached so far , on a stacked tile only as many
+        logged drops are skipped as items remain and the rest are forgotten so they are placed again.
+        A tile out of view is not skipped yet and is checked again once the player walks there."""
+        key = (item_id, int(x), int(y))
+        reached = self.reached.get(key, 0)
+        if reached >= self.logged.get(key, 0):
+            return False
+        on_ground = items_on_ground_at(item_id, x, y)
+        if on_ground is None:
+            return False
+        if on_ground <= reached:
+            self.logged[key] = reached
+            return False
+        return True
+
+    def consume(self, item_id, x, y):
+        """Step past an already logged placement , False when it still has to be made."""
+        if not self.is_logged(item_id, x, y):
+            return False
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        return True
+
+    def logged_for(self, item_id):
+        """Placements of item_id recorded by earlier sessions."""
+        return sum(count for (logged_id, _, _), count in self.logged.items() if logged_id == item_id)
+
+    def record(self, item_id, x, y):
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        try:
+            if self.file is None:
+                if not os.path.exists(PLACEMENT_LOG_FOLDER):
+                    os.makedirs(PLACEMENT_LOG_FOLDER)
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(json.dumps({"i": item_id, "x": int(x), "y": int(y), "t": int(time.time())}) + "\n")
+            self.file.flush()
+            self.unsynced += 1
+            if self.unsynced >= PLACEMENT_LOG_SYNC_EVERY:
+                self.sync()
+        except Exception as e:
+            debug_message(f"Could not write placement log: {e}", 33)
+
+    def sync(self):
+        if self.file is None or not self.unsynced:
+            return
+        try:
+            os.fsync(self.file.fileno())
+        except (AttributeError, OSError):
+            pass
+        self.unsynced = 0
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def finish(self):
+        """The ritual completed , the log is removed so a later ritual at this center starts fresh."""
+        self.close()
+        try:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            debug_message(f"Could not remove placement log: {e}", 33)
+
+def open_placement_log(ritual_name, layout, center_x, center_y):
+    """Start or resume the placement log for a live run , preview runs place nothing and keep no log."""
+    global _PLACEMENT_LOG
+    close_placement_log()
+    del _PLACEMENT_INCOMPLETE[:]
+    if PREVIEW_MODE or not PLACEMENT_LOG_ENABLED:
+        return None
+    _PLACEMENT_LOG = PlacementLog(ritual_name, layout, int(center_x), int(center_y))
+    return _PLACEMENT_LOG
+
+def close_placement_log():
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.close()
+        _PLACEMENT_LOG = None
+
+def finish_placement_log():
+    """Remove the log of a completed ritual , only an interrupted run leaves one to resume from."""
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.finish()
+        _PLACEMENT_LOG = None
+
+def mark_placement_incomplete(reason):
+    """Note a part of the layout that was not placed , the run then keeps its log to resume from."""
+    if PREVIEW_MODE or reason in _PLACEMENT_INCOMPLETE:
+        return
+    _PLACEMENT_INCOMPLETE.append(reason)
+
+def end_placement_log():
+    """Remove the log only when every point was placed or already logged , otherwise keep it for the next run.
+    Returns True when the ritual is complete."""
+    if _PLACEMENT_INCOMPLETE:
+        shown = ", ".join(_PLACEMENT_INCOMPLETE[:3]) + (" ..." if len(_PLACEMENT_INCOMPLETE) > 3 else "")
+        debug_message(f"Placement incomplete ( {len(_PLACEMENT_INCOMPLETE)} parts missed : {shown} ) , run again here to resume", 33)
+        close_placement_log()
+        return False
+    finish_placement_log()
+    return True
+
+def placements_logged_for(item_id):
+    """Placements of item_id already made by earlier sessions , taken off the backpack requirement on resume."""
+    return _PLACEMENT_LOG.logged_for(item_id) if _PLACEMENT_LOG is not None else 0
+
+def placement_logged(item_id, x, y):
+    """True when this placement was already made by an earlier session , used to skip walking to it."""
+    return _PLACEMENT_LOG is not None and _PLACEMENT_LOG.is_logged(item_id, x, y)
+
 def place_item(x, y, item_id, z=None, hue=None):
     """Place a single item at the specified location"""
     # Type validation and debugging
@@ -685,15 +964,23 @@ def place_item(x, y, item_id, z=None, hue=None):
             PLACED_TOP_Z[(x_int, y_int)] = z_final
         return True
     
+    if _PLACEMENT_LOG is not None and _PLACEMENT_LOG.consume(actual_item_id, x_int, y_int):
+        # keep the stack height the skipped placement would have left
+        if ENABLE_STACK_TRACKING:
+            PLACED_TOP_Z[(x_int, y_int)] = compute_target_z(x_int, y_int, base_z)
+        return True
+    
     # Real placement logic
     try:
         debug_message(f"LIVE MODE: Finding item 0x{actual_item_id:X} in backpack", 68)
-        item = Items.FindByID(actual_item_id, -1, Player.Backpack.Serial)
-        if not item:
+        item_serial = _INVENTORY.next_stack(actual_item_id)
+        if item_serial is None:
             debug_message(f"ERROR: Item 0x{actual_item_id:X} not found in backpack", 33)
+            mark_placement_incomplete(f"0x{actual_item_id:X} at ({x_int},{y_int})")
             return False
+        initial_count = _INVENTORY.count(actual_item_id)
         
-        debug_message(f"Found item: Serial={item.Serial}, ItemID=0x{item.ItemID:X}", 68)
+        debug_message(f"Using stack: Serial={item_serial}, ItemID=0x{actual_item_id:X}, count={initial_count}", 68)
         
         z_final = compute_target_z(x_int, y_int, base_z)
         debug_message(f"Computed z_final: {z_final} (type: {type(z_final)})", 68)
@@ -711,33 +998,43 @@ def place_item(x, y, item_id, z=None, hue=None):
             debug_message(f"Too far ({distance} tiles) - moving to location ({x_int},{y_int})", 68)
             if not goto_location_with_wiggle(x_int, y_int):
                 debug_message(f"ERROR: Cannot reach ({x_int},{y_int}) for placement", 33)
+                mark_placement_incomplete(f"0x{actual_item_id:X} at ({x_int},{y_int})")
                 return False
             debug_message(f"Successfully moved to ({x_int},{y_int})", 68)
         
         # Place the item at world coordinates using MoveOnGround like RITUAL_orbs.py
         actual_z = -1 if USE_AUTO_Z_STACKING else int(z_final)
-        debug_message(f"Calling MoveOnGround: Serial={item.Serial} (type: {type(item.Serial)}), amount=1, x={x_int} (type: {type(x_int)}), y={y_int} (type: {type(y_int)}), z={actual_z} (type: {type(actual_z)})", 68)
+        debug_message(f"Calling MoveOnGround: Serial={item_serial} (type: {type(item_serial)}), amount=1, x={x_int} (type: {type(x_int)}), y={y_int} (type: {type(y_int)}), z={actual_z} (type: {type(actual_z)})", 68)
         
-        Items.MoveOnGround(item.Serial, 1, x_int, y_int, actual_z)
+        Items.MoveOnGround(item_serial, 1, x_int, y_int, actual_z)
         debug_message(f"MoveOnGround call completed successfully", 68)
         
         throttle()
         pause_ms(PAUSE_DURATION_PLACE)
         
+        if not _INVENTORY.verify_drop(actual_item_id, 1, x_int, y_int, initial_count):
+            debug_message(f"ERROR: Dropped item did not appear at ({x_int},{y_int})", 33)
+            mark_placement_incomplete(f"0x{actual_item_id:X} at ({x_int},{y_int})")
+            return False
+        
         if hue is not None:
             debug_message(f"Hue specified: {hue} (not implemented)", 68)
             pass
         
         if ENABLE_STACK_TRACKING:
             PLACED_TOP_Z[(x_int, y_int)] = z_final
+        if _PLACEMENT_LOG is not None:
+            _PLACEMENT_LOG.record(actual_item_id, x_int, y_int)
         
         debug_message(f"Item placement successful at ({x_int},{y_int})", 67)
         return True
         
     except Exception as e:
         debug_message(f"ERROR: Exception in place_item at ({x_int},{y_int}): {type(e).__name__}: {e}", 33)
+        _INVENTORY.forget_stack(actual_item_id)
         import traceback
         debug_message(f"Traceback: {traceback.format_exc()}", 33)
+        mark_placement_incomplete(f"0x{actual_item_id:X} at ({x_int},{y_int})")
         return False
 
 def place_items_at_points(points, item_id, base_z, progress_msg="Placing items", center=None, hue=None):
@@ -763,6 +1060,7 @@ def place_items_at_points(points, item_id, base_z, progress_msg="Placing items",
         
         if failures >= MAX_PHASE_FAILURES:
             debug_message(f"Too many failures ({failures}), stopping placement", 33)
+            mark_placement_incomplete(progress_msg)
             break
         
         pause_ms(POINT_BREATHER_MS)
@@ -791,6 +1089,7 @@ def place_mixed_items_at_points(points, item_ids, base_z, progress_msg="Placing
         
         if failures >= MAX_PHASE_FAILURES:
             debug_message(f"Too many failures ({failures}), stopping placement", 33)
+            mark_placement_incomplete(progress_msg)
             break
         
         pause_ms(POINT_BREATHER_MS)
@@ -919,6 +1218,8 @@ def build_center_cracks(center_x, center_y, center_z):
     # Build eye of newt cracks (mystical layer)
     if ENABLE_CENTER_CRACKS_EYE_NEWT:
         newt_id = get_first_available_item_id(MATERIAL_ITEM_IDS.get("Eye of Newt", []))
+        if not newt_id:
+            mark_placement_incomplete("Eye of newt cracks")
         if newt_id:
             build_crack_layer(center_x, center_y, center_z, newt_id,
                             CENTER_CRACK_ARMS, CENTER_CRACK_MIN_LEN, CENTER_CRACK_MAX_LEN,
@@ -927,6 +1228,8 @@ def build_center_cracks(center_x, center_y, center_z):
     # Build black pearl cracks (mystical layer)
     if ENABLE_CENTER_CRACKS_PEARL:
         pearl_id = get_first_available_item_id(MATERIAL_ITEM_IDS.get("Black Pearl", []))
+        if not pearl_id:
+            mark_placement_incomplete("Black pearl cracks")
         if pearl_id:
             build_crack_layer(center_x, center_y, center_z, pearl_id,
                             PEARL_CRACK_ARMS, PEARL_CRACK_MIN_LEN, PEARL_CRACK_MAX_LEN,
@@ -975,6 +1278,7 @@ def build_center_pearl_rings(center_x, center_y, center_z):
     pearl_id = get_first_available_item_id(MATERIAL_ITEM_IDS.get("Black Pearl", []))
     if not pearl_id:
         debug_message("No black pearls available for center rings", 33)
+        mark_placement_incomplete("Center pearl rings")
         return
     
     # Build concentric pearl rings
@@ -1051,6 +1355,7 @@ def build_pillar_at(x, y, center_z):
     if not PREVIEW_MODE:
         if not goto_location_with_wiggle(int(x), int(y)):
             debug_message(f"Cannot reach pillar location ({x},{y})", 33)
+            mark_placement_incomplete(f"pillar at ({x},{y})")
             return center_z + 2  # Return a reasonable Z for decorations even if pillar fails
     
     # 1) Base cloth - continue even if this fails
@@ -1152,6 +1457,7 @@ def place_pillar_decorations(pillar_x, pillar_y, center_x, center_y, center_z):
         
         if not available_item_ids:
             debug_message(f"No available items for {dec_type} decoration {i+1}", 33)
+            mark_placement_incomplete(f"{dec_type} decoration {i+1} at ({pillar_x},{pillar_y})")
             continue
             
         debug_message(f"Placing {dec_type} decoration with {len(available_item_ids)} available item types around pillar", 67)
@@ -1236,6 +1542,12 @@ def initialize_seed():
     random.seed(CURRENT_SEED)
     return CURRENT_SEED
 
+def layout_footprint_radius():
+    """Farthest tile from the ritual center that a pillar , decoration or center layer can reach."""
+    crack_reach = max(CENTER_CRACK_MAX_LEN, PEARL_CRACK_MAX_LEN) + CENTER_CRACK_BRANCH_MAX_LEN
+    pillar_reach = int(DEATH_CIRCLE["radius"]) + max(DECORATION_RING_RADIUS, DECORATION_LINE_LENGTH * DECORATION_LINE_SPACING)
+    return max(list(CENTER_PEARL_RING_RADII) + [crack_reach, pillar_reach]) + 1
+
 def create_death_ritual(center_x, center_y):
     """Create the complete death ritual arrangement"""
     debug_message("Beginning Death Ritual arrangement...", 67)
@@ -1243,9 +1555,21 @@ def create_death_ritual(center_x, center_y):
     # Initialize seed for reproducible patterns
     seed = initialize_seed()
     debug_message(f"Death Ritual Seed: {seed}", 67)
+    open_placement_log("death", {"seed": seed, "circle": DEATH_CIRCLE, "items": DEATH_ITEMS, "pillars": DEATH_PILLAR_CONFIG}, center_x, center_y)
+    try:
+        build_death_ritual(center_x, center_y)
+    finally:
+        close_placement_log()
+
+def build_death_ritual(center_x, center_y):
+    """Place every phase of the death ritual around the center"""
     
     center_z = Player.Position.Z
     
+    # Cracks are random , so the whole disk the layout can reach is checked before walking
+    if FOOTPRINT_PREPASS:
+        classify_footprint(footprint_disk(int(center_x), int(center_y), layout_footprint_radius()), "Death ritual footprint")
+    
     # Move to center position if not in preview mode
     if not PREVIEW_MODE:
         if not goto_location_with_wiggle(int(center_x), int(center_y), center=(int(center_x), int(center_y))):
@@ -1299,7 +1623,8 @@ def create_death_ritual(center_x, center_y):
             if ENABLE_PILLAR_DECORATIONS:
                 place_pillar_decorations(px, py, center_x, center_y, center_z)
     
-    debug_message("Death Ritual arrangement complete!", 67)
+    if end_placement_log():
+        debug_message("Death Ritual arrangement complete!", 67)
 
 def calculate_death_ritual_requirements():
     """Calculate and display item requirements for the death ritual"""
@@ -14,11 +14,15 @@ Color order (inner to outer):
 - Star Sapphire (Blue)      0x0F0F
 - Amethyst (Violet)         0x0F16
 
-VERSION = 20250828
+VERSION = 20261019
 """
 
+import hashlib
+import json
+import os
 import math
 import time
+import struct
 import random
 
 DEBUG_MODE = False
@@ -145,6 +149,9 @@ CENTER_NUDGE_STEPS = 2
 # Placement tuning
 PLACE_MAX_RETRIES = 1
 PLACE_BACKOFF_BASE = 250
+INVENTORY_RECONCILE_EVERY = 25  # re-read BackpackCount after this many locally counted drops
+INVENTORY_GROUND_POLLS = 2  # ground scans for a dropped item before asking the server
+INVENTORY_GROUND_SCAN_RANGE = 6  # tiles around the player scanned for dropped items
 POINT_TIMEOUT_MS = 1500
 POINT_BREATHER_MS = 250
 
@@ -158,6 +165,14 @@ LAST_ACTION_MS = 0
 MAX_PHASE_FAILURES = 6
 PLACED_COORDS_BY_ITEM = {}
 BAD_COORDS = set()
+FOOTPRINT_PREPASS = True  # classify every layout tile before walking , unplaceable tiles are reported and skipped
+PLACEMENT_LOG_ENABLED = True  # append each live placement to data/ritual_runs , a rerun at the same center resumes
+PLACEMENT_LOG_SYNC_EVERY = 10  # fsync the placement log after this many placements
+PLACEMENT_LOG_VERIFY_RANGE = 18  # a logged placement is only skipped while it is seen on the ground within this range
+PLACEMENT_LOG_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "ritual_runs")
+_PLACEMENT_LOG = None  # set by open_placement_log() for a live run
+_PLACEMENT_INCOMPLETE = []  # parts of the layout this run did not place , any keeps the log for the next run
+LAND_ID_CACHE = {}  # (map, x, y) -> land id , land never changes during a ritual
 
 #//========================================================
 
@@ -168,65 +183,36 @@ def debug_message(msg, color=0):
         except Exception:
             print(msg)
 
-def _convert_packet_to_bytes(packet_list):
-    byte_list = []
-    for value in packet_list:
-        if value:
-            byte_list.append(int(value, 16))
-        else:
-            byte_list.append(0)
-    return byte_list
-
-def _send_fake_item(item_x, item_y, item_z, item_id_4hex_with_space, hue_4hex_with_space):
-    """Send a client-only item render at location without server state change.
+# client-only serials keep the high byte 0x48 of the original packet template
+FAKE_SERIAL_MIN = 0x48000000
+FAKE_SERIAL_MAX = 0x48FFFFFF
+
+# 0xF3 world item packet , 26 bytes , rendered by the client only
+# serial at 4 , graphic at 8 , x y z at 15 , hue at 21 , every other byte is fixed
+_FAKE_ITEM_TEMPLATE = (
+    0xF3, 0x00, 0x01, 0x00, 0x48, 0xFC, 0xBB, 0x12, 0x00, 0x00, 0x00, 0x00, 0x01,
+    0x00, 0x01, 0x05, 0x88, 0x06, 0x88, 0x0A, 0x00, 0x04, 0x15, 0x20, 0x00, 0x00,
+)
+_FAKE_ITEM_PACKET = bytearray(_FAKE_ITEM_TEMPLATE)
+_PACK_SERIAL_GRAPHIC = struct.Struct('>IH')
+_PACK_LOCATION = struct.Struct('>HHB')
+_PACK_HUE = struct.Struct('>H')
+
+def build_fake_item_packet(serial, item_x, item_y, item_z, item_id, hue=0):
+    """Fill the reusable 0xF3 buffer in place and return it as a list of byte values."""
+    packet = _FAKE_ITEM_PACKET
+    _PACK_SERIAL_GRAPHIC.pack_into(packet, 4, serial & 0xFFFFFFFF, int(item_id) & 0xFFFF)
+    # Z is a signed byte on the wire , -1 encodes as 0xFF
+    _PACK_LOCATION.pack_into(packet, 15, int(item_x) & 0xFFFF, int(item_y) & 0xFFFF, int(item_z) & 0xFF)
+    _PACK_HUE.pack_into(packet, 21, int(hue) & 0xFFFF)
+    return list(packet)
 
-    item_id_4hex_with_space example: "0F 13" for 0x0F13
-    hue_4hex_with_space example: "00 00" for no hue
-    """
+def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
     try:
-        # Packet template from (F3 -> draw static item to client)
-        packet = (
-            "F3 00 01 00 48 FC BB 12 "
-            + item_id_4hex_with_space
-            + " 00 00 01 00 01 05 88 06 88 0A 00 04 15 20 00 00"
-        )
-        packet_list = packet.split(" ")
-
-        serial_hex = hex(random.randrange(0, 0xFFFFFF))[2:].zfill(6)
-
-        i_loc_x = hex(int(item_x))[2:].zfill(4)
-        i_loc_y = hex(int(item_y))[2:].zfill(4)
-        i_loc_z = hex(int(item_z))[2:].zfill(2)
-
-        x1, x2 = i_loc_x[:2], i_loc_x[2:]
-        y1, y2 = i_loc_y[:2], i_loc_y[2:]
-
-        hues = hue_4hex_with_space.split(" ")
-
-        packet_list[5] = serial_hex[0:2]
-        packet_list[6] = serial_hex[2:4]
-        packet_list[7] = serial_hex[4:6]
-        packet_list[15] = x1
-        packet_list[16] = x2
-        packet_list[17] = y1
-        packet_list[18] = y2
-        packet_list[19] = i_loc_z
-        packet_list[21] = hues[0]
-        packet_list[22] = hues[1]
-
-        byte_list = _convert_packet_to_bytes(packet_list)
-        PacketLogger.SendToClient(byte_list)
+        serial = random.randrange(FAKE_SERIAL_MIN, FAKE_SERIAL_MAX)
+        PacketLogger.SendToClient(build_fake_item_packet(serial, x, y, z, item_id, hue))
     except Exception as e:
-        debug_message(f"Preview send failed: {e}", 33)
-
-def _format_hex_4_with_space(value):
-    s = f"{int(value) & 0xFFFF:04X}"
-    return s[:2] + " " + s[2:]
-
-def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
-    item_hex = _format_hex_4_with_space(item_id)
-    hue_hex = _format_hex_4_with_space(hue)
-    _send_fake_item(x, y, z, item_hex, hue_hex)
+        debug_message(f"Failed to send item packet: {e}", 33)
 
 def generate_circle_points(center_x, center_y, radius, points, rotation=0):
     result = []
@@ -254,29 +240,313 @@ def throttle(min_gap_ms=RATE_MIN_GAP_MS):
         Misc.Pause(min_gap_ms - elapsed)
     LAST_ACTION_MS = now_ms()
 
+def get_land_id(x, y, game_map=None):
+    """Land tile id at (x, y) , looked up once per session. None when the lookup fails."""
+    if game_map is None:
+        game_map = Player.Map
+    key = (game_map, x, y)
+    if key not in LAND_ID_CACHE:
+        try:
+            LAND_ID_CACHE[key] = Statics.GetLandID(x, y, game_map)
+        except Exception:
+            LAND_ID_CACHE[key] = None
+    return LAND_ID_CACHE[key]
+
 def is_safe_ground(x, y, game_map=None):
     if game_map is None:
         game_map = Player.Map
     if (x, y) in BAD_COORDS:
         return False
-    try:
-        land_id = Statics.GetLandID(x, y, game_map)
-    except Exception:
+    land_id = get_land_id(x, y, game_map)
+    if land_id is None:
         return False
     BAD_LAND_IDS = {0x0001}
     if land_id in BAD_LAND_IDS:
         return False
     return True
 
+def classify_footprint(tiles, label="Layout"):
+    """Check every tile of a layout in one sweep before any walking or placing.
+    Unplaceable tiles go into BAD_COORDS and are reported up front. Returns them as a list."""
+    unique_tiles = []
+    seen = set()
+    for tile in tiles:
+        xy = (int(tile[0]), int(tile[1]))
+        if xy not in seen:
+            seen.add(xy)
+            unique_tiles.append(xy)
+    unplaceable = [xy for xy in unique_tiles if not is_safe_ground(xy[0], xy[1])]
+    BAD_COORDS.update(unplaceable)
+    if unplaceable:
+        sample = ", ".join(f"({x},{y})" for x, y in unplaceable[:8])
+        more = " ..." if len(unplaceable) > 8 else ""
+        debug_message(f"{label}: {len(unplaceable)} of {len(unique_tiles)} tiles unplaceable , skipping {sample}{more}", 33)
+    else:
+        debug_message(f"{label}: all {len(unique_tiles)} tiles placeable", 68)
+    return unplaceable
+
 def is_valid_position(x, y, z=None):
     if z is None:
         z = Player.Position.Z
     return (
         Player.Position.X - MAX_DISTANCE <= x <= Player.Position.X + MAX_DISTANCE
         and Player.Position.Y - MAX_DISTANCE <= y <= Player.Position.Y + MAX_DISTANCE
-        and Statics.GetLandID(x, y, Player.Map) not in [0x0001]
+        and get_land_id(x, y) not in (None, 0x0001)
     )
 
+class BackpackInventory:
+    """Local model of the backpack stacks drops are taken from.
+    Counts are read once , decremented on each verified drop , and re-read from the server only every
+    INVENTORY_RECONCILE_EVERY drops or when a drop does not show up on the ground."""
+
+    def __init__(self):
+        self.counts = {}             # item_id -> backpack count
+        self.stacks = {}             # item_id -> [serial, amount] of the stack drops are taken from
+        self.drops_since_sync = {}   # item_id -> drops credited since the last BackpackCount
+        self.seen_ground = set()     # ground serials already seen , a drop is confirmed by a serial not in here
+
+    def sync(self, item_id):
+        """Re-read the server count and forget the cached stack."""
+        try:
+            count = Items.BackpackCount(item_id, -1)
+        except Exception as e:
+            debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
+            count = 0
+        self.counts[item_id] = count
+        self.drops_since_sync[item_id] = 0
+        self.stacks.pop(item_id, None)
+        # items already lying around must not be mistaken for the next drop
+        self._scan_ground_for(None, None, None)
+        return count
+
+    def count(self, item_id):
+        if item_id not in self.counts or self.drops_since_sync.get(item_id, 0) >= INVENTORY_RECONCILE_EVERY:
+            return self.sync(item_id)
+        return self.counts[item_id]
+
+    def next_stack(self, item_id):
+        """Serial of a backpack stack to drop from , None when the model has none left."""
+        if self.count(item_id) <= 0:
+            return None
+        stack = self.stacks.get(item_id)
+        if stack is None or stack[1] <= 0:
+            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
+            if not item:
+                self.counts[item_id] = 0
+                return None
+            stack = [item.Serial, max(1, int(getattr(item, 'Amount', 1) or 1))]
+            self.stacks[item_id] = stack
+        return stack[0]
+
+    def forget_stack(self, item_id):
+        self.stacks.pop(item_id, None)
+
+    def dropped(self, item_id, amount):
+        self.counts[item_id] = max(0, self.counts.get(item_id, 0) - amount)
+        self.drops_since_sync[item_id] = self.drops_since_sync.get(item_id, 0) + 1
+        stack = self.stacks.get(item_id)
+        if stack is not None:
+            stack[1] -= amount
+
+    def verify_drop(self, item_id, amount, x, y, count_before):
+        """True once a new ground item of item_id shows up at (x, y).
+        If nothing new appears the server count decides , which also resyncs the model."""
+        for _ in range(INVENTORY_GROUND_POLLS):
+            if self._scan_ground_for(item_id, x, y):
+                self.dropped(item_id, amount)
+                return True
+            pause_ms(PAUSE_DURATION)
+        return self.sync(item_id) <= count_before - amount
+
+    def _scan_ground_for(self, item_id, x, y):
+        try:
+            ground_filter = Items.Filter()
+            ground_filter.Enabled = True
+            ground_filter.OnGround = True
+            ground_filter.RangeMin = 0
+            ground_filter.RangeMax = INVENTORY_GROUND_SCAN_RANGE
+            ground_items = Items.ApplyFilter(ground_filter) or []
+        except Exception as e:
+            debug_message(f"Ground scan error: {e}", 33)
+            return False
+        found = False
+        for ground_item in ground_items:
+            serial = int(ground_item.Serial)
+            if serial in self.seen_ground:
+                continue
+            self.seen_ground.add(serial)
+            if ground_item.ItemID == item_id and ground_item.Position.X == x and ground_item.Position.Y == y:
+                found = True
+        return found
+
+_INVENTORY = BackpackInventory()
+
+def items_on_ground_at(item_id, x, y):
+    """How many item_id items lie on the ground at (x, y) , None when the tile is out of view and cannot be checked."""
+    if max(abs(Player.Position.X - int(x)), abs(Player.Position.Y - int(y))) > PLACEMENT_LOG_VERIFY_RANGE:
+        return None
+    try:
+        ground_filter = Items.Filter()
+        ground_filter.Enabled = True
+        ground_filter.OnGround = True
+        ground_filter.RangeMin = 0
+        ground_filter.RangeMax = PLACEMENT_LOG_VERIFY_RANGE
+        ground_items = Items.ApplyFilter(ground_filter) or []
+    except Exception:
+        return None
+    return sum(1 for ground_item in ground_items
+               if ground_item.ItemID == item_id and ground_item.Position.X == int(x) and ground_item.Position.Y == int(y))
+
+class PlacementLog:
+    """Append-only record of the placements made for one layout at one center.
+    Each placement is one JSON line , flushed as it is written and fsynced every PLACEMENT_LOG_SYNC_EVERY lines.
+    A later session with the same layout and center replays the log and skips what was already placed."""
+
+    def __init__(self, ritual_name, layout, center_x, center_y):
+        layout_json = json.dumps(layout, sort_keys=True, default=str)
+        layout_hash = hashlib.sha1(layout_json.encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(PLACEMENT_LOG_FOLDER, f"{ritual_name}_{layout_hash}_{center_x}_{center_y}.ndjson")
+        self.logged = {}    # (item_id, x, y) -> placements recorded by earlier sessions
+        self.reached = {}   # (item_id, x, y) -> placements reached in this session
+        self.unsynced = 0
+        self.file = None
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a disconnect
+                    key = (record["i"], record["x"], record["y"])
+                    self.logged[key] = self.logged.get(key, 0) + 1
+        except Exception as e:
+            debug_message(f"Could not read placement log: {e}", 33)
+        total = sum(self.logged.values())
+        if total:
+            debug_message(f"Resuming: {total} placements already logged in {os.path.basename(self.path)}", 67)
+
+    def is_logged(self, item_id, x, y):
+        """True when the next placement of item_id at (x, y) was made by an earlier session and still lies there.
+        The items on the tile are counted against the placements reached so far , on a stacked tile only as many
+        logged drops are skipped as items remain and the rest are forgotten so they are placed again.
+        A tile out of view is not skipped yet and is checked again once the player walks there."""
+        key = (item_id, int(x), int(y))
+        reached = self.reached.get(key, 0)
+        if reached >= self.logged.get(key, 0):
+            return False
+        on_ground = items_on_ground_at(item_id, x, y)
+        if on_ground is None:
+            return False
+        if on_ground <= reached:
+            self.logged[key] = reached
+            return False
+        return True
+
+    def consume(self, item_id, x, y):
+        """Step past an already logged placement , False when it still has to be made."""
+        if not self.is_logged(item_id, x, y):
+            return False
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        return True
+
+    def logged_for(self, item_id):
+        """Placements of item_id recorded by earlier sessions."""
+        return sum(count for (logged_id, _, _), count in self.logged.items() if logged_id == item_id)
+
+    def record(self, item_id, x, y):
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        try:
+            if self.file is None:
+                if not os.path.exists(PLACEMENT_LOG_FOLDER):
+                    os.makedirs(PLACEMENT_LOG_FOLDER)
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(json.dumps({"i": item_id, "x": int(x), "y": int(y), "t": int(time.time())}) + "\n")
+            self.file.flush()
+            self.unsynced += 1
+            if self.unsynced >= PLACEMENT_LOG_SYNC_EVERY:
+                self.sync()
+        except Exception as e:
+            debug_message(f"Could not write placement log: {e}", 33)
+
+    def sync(self):
+        if self.file is None or not self.unsynced:
+            return
+        try:
+            os.fsync(self.file.fileno())
+        except (AttributeError, OSError):
+            pass
+        self.unsynced = 0
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def finish(self):
+        """The ritual completed , the log is removed so a later ritual at this center starts fresh."""
+        self.close()
+        try:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            debug_message(f"Could not remove placement log: {e}", 33)
+
+def open_placement_log(ritual_name, layout, center_x, center_y):
+    """Start or resume the placement log for a live run , preview runs place nothing and keep no log."""
+    global _PLACEMENT_LOG
+    close_placement_log()
+    del _PLACEMENT_INCOMPLETE[:]
+    if PREVIEW_MODE or not PLACEMENT_LOG_ENABLED:
+        return None
+    _PLACEMENT_LOG = PlacementLog(ritual_name, layout, int(center_x), int(center_y))
+    return _PLACEMENT_LOG
+
+def close_placement_log():
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.close()
+        _PLACEMENT_LOG = None
+
+def finish_placement_log():
+    """Remove the log of a completed ritual , only an interrupted run leaves one to resume from."""
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.finish()
+        _PLACEMENT_LOG = None
+
+def mark_placement_incomplete(reason):
+    """Note a part of the layout that was not placed , the run then keeps its log to resume from."""
+    if PREVIEW_MODE or reason in _PLACEMENT_INCOMPLETE:
+        return
+    _PLACEMENT_INCOMPLETE.append(reason)
+
+def end_placement_log():
+    """Remove the log only when every point was placed or already logged , otherwise keep it for the next run.
+    Returns True when the ritual is complete."""
+    if _PLACEMENT_INCOMPLETE:
+        shown = ", ".join(_PLACEMENT_INCOMPLETE[:3]) + (" ..." if len(_PLACEMENT_INCOMPLETE) > 3 else "")
+        debug_message(f"Placement incomplete ( {len(_PLACEMENT_INCOMPLETE)} parts missed : {shown} ) , run again here to resume", 33)
+        close_placement_log()
+        return False
+    finish_placement_log()
+    return True
+
+def placements_logged_for(item_id):
+    """Placements of item_id already made by earlier sessions , taken off the backpack requirement on resume."""
+    return _PLACEMENT_LOG.logged_for(item_id) if _PLACEMENT_LOG is not None else 0
+
+def placement_logged(item_id, x, y):
+    """True when this placement was already made by an earlier session , used to skip walking to it."""
+    return _PLACEMENT_LOG is not None and _PLACEMENT_LOG.is_logged(item_id, x, y)
+
 def place_item(x, y, item_id, z=None):
     if PREVIEW_MODE:
         if z is None:
@@ -285,6 +555,8 @@ def place_item(x, y, item_id, z=None):
         return True
     if item_id is None:
         return False
+    if _PLACEMENT_LOG is not None and _PLACEMENT_LOG.consume(item_id, x, y):
+        return True
     offsets = [(0, 0)] if SAFE_MODE else [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
     if z is None:
         z = Player.Position.Z
@@ -298,42 +570,34 @@ def place_item(x, y, item_id, z=None):
             BAD_COORDS.add((tx, ty))
             continue
         for attempt in range(1, PLACE_MAX_RETRIES + 1):
-            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
-            if not item:
+            item_serial = _INVENTORY.next_stack(item_id)
+            if item_serial is None:
                 debug_message(f"Could not find item 0x{item_id:X}", 33)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
+            initial_count = _INVENTORY.count(item_id)
 
             try:
-                initial_count = Items.BackpackCount(item_id, -1)
-            except Exception as e:
-                debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
-                return False
-            if initial_count <= 0:
-                return False
-
-            try:
-                Items.MoveOnGround(item, 1, tx, ty, z)
+                Items.MoveOnGround(item_serial, 1, tx, ty, z)
             except Exception as e:
                 debug_message(f"MoveOnGround failed at ({tx},{ty}): {e}", 33)
+                _INVENTORY.forget_stack(item_id)
                 BAD_COORDS.add((x, y))
                 pause_ms(PAUSE_DURATION + 150)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
             else:
                 throttle()
                 pause_ms(PAUSE_DURATION_PLACE)
 
-            for _ in range(2):
-                try:
-                    new_count = Items.BackpackCount(item_id, -1)
-                except Exception as e:
-                    debug_message(f"BackpackCount verify error: {e}", 33)
-                    break
-                if new_count < initial_count:
-                    return True
-                pause_ms(PAUSE_DURATION)
+            if _INVENTORY.verify_drop(item_id, 1, tx, ty, initial_count):
+                if _PLACEMENT_LOG is not None:
+                    _PLACEMENT_LOG.record(item_id, x, y)
+                return True
 
             pause_ms(PLACE_BACKOFF_BASE * attempt)
 
+    mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
     return False
 
 def place_items_at_points(points, item_id, z=None, progress_msg="Placing items", center=None):
@@ -359,12 +623,14 @@ def place_items_at_points(points, item_id, z=None, progress_msg="Placing items",
             debug_message(f"Duplicate coords for {get_item_name(item_id)} at ({x},{y}), skipping.", 68)
             continue
 
-        if not PREVIEW_MODE:
+        if not PREVIEW_MODE and not placement_logged(item_id, x, y):
             if not goto_location_with_wiggle(x, y, center=center):
                 debug_message(f"Could not reach position ({x}, {y})", 33)
                 failures += 1
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 if failures >= MAX_PHASE_FAILURES:
                     debug_message("Too many failures in this phase; aborting phase early.", 33)
+                    mark_placement_incomplete(progress_msg)
                     break
                 continue
 
@@ -501,18 +767,21 @@ def get_first_available_item_id(item_ids, required_count):
             return item_id
     return None
 
-def place_pattern_component(center_x, center_y, config, z=None):
-    points = []
+def get_pattern_points(center_x, center_y, config):
     if config["pattern"] == "circle":
-        points = generate_circle_points(
+        return generate_circle_points(
             center_x,
             center_y,
             config["radius"],
             config["points"],
             config.get("rotation", 0)
         )
-    elif config["pattern"] == "center":
-        points = [(center_x, center_y)]
+    if config["pattern"] == "center":
+        return [(center_x, center_y)]
+    return []
+
+def place_pattern_component(center_x, center_y, config, z=None):
+    points = get_pattern_points(center_x, center_y, config)
 
     required = 1 if config["pattern"] == "center" else config["points"]
     if PREVIEW_MODE:
@@ -523,6 +792,7 @@ def place_pattern_component(center_x, center_y, config, z=None):
         item_id = get_first_available_item_id(config["item_ids"], required)
     if item_id is None:
         debug_message("Skipping component: item ID not set or not available.", 33)
+        mark_placement_incomplete(config.get("label", "component"))
         return set()
     verb = "Previewing" if PREVIEW_MODE else "Placing"
     return place_items_at_points(
@@ -576,6 +846,13 @@ def create_arrangement(center_x, center_y):
 
     center_z = Player.Position.Z
 
+    if FOOTPRINT_PREPASS:
+        layout_tiles = []
+        for phase, config in get_ordered_phases():
+            if PLACE_COMPONENTS[phase]:
+                layout_tiles.extend(get_pattern_points(center_x, center_y, config))
+        classify_footprint(layout_tiles, "Gem footprint")
+
     if not PREVIEW_MODE:
         if not goto_location_with_wiggle(center_x, center_y, center=(center_x, center_y)):
             debug_message("Could not reach center position!", 33)
@@ -593,10 +870,13 @@ def create_arrangement(center_x, center_y):
             item_id = get_first_available_item_id(item_ids, required)
             if item_id is None:
                 debug_message(f"Skipping {phase}: item ID not set or item missing.", 33)
+                mark_placement_incomplete(phase)
                 continue
-            have = Items.BackpackCount(item_id, -1)
+            have = _INVENTORY.sync(item_id)
+            required = max(0, required - placements_logged_for(item_id))
             if have < required:
                 debug_message(f"Skipping {phase}: missing {get_item_name(item_id)} (need {required}, have {have})", 33)
+                mark_placement_incomplete(phase)
                 continue
         temp_config = dict(config)
         temp_config["item_ids"] = [item_id]
@@ -606,7 +886,8 @@ def create_arrangement(center_x, center_y):
             68 if placed else 33
         )
 
-    debug_message("Gem arrangement complete!", 67)
+    if end_placement_log():
+        debug_message("Gem arrangement complete!", 67)
 
 def main():
     display_configuration()
@@ -615,7 +896,11 @@ def main():
     center_x = Player.Position.X
     center_y = Player.Position.Y
 
-    create_arrangement(center_x, center_y)
+    open_placement_log("gems", {"components": PLACE_COMPONENTS, "config": RITUAL_CONFIG}, center_x, center_y)
+    try:
+        create_arrangement(center_x, center_y)
+    finally:
+        close_placement_log()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -11,13 +11,15 @@ searching for pack horses and try to resume gracefully . some issues still with
 SEEDS =
 Chosen seed 733978 for 26x26 with score 5431 # this was preety good , long curling tricky paths , its a little harsh as it immeadiately forks you two long choices 
 
-VERSION = 20250923
+VERSION = 20261019
 """
 
+import hashlib
 import json
 import os
 import random
 import time
+import struct
 
 DEBUG_MODE = True # debug messages
 SAFE_MODE = False # extra slow
@@ -28,7 +30,6 @@ PREVIEW_SOLUTION_HUE = 0x0042  # blue-ish overlay for solution
 
 # Checkpointing / resume
 CHECKPOINT_DIR = os.path.join("data", "maze_runs")
-CHECKPOINT_EVERY_N = 10  # write checkpoint every N placements
 
 # Placement pacing and limits
 PAUSE_DURATION = 350
@@ -43,6 +44,8 @@ GOTO_MAX_RETRIES = 1
 WIGGLE_RADII = [0]
 WIGGLE_ANGLES = [0, 45, 90, 135, 180, 225, 270, 315]
 WALK_REPEATS_PER_DIR = 2
+PLAN_TRAVEL_ROUTE = True  # reorder each placement pass into reach-sized stops walked as a short tour
+PLAN_TWO_OPT_MAX_PASSES = 4  # 2-opt improvement passes over the stop order
 
 # Center bias
 CENTER_BIAS_ENABLED = True
@@ -52,6 +55,9 @@ CENTER_NUDGE_STEPS = 2
 # Placement tuning
 PLACE_MAX_RETRIES = 1
 PLACE_BACKOFF_BASE = 250
+INVENTORY_RECONCILE_EVERY = 25  # re-read BackpackCount after this many locally counted drops
+INVENTORY_GROUND_POLLS = 2  # ground scans for a dropped item before asking the server
+INVENTORY_GROUND_SCAN_RANGE = 6  # tiles around the player scanned for dropped items
 POINT_TIMEOUT_MS = 1500
 POINT_BREATHER_MS = 250
 PREVIEW_BREATHER_MS = 15
@@ -70,6 +76,15 @@ PLACED_COORDS_BY_ITEM = {}
 ALL_PLACED_COORDS = set()
 ALL_PLACED_COORDS_BY_COMPONENT = {}
 BAD_COORDS = set()
+FOOTPRINT_PREPASS = True  # classify every layout tile before walking , unplaceable tiles are reported and skipped
+PLACEMENT_LOG_ENABLED = True  # append each live placement to data/ritual_runs , a rerun at the same center resumes
+PLACEMENT_LOG_SYNC_EVERY = 10  # fsync the placement log after this many placements
+PLACEMENT_LOG_VERIFY_RANGE = 18  # a logged placement is only skipped while it is seen on the ground within this range
+PLACEMENT_LOG_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "ritual_runs")
+_PLACEMENT_LOG = None  # set by open_placement_log() for a live run
+_PLACEMENT_INCOMPLETE = []  # parts of the layout this run did not place , any keeps the log for the next run
+LAND_ID_CACHE = {}  # (map, x, y) -> land id , land never changes during a ritual
+MAZE_CACHE = {}  # (width, height, seed) -> generated maze , treated as read-only
  
 # Pack animal state
 PACK_ROUND_ROBIN_INDEX = 0
@@ -126,60 +141,36 @@ def debug_message(msg, color=0):
         except Exception:
             print(msg)
 
-def _convert_packet_to_bytes(packet_list):
-    byte_list = []
-    for value in packet_list:
-        if value:
-            byte_list.append(int(value, 16))
-        else:
-            byte_list.append(0)
-    return byte_list
-
-def _format_hex_4_with_space(value):
-    s = f"{int(value) & 0xFFFF:04X}"
-    return s[:2] + " " + s[2:]
+# client-only serials keep the high byte 0x48 of the original packet template
+FAKE_SERIAL_MIN = 0x48000000
+FAKE_SERIAL_MAX = 0x48FFFFFF
+
+# 0xF3 world item packet , 26 bytes , rendered by the client only
+# serial at 4 , graphic at 8 , x y z at 15 , hue at 21 , every other byte is fixed
+_FAKE_ITEM_TEMPLATE = (
+    0xF3, 0x00, 0x01, 0x00, 0x48, 0xFC, 0xBB, 0x12, 0x00, 0x00, 0x00, 0x00, 0x01,
+    0x00, 0x01, 0x05, 0x88, 0x06, 0x88, 0x0A, 0x00, 0x04, 0x15, 0x20, 0x00, 0x00,
+)
+_FAKE_ITEM_PACKET = bytearray(_FAKE_ITEM_TEMPLATE)
+_PACK_SERIAL_GRAPHIC = struct.Struct('>IH')
+_PACK_LOCATION = struct.Struct('>HHB')
+_PACK_HUE = struct.Struct('>H')
+
+def build_fake_item_packet(serial, item_x, item_y, item_z, item_id, hue=0):
+    """Fill the reusable 0xF3 buffer in place and return it as a list of byte values."""
+    packet = _FAKE_ITEM_PACKET
+    _PACK_SERIAL_GRAPHIC.pack_into(packet, 4, serial & 0xFFFFFFFF, int(item_id) & 0xFFFF)
+    # Z is a signed byte on the wire , -1 encodes as 0xFF
+    _PACK_LOCATION.pack_into(packet, 15, int(item_x) & 0xFFFF, int(item_y) & 0xFFFF, int(item_z) & 0xFF)
+    _PACK_HUE.pack_into(packet, 21, int(hue) & 0xFFFF)
+    return list(packet)
 
-def _send_fake_item(item_x, item_y, item_z, item_id_4hex_with_space, hue_4hex_with_space):
+def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
     try:
-        packet = (
-            "F3 00 01 00 48 FC BB 12 "
-            + item_id_4hex_with_space
-            + " 00 00 01 00 01 05 88 06 88 0A 00 04 15 20 00 00"
-        )
-        packet_list = packet.split(" ")
-
-        serial_hex = hex(random.randrange(0, 0xFFFFFF))[2:].zfill(6)
-
-        i_loc_x = hex(int(item_x))[2:].zfill(4)
-        i_loc_y = hex(int(item_y))[2:].zfill(4)
-        # Encode Z as unsigned byte to support negative values like -1 => 0xFF
-        i_loc_z = f"{(int(item_z) & 0xFF):02X}"
-
-        x1, x2 = i_loc_x[:2], i_loc_x[2:]
-        y1, y2 = i_loc_y[:2], i_loc_y[2:]
-
-        hues = hue_4hex_with_space.split(" ")
-
-        packet_list[5] = serial_hex[0:2]
-        packet_list[6] = serial_hex[2:4]
-        packet_list[7] = serial_hex[4:6]
-        packet_list[15] = x1
-        packet_list[16] = x2
-        packet_list[17] = y1
-        packet_list[18] = y2
-        packet_list[19] = i_loc_z
-        packet_list[21] = hues[0]
-        packet_list[22] = hues[1]
-
-        byte_list = _convert_packet_to_bytes(packet_list)
-        PacketLogger.SendToClient(byte_list)
+        serial = random.randrange(FAKE_SERIAL_MIN, FAKE_SERIAL_MAX)
+        PacketLogger.SendToClient(build_fake_item_packet(serial, x, y, z, item_id, hue))
     except Exception as e:
-        debug_message(f"Preview send failed: {e}", 33)
-
-def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
-    item_hex = _format_hex_4_with_space(item_id)
-    hue_hex = _format_hex_4_with_space(hue)
-    _send_fake_item(x, y, z, item_hex, hue_hex)
+        debug_message(f"Failed to send item packet: {e}", 33)
 
 def now_ms():
     return int(time.time() * 1000)
@@ -205,27 +196,58 @@ def throttle(min_gap_ms=None):
         Misc.Pause(min_gap_ms - elapsed)
     LAST_ACTION_MS = now_ms()
 
+def get_land_id(x, y, game_map=None):
+    """Land tile id at (x, y) , looked up once per session. None when the lookup fails."""
+    if game_map is None:
+        game_map = Player.Map
+    key = (game_map, x, y)
+    if key not in LAND_ID_CACHE:
+        try:
+            LAND_ID_CACHE[key] = Statics.GetLandID(x, y, game_map)
+        except Exception:
+            LAND_ID_CACHE[key] = None
+    return LAND_ID_CACHE[key]
+
 def is_safe_ground(x, y, game_map=None):
     if game_map is None:
         game_map = Player.Map
     if (x, y) in BAD_COORDS:
         return False
-    try:
-        land_id = Statics.GetLandID(x, y, game_map)
-    except Exception:
+    land_id = get_land_id(x, y, game_map)
+    if land_id is None:
         return False
     BAD_LAND_IDS = {0x0001}
     if land_id in BAD_LAND_IDS:
         return False
     return True
 
+def classify_footprint(tiles, label="Layout"):
+    """Check every tile of a layout in one sweep before any walking or placing.
+    Unplaceable tiles go into BAD_COORDS and are reported up front. Returns them as a list."""
+    unique_tiles = []
+    seen = set()
+    for tile in tiles:
+        xy = (int(tile[0]), int(tile[1]))
+        if xy not in seen:
+            seen.add(xy)
+            unique_tiles.append(xy)
+    unplaceable = [xy for xy in unique_tiles if not is_safe_ground(xy[0], xy[1])]
+    BAD_COORDS.update(unplaceable)
+    if unplaceable:
+        sample = ", ".join(f"({x},{y})" for x, y in unplaceable[:8])
+        more = " ..." if len(unplaceable) > 8 else ""
+        debug_message(f"{label}: {len(unplaceable)} of {len(unique_tiles)} tiles unplaceable , skipping {sample}{more}", 33)
+    else:
+        debug_message(f"{label}: all {len(unique_tiles)} tiles placeable", 68)
+    return unplaceable
+
 def is_valid_position(x, y, z=None):
     if z is None:
         z = Player.Position.Z
     return (
         Player.Position.X - MAX_DISTANCE <= x <= Player.Position.X + MAX_DISTANCE
         and Player.Position.Y - MAX_DISTANCE <= y <= Player.Position.Y + MAX_DISTANCE
-        and Statics.GetLandID(x, y, Player.Map) not in [0x0001]
+        and get_land_id(x, y) not in (None, 0x0001)
     )
 
 def get_direction(from_x, from_y, to_x, to_y):
@@ -262,12 +284,12 @@ def dir_to_str(d):
     }
     return mapping.get(int(d) % 8, "North")
 
-def attempt_walk_toward(tx, ty, max_steps=6):
+def attempt_walk_toward(tx, ty, max_steps=6, reach=MAX_DISTANCE):
     last_pos = (Player.Position.X, Player.Position.Y)
     step_delay = GOTO_BASE_DELAY
     for _ in range(max_steps):
-        if (abs(Player.Position.X - tx) <= MAX_DISTANCE and
-            abs(Player.Position.Y - ty) <= MAX_DISTANCE):
+        if (abs(Player.Position.X - tx) <= reach and
+            abs(Player.Position.Y - ty) <= reach):
             return True
         try:
             base_dir = get_direction(Player.Position.X, Player.Position.Y, tx, ty)
@@ -295,8 +317,8 @@ def attempt_walk_toward(tx, ty, max_steps=6):
         if not moved:
             step_delay = int(step_delay * 1.3) + 50
             pause_ms(step_delay)
-    return (abs(Player.Position.X - tx) <= MAX_DISTANCE and
-            abs(Player.Position.Y - ty) <= MAX_DISTANCE)
+    return (abs(Player.Position.X - tx) <= reach and
+            abs(Player.Position.Y - ty) <= reach)
 
 def goto_location_with_wiggle(x, y, max_retries=GOTO_MAX_RETRIES, center=None):
     target_x = int(float(x))
@@ -320,6 +342,359 @@ def goto_location_with_wiggle(x, y, max_retries=GOTO_MAX_RETRIES, center=None):
     return (abs(Player.Position.X - target_x) <= MAX_DISTANCE and
             abs(Player.Position.Y - target_y) <= MAX_DISTANCE)
 
+def walk_to_stand_tile(stand_x, stand_y):
+    """Walk onto a planned standing tile , every point of its cluster is then within reach."""
+    steps = max(abs(Player.Position.X - stand_x), abs(Player.Position.Y - stand_y)) + 2
+    return attempt_walk_toward(stand_x, stand_y, max_steps=steps, reach=0)
+
+def _tile_distance(a, b):
+    # diagonal steps cost the same as straight ones
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+def cluster_points_by_reach(points, reach=MAX_DISTANCE):
+    """Group points into clusters that can all be placed from one standing tile.
+    Returns [((stand_x, stand_y), [index, ...]), ...] , indexes keep generation order inside a cluster
+    so stacks on the same tile stay in their original layer order."""
+    cell_size = 2 * reach + 1
+    buckets = {}
+    for index, point in enumerate(points):
+        buckets.setdefault((point[0] // cell_size, point[1] // cell_size), []).append(index)
+
+    unassigned = set(range(len(points)))
+    clusters = []
+    for index in range(len(points)):
+        if index not in unassigned:
+            continue
+        seed = points[index]
+        cell_x, cell_y = seed[0] // cell_size, seed[1] // cell_size
+        # points within twice the reach can share a standing tile with the seed
+        nearby = [
+            j
+            for gx in (cell_x - 1, cell_x, cell_x + 1)
+            for gy in (cell_y - 1, cell_y, cell_y + 1)
+            for j in buckets.get((gx, gy), ())
+            if j in unassigned and _tile_distance(points[j], seed) <= 2 * reach
+        ]
+        xs = sorted(points[j][0] for j in nearby)
+        ys = sorted(points[j][1] for j in nearby)
+        # stand at the median of the neighbourhood , clamped so the seed itself stays in reach
+        stand = (
+            min(max(xs[len(xs) // 2], seed[0] - reach), seed[0] + reach),
+            min(max(ys[len(ys) // 2], seed[1] - reach), seed[1] + reach),
+        )
+        if stand != (seed[0], seed[1]) and not is_safe_ground(stand[0], stand[1]):
+            stand = (seed[0], seed[1])
+        members = sorted(j for j in nearby if _tile_distance(points[j], stand) <= reach)
+        unassigned.difference_update(members)
+        clusters.append((stand, members))
+    return clusters
+
+def order_clusters_by_route(clusters, start_xy):
+    """Order clusters as an open walking tour from start_xy , nearest neighbour then 2-opt."""
+    remaining = list(range(len(clusters)))
+    order = []
+    current = start_xy
+    while remaining:
+        nearest = min(remaining, key=lambda c: _tile_distance(current, clusters[c][0]))
+        remaining.remove(nearest)
+        order.append(nearest)
+        current = clusters[nearest][0]
+
+    # 2-opt , reverse any stretch of the tour that shortens the walk , the start tile stays fixed
+    stops = [start_xy] + [clusters[c][0] for c in order]
+    for _ in range(PLAN_TWO_OPT_MAX_PASSES):
+        improved = False
+        for i in range(1, len(stops) - 1):
+            for j in range(i + 1, len(stops)):
+                before = _tile_distance(stops[i - 1], stops[i])
+                after = _tile_distance(stops[i - 1], stops[j])
+                if j + 1 < len(stops):
+                    before += _tile_distance(stops[j], stops[j + 1])
+                    after += _tile_distance(stops[i], stops[j + 1])
+                if after < before:
+                    stops[i:j + 1] = stops[i:j + 1][::-1]
+                    order[i - 1:j] = order[i - 1:j][::-1]
+                    improved = True
+        if not improved:
+            break
+    return [clusters[c] for c in order]
+
+def plan_placement_route(points, start_xy=None, reach=MAX_DISTANCE):
+    """Reorder points into a walking route of reach-sized clusters.
+    Returns (ordered_points, stand_by_position) , stand_by_position maps the position of each cluster's
+    first point in ordered_points to the tile to stand on. Points in BAD_COORDS are left out of the route."""
+    routable = [p for p in points if (p[0], p[1]) not in BAD_COORDS]
+    if len(routable) < len(points):
+        debug_message(f"Route skips {len(points) - len(routable)} known-bad coords", 33)
+    if start_xy is None:
+        start_xy = (Player.Position.X, Player.Position.Y)
+
+    clusters = order_clusters_by_route(cluster_points_by_reach(routable, reach), start_xy)
+    ordered_points = []
+    stand_by_position = {}
+    walk_steps = 0
+    current = start_xy
+    for stand, members in clusters:
+        stand_by_position[len(ordered_points)] = stand
+        ordered_points.extend(routable[j] for j in members)
+        walk_steps += _tile_distance(current, stand)
+        current = stand
+    debug_message(f"Route: {len(ordered_points)} points in {len(clusters)} stops , about {walk_steps} steps", 67)
+    return ordered_points, stand_by_position
+
+class BackpackInventory:
+    """Local model of the backpack stacks drops are taken from.
+    Counts are read once , decremented on each verified drop , and re-read from the server only every
+    INVENTORY_RECONCILE_EVERY drops or when a drop does not show up on the ground."""
+
+    def __init__(self):
+        self.counts = {}             # item_id -> backpack count
+        self.stacks = {}             # item_id -> [serial, amount] of the stack drops are taken from
+        self.drops_since_sync = {}   # item_id -> drops credited since the last BackpackCount
+        self.seen_ground = set()     # ground serials already seen , a drop is confirmed by a serial not in here
+
+    def sync(self, item_id):
+        """Re-read the server count and forget the cached stack."""
+        try:
+            count = Items.BackpackCount(item_id, -1)
+        except Exception as e:
+            debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
+            count = 0
+        self.counts[item_id] = count
+        self.drops_since_sync[item_id] = 0
+        self.stacks.pop(item_id, None)
+        # items already lying around must not be mistaken for the next drop
+        self._scan_ground_for(None, None, None)
+        return count
+
+    def count(self, item_id):
+        if item_id not in self.counts or self.drops_since_sync.get(item_id, 0) >= INVENTORY_RECONCILE_EVERY:
+            return self.sync(item_id)
+        return self.counts[item_id]
+
+    def next_stack(self, item_id):
+        """Serial of a backpack stack to drop from , None when the model has none left."""
+        if self.count(item_id) <= 0:
+            return None
+        stack = self.stacks.get(item_id)
+        if stack is None or stack[1] <= 0:
+            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
+            if not item:
+                self.counts[item_id] = 0
+                return None
+            stack = [item.Serial, max(1, int(getattr(item, 'Amount', 1) or 1))]
+            self.stacks[item_id] = stack
+        return stack[0]
+
+    def forget_stack(self, item_id):
+        self.stacks.pop(item_id, None)
+
+    def dropped(self, item_id, amount):
+        self.counts[item_id] = max(0, self.counts.get(item_id, 0) - amount)
+        self.drops_since_sync[item_id] = self.drops_since_sync.get(item_id, 0) + 1
+        stack = self.stacks.get(item_id)
+        if stack is not None:
+            stack[1] -= amount
+
+    def verify_drop(self, item_id, amount, x, y, count_before):
+        """True once a new ground item of item_id shows up at (x, y).
+        If nothing new appears the server count decides , which also resyncs the model."""
+        for _ in range(INVENTORY_GROUND_POLLS):
+            if self._scan_ground_for(item_id, x, y):
+                self.dropped(item_id, amount)
+                return True
+            pause_ms(PAUSE_DURATION)
+        return self.sync(item_id) <= count_before - amount
+
+    def _scan_ground_for(self, item_id, x, y):
+        try:
+            ground_filter = Items.Filter()
+            ground_filter.Enabled = True
+            ground_filter.OnGround = True
+            ground_filter.RangeMin = 0
+            ground_filter.RangeMax = INVENTORY_GROUND_SCAN_RANGE
+            ground_items = Items.ApplyFilter(ground_filter) or []
+        except Exception as e:
+            debug_message(f"Ground scan error: {e}", 33)
+            return False
+        found = False
+        for ground_item in ground_items:
+            serial = int(ground_item.Serial)
+            if serial in self.seen_ground:
+                continue
+            self.seen_ground.add(serial)
+            if ground_item.ItemID == item_id and ground_item.Position.X == x and ground_item.Position.Y == y:
+                found = True
+        return found
+
+_INVENTORY = BackpackInventory()
+
+def items_on_ground_at(item_id, x, y):
+    """How many item_id items lie on the ground at (x, y) , None when the tile is out of view and cannot be checked."""
+    if max(abs(Player.Position.X - int(x)), abs(Player.Position.Y - int(y))) > PLACEMENT_LOG_VERIFY_RANGE:
+        return None
+    try:
+        ground_filter = Items.Filter()
+        ground_filter.Enabled = True
+        ground_filter.OnGround = True
+        ground_filter.RangeMin = 0
+        ground_filter.RangeMax = PLACEMENT_LOG_VERIFY_RANGE
+        ground_items = Items.ApplyFilter(ground_filter) or []
+    except Exception:
+        return None
+    return sum(1 for ground_item in ground_items
+               if ground_item.ItemID == item_id and ground_item.Position.X == int(x) and ground_item.Position.Y == int(y))
+
+class PlacementLog:
+    """Append-only record of the placements made for one layout at one center.
+    Each placement is one JSON line , flushed as it is written and fsynced every PLACEMENT_LOG_SYNC_EVERY lines.
+    A later session with the same layout and center replays the log and skips what was already placed."""
+
+    def __init__(self, ritual_name, layout, center_x, center_y):
+        layout_json = json.dumps(layout, sort_keys=True, default=str)
+        layout_hash = hashlib.sha1(layout_json.encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(PLACEMENT_LOG_FOLDER, f"{ritual_name}_{layout_hash}_{center_x}_{center_y}.ndjson")
+        self.logged = {}    # (item_id, x, y) -> placements recorded by earlier sessions
+        self.reached = {}   # (item_id, x, y) -> placements reached in this session
+        self.unsynced = 0
+        self.file = None
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a disconnect
+                    key = (record["i"], record["x"], record["y"])
+                    self.logged[key] = self.logged.get(key, 0) + 1
+        except Exception as e:
+            debug_message(f"Could not read placement log: {e}", 33)
+        total = sum(self.logged.values())
+        if total:
+            debug_message(f"Resuming: {total} placements already logged in {os.path.basename(self.path)}", 67)
+
+    def is_logged(self, item_id, x, y):
+        """True when the next placement of item_id at (x, y) was made by an earlier session and still lies there.
+        The items on the tile are counted against the placements reached so far , on a stacked tile only as many
+        logged drops are skipped as items remain and the rest are forgotten so they are placed again.
+        A tile out of view is not skipped yet and is checked again once the player walks there."""
+        key = (item_id, int(x), int(y))
+        reached = self.reached.get(key, 0)
+        if reached >= self.logged.get(key, 0):
+            return False
+        on_ground = items_on_ground_at(item_id, x, y)
+        if on_ground is None:
+            return False
+        if on_ground <= reached:
+            self.logged[key] = reached
+            return False
+        return True
+
+    def consume(self, item_id, x, y):
+        """Step past an already logged placement , False when it still has to be made."""
+        if not self.is_logged(item_id, x, y):
+            return False
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        return True
+
+    def logged_for(self, item_id):
+        """Placements of item_id recorded by earlier sessions."""
+        return sum(count for (logged_id, _, _), count in self.logged.items() if logged_id == item_id)
+
+    def record(self, item_id, x, y):
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        try:
+            if self.file is None:
+                if not os.path.exists(PLACEMENT_LOG_FOLDER):
+                    os.makedirs(PLACEMENT_LOG_FOLDER)
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(json.dumps({"i": item_id, "x": int(x), "y": int(y), "t": int(time.time())}) + "\n")
+            self.file.flush()
+            self.unsynced += 1
+            if self.unsynced >= PLACEMENT_LOG_SYNC_EVERY:
+                self.sync()
+        except Exception as e:
+            debug_message(f"Could not write placement log: {e}", 33)
+
+    def sync(self):
+        if self.file is None or not self.unsynced:
+            return
+        try:
+            os.fsync(self.file.fileno())
+        except (AttributeError, OSError):
+            pass
+        self.unsynced = 0
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def finish(self):
+        """The ritual completed , the log is removed so a later ritual at this center starts fresh."""
+        self.close()
+        try:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            debug_message(f"Could not remove placement log: {e}", 33)
+
+def open_placement_log(ritual_name, layout, center_x, center_y):
+    """Start or resume the placement log for a live run , preview runs place nothing and keep no log."""
+    global _PLACEMENT_LOG
+    close_placement_log()
+    del _PLACEMENT_INCOMPLETE[:]
+    if PREVIEW_MODE or not PLACEMENT_LOG_ENABLED:
+        return None
+    _PLACEMENT_LOG = PlacementLog(ritual_name, layout, int(center_x), int(center_y))
+    return _PLACEMENT_LOG
+
+def close_placement_log():
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.close()
+        _PLACEMENT_LOG = None
+
+def finish_placement_log():
+    """Remove the log of a completed ritual , only an interrupted run leaves one to resume from."""
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.finish()
+        _PLACEMENT_LOG = None
+
+def mark_placement_incomplete(reason):
+    """Note a part of the layout that was not placed , the run then keeps its log to resume from."""
+    if PREVIEW_MODE or reason in _PLACEMENT_INCOMPLETE:
+        return
+    _PLACEMENT_INCOMPLETE.append(reason)
+
+def end_placement_log():
+    """Remove the log only when every point was placed or already logged , otherwise keep it for the next run.
+    Returns True when the ritual is complete."""
+    if _PLACEMENT_INCOMPLETE:
+        shown = ", ".join(_PLACEMENT_INCOMPLETE[:3]) + (" ..." if len(_PLACEMENT_INCOMPLETE) > 3 else "")
+        debug_message(f"Placement incomplete ( {len(_PLACEMENT_INCOMPLETE)} parts missed : {shown} ) , run again here to resume", 33)
+        close_placement_log()
+        return False
+    finish_placement_log()
+    return True
+
+def placements_logged_for(item_id):
+    """Placements of item_id already made by earlier sessions , taken off the backpack requirement on resume."""
+    return _PLACEMENT_LOG.logged_for(item_id) if _PLACEMENT_LOG is not None else 0
+
+def placement_logged(item_id, x, y):
+    """True when this placement was already made by an earlier session , used to skip walking to it."""
+    return _PLACEMENT_LOG is not None and _PLACEMENT_LOG.is_logged(item_id, x, y)
+
 def place_item(x, y, item_id, z=None):
     if PREVIEW_MODE:
         if z is None:
@@ -328,6 +703,8 @@ def place_item(x, y, item_id, z=None):
         return True
     if item_id is None:
         return False
+    if _PLACEMENT_LOG is not None and _PLACEMENT_LOG.consume(item_id, x, y):
+        return True
     offsets = [(0, 0)] if SAFE_MODE else [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
     if z is None:
         z = -1
@@ -341,43 +718,35 @@ def place_item(x, y, item_id, z=None):
             BAD_COORDS.add((tx, ty))
             continue
         for attempt in range(1, PLACE_MAX_RETRIES + 1):
-            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
-            if not item:
+            item_serial = _INVENTORY.next_stack(item_id)
+            if item_serial is None:
                 debug_message(f"Could not find item 0x{item_id:X}", 33)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
-
-            try:
-                initial_count = Items.BackpackCount(item_id, -1)
-            except Exception as e:
-                debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
-                return False
-            if initial_count <= 0:
-                return False
+            initial_count = _INVENTORY.count(item_id)
 
             try:
                 force_z = -1
-                Items.MoveOnGround(item, 1, tx, ty, force_z)
+                Items.MoveOnGround(item_serial, 1, tx, ty, force_z)
             except Exception as e:
                 debug_message(f"MoveOnGround failed at ({tx},{ty},{force_z}): {e}", 33)
+                _INVENTORY.forget_stack(item_id)
                 BAD_COORDS.add((x, y))
                 pause_ms(PAUSE_DURATION + 150)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
             else:
                 throttle()
                 pause_ms(PAUSE_DURATION_PLACE)
 
-            for _ in range(2):
-                try:
-                    new_count = Items.BackpackCount(item_id, -1)
-                except Exception as e:
-                    debug_message(f"BackpackCount verify error: {e}", 33)
-                    break
-                if new_count < initial_count:
-                    return True
-                pause_ms(PAUSE_DURATION)
+            if _INVENTORY.verify_drop(item_id, 1, tx, ty, initial_count):
+                if _PLACEMENT_LOG is not None:
+                    _PLACEMENT_LOG.record(item_id, x, y)
+                return True
 
             pause_ms(PLACE_BACKOFF_BASE * attempt)
 
+    mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
     return False
 
 def get_item_name(item_id):
@@ -398,6 +767,16 @@ def _neighbors(grid_w, grid_h, cx, cy):
             yield nx, ny, dx, dy
 
 def generate_maze(width, height, seed=None):
+    """Generate the maze for a seed , a seeded maze is built once per session and shared."""
+    key = (width, height, seed)
+    if seed is not None and key in MAZE_CACHE:
+        return MAZE_CACHE[key]
+    maze = _build_maze(width, height, seed)
+    if seed is not None:
+        MAZE_CACHE[key] = maze
+    return maze
+
+def _build_maze(width, height, seed):
     # Use odd dimensions for proper walls; enforce
     if width % 2 == 0:
         width += 1
@@ -448,10 +827,10 @@ def generate_maze(width, height, seed=None):
 
     # Choose exit as farthest from entrance interior point (ix, iy)
     dist, parents = _bfs_dist(grid, (ix, iy))
-    far_candidates = [(dist.get((x, 1), -1), (x, 0), (x, 1)) for x in range(1, width, 2) if grid[1][x] == 0]
-    far_candidates += [(dist.get((x, height-2), -1), (x, height-1), (x, height-2)) for x in range(1, width, 2) if grid[height-2][x] == 0]
-    far_candidates += [(dist.get((1, y), -1), (0, y), (1, y)) for y in range(1, height, 2) if grid[y][1] == 0]
-    far_candidates += [(dist.get((width-2, y), -1), (width-1, y), (width-2, y)) for y in range(1, height, 2) if grid[y][width-2] == 0]
+    far_candidates = [(dist[width + x], (x, 0), (x, 1)) for x in range(1, width, 2) if grid[1][x] == 0]
+    far_candidates += [(dist[(height-2) * width + x], (x, height-1), (x, height-2)) for x in range(1, width, 2) if grid[height-2][x] == 0]
+    far_candidates += [(dist[y * width + 1], (0, y), (1, y)) for y in range(1, height, 2) if grid[y][1] == 0]
+    far_candidates += [(dist[y * width + width-2], (width-1, y), (width-2, y)) for y in range(1, height, 2) if grid[y][width-2] == 0]
     if far_candidates:
         far_candidates.sort(key=lambda t: t[0])
         d, (ex, ey), (ix2, iy2) = far_candidates[-1]
@@ -461,7 +840,7 @@ def generate_maze(width, height, seed=None):
     # Build solution path from farthest exit
     dist2, parents2 = _bfs_dist(grid, (ix2, iy2)) if far_candidates else (dist, parents)
     target = (ex, ey)
-    sol = _reconstruct_path(parents2, (ix2, iy2), target)
+    sol = _reconstruct_path(parents2, width, (ix2, iy2), target)
     # Convert entrance cell to interior neighbor for world mapping
     entrance_interior = (ix2, iy2) if far_candidates else (ix, iy)
 
@@ -477,30 +856,53 @@ def generate_maze(width, height, seed=None):
         "score": _score_maze(grid, sol),
     }
 
+def _open_cells(grid):
+    """Flat row-major list of open cells , index = y * width + x."""
+    return [cell == 0 for row in grid for cell in row]
+
+def _open_neighbor_indices(open_cells, width, height, index):
+    # 4-dir open neighbors in the order right , left , down , up
+    x = index % width
+    out = []
+    if x + 1 < width and open_cells[index + 1]:
+        out.append(index + 1)
+    if x > 0 and open_cells[index - 1]:
+        out.append(index - 1)
+    if index + width < width * height and open_cells[index + width]:
+        out.append(index + width)
+    if index >= width and open_cells[index - width]:
+        out.append(index - width)
+    return out
+
 def _bfs_dist(grid, start):
+    """Breadth-first distances over open cells from start.
+    Returns flat lists indexed by y * width + x , dist is -1 and parent is -1 where unreached."""
     width = len(grid[0])
     height = len(grid)
-    q = [start]
-    dist = {start: 0}
-    parents = {start: None}
+    open_cells = _open_cells(grid)
+    start_index = start[1] * width + start[0]
+    dist = [-1] * (width * height)
+    parents = [-1] * (width * height)
+    dist[start_index] = 0
+    q = [start_index]
     head = 0
     while head < len(q):
-        x, y = q[head]
+        index = q[head]
         head += 1
-        for dx, dy in [(1,0),(-1,0),(0,1),(0,-1)]:
-            nx, ny = x+dx, y+dy
-            if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 0 and (nx, ny) not in dist:
-                dist[(nx, ny)] = dist[(x, y)] + 1
-                parents[(nx, ny)] = (x, y)
-                q.append((nx, ny))
+        next_dist = dist[index] + 1
+        for n in _open_neighbor_indices(open_cells, width, height, index):
+            if dist[n] < 0:
+                dist[n] = next_dist
+                parents[n] = index
+                q.append(n)
     return dist, parents
 
-def _reconstruct_path(parents, start, end):
-    cur = end
+def _reconstruct_path(parents, width, start, end):
+    cur = end[1] * width + end[0]
     out = []
-    while cur is not None:
-        out.append(cur)
-        cur = parents.get(cur)
+    while cur >= 0:
+        out.append((cur % width, cur // width))
+        cur = parents[cur]
     out.reverse()
     # ensure starts with start
     if out and out[0] != start:
@@ -513,35 +915,29 @@ def _score_maze(grid, solution_path):
     # Dead-end analysis: count lengths of branches ending at degree-1 nodes excluding solution path
     width = len(grid[0])
     height = len(grid)
-    sol_set = set(solution_path)
-
-    def neighbors_open(x, y):
-        for dx, dy in [(1,0),(-1,0),(0,1),(0,-1)]:
-            nx, ny = x+dx, y+dy
-            if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] == 0:
-                yield nx, ny
+    open_cells = _open_cells(grid)
+    on_solution = [False] * (width * height)
+    for x, y in solution_path:
+        if 0 <= x < width and 0 <= y < height:
+            on_solution[y * width + x] = True
 
     dead_end_lengths = []
-    visited = set()
-    for y in range(height):
-        for x in range(width):
-            if grid[y][x] != 0 or (x, y) in visited:
-                continue
-            deg = sum(1 for _ in neighbors_open(x, y))
-            if deg == 1 and (x, y) not in sol_set:
-                # Follow branch until junction
-                length = 1
-                visited.add((x, y))
-                px, py = x, y
-                # advance to next
-                nexts = [n for n in neighbors_open(px, py) if n not in visited]
-                while len(nexts) == 1:
-                    nx, ny = nexts[0]
-                    visited.add((nx, ny))
-                    length += 1
-                    px, py = nx, ny
-                    nexts = [n for n in neighbors_open(px, py) if n not in visited]
-                dead_end_lengths.append(length)
+    visited = [False] * (width * height)
+    for index in range(width * height):
+        if not open_cells[index] or visited[index]:
+            continue
+        if on_solution[index] or len(_open_neighbor_indices(open_cells, width, height, index)) != 1:
+            continue
+        # Follow branch until junction
+        length = 1
+        visited[index] = True
+        nexts = [n for n in _open_neighbor_indices(open_cells, width, height, index) if not visited[n]]
+        while len(nexts) == 1:
+            n = nexts[0]
+            visited[n] = True
+            length += 1
+            nexts = [m for m in _open_neighbor_indices(open_cells, width, height, n) if not visited[m]]
+        dead_end_lengths.append(length)
 
     # Reward longer dead-ends more than many short ones
     dead_score = sum(l*l for l in dead_end_lengths)
@@ -864,59 +1260,72 @@ def attempt_autorestock_hay_from_packs(item_id, desired_count):
     return total_moved
 
 def place_points_with_checkpoint(points, item_id, cp_path, cp_state_key="placed_walls", label="Placing walls", center=None):
+    """Place points , skipping those in the placement log or in a checkpoint written by older versions."""
     placed_set = set()
 
-    # Load existing checkpoint
+    # Older runs kept the placed points in the checkpoint itself
     cp = load_checkpoint(cp_path)
     if cp and cp.get(cp_state_key):
         for t in cp.get(cp_state_key, []):
             placed_set.add(tuple(t))
 
     # Skip already placed
-    remaining_points = [p for p in points if (p[0], p[1]) not in placed_set]
+    remaining_points = []
+    for p in points:
+        if (p[0], p[1]) in placed_set:
+            continue
+        if placement_logged(item_id, p[0], p[1]):
+            placed_set.add((p[0], p[1]))
+            continue
+        remaining_points.append(p)
     debug_message(f"{label}: {len(placed_set)} already placed, {len(remaining_points)} remaining", 67)
+    stand_by_position = {}
+    if PLAN_TRAVEL_ROUTE and not PREVIEW_MODE:
+        remaining_points, stand_by_position = plan_placement_route(remaining_points)
 
-    # Place with periodic checkpointing and restock handling
-    placed_since_cp = 0
+    # Each placement is appended to the placement log , no checkpoint rewrites while placing
     failures = 0
+    pending_stand = None
 
     for idx, (x, y) in enumerate(remaining_points, 1):
         debug_message(f"{label}: {idx} out of {len(remaining_points)}", 67)
+        if idx - 1 in stand_by_position:
+            pending_stand = stand_by_position[idx - 1]
 
         if not PREVIEW_MODE:
+            # Walk to the cluster's stand tile once , at its first point that is actually placed
+            if pending_stand is not None:
+                walk_to_stand_tile(pending_stand[0], pending_stand[1])
+                pending_stand = None
             if not goto_location_with_wiggle(x, y, center=center):
                 debug_message(f"Could not reach position ({x}, {y})", 33)
                 failures += 1
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 if failures >= MAX_PHASE_FAILURES:
                     debug_message("Too many failures in this phase; aborting early.", 33)
+                    mark_placement_incomplete(label)
                     break
                 continue
 
         # Ensure we have at least 1 item; if none, wait for restock
         if not PREVIEW_MODE:
-            try:
-                have = Items.BackpackCount(item_id, -1)
-            except Exception:
-                have = 0
+            have = _INVENTORY.count(item_id)
             if have <= 0:
-                # Save checkpoint before waiting
-                cp_out = cp or {}
-                cp_out.update({
-                    "seed": cp_out.get("seed"),
-                    cp_state_key: list(placed_set),
-                })
-                save_checkpoint(cp_path, cp_out)
+                if _PLACEMENT_LOG is not None:
+                    _PLACEMENT_LOG.sync()
                 if not wait_for_restock_if_needed(item_id, 1):
+                    mark_placement_incomplete(f"{label} ( out of 0x{item_id:X} )")
                     break
+                _INVENTORY.sync(item_id)
 
         if place_item(x, y, item_id):
             placed_set.add((x, y))
             ALL_PLACED_COORDS.add((x, y))
-            placed_since_cp += 1
         else:
             failures += 1
             if failures >= MAX_PHASE_FAILURES:
                 debug_message("Too many placement failures; aborting early.", 33)
+                mark_placement_incomplete(label)
                 break
 
         if PREVIEW_MODE:
@@ -924,24 +1333,6 @@ def place_points_with_checkpoint(points, item_id, cp_path, cp_state_key="placed_
         else:
             pause_ms(POINT_BREATHER_MS)
 
-        # Periodic checkpoint
-        if placed_since_cp >= CHECKPOINT_EVERY_N:
-            cp_out = cp or {}
-            cp_out.update({
-                "seed": cp_out.get("seed"),
-                cp_state_key: list(placed_set),
-            })
-            save_checkpoint(cp_path, cp_out)
-            placed_since_cp = 0
-
-    # Final checkpoint
-    cp_out = cp or {}
-    cp_out.update({
-        "seed": cp_out.get("seed"),
-        cp_state_key: list(placed_set),
-    })
-    save_checkpoint(cp_path, cp_out)
-
     return placed_set
 
 # ============================= Main =============================
@@ -1030,13 +1421,15 @@ def create_maze_arrangement(center_x, center_y):
         return
 
     # Real placement
+    wall_points = build_wall_points_from_grid(center_x, center_y, maze, MAZE_CONFIG["cell_size"])
+    if FOOTPRINT_PREPASS:
+        classify_footprint(wall_points, "Maze footprint")
+
     # Move to center first if possible
     if not goto_location_with_wiggle(center_x, center_y, center=center):
         debug_message("Could not reach center position!", 33)
         return
 
-    wall_points = build_wall_points_from_grid(center_x, center_y, maze, MAZE_CONFIG["cell_size"])
-
     wall_item_ids = MAZE_CONFIG["wall_item_ids"]
     wall_item_id = get_first_available_item_id(wall_item_ids, 1)
     if wall_item_id is None:
@@ -1049,17 +1442,23 @@ def create_maze_arrangement(center_x, center_y):
     cp.setdefault("seed", maze["seed"])
     save_checkpoint(cp_path, cp)
 
-    placed = place_points_with_checkpoint(
-        wall_points,
-        wall_item_id,
-        cp_path,
-        cp_state_key="placed_walls",
-        label="Placing hay walls",
-        center=center,
-    )
+    open_placement_log("maze", {"maze": MAZE_CONFIG, "seed": maze["seed"]}, center_x, center_y)
+    try:
+        placed = place_points_with_checkpoint(
+            wall_points,
+            wall_item_id,
+            cp_path,
+            cp_state_key="placed_walls",
+            label="Placing hay walls",
+            center=center,
+        )
+        complete = end_placement_log()
+    finally:
+        close_placement_log()
     debug_message(f"Placed {len(placed)} maze wall tiles.", 68 if placed else 33)
 
-    debug_message("Maze arrangement complete!", 67)
+    if complete:
+        debug_message("Maze arrangement complete!", 67)
 
 def main():
     display_configuration()
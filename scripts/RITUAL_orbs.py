@@ -37,10 +37,14 @@ ORBS THEME ITEMS________________________________________________
 - Druidic:         seeds , parasitic plant 
 - Holy:            strength potion , diamonds, faery dust 
 
-VERSION::20250826
+VERSION::20261019
 """
+import hashlib
+import json
+import os
 import math
 import time
+import struct
 import random
 
 # ===== Global toggles =====
@@ -152,6 +156,8 @@ WIGGLE_RADII = [0]
 
 WIGGLE_ANGLES = [0, 45, 90, 135, 180, 225, 270, 315]
 WALK_REPEATS_PER_DIR = 2
+PLAN_TRAVEL_ROUTE = True  # reorder each placement pass into reach-sized stops walked as a short tour
+PLAN_TWO_OPT_MAX_PASSES = 4  # 2-opt improvement passes over the stop order
 
 CENTER_BIAS_ENABLED = True
 CENTER_NUDGE_DISTANCE = 3
@@ -159,6 +165,9 @@ CENTER_NUDGE_STEPS = 2
 
 PLACE_MAX_RETRIES = 2
 PLACE_BACKOFF_BASE = 250
+INVENTORY_RECONCILE_EVERY = 25  # re-read BackpackCount after this many locally counted drops
+INVENTORY_GROUND_POLLS = 2  # ground scans for a dropped item before asking the server
+INVENTORY_GROUND_SCAN_RANGE = 6  # tiles around the player scanned for dropped items
 POINT_TIMEOUT_MS = 1500
 POINT_BREATHER_MS = 250
 
@@ -177,6 +186,16 @@ PREVIEW_RANDOM_POOL_DELAY_MS = 600  # extra delay per preview random-pool item t
 MAX_PHASE_FAILURES = 6
 PLACED_COORDS_BY_ITEM = {}
 BAD_COORDS = set()
+FOOTPRINT_PREPASS = True  # classify every layout tile before walking , unplaceable tiles are reported and skipped
+PLACEMENT_LOG_ENABLED = True  # append each live placement to data/ritual_runs , a rerun at the same center resumes
+PLACEMENT_LOG_SYNC_EVERY = 10  # fsync the placement log after this many placements
+PLACEMENT_LOG_VERIFY_RANGE = 18  # a logged placement is only skipped while it is seen on the ground within this range
+PLACEMENT_LOG_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "ritual_runs")
+_PLACEMENT_LOG = None  # set by open_placement_log() for a live run
+_PLACEMENT_INCOMPLETE = []  # parts of the layout this run did not place , any keeps the log for the next run
+LAND_ID_CACHE = {}  # (map, x, y) -> land id , land never changes during a ritual
+GROUND_Z_CACHE = {}  # (map, x, y) -> ground Z from land and statics
+SHAPE_CACHE = {}  # generator parameters -> point offsets around the origin , translated per center
 EXCLUDED_COORDS = set()  # Global exclusion zone coordinates
 ENABLE_STACK_TRACKING = True
 # Tracks the next available Z at a given (x,y) after successful placements.
@@ -603,59 +622,36 @@ def debug_message(msg, color=0):
         except Exception:
             print(msg)
 
-def _convert_packet_to_bytes(packet_list):
-    byte_list = []
-    for value in packet_list:
-        if value:
-            byte_list.append(int(value, 16))
-        else:
-            byte_list.append(0)
-    return byte_list
+# client-only serials keep the high byte 0x48 of the original packet template
+FAKE_SERIAL_MIN = 0x48000000
+FAKE_SERIAL_MAX = 0x48FFFFFF
+
+# 0xF3 world item packet , 26 bytes , rendered by the client only
+# serial at 4 , graphic at 8 , x y z at 15 , hue at 21 , every other byte is fixed
+_FAKE_ITEM_TEMPLATE = (
+    0xF3, 0x00, 0x01, 0x00, 0x48, 0xFC, 0xBB, 0x12, 0x00, 0x00, 0x00, 0x00, 0x01,
+    0x00, 0x01, 0x05, 0x88, 0x06, 0x88, 0x0A, 0x00, 0x04, 0x15, 0x20, 0x00, 0x00,
+)
+_FAKE_ITEM_PACKET = bytearray(_FAKE_ITEM_TEMPLATE)
+_PACK_SERIAL_GRAPHIC = struct.Struct('>IH')
+_PACK_LOCATION = struct.Struct('>HHB')
+_PACK_HUE = struct.Struct('>H')
+
+def build_fake_item_packet(serial, item_x, item_y, item_z, item_id, hue=0):
+    """Fill the reusable 0xF3 buffer in place and return it as a list of byte values."""
+    packet = _FAKE_ITEM_PACKET
+    _PACK_SERIAL_GRAPHIC.pack_into(packet, 4, serial & 0xFFFFFFFF, int(item_id) & 0xFFFF)
+    # Z is a signed byte on the wire , -1 encodes as 0xFF
+    _PACK_LOCATION.pack_into(packet, 15, int(item_x) & 0xFFFF, int(item_y) & 0xFFFF, int(item_z) & 0xFF)
+    _PACK_HUE.pack_into(packet, 21, int(hue) & 0xFFFF)
+    return list(packet)
 
-def _send_fake_item(item_x, item_y, item_z, item_id_4hex_with_space, hue_4hex_with_space):
+def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
     try:
-        packet = (
-            "F3 00 01 00 48 FC BB 12 "
-            + item_id_4hex_with_space
-            + " 00 00 01 00 01 05 88 06 88 0A 00 04 15 20 00 00"
-        )
-        packet_list = packet.split(" ")
-
-        serial_hex = hex(random.randrange(0, 0xFFFFFF))[2:].zfill(6)
-
-        i_loc_x = hex(int(item_x))[2:].zfill(4)
-        i_loc_y = hex(int(item_y))[2:].zfill(4)
-        i_loc_z = hex(int(item_z))[2:].zfill(2)
-
-        x1, x2 = i_loc_x[:2], i_loc_x[2:]
-        y1, y2 = i_loc_y[:2], i_loc_y[2:]
-
-        hues = hue_4hex_with_space.split(" ")
-
-        packet_list[5] = serial_hex[0:2]
-        packet_list[6] = serial_hex[2:4]
-        packet_list[7] = serial_hex[4:6]
-        packet_list[15] = x1
-        packet_list[16] = x2
-        packet_list[17] = y1
-        packet_list[18] = y2
-        packet_list[19] = i_loc_z
-        packet_list[21] = hues[0]
-        packet_list[22] = hues[1]
-
-        byte_list = _convert_packet_to_bytes(packet_list)
-        PacketLogger.SendToClient(byte_list)
+        serial = random.randrange(FAKE_SERIAL_MIN, FAKE_SERIAL_MAX)
+        PacketLogger.SendToClient(build_fake_item_packet(serial, x, y, z, item_id, hue))
     except Exception as e:
-        debug_message(f"Preview send failed: {e}", 33)
-
-def _format_hex_4_with_space(value):
-    s = f"{int(value) & 0xFFFF:04X}"
-    return s[:2] + " " + s[2:]
-
-def preview_item_at(x, y, z, item_id, hue=PREVIEW_DEFAULT_HUE):
-    item_hex = _format_hex_4_with_space(item_id)
-    hue_hex = _format_hex_4_with_space(hue)
-    _send_fake_item(x, y, z, item_hex, hue_hex)
+        debug_message(f"Failed to send item packet: {e}", 33)
 
 def now_ms():
     return int(time.time() * 1000)
@@ -681,7 +677,10 @@ def throttle(min_gap_ms=RATE_MIN_GAP_MS):
     LAST_ACTION_MS = now_ms()
 
 def get_ground_z(x, y):
-    """Get the actual ground Z coordinate at the specified tile."""
+    """Get the actual ground Z coordinate at the specified tile , cached once a lookup succeeds."""
+    key = (Player.Map, x, y)
+    if key in GROUND_Z_CACHE:
+        return GROUND_Z_CACHE[key]
     try:
         # Get static tiles at this position
         tiles = Statics.GetStaticsTileInfo(x, y, Player.Map)
@@ -691,10 +690,12 @@ def get_ground_z(x, y):
             if walkable_tiles:
                 ground_z = max(t.StaticZ for t in walkable_tiles)
                 debug_message(f"get_ground_z({x},{y}): found static tiles, using Z={ground_z}", 68)
+                GROUND_Z_CACHE[key] = ground_z
                 return ground_z
         # Fallback to land tile Z
         land_z = Statics.GetLandZ(x, y, Player.Map)
         debug_message(f"get_ground_z({x},{y}): using land Z={land_z}", 68)
+        GROUND_Z_CACHE[key] = land_z
         return land_z
     except Exception as e:
         debug_message(f"get_ground_z({x},{y}): error {e}, using player Z={Player.Position.Z}", 68)
@@ -717,20 +718,315 @@ def compute_target_z(x, y, proposed_z):
     # Use ground Z as base instead of proposed Z
     return ground_z
 
+def get_land_id(x, y, game_map=None):
+    """Land tile id at (x, y) , looked up once per session. None when the lookup fails."""
+    if game_map is None:
+        game_map = Player.Map
+    key = (game_map, x, y)
+    if key not in LAND_ID_CACHE:
+        try:
+            LAND_ID_CACHE[key] = Statics.GetLandID(x, y, game_map)
+        except Exception:
+            LAND_ID_CACHE[key] = None
+    return LAND_ID_CACHE[key]
+
 def is_safe_ground(x, y, game_map=None):
     if game_map is None:
         game_map = Player.Map
     if (x, y) in BAD_COORDS:
         return False
-    try:
-        land_id = Statics.GetLandID(x, y, game_map)
-    except Exception:
+    land_id = get_land_id(x, y, game_map)
+    if land_id is None:
         return False
     BAD_LAND_IDS = {0x0001}
     if land_id in BAD_LAND_IDS:
         return False
     return True
 
+def classify_footprint(tiles, label="Layout"):
+    """Check every tile of a layout in one sweep before any walking or placing.
+    Unplaceable tiles go into BAD_COORDS and are reported up front. Returns them as a list."""
+    unique_tiles = []
+    seen = set()
+    for tile in tiles:
+        xy = (int(tile[0]), int(tile[1]))
+        if xy not in seen:
+            seen.add(xy)
+            unique_tiles.append(xy)
+    unplaceable = [xy for xy in unique_tiles if not is_safe_ground(xy[0], xy[1])]
+    BAD_COORDS.update(unplaceable)
+    if unplaceable:
+        sample = ", ".join(f"({x},{y})" for x, y in unplaceable[:8])
+        more = " ..." if len(unplaceable) > 8 else ""
+        debug_message(f"{label}: {len(unplaceable)} of {len(unique_tiles)} tiles unplaceable , skipping {sample}{more}", 33)
+    else:
+        debug_message(f"{label}: all {len(unique_tiles)} tiles placeable", 68)
+    return unplaceable
+
+def footprint_disk(center_x, center_y, radius):
+    """Every tile within radius of the center , for layouts whose points are only known while placing."""
+    return [
+        (center_x + dx, center_y + dy)
+        for dx in range(-radius, radius + 1)
+        for dy in range(-radius, radius + 1)
+        if dx * dx + dy * dy <= radius * radius
+    ]
+
+# ===== Placement log =====
+def items_on_ground_at(item_id, x, y):
+    """How many item_id items lie on the ground at (x, y) , None when the tile is out of view and cannot be checked."""
+    if max(abs(Player.Position.X - int(x)), abs(Player.Position.Y - int(y))) > PLACEMENT_LOG_VERIFY_RANGE:
+        return None
+    try:
+        ground_filter = Items.Filter()
+        ground_filter.Enabled = True
+        ground_filter.OnGround = True
+        ground_filter.RangeMin = 0
+        ground_filter.RangeMax = PLACEMENT_LOG_VERIFY_RANGE
+        ground_items = Items.ApplyFilter(ground_filter) or []
+    except Exception:
+        return None
+    return sum(1 for ground_item in ground_items
+               if ground_item.ItemID == item_id and ground_item.Position.X == int(x) and ground_item.Position.Y == int(y))
+
+class PlacementLog:
+    """Append-only record of the placements made for one layout at one center.
+    Each placement is one JSON line , flushed as it is written and fsynced every PLACEMENT_LOG_SYNC_EVERY lines.
+    A later session with the same layout and center replays the log and skips what was already placed."""
+
+    def __init__(self, ritual_name, layout, center_x, center_y):
+        layout_json = json.dumps(layout, sort_keys=True, default=str)
+        layout_hash = hashlib.sha1(layout_json.encode("utf-8")).hexdigest()[:12]
+        self.path = os.path.join(PLACEMENT_LOG_FOLDER, f"{ritual_name}_{layout_hash}_{center_x}_{center_y}.ndjson")
+        self.logged = {}    # (item_id, x, y) -> placements recorded by earlier sessions
+        self.reached = {}   # (item_id, x, y) -> placements reached in this session
+        self.unsynced = 0
+        self.file = None
+        self._load()
+
+    def _load(self):
+        if not os.path.isfile(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line from a disconnect
+                    key = (record["i"], record["x"], record["y"])
+                    self.logged[key] = self.logged.get(key, 0) + 1
+        except Exception as e:
+            debug_message(f"Could not read placement log: {e}", 33)
+        total = sum(self.logged.values())
+        if total:
+            debug_message(f"Resuming: {total} placements already logged in {os.path.basename(self.path)}", 67)
+
+    def is_logged(self, item_id, x, y):
+        """True when the next placement of item_id at (x, y) was made by an earlier session and still lies there.
+        The items on the tile are counted against the placements reached so far , on a stacked tile only as many
+        logged drops are skipped as items remain and the rest are forgotten so they are placed again.
+        A tile out of view is not skipped yet and is checked again once the player walks there."""
+        key = (item_id, int(x), int(y))
+        reached = self.reached.get(key, 0)
+        if reached >= self.logged.get(key, 0):
+            return False
+        on_ground = items_on_ground_at(item_id, x, y)
+        if on_ground is None:
+            return False
+        if on_ground <= reached:
+            self.logged[key] = reached
+            return False
+        return True
+
+    def consume(self, item_id, x, y):
+        """Step past an already logged placement , False when it still has to be made."""
+        if not self.is_logged(item_id, x, y):
+            return False
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        return True
+
+    def logged_for(self, item_id):
+        """Placements of item_id recorded by earlier sessions."""
+        return sum(count for (logged_id, _, _), count in self.logged.items() if logged_id == item_id)
+
+    def record(self, item_id, x, y):
+        key = (item_id, int(x), int(y))
+        self.reached[key] = self.reached.get(key, 0) + 1
+        try:
+            if self.file is None:
+                if not os.path.exists(PLACEMENT_LOG_FOLDER):
+                    os.makedirs(PLACEMENT_LOG_FOLDER)
+                self.file = open(self.path, "a", encoding="utf-8")
+            self.file.write(json.dumps({"i": item_id, "x": int(x), "y": int(y), "t": int(time.time())}) + "\n")
+            self.file.flush()
+            self.unsynced += 1
+            if self.unsynced >= PLACEMENT_LOG_SYNC_EVERY:
+                self.sync()
+        except Exception as e:
+            debug_message(f"Could not write placement log: {e}", 33)
+
+    def sync(self):
+        if self.file is None or not self.unsynced:
+            return
+        try:
+            os.fsync(self.file.fileno())
+        except (AttributeError, OSError):
+            pass
+        self.unsynced = 0
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def finish(self):
+        """The ritual completed , the log is removed so a later ritual at this center starts fresh."""
+        self.close()
+        try:
+            if os.path.isfile(self.path):
+                os.remove(self.path)
+        except OSError as e:
+            debug_message(f"Could not remove placement log: {e}", 33)
+
+def open_placement_log(ritual_name, layout, center_x, center_y):
+    """Start or resume the placement log for a live run , preview runs place nothing and keep no log."""
+    global _PLACEMENT_LOG
+    close_placement_log()
+    del _PLACEMENT_INCOMPLETE[:]
+    if PREVIEW_MODE or not PLACEMENT_LOG_ENABLED:
+        return None
+    _PLACEMENT_LOG = PlacementLog(ritual_name, layout, int(center_x), int(center_y))
+    return _PLACEMENT_LOG
+
+def close_placement_log():
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.close()
+        _PLACEMENT_LOG = None
+
+def finish_placement_log():
+    """Remove the log of a completed ritual , only an interrupted run leaves one to resume from."""
+    global _PLACEMENT_LOG
+    if _PLACEMENT_LOG is not None:
+        _PLACEMENT_LOG.finish()
+        _PLACEMENT_LOG = None
+
+def mark_placement_incomplete(reason):
+    """Note a part of the layout that was not placed , the run then keeps its log to resume from."""
+    if PREVIEW_MODE or reason in _PLACEMENT_INCOMPLETE:
+        return
+    _PLACEMENT_INCOMPLETE.append(reason)
+
+def end_placement_log():
+    """Remove the log only when every point was placed or already logged , otherwise keep it for the next run.
+    Returns True when the ritual is complete."""
+    if _PLACEMENT_INCOMPLETE:
+        shown = ", ".join(_PLACEMENT_INCOMPLETE[:3]) + (" ..." if len(_PLACEMENT_INCOMPLETE) > 3 else "")
+        debug_message(f"Placement incomplete ( {len(_PLACEMENT_INCOMPLETE)} parts missed : {shown} ) , run again here to resume", 33)
+        close_placement_log()
+        return False
+    finish_placement_log()
+    return True
+
+def placements_logged_for(item_id):
+    """Placements of item_id already made by earlier sessions , taken off the backpack requirement on resume."""
+    return _PLACEMENT_LOG.logged_for(item_id) if _PLACEMENT_LOG is not None else 0
+
+def placement_logged(item_id, x, y):
+    """True when this placement was already made by an earlier session , used to skip walking to it."""
+    return _PLACEMENT_LOG is not None and _PLACEMENT_LOG.is_logged(item_id, x, y)
+
+# ===== Backpack inventory model =====
+class BackpackInventory:
+    """Local model of the backpack stacks drops are taken from.
+    Counts are read once , decremented on each verified drop , and re-read from the server only every
+    INVENTORY_RECONCILE_EVERY drops or when a drop does not show up on the ground."""
+
+    def __init__(self):
+        self.counts = {}             # item_id -> backpack count
+        self.stacks = {}             # item_id -> [serial, amount] of the stack drops are taken from
+        self.drops_since_sync = {}   # item_id -> drops credited since the last BackpackCount
+        self.seen_ground = set()     # ground serials already seen , a drop is confirmed by a serial not in here
+
+    def sync(self, item_id):
+        """Re-read the server count and forget the cached stack."""
+        try:
+            count = Items.BackpackCount(item_id, -1)
+        except Exception as e:
+            debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
+            count = 0
+        self.counts[item_id] = count
+        self.drops_since_sync[item_id] = 0
+        self.stacks.pop(item_id, None)
+        # items already lying around must not be mistaken for the next drop
+        self._scan_ground_for(None, None, None)
+        return count
+
+    def count(self, item_id):
+        if item_id not in self.counts or self.drops_since_sync.get(item_id, 0) >= INVENTORY_RECONCILE_EVERY:
+            return self.sync(item_id)
+        return self.counts[item_id]
+
+    def next_stack(self, item_id):
+        """Serial of a backpack stack to drop from , None when the model has none left."""
+        if self.count(item_id) <= 0:
+            return None
+        stack = self.stacks.get(item_id)
+        if stack is None or stack[1] <= 0:
+            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
+            if not item:
+                self.counts[item_id] = 0
+                return None
+            stack = [item.Serial, max(1, int(getattr(item, 'Amount', 1) or 1))]
+            self.stacks[item_id] = stack
+        return stack[0]
+
+    def forget_stack(self, item_id):
+        self.stacks.pop(item_id, None)
+
+    def dropped(self, item_id, amount):
+        self.counts[item_id] = max(0, self.counts.get(item_id, 0) - amount)
+        self.drops_since_sync[item_id] = self.drops_since_sync.get(item_id, 0) + 1
+        stack = self.stacks.get(item_id)
+        if stack is not None:
+            stack[1] -= amount
+
+    def verify_drop(self, item_id, amount, x, y, count_before):
+        """True once a new ground item of item_id shows up at (x, y).
+        If nothing new appears the server count decides , which also resyncs the model."""
+        for _ in range(INVENTORY_GROUND_POLLS):
+            if self._scan_ground_for(item_id, x, y):
+                self.dropped(item_id, amount)
+                return True
+            pause_ms(PAUSE_DURATION)
+        return self.sync(item_id) <= count_before - amount
+
+    def _scan_ground_for(self, item_id, x, y):
+        try:
+            ground_filter = Items.Filter()
+            ground_filter.Enabled = True
+            ground_filter.OnGround = True
+            ground_filter.RangeMin = 0
+            ground_filter.RangeMax = INVENTORY_GROUND_SCAN_RANGE
+            ground_items = Items.ApplyFilter(ground_filter) or []
+        except Exception as e:
+            debug_message(f"Ground scan error: {e}", 33)
+            return False
+        found = False
+        for ground_item in ground_items:
+            serial = int(ground_item.Serial)
+            if serial in self.seen_ground:
+                continue
+            self.seen_ground.add(serial)
+            if ground_item.ItemID == item_id and ground_item.Position.X == x and ground_item.Position.Y == y:
+                found = True
+        return found
+
+_INVENTORY = BackpackInventory()
+
 def place_item_amount(x, y, item_id, amount, z=None, hue=None):
     """Place a specific amount of a stackable item at ground tile (x,y).
     Falls back to available amount if backpack has less than requested.
@@ -750,6 +1046,12 @@ def place_item_amount(x, y, item_id, amount, z=None, hue=None):
             PLACED_TOP_Z[(x, y)] = z_prev
         return True
 
+    if _PLACEMENT_LOG is not None and _PLACEMENT_LOG.consume(item_id, x, y):
+        # keep the stack height the skipped placement would have left
+        if ENABLE_STACK_TRACKING:
+            PLACED_TOP_Z[(x, y)] = compute_target_z(x, y, base_z)
+        return True
+
     offsets = [(0, 0)] if SAFE_MODE else [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
     if z is None:
         z = Player.Position.Z
@@ -764,48 +1066,41 @@ def place_item_amount(x, y, item_id, amount, z=None, hue=None):
             continue
         z_final = compute_target_z(tx, ty, base_z)
         for attempt in range(1, PLACE_MAX_RETRIES + 1):
-            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
-            if not item:
+            item_serial = _INVENTORY.next_stack(item_id)
+            if item_serial is None:
                 debug_message(f"Could not find item 0x{item_id:X}", 33)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
-            try:
-                initial_count = Items.BackpackCount(item_id, -1)
-            except Exception as e:
-                debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
-                return False
-            if initial_count <= 0:
-                return False
+            initial_count = _INVENTORY.count(item_id)
             move_amt = min(amt, initial_count)
             try:
                 if hue is not None:
                     pass
                 # Apply Z override if auto-stacking is enabled
                 actual_z = -1 if USE_AUTO_Z_STACKING else z_final
-                debug_message(f"place_item_amount: MoveOnGround(serial={item.Serial}, amount={move_amt}, x={tx}, y={ty}, z={actual_z}) [calculated_z={z_final}]", 68)
-                Items.MoveOnGround(item.Serial, move_amt, tx, ty, actual_z)
+                debug_message(f"place_item_amount: MoveOnGround(serial={item_serial}, amount={move_amt}, x={tx}, y={ty}, z={actual_z}) [calculated_z={z_final}]", 68)
+                Items.MoveOnGround(item_serial, move_amt, tx, ty, actual_z)
             except Exception as e:
                 debug_message(f"MoveOnGround failed at ({tx},{ty}) for amt {move_amt}: {e}", 33)
+                _INVENTORY.forget_stack(item_id)
                 BAD_COORDS.add((x, y))
                 pause_ms(PAUSE_DURATION + 150)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
             else:
                 throttle()
                 pause_ms(PAUSE_DURATION_PLACE)
 
-            for _ in range(3):
-                try:
-                    new_count = Items.BackpackCount(item_id, -1)
-                except Exception as e:
-                    debug_message(f"BackpackCount verify error: {e}", 33)
-                    break
-                if new_count <= initial_count - move_amt:
-                    if ENABLE_STACK_TRACKING:
-                        PLACED_TOP_Z[(tx, ty)] = z_final
-                    return True
-                pause_ms(PAUSE_DURATION)
+            if _INVENTORY.verify_drop(item_id, move_amt, tx, ty, initial_count):
+                if ENABLE_STACK_TRACKING:
+                    PLACED_TOP_Z[(tx, ty)] = z_final
+                if _PLACEMENT_LOG is not None:
+                    _PLACEMENT_LOG.record(item_id, x, y)
+                return True
 
             pause_ms(PLACE_BACKOFF_BASE * attempt)
 
+    mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
     return False
     try:
         land_id = Statics.GetLandID(x, y, game_map)
@@ -906,6 +1201,7 @@ def build_center_layers(center_x, center_y, center_z):
                 if not PREVIEW_MODE:
                     if not goto_location_with_wiggle(px, py, center=(center_x, center_y)):
                         debug_message(f"Could not reach black pearl crack position ({px}, {py})", 33)
+                        mark_placement_incomplete(f"black pearl crack at ({px},{py})")
                         continue
                 
                 # distance-weighted stacking: more stacks closer to center
@@ -948,7 +1244,7 @@ def is_valid_position(x, y, z=None):
     return (
         Player.Position.X - MAX_DISTANCE <= x <= Player.Position.X + MAX_DISTANCE
         and Player.Position.Y - MAX_DISTANCE <= y <= Player.Position.Y + MAX_DISTANCE
-        and Statics.GetLandID(x, y, Player.Map) not in [0x0001]
+        and get_land_id(x, y) not in (None, 0x0001)
     )
 
 def place_item(x, y, item_id, z=None, hue=None):
@@ -964,6 +1260,12 @@ def place_item(x, y, item_id, z=None, hue=None):
             PLACED_TOP_Z[(x, y)] = z_prev
         return True
 
+    if _PLACEMENT_LOG is not None and _PLACEMENT_LOG.consume(item_id, x, y):
+        # keep the stack height the skipped placement would have left
+        if ENABLE_STACK_TRACKING:
+            PLACED_TOP_Z[(x, y)] = compute_target_z(x, y, base_z)
+        return True
+
     offsets = [(0, 0)] if SAFE_MODE else [(0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)]
     if z is None:
         z = Player.Position.Z
@@ -981,18 +1283,12 @@ def place_item(x, y, item_id, z=None, hue=None):
             continue
         z_final = compute_target_z(tx, ty, base_z)
         for attempt in range(1, PLACE_MAX_RETRIES + 1):
-            item = Items.FindByID(item_id, -1, Player.Backpack.Serial)
-            if not item:
+            item_serial = _INVENTORY.next_stack(item_id)
+            if item_serial is None:
                 debug_message(f"Could not find item 0x{item_id:X}", 33)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
-
-            try:
-                initial_count = Items.BackpackCount(item_id, -1)
-            except Exception as e:
-                debug_message(f"BackpackCount error for 0x{item_id:X}: {e}", 33)
-                return False
-            if initial_count <= 0:
-                return False
+            initial_count = _INVENTORY.count(item_id)
 
             try:
                 if hue is not None:
@@ -1001,52 +1297,51 @@ def place_item(x, y, item_id, z=None, hue=None):
                     pass
                 # Apply Z override if auto-stacking is enabled
                 actual_z = -1 if USE_AUTO_Z_STACKING else z_final
-                debug_message(f"place_item: MoveOnGround(serial={item.Serial}, amount=1, x={tx}, y={ty}, z={actual_z}) [calculated_z={z_final}]", 68)
-                Items.MoveOnGround(item.Serial, 1, tx, ty, actual_z)
+                debug_message(f"place_item: MoveOnGround(serial={item_serial}, amount=1, x={tx}, y={ty}, z={actual_z}) [calculated_z={z_final}]", 68)
+                Items.MoveOnGround(item_serial, 1, tx, ty, actual_z)
             except Exception as e:
                 debug_message(f"MoveOnGround failed at ({tx},{ty}): {e}", 33)
+                _INVENTORY.forget_stack(item_id)
                 BAD_COORDS.add((x, y))
                 pause_ms(PAUSE_DURATION + 150)
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 return False
             else:
                 throttle()
                 pause_ms(PAUSE_DURATION_PLACE)
 
-            verified = False
-            for _ in range(2):
-                try:
-                    new_count = Items.BackpackCount(item_id, -1)
-                except Exception as e:
-                    debug_message(f"BackpackCount verify error: {e}", 33)
-                    break
-                if new_count < initial_count:
-                    verified = True
-                    break
-                pause_ms(PAUSE_DURATION)
-
-            if verified:
+            if _INVENTORY.verify_drop(item_id, 1, tx, ty, initial_count):
                 if ENABLE_STACK_TRACKING:
                     PLACED_TOP_Z[(tx, ty)] = z_final
+                if _PLACEMENT_LOG is not None:
+                    _PLACEMENT_LOG.record(item_id, x, y)
                 return True
             else:
-                debug_message(f"place_item: verification failed (count {initial_count} -> {new_count}) on attempt {attempt} at ({tx},{ty},{z_final})", 68)
+                debug_message(f"place_item: verification failed (count {initial_count} -> {_INVENTORY.count(item_id)}) on attempt {attempt} at ({tx},{ty},{z_final})", 68)
                 pause_ms(PLACE_BACKOFF_BASE * attempt)
 
     debug_message(f"place_item: exhausted offsets for id=0x{item_id:X} at ({x},{y},{base_z}); giving up", 33)
+    mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
     return False
 
 def place_items_at_points(points, item_id, z=None, progress_msg="Placing items", center=None, hue=None):
     if not points or item_id is None:
         return set()
 
+    stand_by_position = {}
+    if PLAN_TRAVEL_ROUTE and not PREVIEW_MODE:
+        points, stand_by_position = plan_placement_route(points)
     total = len(points)
     placed = set()
     failures = 0
+    pending_stand = None
     if item_id not in PLACED_COORDS_BY_ITEM:
         PLACED_COORDS_BY_ITEM[item_id] = set()
 
     for i, (x, y) in enumerate(points, 1):
         debug_message(f"{progress_msg}: {i} out of {total}", 67)
+        if i - 1 in stand_by_position:
+            pending_stand = stand_by_position[i - 1]
 
         start_ms = int(time.time() * 1000)
 
@@ -1062,12 +1357,18 @@ def place_items_at_points(points, item_id, z=None, progress_msg="Placing items",
             debug_message(f"Duplicate coords for 0x{item_id:X} at ({x},{y}), skipping.", 68)
             continue
 
-        if not PREVIEW_MODE:
+        if not PREVIEW_MODE and not placement_logged(item_id, x, y):
+            # Walk to the cluster's stand tile once , at its first point that is actually placed
+            if pending_stand is not None:
+                walk_to_stand_tile(pending_stand[0], pending_stand[1])
+                pending_stand = None
             if not goto_location_with_wiggle(x, y, center=center):
                 debug_message(f"Could not reach position ({x}, {y})", 33)
                 failures += 1
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 if failures >= MAX_PHASE_FAILURES:
                     debug_message("Too many failures in this phase; aborting phase early.", 33)
+                    mark_placement_incomplete(progress_msg)
                     break
                 continue
 
@@ -1151,11 +1452,13 @@ def place_gold_choice_stacks(points, choices, z=None, progress_msg="Placing gold
         # If already placed gold at this coord, skip to avoid double stacking across phases
         if (x, y) in PLACED_COORDS_BY_ITEM[item_id]:
             continue
-        if not PREVIEW_MODE:
+        if not PREVIEW_MODE and not placement_logged(item_id, x, y):
             if not goto_location_with_wiggle(x, y, center=center):
                 failures += 1
+                mark_placement_incomplete(f"0x{item_id:X} at ({x},{y})")
                 if failures >= MAX_PHASE_FAILURES:
                     debug_message("Too many failures in gold placement; aborting phase early.", 33)
+                    mark_placement_incomplete(progress_msg)
                     break
                 continue
         amt = random.choice(opts)
@@ -1169,6 +1472,7 @@ def place_gold_choice_stacks(points, choices, z=None, progress_msg="Placing gold
             failures += 1
             if failures >= MAX_PHASE_FAILURES:
                 debug_message("Too many failures in gold placement; aborting phase early.", 33)
+                mark_placement_incomplete(progress_msg)
                 break
         pause_ms(POINT_BREATHER_MS)
     return placed
@@ -1219,8 +1523,10 @@ def place_random_items_at_points(points, item_ids, z=None, progress_msg="Placing
         if not PREVIEW_MODE:
             if not goto_location_with_wiggle(x, y, center=center):
                 failures += 1
+                mark_placement_incomplete(f"{progress_msg} at ({x},{y})")
                 if failures >= MAX_PHASE_FAILURES:
                     debug_message("Too many failures in random placement; aborting phase early.", 33)
+                    mark_placement_incomplete(progress_msg)
                     break
                 continue
 
@@ -1234,7 +1540,7 @@ def place_random_items_at_points(points, item_ids, z=None, progress_msg="Placing
         else:
             for iid in try_order:
                 try:
-                    if Items.BackpackCount(iid, -1) > 0:
+                    if _INVENTORY.count(iid) > 0:
                         choice = iid
                         break
                 except Exception:
@@ -1259,25 +1565,35 @@ def place_random_items_at_points(points, item_ids, z=None, progress_msg="Placing
                 pause_ms(PAUSE_DURATION)
     return placed
 
-def generate_circle_points(center_x, center_y, radius, points, rotation=0):
-    result = []
-    for i in range(points):
-        angle = math.radians(rotation + (360.0 * i / max(1, points)))
-        x = center_x + int(radius * math.cos(angle))
-        y = center_y + int(radius * math.sin(angle))
-        result.append((x, y))
-    return result
+def cached_shape(key, build):
+    """Offsets around the origin for one generator parameter set , built once per session.
+    Every orb , decoration and crack reuses the shape at its own center."""
+    shape = SHAPE_CACHE.get(key)
+    if shape is None:
+        shape = tuple(build())
+        SHAPE_CACHE[key] = shape
+    return shape
 
-def generate_line_points(origin_x, origin_y, angle_deg, length, spacing=1):
-    pts = []
+def translate_points(offsets, center_x, center_y):
+    return [(center_x + dx, center_y + dy) for dx, dy in offsets]
+
+def _circle_offsets(radius, points, rotation):
+    angles = [math.radians(rotation + (360.0 * i / max(1, points))) for i in range(points)]
+    return [(int(radius * math.cos(angle)), int(radius * math.sin(angle))) for angle in angles]
+
+def _line_offsets(angle_deg, length, spacing):
     angle = math.radians(angle_deg)
     vx = math.cos(angle)
     vy = math.sin(angle)
-    for i in range(1, length + 1):
-        x = origin_x + int(round(vx * i * spacing))
-        y = origin_y + int(round(vy * i * spacing))
-        pts.append((x, y))
-    return pts
+    return [(int(round(vx * i * spacing)), int(round(vy * i * spacing))) for i in range(1, length + 1)]
+
+def generate_circle_points(center_x, center_y, radius, points, rotation=0):
+    offsets = cached_shape(("circle", radius, points, rotation), lambda: _circle_offsets(radius, points, rotation))
+    return translate_points(offsets, center_x, center_y)
+
+def generate_line_points(origin_x, origin_y, angle_deg, length, spacing=1):
+    offsets = cached_shape(("line", angle_deg, length, spacing), lambda: _line_offsets(angle_deg, length, spacing))
+    return translate_points(offsets, origin_x, origin_y)
 
 def filter_points_outside_radius(points, center_xy, min_radius, forbidden=None):
     """Filter out points that lie within min_radius of center_xy or in forbidden set."""
@@ -1285,14 +1601,9 @@ def filter_points_outside_radius(points, center_xy, min_radius, forbidden=None):
         return []
     cx, cy = center_xy
     fset = set(forbidden) if forbidden else set()
-    result = []
-    for (x, y) in points:
-        if (x, y) in fset:
-            continue
-        if math.hypot(x - cx, y - cy) < float(min_radius):
-            continue
-        result.append((x, y))
-    return result
+    min_radius_sq = float(min_radius) * float(min_radius)
+    return [(x, y) for (x, y) in points
+            if (x, y) not in fset and (x - cx) * (x - cx) + (y - cy) * (y - cy) >= min_radius_sq]
 
 def remove_axis_aligned_points(points, center_xy):
     """Remove points that align exactly on the X or Y axis relative to center_xy.
@@ -1308,12 +1619,12 @@ def remove_axis_aligned_points(points, center_xy):
         result.append((x, y))
     return result
 
-def attempt_walk_toward(tx, ty, max_steps=6):
+def attempt_walk_toward(tx, ty, max_steps=6, reach=MAX_DISTANCE):
     last_pos = (Player.Position.X, Player.Position.Y)
     step_delay = GOTO_BASE_DELAY
     for step in range(max_steps):
-        if (abs(Player.Position.X - tx) <= MAX_DISTANCE and
-            abs(Player.Position.Y - ty) <= MAX_DISTANCE):
+        if (abs(Player.Position.X - tx) <= reach and
+            abs(Player.Position.Y - ty) <= reach):
             return True
         try:
             base_dir = get_direction(Player.Position.X, Player.Position.Y, tx, ty)
@@ -1341,8 +1652,8 @@ def attempt_walk_toward(tx, ty, max_steps=6):
         if not moved:
             step_delay = int(step_delay * 1.3) + 50
             pause_ms(step_delay)
-    return (abs(Player.Position.X - tx) <= MAX_DISTANCE and
-            abs(Player.Position.Y - ty) <= MAX_DISTANCE)
+    return (abs(Player.Position.X - tx) <= reach and
+            abs(Player.Position.Y - ty) <= reach)
 
 def goto_location_with_wiggle(x, y, max_retries=GOTO_MAX_RETRIES, center=None):
     target_x = int(float(x))
@@ -1366,6 +1677,107 @@ def goto_location_with_wiggle(x, y, max_retries=GOTO_MAX_RETRIES, center=None):
     return (abs(Player.Position.X - target_x) <= MAX_DISTANCE and
             abs(Player.Position.Y - target_y) <= MAX_DISTANCE)
 
+# ===== Placement route planner =====
+def walk_to_stand_tile(stand_x, stand_y):
+    """Walk onto a planned standing tile , every point of its cluster is then within reach."""
+    steps = max(abs(Player.Position.X - stand_x), abs(Player.Position.Y - stand_y)) + 2
+    return attempt_walk_toward(stand_x, stand_y, max_steps=steps, reach=0)
+
+def _tile_distance(a, b):
+    # diagonal steps cost the same as straight ones
+    return max(abs(a[0] - b[0]), abs(a[1] - b[1]))
+
+def cluster_points_by_reach(points, reach=MAX_DISTANCE):
+    """Group points into clusters that can all be placed from one standing tile.
+    Returns [((stand_x, stand_y), [index, ...]), ...] , indexes keep generation order inside a cluster
+    so stacks on the same tile stay in their original layer order."""
+    cell_size = 2 * reach + 1
+    buckets = {}
+    for index, point in enumerate(points):
+        buckets.setdefault((point[0] // cell_size, point[1] // cell_size), []).append(index)
+
+    unassigned = set(range(len(points)))
+    clusters = []
+    for index in range(len(points)):
+        if index not in unassigned:
+            continue
+        seed = points[index]
+        cell_x, cell_y = seed[0] // cell_size, seed[1] // cell_size
+        # points within twice the reach can share a standing tile with the seed
+        nearby = [
+            j
+            for gx in (cell_x - 1, cell_x, cell_x + 1)
+            for gy in (cell_y - 1, cell_y, cell_y + 1)
+            for j in buckets.get((gx, gy), ())
+            if j in unassigned and _tile_distance(points[j], seed) <= 2 * reach
+        ]
+        xs = sorted(points[j][0] for j in nearby)
+        ys = sorted(points[j][1] for j in nearby)
+        # stand at the median of the neighbourhood , clamped so the seed itself stays in reach
+        stand = (
+            min(max(xs[len(xs) // 2], seed[0] - reach), seed[0] + reach),
+            min(max(ys[len(ys) // 2], seed[1] - reach), seed[1] + reach),
+        )
+        if stand != (seed[0], seed[1]) and not is_safe_ground(stand[0], stand[1]):
+            stand = (seed[0], seed[1])
+        members = sorted(j for j in nearby if _tile_distance(points[j], stand) <= reach)
+        unassigned.difference_update(members)
+        clusters.append((stand, members))
+    return clusters
+
+def order_clusters_by_route(clusters, start_xy):
+    """Order clusters as an open walking tour from start_xy , nearest neighbour then 2-opt."""
+    remaining = list(range(len(clusters)))
+    order = []
+    current = start_xy
+    while remaining:
+        nearest = min(remaining, key=lambda c: _tile_distance(current, clusters[c][0]))
+        remaining.remove(nearest)
+        order.append(nearest)
+        current = clusters[nearest][0]
+
+    # 2-opt , reverse any stretch of the tour that shortens the walk , the start tile stays fixed
+    stops = [start_xy] + [clusters[c][0] for c in order]
+    for _ in range(PLAN_TWO_OPT_MAX_PASSES):
+        improved = False
+        for i in range(1, len(stops) - 1):
+            for j in range(i + 1, len(stops)):
+                before = _tile_distance(stops[i - 1], stops[i])
+                after = _tile_distance(stops[i - 1], stops[j])
+                if j + 1 < len(stops):
+                    before += _tile_distance(stops[j], stops[j + 1])
+                    after += _tile_distance(stops[i], stops[j + 1])
+                if after < before:
+                    stops[i:j + 1] = stops[i:j + 1][::-1]
+                    order[i - 1:j] = order[i - 1:j][::-1]
+                    improved = True
+        if not improved:
+            break
+    return [clusters[c] for c in order]
+
+def plan_placement_route(points, start_xy=None, reach=MAX_DISTANCE):
+    """Reorder points into a walking route of reach-sized clusters.
+    Returns (ordered_points, stand_by_position) , stand_by_position maps the position of each cluster's
+    first point in ordered_points to the tile to stand on. Points in BAD_COORDS are left out of the route."""
+    routable = [p for p in points if (p[0], p[1]) not in BAD_COORDS]
+    if len(routable) < len(points):
+        debug_message(f"Route skips {len(points) - len(routable)} known-bad coords", 33)
+    if start_xy is None:
+        start_xy = (Player.Position.X, Player.Position.Y)
+
+    clusters = order_clusters_by_route(cluster_points_by_reach(routable, reach), start_xy)
+    ordered_points = []
+    stand_by_position = {}
+    walk_steps = 0
+    current = start_xy
+    for stand, members in clusters:
+        stand_by_position[len(ordered_points)] = stand
+        ordered_points.extend(routable[j] for j in members)
+        walk_steps += _tile_distance(current, stand)
+        current = stand
+    debug_message(f"Route: {len(ordered_points)} points in {len(clusters)} stops , about {walk_steps} steps", 67)
+    return ordered_points, stand_by_position
+
 # ===== Direction helpers =====
 def get_direction(from_x, from_y, to_x, to_y):
     dx = to_x - from_x
@@ -1653,6 +2065,7 @@ def place_decorations_for_orb(orb_idx, orb_pos, center, definition, center_z):
         item_id = get_first_available_item_id(candidates, 1)
         if item_id is None and not deco.get("randomize", False):
             debug_message(f"Orb {definition.get('key')}: decoration '{typ}' skipped (no available items).", 33)
+            mark_placement_incomplete(f"{definition.get('key')} {typ}")
             continue
         if typ == "ring":
             points = generate_circle_points(ox, oy, deco.get("radius", 2), deco.get("points", 6), deco.get("rotation", 0))
@@ -1921,11 +2334,33 @@ def calculate_ritual_requirements():
         debug_message(f"Error saving requirements: {str(e)}", 33)
         return None
 
+def layout_footprint_radius():
+    """Farthest tile from the ritual center that an orb , decoration or center layer can reach."""
+    decoration_reach = 0
+    for definition in ORB_DEFINITIONS:
+        for deco in definition.get("decorations", []):
+            typ = deco.get("type")
+            if typ == "ring":
+                reach = int(deco.get("radius", 2))
+            elif typ in ("line", "arrow"):
+                reach = int(deco.get("start_offset", 0)) + int(deco.get("length", 3)) * int(deco.get("spacing", 1))
+            elif typ == "symbol":
+                reach = int(deco.get("scale", 2)) + 1
+            else:
+                reach = 0
+            decoration_reach = max(decoration_reach, reach)
+    center_reach = max(list(CENTER_PEARL_RING_RADII) + [CENTER_BOWL_RING_RADIUS, CENTER_CRACK_MAX_LEN + CENTER_CRACK_BRANCH_MAX_LEN])
+    return max(int(ORB_CIRCLE["radius"]) + decoration_reach, center_reach) + 1
+
 def create_arrangement(center_x, center_y):
     debug_message("Beginning orb ritual arrangement...", 67)
 
     center_z = Player.Position.Z
 
+    # decorations and cracks are only known while placing , so the whole disk they can reach is checked
+    if FOOTPRINT_PREPASS:
+        classify_footprint(footprint_disk(center_x, center_y, layout_footprint_radius()), "Orb ritual footprint")
+
     if not PREVIEW_MODE:
         if not goto_location_with_wiggle(center_x, center_y, center=(center_x, center_y)):
             debug_message("Could not reach center position!", 33)
@@ -1958,6 +2393,7 @@ def create_arrangement(center_x, center_y):
             top_z = build_pillar_at(ox, oy, definition.get("base", {}), center_z)
             if top_z is None:
                 debug_message(f"Skipping orb at ({ox},{oy}) due to pillar failure", 33)
+                mark_placement_incomplete(f"pillar at ({ox},{oy})")
                 # Even if pillar failed, we may still place decorations if enabled
                 if ENABLE_ORB_DECORATIONS:
                     place_decorations_for_orb(idx, (ox, oy), (center_x, center_y), definition, center_z)
@@ -1973,7 +2409,8 @@ def create_arrangement(center_x, center_y):
         if ENABLE_ORB_DECORATIONS:
             place_decorations_for_orb(idx, (ox, oy), (center_x, center_y), definition, center_z)
 
-    debug_message("Orb ritual arrangement complete!", 67)
+    if end_placement_log():
+        debug_message("Orb ritual arrangement complete!", 67)
 
 def generate_requirements():
     """Standalone function to generate ritual requirements"""
@@ -1994,7 +2431,12 @@ def main():
     
     # Initialize exclusion zone around center
     initialize_exclusion_zone(center_x, center_y)
-    create_arrangement(center_x, center_y)
+    layout = {"circle": ORB_CIRCLE, "orbs": ORB_DEFINITIONS, "order": ORB_ORDER, "allowed": ORB_KEYS_ALLOWED}
+    open_placement_log("orbs", layout, center_x, center_y)
+    try:
+        create_arrangement(center_x, center_y)
+    finally:
+        close_placement_log()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
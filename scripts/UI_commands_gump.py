@@ -5,7 +5,7 @@ Build a clickable gump from the shard's say commands , somtimes viewbable by "[h
 Each button sends a chat-say with a leading '[' to trigger the  command.
 
 HOTKEY:: AutoStart on Login
-VERSION::20251012
+VERSION::20261019
 """
 
 import time
@@ -82,13 +82,31 @@ SLIVER_OVERLAY_TILE_ART_ID = 2624
 SLIVER_OVERLAY_MODE = "full"  # or "stripes"
 SLIVER_STRIPE_HEIGHT = 6
 
+# Text command pacing , one token bucket in Misc shared values paces "[" commands from every running script
+TEXT_COMMAND_INTERVAL_MS = 800  # starting spacing between text commands across all scripts
+TEXT_COMMAND_INTERVAL_MIN_MS = 250  # learned spacing never drops below this
+TEXT_COMMAND_INTERVAL_MAX_MS = 4000  # learned spacing never rises above this
+TEXT_COMMAND_BURST = 2  # commands allowed back to back before the spacing applies
+TEXT_COMMAND_BACKOFF = 1.5  # spacing multiplier after a throttle warning in the journal
+TEXT_COMMAND_RECOVERY_MS = 20  # spacing reduction after each command without a warning
+TEXT_COMMAND_WARNING_WINDOW_MS = 600  # how long after a command its throttle warning can still arrive
+TEXT_COMMAND_GUMP_CONFLICT_MS = 1500  # longest wait for an earlier command's same response gump before sending
+TEXT_COMMAND_POLL_MS = 50
+TEXT_COMMAND_WARNING_PATTERNS = [
+    'too many',
+    'too quickly',
+    'too fast',
+    'must wait',
+    'you have to wait',
+]
+
 # Debounce
 _LAST_CLICK_BID = -1
 _LAST_CLICK_TS = 0.0
 
 # ===================================================================================
 # Commands configuration (structured like ACTIONS in UI_action_buttons.py)
-# Each non-header entry will be invoked as Player.ChatSay(f"[{input}")
+# Each non-header entry is sent as "[{input}" through the shared text command queue
 # type: "header" | "command"
 # fields for command: input, label, color
 # ===================================================================================
@@ -212,6 +230,156 @@ def debug_message(msg, color=67):
         except Exception:
             pass
 
+# shared value keys , identical in every script using TextCommandQueue
+TEXT_COMMAND_SHARED_NEXT = "text_command_next_ms"  # token bucket theoretical send time
+TEXT_COMMAND_SHARED_INTERVAL = "text_command_interval_ms"  # learned spacing
+TEXT_COMMAND_SHARED_FLOOR = "text_command_floor_ms"  # spacing that once drew a warning , plus a margin
+TEXT_COMMAND_SHARED_BURST = "text_command_burst"  # learned burst , drops to 1 when a burst draws a warning
+TEXT_COMMAND_SHARED_HANDLED = "text_command_handled"  # journal time up to which warnings were already acted on
+TEXT_COMMAND_SHARED_GUMP = "text_command_gump"  # "gump_id|deadline_ms" of the last command awaiting a gump
+
+class TextCommandQueue:
+    """Paces "[" text commands across every running script instead of fixed per-script delays.
+    The token bucket ( next send time plus learned spacing ) lives in Misc shared values , so quest and
+    UI scripts running together queue behind each other. A throttle warning in the journal first drops the burst
+    to single commands , later warnings widen the spacing and set a floor it never narrows below again ,
+    clean commands narrow it slowly.
+    Sending does not wait on the journal , a command's warning check runs when the next one is queued.
+    The last command of a batch has no next one , flush() waits out its warning window and checks it.
+    A command answering with a gump waits while an earlier command's same gump is still pending ,
+    commands with distinct response gumps or none pipeline."""
+
+    def __init__(self, source):
+        self.source = source  # message prefix
+        self.pending_since = None  # journal time of the oldest command not yet checked for warnings
+        self.last_sent_at = 0.0  # time the newest command was said
+
+    def _read(self, key, default):
+        try:
+            if Misc.CheckSharedValue(key):
+                return Misc.ReadSharedValue(key)
+        except Exception:
+            pass
+        return default
+
+    def _write(self, key, value):
+        try:
+            Misc.SetSharedValue(key, value)
+        except Exception:
+            pass
+
+    def interval_ms(self):
+        interval = float(self._read(TEXT_COMMAND_SHARED_INTERVAL, TEXT_COMMAND_INTERVAL_MS))
+        floor = float(self._read(TEXT_COMMAND_SHARED_FLOOR, TEXT_COMMAND_INTERVAL_MIN_MS))
+        return min(TEXT_COMMAND_INTERVAL_MAX_MS, max(TEXT_COMMAND_INTERVAL_MIN_MS, floor, interval))
+
+    def burst(self):
+        return max(1, int(self._read(TEXT_COMMAND_SHARED_BURST, TEXT_COMMAND_BURST)))
+
+    def check_warnings(self):
+        """Scan the journal since the oldest unchecked command and tune the shared spacing. Returns the warning line or None."""
+        if self.pending_since is None:
+            return None
+        # the journal is shared , skip warnings another script already acted on
+        since = max(self.pending_since, float(self._read(TEXT_COMMAND_SHARED_HANDLED, 0)))
+        warning_line = None
+        try:
+            for entry in Journal.GetJournalEntry(since) or []:
+                text = str(getattr(entry, 'Text', entry))
+                low = text.lower()
+                if any(pattern in low for pattern in TEXT_COMMAND_WARNING_PATTERNS):
+                    warning_line = text
+                    break
+        except Exception:
+            pass
+        interval = self.interval_ms()
+        if warning_line:
+            self.pending_since = None
+            now = int(time.time() * 1000)
+            self._write(TEXT_COMMAND_SHARED_HANDLED, time.time())
+            if self.burst() > 1:
+                # the server counts bursts , keep the spacing and send one at a time
+                self._write(TEXT_COMMAND_SHARED_BURST, 1)
+            else:
+                # the server limit sits above the current spacing , never probe below it again
+                self._write(TEXT_COMMAND_SHARED_FLOOR, min(TEXT_COMMAND_INTERVAL_MAX_MS, interval + TEXT_COMMAND_RECOVERY_MS * 5))
+                interval = min(TEXT_COMMAND_INTERVAL_MAX_MS, interval * TEXT_COMMAND_BACKOFF)
+                self._write(TEXT_COMMAND_SHARED_INTERVAL, interval)
+            self._write(TEXT_COMMAND_SHARED_NEXT, now + int(interval))
+            try:
+                Misc.SendMessage(f"[{self.source}] Command throttled , spacing now {int(interval)}ms: {warning_line}", 53)
+            except Exception:
+                print(f"[{self.source}] Command throttled , spacing now {int(interval)}ms: {warning_line}")
+        elif (time.time() - self.pending_since) * 1000 >= TEXT_COMMAND_WARNING_WINDOW_MS:
+            # a late warning can no longer arrive , count it clean
+            self.pending_since = None
+            self._write(TEXT_COMMAND_SHARED_INTERVAL, max(TEXT_COMMAND_INTERVAL_MIN_MS, interval - TEXT_COMMAND_RECOVERY_MS))
+        return warning_line
+
+    def _wait_for_pending_gump(self, response_gump_id):
+        """Wait while an earlier command answered by the same gump has not opened it yet , bounded by its deadline."""
+        pending = str(self._read(TEXT_COMMAND_SHARED_GUMP, "") or "")
+        if "|" not in pending:
+            return
+        try:
+            gump_id, deadline = [int(part) for part in pending.split("|", 1)]
+        except ValueError:
+            return
+        if gump_id != int(response_gump_id):
+            return
+        while int(time.time() * 1000) < deadline:
+            try:
+                if Gumps.HasGump(gump_id):
+                    return
+            except Exception:
+                return
+            Misc.Pause(TEXT_COMMAND_POLL_MS)
+
+    def send(self, command_text, response_gump_id=None):
+        """Queue command_text behind earlier commands from any script , then send it.
+        response_gump_id marks a command answered by that gump , a later command for the same gump waits for it to open.
+        Returns False when the command could not be said."""
+        if response_gump_id:
+            self._wait_for_pending_gump(response_gump_id)
+        while True:
+            self.check_warnings()
+            handled = self._read(TEXT_COMMAND_SHARED_HANDLED, 0)
+            # token bucket as a theoretical send time , reserve the slot before sleeping so other scripts queue behind it
+            now = int(time.time() * 1000)
+            interval = self.interval_ms()
+            next_ms = int(self._read(TEXT_COMMAND_SHARED_NEXT, 0))
+            slot = max(now, next_ms - int(interval * (self.burst() - 1)))
+            self._write(TEXT_COMMAND_SHARED_NEXT, int(max(next_ms, slot) + interval))
+            if slot <= now:
+                break
+            Misc.Pause(int(slot - now))
+            # a warning handled while waiting moved the bucket , queue again behind it
+            self.check_warnings()
+            if self._read(TEXT_COMMAND_SHARED_HANDLED, 0) == handled:
+                break
+        if response_gump_id:
+            self._write(TEXT_COMMAND_SHARED_GUMP, f"{int(response_gump_id)}|{int(time.time() * 1000) + TEXT_COMMAND_GUMP_CONFLICT_MS}")
+        if self.pending_since is None:
+            self.pending_since = time.time()
+        try:
+            Player.ChatSay(0, command_text)
+        except Exception:
+            return False
+        self.last_sent_at = time.time()
+        return True
+
+    def flush(self):
+        """Wait until the newest command's warning can no longer arrive , then check the journal once more.
+        Call it after the last command of a batch. Returns the warning line or None."""
+        if self.pending_since is None:
+            return None
+        remaining_ms = TEXT_COMMAND_WARNING_WINDOW_MS - (time.time() - self.last_sent_at) * 1000
+        if remaining_ms > 0:
+            Misc.Pause(int(remaining_ms))
+        return self.check_warnings()
+
+_TEXT_COMMANDS = TextCommandQueue("CMD_UI")
+
 def add_centered_label_with_outline(gd, x, y, w, h, text, hue):
     try:
         approx_char_px = 6
@@ -427,9 +595,13 @@ def processCommandInput():
         try:
             _LAST_CLICK_BID = bid
             _LAST_CLICK_TS = now
+            sent = False
             if cmd_input:
-                Player.ChatSay(f"[{cmd_input}")
-                debug_message(f"Command: {cmd_input}")
+                sent = _TEXT_COMMANDS.send(f"[{cmd_input}")
+                if sent:
+                    debug_message(f"Command: {cmd_input}")
+                else:
+                    debug_message(f"Command not sent: {cmd_input}", 33)
         except Exception as e:
             debug_message(f"Command error: {e}", 33)
         try:
@@ -437,6 +609,11 @@ def processCommandInput():
         except Exception:
             pass
         sendCommandsGump()
+        # each click is a batch of one , check it once the gump is back up
+        if sent:
+            warning_line = _TEXT_COMMANDS.flush()
+            if warning_line:
+                debug_message(f"Command throttled , click again: {cmd_input}", 33)
     return False
 
 
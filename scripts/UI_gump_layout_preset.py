@@ -8,26 +8,39 @@ Gameplay Window Size = 1509 x 758
 spell icons , counters , and character status info under the gameplay 
 right side is map , character , and skills , with backpack just to the left of skills at the bot
 
+LAYOUT PROFILES = named layouts in profiles/<LAYOUT_PROFILE>/gump_layouts.json ( next to the ClassicUO gumps.xml )
+switching layouts only moves the open gumps whose position differs from the last applied layout ,
+all moves are sent in one batch followed by a single verification pass .
+applying the same layout again moves every gump , in case the client or a script reset one .
+GUMP_LAYOUT below is the fallback when the profile file is missing
+
 Notes : Razor Enhanced API of ClassicUO MoveGump = CUO.MoveGump(serial,x,y)
+the client does not report gump positions back , the engine remembers what it applied in a Misc shared value
 # 0xFFFFFFF = 4294967295 # max int , make sure gump ids are under this
 # in razor enhanced we can use Inspect Gump then close or open the gump in game to get the gump id serial
 
 TODO: 
 - core game gumps were not detected , maybe through the gumps.xml we can reference them
 - restore closed gumps , the buff icon gump was not detected , an in game macro ToggleBuffIconGump can open it maybe we can send that macro , but its a toggle and we cant detect it
-- use check gump open so that we dont need to delay between gump moves if the gump is not open
-Check Gump Open = Syntax	Gumps.HasGump( )
 - converter function for the hexidecimal , we want to make sure not overlapping existing ids , inspected gumps are hexidecimal 
-- use serversync getlabelbackpack technique instead of delay 
 
 STATUS::working
 HOTKEY:: P
-VERSION:: 20251206
+VERSION:: 20261019
 """
 
+import os
+import json
+
 DEBUG_MODE = False
 MOVE_GUMPS = True
 
+LAYOUT_PROFILE = "MageSummoner"  # profiles/<LAYOUT_PROFILE>/gump_layouts.json
+LAYOUT_NAME = "combat"  # layout this script applies , copy the script with another name for a second hotkey
+CYCLE_LAYOUTS = False  # each run applies the next layout in the profile instead of LAYOUT_NAME
+MOVE_UNDETECTED_GUMPS = True  # script gumps are not always reported open , send their moves anyway
+VERIFY_DELAY_MS = 150  # wait after the batch before the verification pass
+
 GUMP_LAYOUT = {
     # Custom Shard Gumps (Unchained)
     0xafb24ef0: {"name": "Unchained Toolbar", "x": 400, "y": 825},
@@ -56,7 +69,73 @@ GUMP_LAYOUT = {
 }
 
 RESTORE_CLOSED_GUMPS = False # not working currently
-DELAY_MS = 100
+
+LAYOUT_PROFILE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "profiles", LAYOUT_PROFILE, "gump_layouts.json")
+LAYOUT_PROFILE_FORMAT_VERSION = 1
+FALLBACK_LAYOUT_NAME = "default"  # name of GUMP_LAYOUT when no profile file is found
+LAYOUT_SHARED_INDEX = "gump_layout_index"  # parsed profile , rebuilt only when the file changes
+LAYOUT_SHARED_APPLIED = "gump_layout_applied"  # { layout , positions } last applied by this script
+# =============================================================================
+
+def read_shared(key, default):
+    try:
+        if Misc.CheckSharedValue(key):
+            return Misc.ReadSharedValue(key)
+    except Exception:
+        pass
+    return default
+
+def write_shared(key, value):
+    try:
+        Misc.SetSharedValue(key, value)
+    except Exception:
+        pass
+
+def build_layout_index(layouts):
+    """Index of named layouts : name -> { gump_id : (x, y, name) } , order keeps the profile order for cycling."""
+    index = {'order': [], 'layouts': {}}
+    for layout_name, layout in layouts.items():
+        positions = {}
+        for gump_key, preset in layout.items():
+            gump_id = int(gump_key, 0) if isinstance(gump_key, str) else int(gump_key)
+            positions[gump_id] = (int(preset["x"]), int(preset["y"]), preset.get("name", hex(gump_id)))
+        index['order'].append(layout_name)
+        index['layouts'][layout_name] = positions
+    return index
+
+def load_layout_index():
+    """Layout index for the client session , the profile file is parsed again only when it changes."""
+    try:
+        file_mtime = os.path.getmtime(LAYOUT_PROFILE_FILE)
+    except OSError:
+        file_mtime = None
+    index = read_shared(LAYOUT_SHARED_INDEX, None)
+    if isinstance(index, dict) and index.get('source') == (LAYOUT_PROFILE_FILE, file_mtime):
+        return index
+    layouts = None
+    if file_mtime is not None:
+        try:
+            with open(LAYOUT_PROFILE_FILE, 'r', encoding='utf-8') as f:
+                profile = json.load(f)
+            if profile.get('format_version') == LAYOUT_PROFILE_FORMAT_VERSION:
+                layouts = {name: layout.get('gumps', {}) for name, layout in profile.get('layouts', {}).items()}
+        except Exception as e:
+            Misc.SendMessage(f"[Gump Layout] Could not read {LAYOUT_PROFILE_FILE}: {e}", 0x25)
+    if not layouts:
+        layouts = {FALLBACK_LAYOUT_NAME: GUMP_LAYOUT}
+    index = build_layout_index(layouts)
+    index['source'] = (LAYOUT_PROFILE_FILE, file_mtime)
+    write_shared(LAYOUT_SHARED_INDEX, index)
+    return index
+
+def read_open_gumps(gump_ids):
+    """Configured gumps the client reports open , read once per pass."""
+    try:
+        open_ids = set(Gumps.AllGumpIDs() or [])
+    except Exception:
+        open_ids = set()
+    return set(gump_id for gump_id in gump_ids if gump_id in open_ids or Gumps.HasGump(gump_id))
+
 # =============================================================================
 
 class GumpLayoutManager:
@@ -70,70 +149,79 @@ class GumpLayoutManager:
         if DEBUG_MODE:
             Misc.SendMessage(f"[Gump Layout] {message}", color)
     
-    def get_all_configured_gumps(self):
-        """Get list of all configured gumps"""
-        return list(GUMP_LAYOUT.keys())
+    def select_layout(self, index, applied):
+        """Layout name to apply , LAYOUT_NAME or the next one after the last applied when cycling"""
+        order = index['order']
+        if CYCLE_LAYOUTS and applied.get('layout') in order:
+            return order[(order.index(applied['layout']) + 1) % len(order)]
+        if LAYOUT_NAME in index['layouts']:
+            return LAYOUT_NAME
+        self.debug_message(f"No layout named {LAYOUT_NAME} , using {order[0]}", 0x33)
+        return order[0]
     
-    def move_gump_to_preset(self, gump_id):
-        """Move a specific gump to its preset location"""
-        try:
-            layout = GUMP_LAYOUT
-            if gump_id not in layout:
-                self.debug_message(f"No preset location for gump {hex(gump_id)}", 0x33)
-                return False
-            
-            preset = layout[gump_id]
-            target_x = preset["x"]
-            target_y = preset["y"]
-            gump_name = preset["name"]
-            
-            self.debug_message(f"Attempting to move {gump_name} ({hex(gump_id)}) to ({target_x}, {target_y})")
-            
-            # Try to move the gump
+    def plan_moves(self, layout, open_gumps, applied, force):
+        """Minimal moves for the layout : open gumps not already at their target , plus undetected gumps.
+        Returns a list of (gump_id, x, y, name)."""
+        applied_positions = applied.get('positions', {})
+        moves = []
+        for gump_id, (target_x, target_y, gump_name) in layout.items():
+            if gump_id in open_gumps:
+                if not force and applied_positions.get(gump_id) == (target_x, target_y):
+                    continue
+            elif not MOVE_UNDETECTED_GUMPS:
+                continue
+            moves.append((gump_id, target_x, target_y, gump_name))
+        return moves
+    
+    def apply_moves(self, moves):
+        """Send every move back to back , the client applies them without waiting on each other"""
+        sent = []
+        for gump_id, target_x, target_y, gump_name in moves:
             try:
                 CUO.MoveGump(gump_id, target_x, target_y)
-                self.moved_gumps.append(gump_name)
-                self.debug_message(f"Successfully moved {gump_name} to ({target_x}, {target_y})")
-                
-                Misc.Pause(DELAY_MS)
-                return True
-                
+                sent.append((gump_id, target_x, target_y, gump_name))
             except Exception as move_error:
                 self.debug_message(f"CUO.MoveGump failed for {gump_name}: {move_error}", 0x25)
-                return False
-            
-        except Exception as e:
-            gump_name = layout.get(gump_id, {}).get("name", "Unknown")
-            self.debug_message(f"Error moving gump {hex(gump_id)} ({gump_name}): {e}", 0x25)
-            self.failed_moves.append(f"{gump_name}: {e}")
-            return False
+                self.failed_moves.append(f"{gump_name}: {move_error}")
+        return sent
     
     def move_all_gumps(self):
-        """Move all configured gumps to their preset locations (force attempt all)"""
-        self.debug_message("Starting gump layout preset application...")
+        """Move configured gumps to the selected layout in one batch , then verify once"""
+        index = load_layout_index()
+        applied = read_shared(LAYOUT_SHARED_APPLIED, {})
+        layout_name = self.select_layout(index, applied)
+        layout = index['layouts'][layout_name]
+        # Applying the layout that is already applied moves everything again
+        force = applied.get('layout') == layout_name
         
-        all_gumps = self.get_all_configured_gumps()
-        layout = GUMP_LAYOUT
-        moved_count = 0
-        total_gumps = len(all_gumps)
+        open_gumps = read_open_gumps(layout)
+        moves = self.plan_moves(layout, open_gumps, applied, force)
+        self.debug_message(f"Layout {layout_name}: {len(moves)} moves for {len(layout)} gumps ({len(open_gumps)} open)")
+        sent = self.apply_moves(moves)
         
-        self.debug_message(f"Processing {total_gumps} configured gumps...")
+        # Single verification pass , gumps that opened during the batch get one follow up move
+        if sent:
+            Misc.Pause(VERIFY_DELAY_MS)
+        verified_open = read_open_gumps(layout)
+        sent_ids = set(move[0] for move in sent)
+        late_gumps = [(gump_id,) + layout[gump_id] for gump_id in verified_open - open_gumps if gump_id not in sent_ids]
+        if late_gumps:
+            self.debug_message(f"Moving {len(late_gumps)} gumps opened during the batch")
+            sent += self.apply_moves(late_gumps)
         
-        for i, gump_id in enumerate(all_gumps, 1):
-            gump_name = layout[gump_id]["name"]
-            self.debug_message(f"Step {i} of {total_gumps}: {gump_name} ({hex(gump_id)})")
-            
-            if self.move_gump_to_preset(gump_id):
-                moved_count += 1
-                self.debug_message(f"Step {i} completed successfully")
-            else:
-                self.debug_message(f"Step {i} failed", 0x25)
-            
-            if i < total_gumps:  # Don't pause after the last gump
-                self.debug_message(f"Waiting before next gump...")
-                Misc.Pause(DELAY_MS)
+        # Remember positions of gumps that are still open , closed gumps reopen at their own position
+        # gumps skipped by the plan keep their earlier position , it already matches this layout
+        positions = dict((gump_id, position) for gump_id, position in applied.get('positions', {}).items()
+                         if gump_id in verified_open and gump_id in layout and layout[gump_id][:2] == position)
+        for gump_id, target_x, target_y, gump_name in sent:
+            if gump_id in verified_open:
+                positions[gump_id] = (target_x, target_y)
+                self.moved_gumps.append(gump_name)
+            elif gump_id in open_gumps:
+                self.failed_moves.append(f"{gump_name}: closed during the move")
+        write_shared(LAYOUT_SHARED_APPLIED, {'layout': layout_name, 'positions': positions})
         
-        self.debug_message(f"Layout complete: {moved_count} out of {total_gumps} gumps moved", 0x40)
+        self.debug_message(f"Layout {layout_name} complete: {len(self.moved_gumps)} verified of {len(sent)} moves sent", 0x40)
     
     def apply_layout_preset(self):
         """Main function to apply the complete layout preset"""
@@ -144,7 +232,7 @@ class GumpLayoutManager:
         self.failed_moves = []
         self.restored_gumps = []
         
-        # Move all configured gumps to preset positions
+        # Move configured gumps to the layout positions
         if MOVE_GUMPS:
             self.move_all_gumps()
         
@@ -169,17 +257,19 @@ class GumpLayoutManager:
 # =============================================================================
 
 def list_configured_gumps():
-    """List all configured gumps and their preset positions"""
+    """List all layouts of the profile and their gump positions"""
     manager = GumpLayoutManager()
-    manager.debug_message("=== Configured Gumps ===", 0x44)
-    
-    for gump_id, preset in GUMP_LAYOUT.items():
-        manager.debug_message(f"{hex(gump_id)}: {preset['name']} -> ({preset['x']}, {preset['y']})")
-    
-    manager.debug_message(f"Total configured gumps: {len(GUMP_LAYOUT)}")
+    index = load_layout_index()
+    for layout_name in index['order']:
+        layout = index['layouts'][layout_name]
+        manager.debug_message(f"=== Layout {layout_name} ===", 0x44)
+        for gump_id, (target_x, target_y, gump_name) in layout.items():
+            manager.debug_message(f"{hex(gump_id)}: {gump_name} -> ({target_x}, {target_y})")
+        manager.debug_message(f"Total configured gumps: {len(layout)}")
 
 def reset_layout():
-    """Reset all gumps to their preset positions"""
+    """Reset all gumps to their layout positions , forgetting what was applied before"""
+    write_shared(LAYOUT_SHARED_APPLIED, {})
     manager = GumpLayoutManager()
     manager.apply_layout_preset()
 
@@ -13,7 +13,7 @@ TODO:
 - more material types for runics 
 
 STATUS:: wip , needs update to the hardcoded defaults now that we expanded unknowns to uncommon
-VERSION: 20251028
+VERSION: 20261019
 """
 
 import time
@@ -184,6 +184,7 @@ _USER_RATINGS_CACHE = None  # Dict structure: {"item_key": {"current_tier": str,
 WAIT_PROPS_QUICK_MS = 400         # initial tooltip props wait
 WAIT_PROPS_CLICK_MS = 700         # longer tooltip props wait 
 SEARCH_THROTTLE_MS = 40             # small per-item throttle during searchs
+SCAN_NESTED_CONTAINERS = False      # include items inside bags in the backpack (excluded containers are not opened)
 LAUNCHER_LOOP_MS = 150            # idle loop delay for launcher processing
 GUMP_WAIT_MS = 300                # WaitForGump polling (increased to capture clicks reliably)
 
@@ -1181,6 +1182,83 @@ def classify_item(item, name: str, props: list) -> ClassResult:
 
     return None
 
+#//=============== Container crawl
+# Nested containers are walked level by level, unseen sub-containers are opened in batches,
+# and the result is a flat snapshot so later lookups don't re-query the client per bag.
+
+CRAWL_OPEN_UNSEEN_CONTAINERS = True  # Open sub-containers the client has not received contents for yet
+CRAWL_OPEN_BATCH_SIZE = 4  # Sub-containers requested back to back before waiting on their contents
+CRAWL_OPEN_TIMEOUT_MS = 800  # Max wait for a batch of containers to load
+CRAWL_MAX_DEPTH = 8  # Nesting levels to descend below the root container
+# Nested containers are only opened with UseItem when they are plain bags , using a trapped pouch , spellbook or runebook triggers it
+CRAWL_OPEN_CONTAINER_IDS = {
+    0x0E75,  # Backpack
+    0x09B2,  # Backpack
+    0x0E76,  # Bag
+    0x0E79,  # Pouch
+    0x09B0,  # Pouch
+}
+CRAWL_SKIP_OPEN_HUES = {0x0021, 0x0026, 0x002B}  # red hues , trapped pouches and marked salvage bags are never opened
+
+def _is_crawl_container(item):
+    """True if the item is a container worth descending into."""
+    return bool(getattr(item, 'IsContainer', False) or getattr(item, 'Contains', None))
+
+def _is_unseen_container(item):
+    """True if the item is a container whose contents have not been loaded client-side."""
+    if not getattr(item, 'IsContainer', False):
+        return False
+    if getattr(item, 'ContainerOpened', False):
+        return False
+    return not getattr(item, 'Contains', None)
+
+def _is_openable_container(item):
+    """True if a nested container is a known bag or pouch that is safe to open with UseItem."""
+    if int(getattr(item, 'ItemID', -1)) not in CRAWL_OPEN_CONTAINER_IDS:
+        return False
+    return int(getattr(item, 'Hue', 0)) not in CRAWL_SKIP_OPEN_HUES
+
+def _open_containers_batch(containers):
+    """Load the contents of several containers , skipping any an earlier wait already filled in.
+    Items.WaitForContents uses the container itself , so no separate UseItem is sent."""
+    for container in containers:
+        if _is_unseen_container(container):
+            Items.WaitForContents(int(container.Serial), CRAWL_OPEN_TIMEOUT_MS)
+
+def crawl_container(root_serial, skip_container=None, max_depth=CRAWL_MAX_DEPTH, open_unseen=CRAWL_OPEN_UNSEEN_CONTAINERS):
+    """Iteratively walk a container and its nested containers, returning a flat snapshot.
+    Each entry is (item, parent_serial, depth) with depth 0 for direct children of the root,
+    parents always listed before their children. skip_container(item) returning True keeps the
+    container in the snapshot but does not descend into it. A visited set guards against cycles.
+    """
+    snapshot = []
+    root = Items.FindBySerial(int(root_serial))
+    if root is None:
+        return snapshot
+    visited = set([int(root.Serial)])
+    level = [root]
+    depth = 0
+    while level and depth < max_depth:
+        if open_unseen:
+            # The root was chosen by the caller , nested containers must be known bags or pouches
+            unseen = [container for container in level if _is_unseen_container(container) and (depth == 0 or _is_openable_container(container))]
+            for start in range(0, len(unseen), CRAWL_OPEN_BATCH_SIZE):
+                _open_containers_batch(unseen[start:start + CRAWL_OPEN_BATCH_SIZE])
+        next_level = []
+        for container in level:
+            parent_serial = int(container.Serial)
+            for child in list(getattr(container, 'Contains', None) or []):
+                child_serial = int(child.Serial)
+                if child_serial in visited:
+                    continue
+                visited.add(child_serial)
+                snapshot.append((child, parent_serial, depth))
+                if _is_crawl_container(child) and not (skip_container and skip_container(child)):
+                    next_level.append(child)
+        level = next_level
+        depth += 1
+    return snapshot
+
 #//=============== Collect backpack items and filter
 
 def collect_good_items_from_backpack(max_items_per_tier=100):
@@ -1189,8 +1267,13 @@ def collect_good_items_from_backpack(max_items_per_tier=100):
         Misc.SendMessage("No backpack found!", 33)
         return {}
 
-    items = Items.FindBySerial(Player.Backpack.Serial).Contains
-    items = list(items) if items else []
+    # One crawl of the backpack , excluded containers (junk bag , trapped pouches) are listed but not opened
+    snapshot = crawl_container(
+        Player.Backpack.Serial,
+        skip_container=lambda container: _is_excluded(int(container.ItemID), int(getattr(container, 'Hue', 0))),
+        max_depth=CRAWL_MAX_DEPTH if SCAN_NESTED_CONTAINERS else 1,
+    )
+    items = [item for item, parent_serial, depth in snapshot]
 
     tiers = {tier_key: [] for tier_key in RARITY_ORDER}
 
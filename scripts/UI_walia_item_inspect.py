@@ -5,6 +5,7 @@ WAILA ( What Am I Looking At ) , display item information , formatted with extra
 a custom gump running in background as a button ( book shelf )
 clicking the info bookshelf button triggers the item inspection targeter then select an item 
 a custom gump displays the item info and the items that can be crafted with it 
+AUTO_INSPECT_MODE ( off by default ) watches new items in the backpack and nearby ground , precomputing their info gump while idle so inspecting them opens instantly
 
 ** some item properties are not available through api or limited to 4 properties ( spell books dont list their multiple properties )
 
@@ -19,16 +20,25 @@ TROUBLESHOOTING:
 - if "import" errors , download iron python 3.4.2 and copy the files in its "Lib" folder into your RazorEnhanced "Lib" folder 
 
 HOTKEY:: AutoStart on Login
-VERSION:: 20250920
+VERSION:: 20261019
 """
 
 import re # regex parsing the text
+import time
 
 DEBUG_MODE = False  # Set to True for debugging messages
 SHOW_TECHNICAL_INFO = False  # Set to True to show ItemID, Hue, Serial in results
 SHOW_CLOSE_BUTTON = False  # hiding the close button , its cleaner , right click to close
 HUE_TEXT_COLORIZED_BY_HUE = False  # currently not working , because of needed conversion from hue to html color
 
+# Auto inspect - watch new items entering the backpack or nearby ground and precompute their gump in idle time
+AUTO_INSPECT_MODE = False  # Set to True to precompute info for new items while idle , False only builds info on targeting
+AUTO_INSPECT_SCAN_INTERVAL_MS = 1500  # how often to look for new items
+AUTO_INSPECT_GROUND_RANGE = 2  # tiles around the player to watch for ground items , 0 disables ground watching
+AUTO_INSPECT_PRECOMPUTE_PER_TICK = 1  # items precomputed per UI loop tick , keeps the launcher responsive
+AUTO_INSPECT_PROPS_WAIT_MS = 400  # property wait used during idle precompute
+RENDER_CACHE_MAX_ITEMS = 64  # rendered gumps kept by serial , oldest evicted first
+
 DISPLAY = {
     'show_item_graphic': True,
     'show_item_id': False,
@@ -49,6 +59,7 @@ LAUNCHER_X = 200
 LAUNCHER_Y = 200
 RESULTS_X = 200
 RESULTS_Y = 250
+LINE_HEIGHT_PX = 18  # height of one text line in the results gump
 
 # Separate gump IDs for the small launcher button and the results window
 LAUNCHER_GUMP_ID = 0x7A11A12
@@ -58,6 +69,13 @@ RESULTS_GUMP_ID_MAX_OFFSET = 10 # cycle through 10 different IDs (0-9)
 # Runtime state for cycling gump IDs
 _CURRENT_GUMP_OFFSET = 0
 
+# Runtime state for auto inspect
+_RENDER_CACHE = {}  # serial -> {'fingerprint': tuple, 'gump': gump} , insertion ordered for eviction
+_PRECOMPUTE_QUEUE = []  # serials waiting for idle precompute
+_PRECOMPUTE_QUEUED = set()
+_LAST_AUTO_SCAN_TIME = 0.0
+_AUTO_SEEN_SERIALS = None  # serials present at the last scan , None until the first scan
+
 # Map item properties to richer text for clarity 
 PROPERTY_REMAP = {
     # Accuracy -> Tactics modifier (weapons) — numeric-first formatting , yellow color
@@ -694,6 +712,12 @@ def debug_msg(message, color=90):
         except Exception:
             pass
 
+# (item_id, lowercase name) -> artifact description , built once from KNOWN_ARTIFACT_WEAPON_ITEMS
+_ARTIFACT_DESCRIPTION_BY_KEY = {
+    (int(entry['item_id']), str(entry.get('name', '')).strip().lower()): entry.get('description')
+    for entry in KNOWN_ARTIFACT_WEAPON_ITEMS
+}
+
 def resolve_artifact_weapon_description(item_id: int, item_name: str):
     """Return artifact description if this item matches a known artifact weapon by id and name.
     Matching is case-insensitive on name and exact on item_id.
@@ -701,21 +725,11 @@ def resolve_artifact_weapon_description(item_id: int, item_name: str):
     try:
         iid = int(item_id)
     except Exception:
-        iid = item_id
+        return None
     nm = (item_name or '').strip()
-    if not nm or iid is None:
+    if not nm:
         return None
-    low = nm.lower()
-    try:
-        for entry in (KNOWN_ARTIFACT_WEAPON_ITEMS or []):
-            try:
-                if int(entry.get('item_id')) == iid and str(entry.get('name', '')).strip().lower() == low:
-                    return entry.get('description')
-            except Exception:
-                continue
-    except Exception:
-        pass
-    return None
+    return _ARTIFACT_DESCRIPTION_BY_KEY.get((iid, nm.lower()))
 
 def get_modifier_color_category(property_text):
     """Determine the color category for a modifier based on its content."""
@@ -1145,6 +1159,11 @@ def _format_hex4(v: int) -> str:
 
 # WALIA core -----------------------------
 
+# ASCII -> fullwidth translation tables , built once instead of mapping each character per call
+_FULLWIDTH_NOSPACE_TABLE = {o: o - 0x21 + 0xFF01 for o in range(0x21, 0x7F)}
+_FULLWIDTH_TABLE = dict(_FULLWIDTH_NOSPACE_TABLE)
+_FULLWIDTH_TABLE[ord(' ')] = 0x3000  # fullwidth space
+
 def _stylize_unicode(text: str, style: str = 'fullwidth') -> str:
     """Return a unicode-styled variant of ASCII text.
     Styles:
@@ -1153,20 +1172,10 @@ def _stylize_unicode(text: str, style: str = 'fullwidth') -> str:
     """
     if not text:
         return text
-    if style in ('fullwidth', 'fullwidth_nospace'):
-        out = []
-        for ch in text:
-            o = ord(ch)
-            if 0x21 <= o <= 0x7E:  # visible ASCII
-                out.append(chr(o - 0x21 + 0xFF01))
-            elif ch == ' ':
-                if style == 'fullwidth':
-                    out.append('\u3000')  # fullwidth space
-                else:
-                    out.append(' ')       # keep normal space
-            else:
-                out.append(ch)
-        return ''.join(out)
+    if style == 'fullwidth':
+        return text.translate(_FULLWIDTH_TABLE)
+    if style == 'fullwidth_nospace':
+        return text.translate(_FULLWIDTH_NOSPACE_TABLE)
     return text
 
 def _derive_name_color(prop_list: list) -> str:
@@ -1204,27 +1213,31 @@ class TextSection:
         self.category = category
         self.priority = priority  # Lower numbers = higher priority (displayed first)
         self.separator_before = separator_before
-    
+        self._html_key = None  # lines snapshot the cached html was built from
+        self._html = ""
+
     def to_html(self) -> str:
-        """Convert to HTML with line breaks, ensuring each line has proper color formatting."""
+        """Convert to HTML with line breaks, ensuring each line has proper color formatting.
+        The result is cached until the lines change , so re-rendering a section is free."""
         if not self.lines:
             return ""
-        # Join with <br> but ensure each line maintains its formatting
-        formatted_lines = []
-        for line in self.lines:
+        lines_key = tuple(self.lines)
+        if lines_key != self._html_key:
             # If line doesn't have basefont color, it will inherit from parent or default to black
-            # Make sure each line is properly wrapped
-            if line.strip():
-                formatted_lines.append(line)
-        return "<br>".join(formatted_lines)
-    
+            self._html = "<br>".join(line for line in lines_key if line.strip())
+            self._html_key = lines_key
+        return self._html
+
+    def content_height(self) -> int:
+        """Height in pixels of the section lines , shared by layout sizing and rendering."""
+        return len(self.lines) * LINE_HEIGHT_PX
+
     def height_estimate(self) -> int:
         """Estimate height in pixels for this section."""
         if not self.lines:
             return 0
-        base_height = len(self.lines) * 18  # 18px per line
-        separator_height = 18 if self.separator_before else 0
-        return base_height + separator_height
+        separator_height = LINE_HEIGHT_PX if self.separator_before else 0
+        return self.content_height() + separator_height
 
 def _property_color_for_line(raw_lower: str) -> str:
     """Return HTML hex color for a given property line (lowercased)."""
@@ -1238,24 +1251,41 @@ def _property_color_for_line(raw_lower: str) -> str:
         pass
     return '#888888'  # Medium grey for all regular properties
 
+# Layout cache - wrapped / recolored lines keyed by (step, text, argument)
+# property lines repeat across renders and cycled results gumps , so each is tokenized once
+_LAYOUT_CACHE = {}
+_LAYOUT_CACHE_MAX = 4096
+_BASEFONT_OPEN_RE = re.compile(r'<basefont\s+color=[^>]*>')
+_BASEFONT_CLOSE_RE = re.compile(r'</basefont>')
+_BASEFONT_SEGMENT_RE = re.compile(r'<basefont\s+color=([^>]*)>(.*?)</basefont>')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+def _layout_cached(key, compute):
+    """Return the cached layout result for key , computing and storing it on first use."""
+    result = _LAYOUT_CACHE.get(key)
+    if result is None:
+        if len(_LAYOUT_CACHE) >= _LAYOUT_CACHE_MAX:
+            _LAYOUT_CACHE.clear()
+        result = compute()
+        _LAYOUT_CACHE[key] = result
+    return result
+
 def _wrap_line_with_default_color(line: str, default_color: str = '#BBBBBB') -> str:
     """Wrap a line with default color, preserving existing basefont tags."""
     if not line.strip():
         return line
-    
+    return _layout_cached(('color', line, default_color), lambda: _compute_line_with_default_color(line, default_color))
+
+def _compute_line_with_default_color(line: str, default_color: str) -> str:
     # If line has no basefont tags, just wrap it
     if '<basefont' not in line:
         return f"<basefont color={default_color}>{line}</basefont>"
     
-    # Find all basefont color tags and their positions
-    basefont_pattern = r'<basefont\s+color=[^>]*>'
-    end_pattern = r'</basefont>'
-    
     result = f"<basefont color={default_color}>"
     last_pos = 0
     
     # Find all basefont start tags
-    for match in re.finditer(basefont_pattern, line):
+    for match in _BASEFONT_OPEN_RE.finditer(line):
         # Add text before this basefont tag with default color
         if match.start() > last_pos:
             text_before = line[last_pos:match.start()]
@@ -1268,7 +1298,7 @@ def _wrap_line_with_default_color(line: str, default_color: str = '#BBBBBB') ->
         
         # Find the corresponding end tag
         remaining_text = line[last_pos:]
-        end_match = re.search(end_pattern, remaining_text)
+        end_match = _BASEFONT_CLOSE_RE.search(remaining_text)
         if end_match:
             # Add the colored text
             colored_text = remaining_text[:end_match.end()]
@@ -1288,9 +1318,11 @@ def _wrap_line_with_default_color(line: str, default_color: str = '#BBBBBB') ->
 
 def _split_line_for_wrapping(line: str, max_chars: int = 30) -> list:
     """Split a long line into multiple lines based on character count and word boundaries."""
-    
+    return list(_layout_cached(('split', line, max_chars), lambda: tuple(_compute_line_wrapping(line, max_chars))))
+
+def _compute_line_wrapping(line: str, max_chars: int) -> list:
     # Remove HTML tags to get clean text for length calculation
-    clean_text = re.sub(r'<[^>]+>', '', line)
+    clean_text = _HTML_TAG_RE.sub('', line)
     
     # If line is short enough, return as-is
     if len(clean_text) <= max_chars:
@@ -1323,16 +1355,16 @@ def _split_line_for_wrapping(line: str, max_chars: int = 30) -> list:
     
     return lines if lines else [line]
 
-def _split_html_line(line: str, max_chars: int = 30) -> list:
-    """Split HTML-formatted line while preserving color formatting."""
-    
-    # Extract text segments and their formatting
+def _parse_html_segments(line: str) -> tuple:
+    """Parse a line into (color, text) segments once , 'default' marks text outside basefont tags."""
+    return _layout_cached(('segments', line, None), lambda: tuple(_compute_html_segments(line)))
+
+def _compute_html_segments(line: str) -> list:
     segments = []
-    basefont_pattern = r'<basefont\s+color=([^>]*)>(.*?)</basefont>'
     last_pos = 0
     
     # Find all basefont segments
-    for match in re.finditer(basefont_pattern, line):
+    for match in _BASEFONT_SEGMENT_RE.finditer(line):
         # Add any text before this basefont
         if match.start() > last_pos:
             prefix_text = line[last_pos:match.start()].strip()
@@ -1354,6 +1386,11 @@ def _split_html_line(line: str, max_chars: int = 30) -> list:
     # If no HTML found, treat as plain text
     if not segments:
         segments = [('default', line)]
+    return segments
+
+def _split_html_line(line: str, max_chars: int = 30) -> list:
+    """Split HTML-formatted line while preserving color formatting."""
+    segments = _parse_html_segments(line)
     
     # Now split segments into lines based on character count
     lines = []
@@ -1953,9 +1990,8 @@ def build_text_sections(target_item) -> list:
     
     return sections
 
-def show_walia_gump(target_item, gump_id=None):
-    debug_msg("Showing results gump")
-
+def build_walia_gump(target_item):
+    """Build the results gump for an item without sending it, so it can be cached and sent later."""
     # Build modular text sections
     text_sections = build_text_sections(target_item)
     debug_msg(f"Built {len(text_sections)} text sections")
@@ -2083,7 +2119,7 @@ def show_walia_gump(target_item, gump_id=None):
         debug_msg(f"    Generated HTML ({len(section_html) if section_html else 0} chars): {repr(section_html[:100])}{'...' if section_html and len(section_html) > 100 else ''}", COLORS['cat'])
         
         if section_html:
-            section_height = len(section.lines) * 18
+            section_height = section.content_height()
             debug_msg(f"    Rendering at Y={current_y}, height={section_height}", COLORS['cat'])
             for line_idx, line in enumerate(section.lines):
                 debug_msg(f"      Line [{line_idx}]: {repr(line)}", COLORS['cat'])
@@ -2110,11 +2146,109 @@ def show_walia_gump(target_item, gump_id=None):
         Gumps.AddButton(gump, gump_width-30, 8, 4017, 4018, 1, 1, 0)
         Gumps.AddTooltip(gump, "Close")
 
+    return gump
+
+def show_walia_gump(target_item, gump_id=None):
+    debug_msg("Showing results gump")
+    gump = get_cached_walia_gump(target_item)
+    if gump is None:
+        gump = build_walia_gump(target_item)
+        store_cached_walia_gump(target_item, gump)
+    else:
+        debug_msg(f"Render cache hit for serial {hex(int(target_item.Serial))}", COLORS['cat'])
+
     # Send gump with cycling ID (or reuse provided ID for DEV toggle)
     current_gump_id = gump_id if gump_id is not None else get_next_results_gump_id()
     Gumps.SendGump(current_gump_id, Player.Serial, RESULTS_X, RESULTS_Y, gump.gumpDefinition, gump.gumpStrings)
     return current_gump_id
 
+# Auto inspect render cache -----------------------------
+
+def _item_fingerprint(item):
+    """Fingerprint of everything the rendered gump depends on , read from client data without waiting."""
+    try:
+        property_list = Items.GetPropStringList(int(item.Serial)) or []
+    except Exception:
+        property_list = []
+    return (
+        int(getattr(item, 'ItemID', 0) or 0),
+        int(getattr(item, 'Hue', 0) or 0),
+        int(getattr(item, 'Amount', 1) or 1),
+        tuple(str(p) for p in property_list),
+    )
+
+def get_cached_walia_gump(item):
+    """Return the cached gump for this item if its properties are unchanged , else None."""
+    entry = _RENDER_CACHE.get(int(item.Serial))
+    if entry and entry['fingerprint'] == _item_fingerprint(item):
+        return entry['gump']
+    return None
+
+def store_cached_walia_gump(item, gump):
+    """Cache a built gump by serial and property fingerprint , evicting the oldest entries over the limit."""
+    serial = int(item.Serial)
+    _RENDER_CACHE.pop(serial, None)
+    _RENDER_CACHE[serial] = {'fingerprint': _item_fingerprint(item), 'gump': gump}
+    while len(_RENDER_CACHE) > RENDER_CACHE_MAX_ITEMS:
+        del _RENDER_CACHE[next(iter(_RENDER_CACHE))]
+
+def _watched_items():
+    """Items in the backpack (top level) and on the ground near the player."""
+    watched = []
+    try:
+        backpack = Items.FindBySerial(Player.Backpack.Serial)
+        if backpack and backpack.Contains:
+            watched.extend(backpack.Contains)
+    except Exception:
+        pass
+    if AUTO_INSPECT_GROUND_RANGE > 0:
+        try:
+            ground_filter = Items.Filter()
+            ground_filter.Enabled = True
+            ground_filter.OnGround = True
+            ground_filter.RangeMin = 0
+            ground_filter.RangeMax = AUTO_INSPECT_GROUND_RANGE
+            watched.extend(Items.ApplyFilter(ground_filter) or [])
+        except Exception:
+            pass
+    return watched
+
+def scan_for_new_items():
+    """Queue items that entered the watched area since the last scan.
+    The first scan only records what is already there , so existing items and cache evictions are never re-queued."""
+    global _LAST_AUTO_SCAN_TIME, _AUTO_SEEN_SERIALS
+    now = time.time()
+    if now - _LAST_AUTO_SCAN_TIME < AUTO_INSPECT_SCAN_INTERVAL_MS / 1000.0:
+        return
+    _LAST_AUTO_SCAN_TIME = now
+    current_serials = set(int(item.Serial) for item in _watched_items())
+    previous_serials = _AUTO_SEEN_SERIALS
+    _AUTO_SEEN_SERIALS = current_serials
+    if previous_serials is None:
+        return
+    for serial in current_serials - previous_serials:
+        if serial in _RENDER_CACHE or serial in _PRECOMPUTE_QUEUED:
+            continue
+        _PRECOMPUTE_QUEUE.append(serial)
+        _PRECOMPUTE_QUEUED.add(serial)
+
+def precompute_pending_items(budget=AUTO_INSPECT_PRECOMPUTE_PER_TICK):
+    """Build and cache gumps for queued items , a few per call so the UI loop stays responsive."""
+    while budget > 0 and _PRECOMPUTE_QUEUE:
+        serial = _PRECOMPUTE_QUEUE.pop(0)
+        _PRECOMPUTE_QUEUED.discard(serial)
+        budget -= 1
+        item = Items.FindBySerial(serial)
+        if not item:
+            continue
+        try:
+            # Pay the property wait here while idle , rather than when the player inspects
+            Items.WaitForProps(serial, AUTO_INSPECT_PROPS_WAIT_MS)
+            store_cached_walia_gump(item, build_walia_gump(item))
+            debug_msg(f"Precomputed info for {hex(serial)}", COLORS['cat'])
+        except Exception as e:
+            debug_msg(f"Precompute failed for {hex(serial)}: {e}", COLORS['warn'])
+
 def send_launcher_gump():
     """Create and send a tiny floating gump with a single inspect button."""
     debug_msg("Building launcher gump...")
@@ -2250,6 +2384,9 @@ def main():
             Misc.Pause(50)
             keep_running = process_launcher_input()
             process_results_input()
+            if AUTO_INSPECT_MODE and not _IS_TARGETING:
+                scan_for_new_items()
+                precompute_pending_items()
             if not keep_running:
                 break
     except Exception as e:
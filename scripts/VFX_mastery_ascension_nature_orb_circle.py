@@ -129,12 +129,16 @@ CONFIGURATION:
 - OSCILLATION_AMPLITUDE: ±8 Z
 - PERMANENT_FLOWERS: 9 flowers in 2-tile radius spawn with finale
 
-VERSION::20251022
+VERSION::20261019
 """
 
+import os
+import json
 import random
 import time
 import math
+import heapq
+import struct
 
 DEBUG_MODE = False
 USE_MASTERY_LEVEL_FROM_GUMP = False # currently not implemented
@@ -156,6 +160,8 @@ RITUAL_CONFIG = {
     # Color scheme settings
     "color": {
         "scheme": "green",                    # Druidic green theme
+        "fallback_family": "green",          # Hue family used when the scheme has none
+        "fade_override": {"hues": [0x0481], "family": "green"},  # 0x0481 descends the green family instead of darkening
         "enable_hue_cycling": True,          # Sequential hue variants for decorations
         "enable_brightness_variation": True, # Use brightness levels within hue family
         "brightness_cycle_mode": "wave",     # Wave pattern cycling
@@ -326,6 +332,11 @@ RITUAL_CONFIG = {
     "timeline": {
         "minimum_tick_rate_ms": 30,  # ~33 FPS for smooth animation
         "max_updates_per_frame": 18,   # Limit simultaneous updates per frame
+        "bake_enabled": True,          # Bake the scene once per mastery level and seed , replay from data/vfx_bake
+        "bake_variants": 8,            # Number of random seeds per level , each variant is baked once
+        "dry_run": False,              # Report events/sec and peak live items without sending packets
+        "max_packets_per_sec": 300,    # Packet budget , the governor shortens trails and thins VFX above it
+        "max_live_items": 180,         # Live fake item budget , same degrade response
     },
 }
 
@@ -488,6 +499,12 @@ SLIVER_OVERLAY_TILE = 2624  # Dark tile overlay
 # Global state
 CURRENT_MASTERY_LEVEL = 8  # Default mastery level
 
+# =============================================================================
+# VFX ENGINE
+# Identical in every VFX_mastery_ascension script , scene differences live in RITUAL_CONFIG.
+# Edit it in one script then run tools/VFX_engine_sync.py to copy it into the others.
+# =============================================================================
+
 # =============================================================================
 # PACKET HANDLING FUNCTIONS
 # =============================================================================
@@ -501,20 +518,29 @@ def debug_message(msg, color=67):
     except Exception:
         print(f"[VFX_CIRCLE] {msg}")
 
-def _convert_packet_to_bytes(packet_list):
-    """Convert hex string list to byte array"""
-    byte_list = []
-    for value in packet_list:
-        if value:
-            byte_list.append(int(value, 16))
-        else:
-            byte_list.append(0)
-    return byte_list
-
-def _format_hex_4_with_space(value):
-    """Format integer as 4-digit hex with space (e.g., '12 34')"""
-    s = f"{int(value) & 0xFFFF:04X}"
-    return s[:2] + " " + s[2:]
+# client-only serials stay in the item serial range and above anything the server hands out nearby
+FAKE_SERIAL_MIN = 0x40000000
+FAKE_SERIAL_MAX = 0x7FFFFFFF
+
+# 0xF3 world item packet , 26 bytes , rendered by the client only
+# serial at 4 , graphic at 8 , x y z at 15 , hue at 21 , every other byte is fixed
+_FAKE_ITEM_TEMPLATE = (
+    0xF3, 0x00, 0x01, 0x00, 0x48, 0xFC, 0xBB, 0x12, 0x00, 0x00, 0x00, 0x00, 0x01,
+    0x00, 0x01, 0x05, 0x88, 0x06, 0x88, 0x0A, 0x00, 0x04, 0x15, 0x20, 0x00, 0x00,
+)
+_FAKE_ITEM_PACKET = bytearray(_FAKE_ITEM_TEMPLATE)
+_PACK_SERIAL_GRAPHIC = struct.Struct('>IH')
+_PACK_LOCATION = struct.Struct('>HHB')
+_PACK_HUE = struct.Struct('>H')
+
+def build_fake_item_packet(serial, item_x, item_y, item_z, item_id, hue=0):
+    """Fill the reusable 0xF3 buffer in place and return it as a list of byte values."""
+    packet = _FAKE_ITEM_PACKET
+    _PACK_SERIAL_GRAPHIC.pack_into(packet, 4, serial & 0xFFFFFFFF, int(item_id) & 0xFFFF)
+    # Z is a signed byte on the wire , -1 encodes as 0xFF
+    _PACK_LOCATION.pack_into(packet, 15, int(item_x) & 0xFFFF, int(item_y) & 0xFFFF, int(item_z) & 0xFF)
+    _PACK_HUE.pack_into(packet, 21, int(hue) & 0xFFFF)
+    return list(packet)
 
 def _send_fake_item(item_x, item_y, item_z, item_id, hue=0x0000):
     """
@@ -530,71 +556,52 @@ def _send_fake_item(item_x, item_y, item_z, item_id, hue=0x0000):
     Returns:
         Serial number of the fake item (for later removal)
     """
+    entry = (_new_fake_serial(), item_x, item_y, item_z, item_id, hue)
+    if _VFX_GOVERNOR is not None:
+        _VFX_GOVERNOR.queue_spawn(entry)
+    else:
+        _emit_fake_items((entry,))
+    return entry[0]
+
+def build_remove_item_packet(serial):
+    """0x1D remove item packet as a list of byte values."""
+    return [0x1D] + list(struct.pack('>I', int(serial) & 0xFFFFFFFF))
+
+def _remove_fake_item(serial):
+    """Send packet to remove a client-side item by serial."""
+    if _VFX_GOVERNOR is not None:
+        _VFX_GOVERNOR.queue_removal(serial)
+    else:
+        _emit_removals((serial,))
+
+def _new_fake_serial():
+    if _VFX_BAKE_RECORDER is not None:
+        return _VFX_BAKE_RECORDER.serials.randrange(FAKE_SERIAL_MIN, FAKE_SERIAL_MAX)
+    return random.randrange(FAKE_SERIAL_MIN, FAKE_SERIAL_MAX)
+
+def _emit_fake_items(entries):
+    """Send (serial, x, y, z, item_id, hue) spawns , or record them while baking."""
+    if _VFX_BAKE_RECORDER is not None:
+        for entry in entries:
+            _VFX_BAKE_RECORDER.add(*entry)
+        return
     try:
-        # Base packet template for item display
-        packet = (
-            "F3 00 01 00 48 FC BB 12 "
-            + _format_hex_4_with_space(item_id)
-            + " 00 00 01 00 01 05 88 06 88 0A 00 04 15 20 00 00"
-        )
-        packet_list = packet.split(" ")
-
-        # Generate random serial for this fake item
-        serial_hex = f"{random.randrange(0x40000000, 0x7FFFFFFF):08X}"
-
-        # Convert coordinates to hex
-        i_loc_x = f"{int(item_x):04X}"
-        i_loc_y = f"{int(item_y):04X}"
-        i_loc_z = f"{int(item_z):02X}"
-
-        # Split hex values into bytes
-        x1, x2 = i_loc_x[:2], i_loc_x[2:]
-        y1, y2 = i_loc_y[:2], i_loc_y[2:]
-        s1, s2, s3, s4 = serial_hex[0:2], serial_hex[2:4], serial_hex[4:6], serial_hex[6:8]
-
-        # Format hue
-        hue_hex = _format_hex_4_with_space(hue)
-        hues = hue_hex.split(" ")
-
-        # Inject values into packet
-        packet_list[4] = s1
-        packet_list[5] = s2
-        packet_list[6] = s3
-        packet_list[7] = s4
-        packet_list[15] = x1
-        packet_list[16] = x2
-        packet_list[17] = y1
-        packet_list[18] = y2
-        packet_list[19] = i_loc_z
-        packet_list[21] = hues[0]
-        packet_list[22] = hues[1]
-
-        # Convert to bytes and send
-        byte_list = _convert_packet_to_bytes(packet_list)
-        PacketLogger.SendToClient(byte_list)
-        
-        # Return serial as integer for tracking
-        return int(serial_hex, 16)
-        
+        send = PacketLogger.SendToClient
+        for serial, item_x, item_y, item_z, item_id, hue in entries:
+            send(build_fake_item_packet(serial, item_x, item_y, item_z, item_id, hue))
     except Exception as e:
         debug_message(f"Failed to send item packet: {e}", 33)
-        return None
 
-def _remove_fake_item(serial):
-    """Send packet to remove a client-side item by serial."""
+def _emit_removals(serials):
+    """Send 0x1D removals , or record them while baking."""
+    if _VFX_BAKE_RECORDER is not None:
+        for serial in serials:
+            _VFX_BAKE_RECORDER.remove(serial)
+        return
     try:
-        # Remove item packet (0x1D)
-        serial_hex = f"{int(serial):08X}"
-        packet = [
-            0x1D,  # Packet ID
-            int(serial_hex[0:2], 16),
-            int(serial_hex[2:4], 16),
-            int(serial_hex[4:6], 16),
-            int(serial_hex[6:8], 16)
-        ]
-        
-        PacketLogger.SendToClient(packet)
-        
+        send = PacketLogger.SendToClient
+        for serial in serials:
+            send(build_remove_item_packet(serial))
     except Exception as e:
         debug_message(f"Failed to remove item: {e}", 33)
 
@@ -602,9 +609,24 @@ def _remove_fake_item(serial):
 # GEOMETRY FUNCTIONS
 # =============================================================================
 
+_CIRCLE_OFFSET_CACHE = {}  # (radius, count, rotation) -> offsets around the origin
+
+def _circle_offsets(radius, count, rotation):
+    """Circle offsets around the origin , computed once per parameter set."""
+    key = (radius, count, rotation)
+    offsets = _CIRCLE_OFFSET_CACHE.get(key)
+    if offsets is None:
+        angle_step = 360.0 / count
+        angles = [math.radians((i * angle_step + rotation) % 360) for i in range(count)]
+        offsets = tuple((int(radius * math.cos(angle_rad)), int(radius * math.sin(angle_rad))) for angle_rad in angles)
+        _CIRCLE_OFFSET_CACHE[key] = offsets
+    return offsets
+
 def generate_circle_points(center_x, center_y, radius, count, rotation=0):
     """
     Generate points in a circle around center.
+    Rings repeat every frame and at every orb center , so the offsets are memoized
+    per (radius, count, rotation) and shifted to the center.
     
     Args:
         center_x, center_y: Center coordinates
@@ -615,19 +637,7 @@ def generate_circle_points(center_x, center_y, radius, count, rotation=0):
     Returns:
         List of (x, y) tuples
     """
-    points = []
-    angle_step = 360.0 / count
-    
-    for i in range(count):
-        angle_deg = (i * angle_step + rotation) % 360
-        angle_rad = math.radians(angle_deg)
-        
-        x = center_x + int(radius * math.cos(angle_rad))
-        y = center_y + int(radius * math.sin(angle_rad))
-        
-        points.append((x, y))
-    
-    return points
+    return [(center_x + dx, center_y + dy) for dx, dy in _circle_offsets(radius, count, rotation)]
 
 def calculate_phase_rotation(element_count, phase_offset=0):
     """
@@ -728,7 +738,7 @@ def get_scheme_hue(brightness="brightest"):
         Hue value (integer)
     """
     scheme = RITUAL_CONFIG["color"]["scheme"]
-    hue_family = HUE_FAMILIES.get(scheme, HUE_FAMILIES["green"])
+    hue_family = HUE_FAMILIES.get(scheme, HUE_FAMILIES[RITUAL_CONFIG["color"]["fallback_family"]])
     base_hues = hue_family["base_hues"]
     
     if not base_hues:
@@ -755,7 +765,7 @@ def get_hue_for_element(element_index, total_elements):
     """
     # Get the active hue family
     scheme = RITUAL_CONFIG["color"]["scheme"]
-    hue_family = HUE_FAMILIES.get(scheme, HUE_FAMILIES["green"])
+    hue_family = HUE_FAMILIES.get(scheme, HUE_FAMILIES[RITUAL_CONFIG["color"]["fallback_family"]])
     base_hues = hue_family["base_hues"]
     
     if not base_hues:
@@ -810,26 +820,28 @@ def get_hue_for_element(element_index, total_elements):
 def darken_hue(hue, steps):
     """
     Darken a hue using UO hue family system.
-    Special handling for holy white hue to fade gracefully.
+    Hues listed in RITUAL_CONFIG["color"]["fade_override"] either descend a named family
+    from brightest to darkest , or hold until a final step and then switch to final_hue.
     
     Args:
         hue: Original hue value
         steps: Number of darkening steps
     Returns:Darkened hue value
     """
-    # Special handling for holy hue - fade from bright to dark
-    holy_hue = RITUAL_CONFIG["color"].get("holy_orb_hue", 0x0481)
-    if hue == holy_hue or hue == 0x0481:
-        # Holy hue fades from bright white to darker
-        # Use white family brightness levels
-        green_family = HUE_FAMILIES["green"]["base_hues"]
-        # Start from brightest, move toward darkest
-        fade_index = len(green_family) - 1 - min(steps, len(green_family) - 1)
-        return green_family[max(0, fade_index)]
+    fade_override = RITUAL_CONFIG["color"].get("fade_override")
+    if fade_override and hue in fade_override["hues"]:
+        if "family" in fade_override:
+            family_hues = HUE_FAMILIES[fade_override["family"]]["base_hues"]
+            # Start from brightest, move toward darkest
+            fade_index = len(family_hues) - 1 - min(steps, len(family_hues) - 1)
+            return family_hues[max(0, fade_index)]
+        if steps >= fade_override["hold_until_step"]:
+            return fade_override["final_hue"]
+        return hue
     
     if RITUAL_CONFIG["phase_fade"]["use_brightness_levels"]:
         # Find which family this hue belongs to
-        hue_family = HUE_FAMILIES.get(RITUAL_CONFIG["color"]["scheme"], HUE_FAMILIES["green"])
+        hue_family = HUE_FAMILIES.get(RITUAL_CONFIG["color"]["scheme"], HUE_FAMILIES[RITUAL_CONFIG["color"]["fallback_family"]])
         base_hues = hue_family["base_hues"]
         
         # Find current brightness level in family
@@ -850,13 +862,115 @@ def darken_hue(hue, steps):
         darkened = max(1, hue - (5 * steps))  # 5 hue units per step
         return darkened
 
+# =============================================================================
+# PACKET GOVERNOR
+# While a timeline frame runs , spawns and removals are queued instead of sent. At the end of the frame
+# a spawn and removal of the same serial cancel out , duplicate removals are dropped , and the rest go out
+# spawns first so a replaced frame never leaves a gap. The governor tracks packets over the last second and
+# live fake items , and raises a degrade level when either passes its budget : trails shorten , VFX overlap
+# shrinks , then oscillation and idle hue cycling slow down and multi-frame VFX skip alternate frames.
+# The level drops again once the scene is well under budget.
+# =============================================================================
+
+GOVERNOR_MAX_DEGRADE_LEVEL = 3
+GOVERNOR_RAISE_INTERVAL_MS = 250   # minimum time between degrade steps up
+GOVERNOR_LOWER_INTERVAL_MS = 1000  # minimum time between degrade steps down
+GOVERNOR_RECOVER_RATIO = 0.6       # step down once usage is below this share of both budgets
+_VFX_GOVERNOR = None  # set while a timeline frame runs
+
+class PacketGovernor:
+    """Per-frame packet queue with a packets/sec budget and a live fake item budget."""
+    
+    def __init__(self, max_packets_per_sec=300, max_live_items=180):
+        self.max_packets_per_sec = max_packets_per_sec
+        self.max_live_items = max_live_items
+        self.pending_spawns = []  # (serial, x, y, z, item_id, hue)
+        self.pending_removals = []  # serial
+        self.packet_window = []  # (time_ms, packet_count) over the last second
+        self.window_packets = 0
+        self.live_items = 0
+        self.degrade_level = 0
+        self.last_level_change_ms = 0
+        self.stats = {'sent': 0, 'coalesced': 0, 'peak_live_items': 0, 'peak_degrade_level': 0}
+    
+    def queue_spawn(self, entry):
+        self.pending_spawns.append(entry)
+    
+    def queue_removal(self, serial):
+        self.pending_removals.append(serial)
+    
+    def flush(self, current_time_ms):
+        """Send the frame's queued packets and update the degrade level."""
+        queued_count = len(self.pending_spawns) + len(self.pending_removals)
+        if queued_count:
+            spawned_serials = set(entry[0] for entry in self.pending_spawns)
+            cancelled = set()
+            removals = []
+            seen_removals = set()
+            for serial in self.pending_removals:
+                if serial in seen_removals:
+                    continue
+                seen_removals.add(serial)
+                if serial in spawned_serials:
+                    cancelled.add(serial)
+                else:
+                    removals.append(serial)
+            spawns = [entry for entry in self.pending_spawns if entry[0] not in cancelled]
+            self.pending_spawns = []
+            self.pending_removals = []
+            
+            _emit_fake_items(spawns)
+            _emit_removals(removals)
+            sent_count = len(spawns) + len(removals)
+            self.live_items += len(spawns) - len(removals)
+            self.stats['sent'] += sent_count
+            self.stats['coalesced'] += queued_count - sent_count
+            self.stats['peak_live_items'] = max(self.stats['peak_live_items'], self.live_items)
+            self.packet_window.append((current_time_ms, sent_count))
+            self.window_packets += sent_count
+        self._update_degrade_level(current_time_ms)
+    
+    def _update_degrade_level(self, current_time_ms):
+        while self.packet_window and current_time_ms - self.packet_window[0][0] >= 1000:
+            self.window_packets -= self.packet_window.pop(0)[1]
+        over_budget = self.window_packets > self.max_packets_per_sec or self.live_items > self.max_live_items
+        under_budget = (self.window_packets < self.max_packets_per_sec * GOVERNOR_RECOVER_RATIO
+                        and self.live_items < self.max_live_items * GOVERNOR_RECOVER_RATIO)
+        since_change_ms = current_time_ms - self.last_level_change_ms
+        if over_budget and self.degrade_level < GOVERNOR_MAX_DEGRADE_LEVEL and since_change_ms >= GOVERNOR_RAISE_INTERVAL_MS:
+            self.degrade_level += 1
+            self.last_level_change_ms = current_time_ms
+            self.stats['peak_degrade_level'] = max(self.stats['peak_degrade_level'], self.degrade_level)
+        elif under_budget and self.degrade_level > 0 and since_change_ms >= GOVERNOR_LOWER_INTERVAL_MS:
+            self.degrade_level -= 1
+            self.last_level_change_ms = current_time_ms
+
+def current_degrade_level():
+    """Degrade level of the running timeline , 0 outside a timeline frame."""
+    return _VFX_GOVERNOR.degrade_level if _VFX_GOVERNOR is not None else 0
+
+def degraded_interval_ms(interval_ms):
+    """Repeating update interval ( oscillation , idle hue cycling ) , doubled from degrade level 2."""
+    return interval_ms * (1 + current_degrade_level() // 2)
+
 # =============================================================================
 # TIMELINE ANIMATION SYSTEM 
 # =============================================================================
 
+def _next_step_time_ms(track_start_ms, local_time_ms, origin_local_ms, step_ms, step_count):
+    """Timeline time of the next step boundary after local_time_ms , None once the last step is reached."""
+    if step_ms <= 0:
+        return None
+    next_step = int((local_time_ms - origin_local_ms) / step_ms) + 1
+    if next_step >= step_count:
+        return None
+    return track_start_ms + origin_local_ms + int(math.ceil(next_step * step_ms))
+
 class AnimationTrack:
     """Base class for timeline animation tracks."""
     
+    update_cost = 1  # frame budget used by one update()
+    
     def __init__(self, start_time_ms=0, duration_ms=None, loop=False, loop_count=None):
         self.start_time_ms = int(start_time_ms)
         self.duration_ms = int(duration_ms) if duration_ms is not None else None
@@ -916,6 +1030,14 @@ class AnimationTrack:
         local_time = self.get_local_time_ms(current_timeline_time_ms)
         self.on_update(local_time)
     
+    def next_wake_ms(self, current_timeline_time_ms):
+        """Timeline time this track next needs start() or update() , subclasses add their own state changes."""
+        if not self.is_active:
+            return self.start_time_ms
+        if self.duration_ms is None:
+            return current_timeline_time_ms
+        return self.track_start_time_ms + self.duration_ms
+    
     def on_start(self):
         pass
     
@@ -988,6 +1110,17 @@ class StaticItemTrack(AnimationTrack):
         """Remove the item."""
         if self.spawned_serial:
             _remove_fake_item(self.spawned_serial)
+    
+    def next_wake_ms(self, current_timeline_time_ms):
+        wake = super().next_wake_ms(current_timeline_time_ms)
+        if not self.is_active or self.fade_steps == 0:
+            return wake
+        local_time = self.get_local_time_ms(current_timeline_time_ms)
+        if local_time < self.fade_start_local_ms:
+            return min(wake, self.track_start_time_ms + self.fade_start_local_ms)
+        step_time = _next_step_time_ms(self.track_start_time_ms, local_time, self.fade_start_local_ms,
+                                       self.time_per_fade_step, self.fade_steps)
+        return wake if step_time is None else min(wake, step_time)
 
 class PaletteShiftingItemTrack(AnimationTrack):
     """
@@ -1097,7 +1230,7 @@ class PaletteShiftingItemTrack(AnimationTrack):
             if len(self.idle_palette) > 1 and self.idle_cycle_speed_ms > 0:
                 time_since_last_update = local_time_ms - self.last_update_time
                 
-                if time_since_last_update >= self.idle_cycle_speed_ms:
+                if time_since_last_update >= degraded_interval_ms(self.idle_cycle_speed_ms):
                     # Move to next hue in idle palette
                     self.current_palette_index = (self.current_palette_index + 1) % len(self.idle_palette)
                     new_hue = self.idle_palette[self.current_palette_index]
@@ -1116,6 +1249,23 @@ class PaletteShiftingItemTrack(AnimationTrack):
         """Remove the item."""
         if self.spawned_serial:
             _remove_fake_item(self.spawned_serial)
+    
+    def next_wake_ms(self, current_timeline_time_ms):
+        wake = super().next_wake_ms(current_timeline_time_ms)
+        if not self.is_active:
+            return wake
+        local_time = self.get_local_time_ms(current_timeline_time_ms)
+        if local_time < self.fade_start_local_ms:
+            wake = min(wake, self.track_start_time_ms + self.fade_start_local_ms)
+            if len(self.idle_palette) > 1 and self.idle_cycle_speed_ms > 0:
+                wake = min(wake, self.track_start_time_ms + self.last_update_time + degraded_interval_ms(self.idle_cycle_speed_ms))
+            return wake
+        if self.use_phase_out_palette and self.phase_out_steps > 0:
+            step_ms, step_count = self.time_per_phase_step, self.phase_out_steps
+        else:
+            step_ms, step_count = self.fade_duration_ms / 4, 4
+        step_time = _next_step_time_ms(self.track_start_time_ms, local_time, self.fade_start_local_ms, step_ms, step_count)
+        return wake if step_time is None else min(wake, step_time)
 
 class OscillatingItemTrack(AnimationTrack):
     """
@@ -1124,6 +1274,8 @@ class OscillatingItemTrack(AnimationTrack):
     Uses frame overlap system for smooth transitions without flicker.
     """
     
+    update_cost = 2  # respawns a trail frame on most updates
+    
     def __init__(self, start_time_ms, end_time_ms, item_id, position, hue=0x0000, 
                  z_amplitude=10, update_interval_ms=100, z_direction=1, trail_length=2):
         """
@@ -1170,7 +1322,7 @@ class OscillatingItemTrack(AnimationTrack):
         needs_update = False
         
         # Check if it's time to update position (skip if amplitude is 0 - static item)
-        if self.z_amplitude > 0 and local_time_ms - self.last_update_time >= self.update_interval_ms:
+        if self.z_amplitude > 0 and local_time_ms - self.last_update_time >= degraded_interval_ms(self.update_interval_ms):
             # Update Z offset
             self.current_z_offset += self.z_direction
             
@@ -1195,8 +1347,8 @@ class OscillatingItemTrack(AnimationTrack):
                 # Add new frame to trail with current time
                 self.frame_trail.append((serial, local_time_ms))
                 
-                # Maintain fixed trail length - remove oldest frames when exceeding trail_length
-                while len(self.frame_trail) > self.trail_length:
+                # Maintain trail length - remove oldest frames when exceeding trail_length , shorter while degraded
+                while len(self.frame_trail) > max(1, self.trail_length - current_degrade_level()):
                     old_serial, old_time = self.frame_trail.pop(0)  # Remove oldest
                     _remove_fake_item(old_serial)
     
@@ -1205,6 +1357,12 @@ class OscillatingItemTrack(AnimationTrack):
         for serial, spawn_time in self.frame_trail:
             _remove_fake_item(serial)
         self.frame_trail.clear()
+    
+    def next_wake_ms(self, current_timeline_time_ms):
+        wake = super().next_wake_ms(current_timeline_time_ms)
+        if not self.is_active or self.z_amplitude <= 0:
+            return wake
+        return min(wake, self.track_start_time_ms + self.last_update_time + degraded_interval_ms(self.update_interval_ms))
 
 class VFXPlaybackTrack(AnimationTrack):
     """Plays through VFX frames in sequence with overlap for smooth transitions."""
@@ -1265,7 +1423,10 @@ class VFXPlaybackTrack(AnimationTrack):
             if target_frame_index >= len(self.vfx_frames):
                 target_frame_index = len(self.vfx_frames) - 1
             
-            if target_frame_index != self.current_frame_index:
+            # while heavily degraded alternate middle frames are skipped , the previous frame stays up instead
+            skip_frame = (current_degrade_level() >= 2 and target_frame_index % 2 == 1
+                          and target_frame_index < len(self.vfx_frames) - 1)
+            if target_frame_index != self.current_frame_index and not skip_frame:
                 x, y, z = self.position
                 frame_item_id = self.vfx_frames[target_frame_index]
                 new_serial = _send_fake_item(x, y, z, frame_item_id, self.hue)
@@ -1283,7 +1444,7 @@ class VFXPlaybackTrack(AnimationTrack):
             frames_to_remove = []
             for i, (serial, spawn_time) in enumerate(self.frame_trail[:-1]):  # Don't check newest frame
                 age_ms = local_time_ms - spawn_time
-                if age_ms > self.frame_overlap_ms:
+                if age_ms > self.effective_overlap_ms():
                     frames_to_remove.append(i)
                     _remove_fake_item(serial)
             
@@ -1296,53 +1457,95 @@ class VFXPlaybackTrack(AnimationTrack):
         for serial, spawn_time in self.frame_trail:
             _remove_fake_item(serial)
         self.frame_trail.clear()
+    
+    def effective_overlap_ms(self):
+        """Overlap time for old frames , shortened while the packet governor is degrading."""
+        return self.frame_overlap_ms // (1 + current_degrade_level())
+    
+    def next_wake_ms(self, current_timeline_time_ms):
+        wake = super().next_wake_ms(current_timeline_time_ms)
+        if not self.is_active or self.is_single_frame:
+            return wake
+        local_time = self.get_local_time_ms(current_timeline_time_ms)
+        frame_time = _next_step_time_ms(self.track_start_time_ms, local_time, 0, self.frame_duration_ms, len(self.vfx_frames))
+        if frame_time is not None:
+            wake = min(wake, frame_time)
+        if len(self.frame_trail) > 1:
+            # oldest overlapping frame is removed once its age passes the overlap time
+            oldest_spawn = min(spawn_time for serial, spawn_time in self.frame_trail[:-1])
+            cleanup_local = max(oldest_spawn + self.effective_overlap_ms() + 1, self.last_overlap_cleanup_time + 10)
+            wake = min(wake, self.track_start_time_ms + cleanup_local)
+        return wake
 
 class AnimationTimeline:
-    """Manages multiple animation tracks with scheduling and update queue."""
+    """Manages multiple animation tracks with a wake-time heap and a per-frame update budget.
+    Each track sits in the heap once , keyed by the timeline time it next needs work.
+    Ties are broken by track order so tracks due at the same time share the budget round-robin."""
     
     def __init__(self, tick_rate_ms=60, max_updates_per_frame=8):
         self.tick_rate_ms = tick_rate_ms
         self.max_updates_per_frame = max_updates_per_frame
+        timeline_cfg = RITUAL_CONFIG["timeline"]
+        self.governor = PacketGovernor(
+            max_packets_per_sec=timeline_cfg.get("max_packets_per_sec", 300),
+            max_live_items=timeline_cfg.get("max_live_items", 180)
+        )
         self.tracks = []
         self.timeline_start_time_ms = 0
         self.is_playing = False
-        self.operation_queue = []  # List of (queue_time_ms, operation_type, track, cost) tuples
+        self.wake_heap = []  # (wake_time_ms, track_order, track)
+        self.scheduled_tracks = set()  # track_order of every track currently in wake_heap
     
     def add_track(self, track):
         self.tracks.append(track)
+        self.schedule_track(len(self.tracks) - 1, track.start_time_ms)
+    
+    def schedule_track(self, track_order, wake_time_ms):
+        if track_order in self.scheduled_tracks:
+            return
+        self.scheduled_tracks.add(track_order)
+        heapq.heappush(self.wake_heap, (int(wake_time_ms), track_order, self.tracks[track_order]))
     
     def get_next_update_time_ms(self, current_timeline_time_ms):
-        next_update_ms = self.tick_rate_ms
-        for track in self.tracks:
+        if not self.wake_heap:
+            return self.tick_rate_ms
+        return max(self.tick_rate_ms, self.wake_heap[0][0] - current_timeline_time_ms)
+    
+    def run_due_operations(self, current_time_ms):
+        """Pop due tracks oldest-wake first and start or update them within the frame budget.
+        Work past the budget stays in the heap with its original wake time , so it runs first next frame.
+        Packets the tracks send are held by the governor and flushed together at the end of the frame."""
+        global _VFX_GOVERNOR
+        _VFX_GOVERNOR = self.governor
+        try:
+            return self._run_due_tracks(current_time_ms)
+        finally:
+            _VFX_GOVERNOR = None
+            self.governor.flush(current_time_ms)
+    
+    def _run_due_tracks(self, current_time_ms):
+        operations_executed = 0
+        while self.wake_heap and self.wake_heap[0][0] <= current_time_ms:
+            wake_time_ms, track_order, track = self.wake_heap[0]
             if track.is_complete:
+                heapq.heappop(self.wake_heap)
+                self.scheduled_tracks.discard(track_order)
                 continue
-            if not track.is_active:
-                time_until_start = track.start_time_ms - current_timeline_time_ms
-                if time_until_start > 0:
-                    next_update_ms = min(next_update_ms, time_until_start)
-                continue
-            if isinstance(track, VFXPlaybackTrack):
-                local_time = track.get_local_time_ms(current_timeline_time_ms)
-                time_to_next_frame = track.frame_duration_ms - (local_time % track.frame_duration_ms)
-                next_update_ms = min(next_update_ms, time_to_next_frame)
-            elif isinstance(track, OscillatingItemTrack):
-                # Schedule updates for oscillation
-                local_time = track.get_local_time_ms(current_timeline_time_ms)
-                time_since_last = local_time - track.last_update_time
-                time_to_next_update = track.update_interval_ms - time_since_last
-                if time_to_next_update > 0:
-                    next_update_ms = min(next_update_ms, time_to_next_update)
-                else:
-                    next_update_ms = min(next_update_ms, track.update_interval_ms)
-            elif isinstance(track, StaticItemTrack):
-                # Only schedule updates during fade period
-                if track.fade_steps > 0:
-                    local_time = track.get_local_time_ms(current_timeline_time_ms)
-                    if local_time >= track.fade_start_local_ms:
-                        fade_elapsed = local_time - track.fade_start_local_ms
-                        time_to_next_step = track.time_per_fade_step - (fade_elapsed % track.time_per_fade_step)
-                        next_update_ms = min(next_update_ms, time_to_next_step)
-        return max(self.tick_rate_ms, next_update_ms)
+            cost = track.update_cost if track.is_active else 1
+            if operations_executed + cost > self.max_updates_per_frame:
+                break
+            heapq.heappop(self.wake_heap)
+            self.scheduled_tracks.discard(track_order)
+            if track.is_active:
+                track.update(current_time_ms)
+            else:
+                track.start(current_time_ms)
+            operations_executed += cost
+            if not track.is_complete:
+                # a wake time that is not in the future would spin , push it to the next frame
+                next_wake_ms = track.next_wake_ms(current_time_ms)
+                self.schedule_track(track_order, max(next_wake_ms, current_time_ms + 1))
+        return operations_executed
     
     def play(self):
         if not self.tracks:
@@ -1354,83 +1557,186 @@ class AnimationTimeline:
         
         while self.is_playing:
             current_time_ms = int(time.time() * 1000) - self.timeline_start_time_ms
+            self.run_due_operations(current_time_ms)
             
-            # PHASE 1: Add NEW operations to queue with CURRENT time as queue time
-            # This is critical - each update gets queued at the current frame time
-            for track in self.tracks:
-                # Check if track needs to start
-                if track.should_start(current_time_ms):
-                    cost = 1
-                    # Check if already queued
-                    already_queued = any(op[2] == track and op[1] == 'start' for op in self.operation_queue)
-                    if not already_queued:
-                        # Queue with CURRENT time - when this operation was requested
-                        self.operation_queue.append((current_time_ms, 'start', track, cost))
-                
-                # Check if track needs update
-                elif track.is_active and not track.is_complete:
-                    if isinstance(track, OscillatingItemTrack):
-                        cost = 2
-                    else:
-                        cost = 1
-                    
-                    # Check if this track already has a queued update
-                    already_queued = any(op[2] == track and op[1] == 'update' for op in self.operation_queue)
-                    if not already_queued:
-                        # Queue with CURRENT time - when this update was requested
-                        # This ensures round-robin: all tracks requesting updates at t=120ms
-                        # get equal priority, regardless of when they started
-                        self.operation_queue.append((current_time_ms, 'update', track, cost))
-            
-            # PHASE 2: Sort queue by time (oldest queued first) + round-robin within same time
-            # Operations queued earlier execute first
-            # Within same queue_time, use track index for round-robin distribution
-            self.operation_queue.sort(key=lambda x: (x[0], self.tracks.index(x[2]) if x[2] in self.tracks else 0))
-            
-            # PHASE 3: Execute operations up to limit
-            operations_executed = 0
-            remaining_queue = []
-            
-            for queue_time, operation_type, track, cost in self.operation_queue:
-                # Skip if track is already complete
-                if track.is_complete:
-                    continue
-                
-                # Try to execute if we have budget
-                if operations_executed + cost <= self.max_updates_per_frame:
-                    if operation_type == 'start':
-                        if track.should_start(current_time_ms):
-                            track.start(current_time_ms)
-                            operations_executed += cost
-                        # Don't re-queue starts
-                    elif operation_type == 'update':
-                        if track.is_active and not track.is_complete:
-                            track.update(current_time_ms)
-                            operations_executed += cost
-                        # Don't re-queue updates (will be added fresh next frame)
-                else:
-                    # Keep in queue for next frame (maintains wait time priority)
-                    remaining_queue.append((queue_time, operation_type, track, cost))
-            
-            # Keep deferred operations for next frame
-            self.operation_queue = remaining_queue
-            
-            if all(track.is_complete for track in self.tracks):
+            if not self.wake_heap:
                 break
             
-            next_update_ms = self.get_next_update_time_ms(current_time_ms)
-            # Enforce minimum delay to prevent client overload
-            next_update_ms = max(self.tick_rate_ms, next_update_ms)
-            Misc.Pause(int(next_update_ms))
+            # Sleep until the earliest wake , never faster than tick_rate_ms to prevent client overload
+            Misc.Pause(int(self.get_next_update_time_ms(current_time_ms)))
         
         self.is_playing = False
         debug_message("Timeline: Complete", 88)
+        self.report_governor()
+    
+    def report_governor(self):
+        stats = self.governor.stats
+        debug_message(f"Governor: {stats['sent']} packets sent, {stats['coalesced']} coalesced, peak {stats['peak_live_items']} live items, peak degrade level {stats['peak_degrade_level']}", 68)
+
+# =============================================================================
+# BAKED PLAYBACK
+# A scene timeline is run once against a virtual clock and every spawn / removal is recorded as
+# (t_ms, op, x, y, z, item_id, hue, serial). The events are cached per scene , mastery level and seed
+# in data/vfx_bake , playback then only sleeps and sends. Coordinates are shifted to the player on replay.
+# =============================================================================
+
+VFX_BAKE_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "vfx_bake")
+VFX_BAKE_FORMAT_VERSION = 1
+_VFX_BAKE_RECORDER = None  # set while bake_timeline() runs , packet sends are recorded instead
+
+class VFXBakeRecorder:
+    """Collects fake item events at the virtual timeline time."""
+    
+    def __init__(self, seed):
+        self.events = []
+        self.now_ms = 0
+        self.serials = random.Random(seed)
+    
+    def add(self, serial, item_x, item_y, item_z, item_id, hue):
+        self.events.append((self.now_ms, "add", int(item_x), int(item_y), int(item_z), int(item_id), int(hue), int(serial)))
+    
+    def remove(self, serial):
+        self.events.append((self.now_ms, "remove", 0, 0, 0, 0, 0, int(serial)))
+
+def bake_timeline(timeline, seed):
+    """Run the timeline's scheduling against a virtual clock and return its events in time order.
+    The tracks are consumed , bake a freshly built timeline."""
+    global _VFX_BAKE_RECORDER
+    recorder = VFXBakeRecorder(seed)
+    _VFX_BAKE_RECORDER = recorder
+    try:
+        current_time_ms = 0
+        while True:
+            recorder.now_ms = current_time_ms
+            timeline.run_due_operations(current_time_ms)
+            if not timeline.wake_heap:
+                break
+            current_time_ms += int(timeline.get_next_update_time_ms(current_time_ms))
+    finally:
+        _VFX_BAKE_RECORDER = None
+    timeline.report_governor()
+    return recorder.events
+
+def _baked_scene_path(scene_name, seed):
+    """Cache file for the current mastery level and seed , keyed to this script's size and mtime so edits re-bake."""
+    try:
+        script_stat = os.stat(os.path.abspath(__file__))
+        script_key = f"{int(script_stat.st_mtime)}_{script_stat.st_size}"
+    except Exception:
+        script_key = "0"
+    level = RITUAL_CONFIG["circle"]["element_count"]
+    return os.path.join(VFX_BAKE_FOLDER, f"{scene_name}_L{level}_S{seed}_{script_key}.json")
+
+def load_baked_scene(scene_name, seed):
+    path = _baked_scene_path(scene_name, seed)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r") as f:
+            baked = json.load(f)
+        if baked.get("format_version") != VFX_BAKE_FORMAT_VERSION:
+            return None
+        return baked
+    except Exception as e:
+        debug_message(f"Bake cache unreadable , re-baking: {e}", 33)
+        return None
+
+def save_baked_scene(scene_name, seed, baked):
+    path = _baked_scene_path(scene_name, seed)
+    try:
+        if not os.path.exists(VFX_BAKE_FOLDER):
+            os.makedirs(VFX_BAKE_FOLDER)
+        with open(path, "w") as f:
+            json.dump(baked, f, separators=(",", ":"))
+    except Exception as e:
+        debug_message(f"Could not save bake cache: {e}", 33)
+
+def summarize_baked_events(events):
+    """Return (event_count, duration_ms, average events/sec, peak events in any 1s window, peak live fake items)."""
+    if not events:
+        return 0, 0, 0.0, 0, 0
+    duration_ms = events[-1][0] - events[0][0]
+    live_items = 0
+    peak_live_items = 0
+    window_start = 0
+    peak_window = 0
+    for index, event in enumerate(events):
+        live_items += 1 if event[1] == "add" else -1
+        peak_live_items = max(peak_live_items, live_items)
+        while event[0] - events[window_start][0] >= 1000:
+            window_start += 1
+        peak_window = max(peak_window, index - window_start + 1)
+    events_per_sec = len(events) * 1000.0 / duration_ms if duration_ms > 0 else float(len(events))
+    return len(events), duration_ms, events_per_sec, peak_window, peak_live_items
+
+def play_baked_events(baked, center, dry_run=False):
+    """Replay baked events at their recorded times , shifted from the baked center to center."""
+    events = baked["events"]
+    offset_x = center[0] - baked["center"][0]
+    offset_y = center[1] - baked["center"][1]
+    offset_z = center[2] - baked["center"][2]
+    
+    if dry_run:
+        count, duration_ms, events_per_sec, peak_window, peak_live_items = summarize_baked_events(events)
+        debug_message(f"Dry run: {count} events over {duration_ms}ms , {events_per_sec:.1f} events/sec avg , {peak_window} peak in 1s , {peak_live_items} peak live items", 68)
+        return
+    
+    send = PacketLogger.SendToClient
+    start_time = time.time()
+    try:
+        for t_ms, op, item_x, item_y, item_z, item_id, hue, serial in events:
+            wait_ms = t_ms - (time.time() - start_time) * 1000.0
+            if wait_ms >= 1:
+                Misc.Pause(int(wait_ms))
+            if op == "add":
+                send(build_fake_item_packet(serial, item_x + offset_x, item_y + offset_y, item_z + offset_z, item_id, hue))
+            else:
+                send(build_remove_item_packet(serial))
+    except Exception as e:
+        debug_message(f"Baked playback failed: {e}", 33)
+
+def play_scene(scene_name, build_timeline):
+    """Play a scene at the player. build_timeline(center_x, center_y, center_z, seed) returns an AnimationTimeline.
+    With baking enabled the timeline is built and baked once per mastery level and seed , then replayed from cache."""
+    timeline_cfg = RITUAL_CONFIG["timeline"]
+    center = (int(Player.Position.X), int(Player.Position.Y), int(Player.Position.Z))
+    # a small fixed set of seeds keeps variety while letting each variant's bake be reused
+    seed = int(time.time() * 1000) % max(1, int(timeline_cfg.get("bake_variants", 8)))
+    
+    if not timeline_cfg.get("bake_enabled", True) and not timeline_cfg.get("dry_run", False):
+        timeline = build_timeline(center[0], center[1], center[2], seed)
+        if timeline:
+            timeline.play()
+        return
+    
+    baked = load_baked_scene(scene_name, seed)
+    if baked is None:
+        timeline = build_timeline(center[0], center[1], center[2], seed)
+        if not timeline:
+            return
+        bake_start = time.time()
+        baked = {
+            "format_version": VFX_BAKE_FORMAT_VERSION,
+            "scene": scene_name,
+            "seed": seed,
+            "center": list(center),
+            "events": bake_timeline(timeline, seed),
+        }
+        debug_message(f"Baked {len(baked['events'])} events in {int((time.time() - bake_start) * 1000)}ms (seed {seed})", 68)
+        if timeline_cfg.get("bake_enabled", True):
+            save_baked_scene(scene_name, seed, baked)
+    else:
+        debug_message(f"Playing cached bake: {len(baked['events'])} events (seed {seed})", 68)
+    
+    play_baked_events(baked, center, dry_run=timeline_cfg.get("dry_run", False))
+
+# END VFX ENGINE
 
 # =============================================================================
 # MAIN RITUAL SEQUENCE
 # =============================================================================
 
-def perform_nature_circle_ritual():
+def build_nature_circle_timeline(center_x, center_y, center_z, seed):
     """
     Timeline-based Nature Mastery ascension ritual:
     - Alchemical symbols spawn at each orb position (green hue)
@@ -1444,13 +1750,8 @@ def perform_nature_circle_ritual():
     - All decorations fade out at the end
     """
     try:
-        # Initialize random seed based on current time for unique patterns each ritual
-        random.seed(int(time.time() * 1000))  # Use milliseconds for more variation
-        
-        # Get player position as center
-        center_x = int(Player.Position.X)
-        center_y = int(Player.Position.Y)
-        center_z = int(Player.Position.Z)
+        # Seed picks the symbol shuffle and random decorations , play_scene() caches one bake per seed
+        random.seed(seed)
         
         # Load config
         cfg = RITUAL_CONFIG
@@ -1491,7 +1792,7 @@ def perform_nature_circle_ritual():
         debug_message(f"Elements: {circle_cfg['element_count']}, Radius: {circle_cfg['radius']}", 68)
         debug_message(f"Mastery Level {element_count}: Trail length set to {orb_cfg['trail_length']}", 68)
         debug_message(f"Color: {color_cfg['scheme']}, Druidic Hue: {color_cfg['druidic_orb_hue']}", 68)
-        debug_message(f"Random Seed: {int(time.time() * 1000)} (symbols shuffled)", 68)
+        debug_message(f"Random Seed: {seed} (symbols shuffled)", 68)
         
         # Symbol palette debug info
         palette_cfg = cfg.get("symbol_hue_palette", {})
@@ -1913,21 +2214,22 @@ def perform_nature_circle_ritual():
             fade_duration_ms=0
         ))
         
-        # =====================================================================
-        # EXECUTE TIMELINE
-        # =====================================================================
-        
         debug_message(f"Timeline: {len(timeline.tracks)} tracks scheduled", 68)
-        timeline.play()
-        
-        debug_message("=" * 60, 88)
-        debug_message("Nature Mastery Ascension Orb Circle Ritual - Complete", 88)
-        debug_message("=" * 60, 88)
+        return timeline
         
     except Exception as e:
         debug_message(f"Error in ritual: {e}", 33)
         import traceback
         debug_message(traceback.format_exc(), 33)
+        return None
+
+def perform_nature_circle_ritual():
+    """Build or load the baked timeline for the current mastery level and play it at the player."""
+    play_scene("nature", build_nature_circle_timeline)
+    
+    debug_message("=" * 60, 88)
+    debug_message("Nature Mastery Ascension Orb Circle Ritual - Complete", 88)
+    debug_message("=" * 60, 88)
 
 # =============================================================================
 # GUMP LAUNCHER UI
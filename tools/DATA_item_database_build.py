@@ -0,0 +1,234 @@
+"""
+DATA Item Database Build - External Processing Tool
+
+This is NOT a Razor Enhanced script. It is a Python utility that compiles the
+armor / weapon base data into one versioned item database JSON , one per-ItemID
+view of data that is otherwise spread over several scripts , for external tools.
+The in-game scripts keep their own literal tables authoritative and do not read it ,
+so an edit to those tables never has to wait on a rebuild.
+
+Sources:
+- the literal tables in scripts/UI_walia_item_inspect.py
+  ( ARMOR_DATA_BY_ITEMID , WEAPON_DATA_BY_ITEMID , KNOWN_ARTIFACT_WEAPON_ITEMS )
+- the salvager type tables in scripts/ITEM_filter_junk_salvager.py ( WEAPON_*_INFO , ARMOR_*_INFO , SHIELD_*_INFO )
+- data/armor_universal_database.json created by scripts/DEV_item_armor_data.py ( optional )
+  measured base AR and per-modifier AR fill in items the literal tables do not cover
+
+Output: data/item_database.json
+- items : "0x0F49" -> { name , category , subtype , salvager_tables , armor , weapon , artifacts }
+  salvager_tables lists every salvager table holding the ItemID , category keeps only the winning one
+- artifact_index : "0x0F5E|pridestalker's blade" -> description
+
+Usage:
+  python tools/DATA_item_database_build.py
+  python tools/DATA_item_database_build.py -a data/armor_universal_database.json -o data/item_database.json
+
+VERSION:: 20261019
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+from datetime import datetime
+from statistics import median
+
+# Bump when the record layout changes , readers check it before using the records
+SCHEMA_VERSION = 2  # 2 dropped the unused name_index
+
+WAILA_SCRIPT = os.path.join("scripts", "UI_walia_item_inspect.py")
+SALVAGER_SCRIPT = os.path.join("scripts", "ITEM_filter_junk_salvager.py")
+ARMOR_MEASURED_FILE = os.path.join("data", "armor_universal_database.json")
+OUTPUT_FILE = os.path.join("data", "item_database.json")
+DEBUG_MODE = True
+
+# Measured layer names from DEV_item_armor_data.py -> layer names used in ARMOR_DATA_BY_ITEMID
+MEASURED_LAYER_NAMES = {
+    'head': 'Head', 'neck': 'Neck', 'arms': 'Arms', 'gloves': 'Gloves', 'hand': 'Gloves',
+    'innertorso': 'InnerTorso', 'body': 'InnerTorso', 'pants': 'Pants', 'legs': 'Pants',
+    'lefthand': 'LeftHand', 'shield': 'LeftHand',
+}
+
+def debug_msg(message):
+    """Debug message output"""
+    if DEBUG_MODE:
+        print(f"[ITEM_DATABASE] {message}")
+
+def _project_root():
+    return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+def _hex_key(item_id):
+    return f"0x{int(item_id):04X}"
+
+def read_literal_tables(script_path, wanted):
+    """Return {name: value} for module-level literal assignments in a script.
+    wanted(name) decides which names to keep. The script is parsed, never executed."""
+    with open(script_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=script_path)
+    tables = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if not isinstance(target, ast.Name) or not wanted(target.id):
+            continue
+        try:
+            tables[target.id] = ast.literal_eval(node.value)
+        except ValueError:
+            # merged tables like {**A, **B} are rebuilt from their parts
+            continue
+    return tables
+
+def _armor_type_from_name(item_name):
+    """Determine armor type from item name ( same order as DATA_item_armor_data_to_wiki.py )"""
+    item_lower = item_name.lower()
+    if 'studded' in item_lower:
+        return 'Studded'
+    if 'leather' in item_lower:
+        return 'Leather'
+    if 'ring' in item_lower:
+        return 'Ringmail'
+    if 'bone' in item_lower:
+        return 'Bone'
+    if 'chain' in item_lower:
+        return 'Chainmail'
+    if 'shield' in item_lower:
+        return 'Shield'
+    if any(keyword in item_lower for keyword in ['plate', 'helm', 'bascinet']):
+        return 'Platemail'
+    return 'Unknown'
+
+def summarize_measured_armor(armor_entries):
+    """Reduce DEV_item_armor_data.py entries to one armor record per ItemID.
+    Base AR is the median AR delta of unmodified samples , each AR modifier the median of single-modifier samples."""
+    samples = {}
+    for entry in armor_entries:
+        try:
+            item_id = int(str(entry.get('item_id')), 16)
+        except (TypeError, ValueError):
+            continue
+        deltas = entry.get('deltas', {})
+        record = samples.setdefault(item_id, {'name': entry.get('item_name', ''), 'layer': entry.get('layer'), 'base': [], 'dex': [], 'mods': {}})
+        ar_modifiers = entry.get('ar_modifiers', []) or []
+        if not ar_modifiers:
+            record['base'].append(int(deltas.get('ar_delta', 0)))
+        elif len(ar_modifiers) == 1:
+            record['mods'].setdefault(ar_modifiers[0], []).append(int(deltas.get('ar_delta', 0)))
+        record['dex'].append(int(deltas.get('dex_delta', 0)))
+
+    measured = {}
+    for item_id, record in samples.items():
+        name = str(record['name']).strip().lower()
+        layer = MEASURED_LAYER_NAMES.get(str(record['layer'] or '').lower(), record['layer'])
+        measured[item_id] = {
+            'type': _armor_type_from_name(name),
+            'layer': layer,
+            'name': name,
+            'base_ar': int(median(record['base'])) if record['base'] else 0,
+            'ar_modifiers': {mod: int(median(values)) for mod, values in sorted(record['mods'].items())},
+            'dex_penalty': int(median(record['dex'])) if record['dex'] else 0,
+            'samples': len(record['base']) + sum(len(v) for v in record['mods'].values()),
+        }
+    return measured
+
+def build_database(waila_tables, salvager_tables, measured_armor):
+    """Merge all sources into ItemID records plus name and artifact indexes."""
+    items = {}
+
+    def _record(item_id):
+        return items.setdefault(_hex_key(item_id), {'item_id': int(item_id)})
+
+    for item_id, info in sorted(measured_armor.items()):
+        record = _record(item_id)
+        record['armor'] = {k: v for k, v in info.items() if k != 'samples'}
+        record['armor_samples'] = info['samples']
+    # hand-checked literal values win over measured medians
+    for item_id, info in waila_tables.get('ARMOR_DATA_BY_ITEMID', {}).items():
+        _record(item_id)['armor'] = dict(info)
+    for item_id, info in waila_tables.get('WEAPON_DATA_BY_ITEMID', {}).items():
+        _record(item_id)['weapon'] = dict(info)
+
+    # salvager priority is weapon , then armor , then shield , later tables in the file override earlier ones
+    for prefix in ('SHIELD', 'ARMOR', 'WEAPON'):
+        for table_name in [name for name in salvager_tables if name.startswith(prefix + '_')]:
+            for item_id, info in salvager_tables[table_name].items():
+                record = _record(item_id)
+                record['category'] = info.get('category')
+                record['subtype'] = info.get('subtype')
+                record['name'] = info.get('name')
+                # shields like 0x1B72 sit in both SHIELD_BASE_INFO and ARMOR_BONE_INFO , keep every membership
+                record.setdefault('salvager_tables', []).append(table_name)
+
+    artifact_index = {}
+    for entry in waila_tables.get('KNOWN_ARTIFACT_WEAPON_ITEMS', []):
+        name = str(entry.get('name', '')).strip()
+        record = _record(entry['item_id'])
+        record.setdefault('artifacts', []).append({'name': name, 'description': entry.get('description')})
+        artifact_index[f"{_hex_key(entry['item_id'])}|{name.lower()}"] = entry.get('description')
+
+    for key, record in sorted(items.items()):
+        names = set()
+        for source in (record, record.get('armor', {}), record.get('weapon', {})):
+            if source.get('name'):
+                names.add(str(source['name']).strip().lower())
+        if 'name' not in record and names:
+            record['name'] = sorted(names)[0]
+
+    return {
+        'metadata': {
+            'schema_version': SCHEMA_VERSION,
+            'version': datetime.now().strftime("%Y%m%d%H%M%S"),
+            'sources': [WAILA_SCRIPT, SALVAGER_SCRIPT] + ([ARMOR_MEASURED_FILE] if measured_armor else []),
+            'item_count': len(items),
+            'measured_armor_count': len(measured_armor),
+        },
+        'items': items,
+        'artifact_index': artifact_index,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the shared item database JSON from script tables and armor test data")
+    parser.add_argument('-a', '--armor', default=None, help='Path to armor_universal_database.json; defaults to data/ , skipped if missing')
+    parser.add_argument('-o', '--output', default=None, help='Path to output JSON; defaults to data/item_database.json')
+    args = parser.parse_args()
+
+    project_root = _project_root()
+    waila_path = os.path.join(project_root, WAILA_SCRIPT)
+    salvager_path = os.path.join(project_root, SALVAGER_SCRIPT)
+    armor_path = args.armor or os.path.join(project_root, ARMOR_MEASURED_FILE)
+    out_path = args.output or os.path.join(project_root, OUTPUT_FILE)
+
+    for path in (waila_path, salvager_path):
+        if not os.path.exists(path):
+            print(f"Source script not found: {path}")
+            sys.exit(1)
+
+    waila_tables = read_literal_tables(
+        waila_path,
+        lambda name: name in ('ARMOR_DATA_BY_ITEMID', 'WEAPON_DATA_BY_ITEMID', 'KNOWN_ARTIFACT_WEAPON_ITEMS'),
+    )
+    salvager_tables = read_literal_tables(
+        salvager_path,
+        lambda name: name.endswith('_INFO') and name.split('_')[0] in ('WEAPON', 'ARMOR', 'SHIELD'),
+    )
+    debug_msg(f"Read {len(waila_tables)} WAILA tables and {len(salvager_tables)} salvager tables")
+
+    measured_armor = {}
+    if os.path.exists(armor_path):
+        with open(armor_path, 'r', encoding='utf-8') as f:
+            armor_entries = json.load(f).get('armor_entries', [])
+        measured_armor = summarize_measured_armor(armor_entries)
+        debug_msg(f"Summarized {len(armor_entries)} armor test entries into {len(measured_armor)} items")
+    else:
+        debug_msg(f"No armor test data at {armor_path} , using literal tables only")
+
+    database = build_database(waila_tables, salvager_tables, measured_armor)
+
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        json.dump(database, f, indent=1, ensure_ascii=False, sort_keys=True)
+    print(f"Wrote {database['metadata']['item_count']} items to: {out_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""
+DEV Crafting Capture Parse - External Processing Tool
+
+This is NOT a Razor Enhanced script. It is a Python utility that parses the raw crafting gump
+captures written by scripts/DEV_crafting_gump_crawler.py with CAPTURE_ONLY = True.
+The in-game crawl then only clicks and records , scoring every handler candidate
+( handle_example_A..F , normalized and order type suggestions ) runs here across a process pool.
+
+The parser functions are loaded from the crawler script itself so live and offline parsing stay identical.
+The script source is executed with USE_ALCHEMY_SETTINGS matched to the capture , main() never runs
+and no Razor API is reached by the parsers.
+
+Input: data/gump_crafting_capture_<crafting>_<timestamp>.ndjson ( newest one when not given )
+- one JSON record per line , a "session" record first , then "category" and "item" records in crawl order
+Output: data/gump_crafting_<crafting>_<timestamp>.json
+- the same JSON a parsing crawl saves , shaped by the script's OUTPUT_BASE / OUTPUT_ITEM
+
+Usage:
+  python tools/DEV_crafting_capture_parse.py
+  python tools/DEV_crafting_capture_parse.py -i data/gump_crafting_capture_alchemy_20261019120000.ndjson -j 8
+
+VERSION:: 20261019
+"""
+
+import argparse
+import ast
+import glob
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+CRAWLER_SCRIPT = os.path.join("scripts", "DEV_crafting_gump_crawler.py")
+CAPTURE_PATTERN = os.path.join("data", "gump_crafting_capture_*.ndjson")
+OUTPUT_FOLDER = "data"
+CHUNK_SIZE = 8  # item records handed to a worker at a time
+DEBUG_MODE = True
+
+_CRAWLER = None  # per process crawler namespace , set by _init_worker
+
+def debug_msg(message):
+    """Debug message output"""
+    if DEBUG_MODE:
+        print(f"[CRAFTING_CAPTURE_PARSE] {message}")
+
+def _project_root():
+    return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+def load_crawler_namespace(script_path, crafting_type_key):
+    """Execute the crawler script source and return its globals.
+    USE_ALCHEMY_SETTINGS is rewritten to match the capture so the discipline derived tables match the crawl."""
+    with open(script_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=script_path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name) and target.id == 'USE_ALCHEMY_SETTINGS':
+                node.value = ast.copy_location(ast.Constant(crafting_type_key == 'alchemy'), node.value)
+    namespace = {'__name__': 'DEV_crafting_gump_crawler', '__file__': script_path}
+    exec(compile(tree, script_path, 'exec'), namespace)
+    namespace['DEBUG_TO_INGAME_MESSAGE'] = False
+    return namespace
+
+def _init_worker(script_path, crafting_type_key):
+    global _CRAWLER
+    _CRAWLER = load_crawler_namespace(script_path, crafting_type_key)
+
+def parse_item_record(record):
+    """Parse one captured item record , returns (parsed_item_details, parse_meta, is_sparse)."""
+    parsed_item_details, parse_meta = _CRAWLER['parse_item_entry'](
+        record.get('detail') or {}, record.get('category'), record.get('button_category'), record.get('button_info'))
+    return parsed_item_details, parse_meta, _CRAWLER['is_sparse_parsed_item'](parsed_item_details)
+
+def read_capture(capture_path):
+    """Return (session, records) from an NDJSON capture.
+    A crawl stopped mid-write can leave a partial last line , unreadable lines are skipped."""
+    session = None
+    records = []
+    with open(capture_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                debug_msg(f"Skipping unreadable line {line_number}")
+                continue
+            if record.get('type') == 'session':
+                session = record
+            else:
+                records.append(record)
+    return session, records
+
+def build_results(session, records, parsed_items, crawler):
+    """Assemble crawl results in the layout crawl_once returns."""
+    results = {
+        'session_start': session.get('session_start'),
+        'tool_item_ids': session.get('tool_item_ids'),
+        'crafting_type': session.get('crafting_type'),
+        'crafting_type_key': session.get('crafting_type_key'),
+        'base_gump': session.get('base_gump'),
+        'categories': {},
+        'known_gumps': {}
+    }
+    crawler['register_known'](results['base_gump'], results)
+    parsed_iter = iter(parsed_items)
+    skipped = 0
+    for record in records:
+        category_key = record.get('category')
+        if record.get('type') == 'category':
+            results['categories'].setdefault(category_key, {'button': record.get('button'), 'items': []})
+            continue
+        if record.get('type') != 'item':
+            continue
+        detail = record.get('detail') or {}
+        crawler['register_known'](detail, results)
+        parsed_item_details, parse_meta, is_sparse = next(parsed_iter)
+        if is_sparse:
+            skipped += 1
+            debug_msg(f"Skipped sparse item detail (btn {record.get('button_info')}) in category {category_key}")
+            continue
+        bucket = results['categories'].setdefault(category_key, {'button': record.get('button_category'), 'items': []})
+        bucket['items'].append({
+            'button': record.get('button_info'),
+            'detail': detail,
+            'parsed': parsed_item_details,
+            'parse_meta': parse_meta
+        })
+    if skipped:
+        debug_msg(f"Skipped {skipped} sparse item details")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse a CAPTURE_ONLY crafting gump capture into the crafting crawl JSON")
+    parser.add_argument('-i', '--input', default=None, help='Path to a capture NDJSON; defaults to the newest data/gump_crafting_capture_*.ndjson')
+    parser.add_argument('-o', '--output', default=None, help='Path to output JSON; defaults to data/gump_crafting_<crafting>_<timestamp>.json')
+    parser.add_argument('-s', '--script', default=None, help='Crawler script holding the parsers; defaults to scripts/DEV_crafting_gump_crawler.py')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='Parser processes , 1 parses in this process')
+    args = parser.parse_args()
+
+    project_root = _project_root()
+    script_path = os.path.abspath(args.script or os.path.join(project_root, CRAWLER_SCRIPT))
+    capture_path = args.input
+    if not capture_path:
+        captures = sorted(glob.glob(os.path.join(project_root, CAPTURE_PATTERN)), key=os.path.getmtime)
+        if not captures:
+            print(f"No capture found matching: {os.path.join(project_root, CAPTURE_PATTERN)}")
+            sys.exit(1)
+        capture_path = captures[-1]
+    for path in (script_path, capture_path):
+        if not os.path.exists(path):
+            print(f"File not found: {path}")
+            sys.exit(1)
+
+    session, records = read_capture(capture_path)
+    if session is None:
+        print(f"No session record in: {capture_path}")
+        sys.exit(1)
+    crafting_type_key = session.get('crafting_type_key') or ''
+    item_records = [record for record in records if record.get('type') == 'item']
+    debug_msg(f"Read {len(item_records)} item records from {os.path.basename(capture_path)} ( {crafting_type_key} )")
+
+    crawler = load_crawler_namespace(script_path, crafting_type_key)
+    start = time.time()
+    if args.jobs <= 1:
+        _init_worker(script_path, crafting_type_key)
+        parsed_items = [parse_item_record(record) for record in item_records]
+    else:
+        with multiprocessing.Pool(args.jobs, initializer=_init_worker, initargs=(script_path, crafting_type_key)) as pool:
+            parsed_items = pool.map(parse_item_record, item_records, chunksize=CHUNK_SIZE)
+    debug_msg(f"Parsed {len(parsed_items)} items with {max(1, args.jobs)} processes in {time.time() - start:.2f}s")
+
+    results = build_results(session, records, parsed_items, crawler)
+    out_path = args.output
+    if not out_path:
+        dt = time.strftime("%Y%m%d%H%M%S", time.localtime())
+        out_path = os.path.join(project_root, OUTPUT_FOLDER, f"gump_crafting_{crafting_type_key or crawler['CRAFTING_TYPE_KEY']}_{dt}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, 'w', encoding='utf-8') as f:
+        f.write(crawler['to_json'](crawler['shape_results'](results), indent=4))
+    print(f"Wrote crafting gump data to: {out_path}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+VFX Engine Sync - External Processing Tool
+
+This is NOT a Razor Enhanced script. It is a Python utility that keeps the shared
+VFX engine section identical across the VFX_mastery_ascension scripts.
+
+Each scene script stays self-contained so it runs on its own in Razor Enhanced ,
+the engine ( packet helpers , geometry , hue helpers , animation tracks and timeline )
+sits between the "# VFX ENGINE" header and the "# END VFX ENGINE" line.
+Scene differences belong in each script's RITUAL_CONFIG , never inside the engine section.
+
+Usage:
+  python tools/VFX_engine_sync.py --check
+  python tools/VFX_engine_sync.py -s scripts/VFX_mastery_ascension_nature_orb_circle.py
+
+VERSION:: 20261019
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+SCRIPT_PATTERN = os.path.join("scripts", "VFX_mastery_ascension_*.py")
+DEFAULT_SOURCE = os.path.join("scripts", "VFX_mastery_ascension_blood_orb_circle.py")
+ENGINE_START_MARKER = "# VFX ENGINE\n"
+ENGINE_END_MARKER = "# END VFX ENGINE\n"
+DEBUG_MODE = True
+
+def debug_msg(message):
+    """Debug message output"""
+    if DEBUG_MODE:
+        print(f"[VFX_ENGINE_SYNC] {message}")
+
+def _project_root():
+    return os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+def find_engine_span(text):
+    """Return (start, end) of the engine section including both marker lines , None if either marker is missing.
+    The start includes the separator line above the header."""
+    start = text.find(ENGINE_START_MARKER)
+    end = text.find(ENGINE_END_MARKER)
+    if start < 0 or end < start:
+        return None
+    separator_start = text.rfind("\n", 0, max(0, start - 1)) + 1
+    return separator_start, end + len(ENGINE_END_MARKER)
+
+def main():
+    parser = argparse.ArgumentParser(description="Copy the shared VFX engine section from one VFX_mastery_ascension script into the others")
+    parser.add_argument('-s', '--source', default=None, help='Script holding the engine to copy; defaults to the blood orb circle script')
+    parser.add_argument('--check', action='store_true', help='Only report scripts whose engine differs , exit 1 if any do')
+    args = parser.parse_args()
+
+    project_root = _project_root()
+    source_path = os.path.abspath(args.source or os.path.join(project_root, DEFAULT_SOURCE))
+    with open(source_path, 'r', encoding='utf-8') as f:
+        source_text = f.read()
+    span = find_engine_span(source_text)
+    if span is None:
+        print(f"Engine markers not found in: {source_path}")
+        sys.exit(1)
+    engine = source_text[span[0]:span[1]]
+    debug_msg(f"Engine from {os.path.basename(source_path)}: {engine.count(chr(10))} lines")
+
+    drifted = []
+    for path in sorted(glob.glob(os.path.join(project_root, SCRIPT_PATTERN))):
+        if os.path.abspath(path) == source_path:
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        target_span = find_engine_span(text)
+        if target_span is None:
+            debug_msg(f"Skipping {os.path.basename(path)} , no engine markers")
+            continue
+        if text[target_span[0]:target_span[1]] == engine:
+            continue
+        drifted.append(path)
+        if args.check:
+            print(f"Engine differs: {path}")
+            continue
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text[:target_span[0]] + engine + text[target_span[1]:])
+        print(f"Updated engine: {path}")
+
+    if args.check and drifted:
+        sys.exit(1)
+    if not drifted:
+        print("All engine sections match")
+
+if __name__ == '__main__':
+    main()